@@ -16,9 +16,9 @@ from jose import jwt
 from jose.exceptions import JWTError
 
 try:
-    from backend.app.db.database import get_db_connection
+    from backend.app.db.database import db_connection
 except Exception:  # pragma: no cover
-    get_db_connection = None  # type: ignore
+    db_connection = None  # type: ignore
 
 HASH_ALGO = "sha256"
 JWKS_CACHE_TTL = 300  # seconds
@@ -131,11 +131,11 @@ def _ensure_anon_cookie(request, response, ttl_days: int = 30) -> str:
 
 
 def _maybe_record_session(anon_id: Optional[str], ip_hash: str, ua_hash: str, ttl_days: int) -> None:
-    if not anon_id or get_db_connection is None:
+    if not anon_id or db_connection is None:
         return
     try:
         expires_at = datetime.now(timezone.utc) + timedelta(days=ttl_days)
-        with get_db_connection() as conn:
+        with db_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(
                     """
@@ -18,6 +18,11 @@ class Settings(BaseSettings):
     debug_errors: int = Field(0, alias="DEBUG_ERRORS")
     log_level: str = Field("INFO", alias="LOG_LEVEL")
     request_id_header: str = Field("x-request-id", alias="REQUEST_ID_HEADER")
+    metrics_enabled: int = Field(0, alias="METRICS_ENABLED")
+    metrics_rollup_interval_seconds: int = Field(60, alias="METRICS_ROLLUP_INTERVAL_SECONDS")
+    metrics_max_series_per_metric: int = Field(64, alias="METRICS_MAX_SERIES_PER_METRIC")
+    log_queue_size: int = Field(10000, alias="LOG_QUEUE_SIZE")
+    log_sample_rates: Optional[str] = Field(None, alias="LOG_SAMPLE_RATES")
     db_host_allowlist_staging: Optional[str] = Field(None, alias="DB_HOST_ALLOWLIST_STAGING")
     db_host_allowlist_prod: Optional[str] = Field(None, alias="DB_HOST_ALLOWLIST_PROD")
 
@@ -53,6 +58,9 @@ class Settings(BaseSettings):
     waf_lockout_schedule_seconds: str = Field("30,120,600,3600", alias="WAF_LOCKOUT_SCHEDULE_SECONDS")
     waf_lockout_cooldown_seconds: int = Field(21600, alias="WAF_LOCKOUT_COOLDOWN_SECONDS")
     waf_enforce_routes: str = Field("/api/chat", alias="WAF_ENFORCE_ROUTES")
+    waf_prefilter_share: float = Field(0.0, alias="WAF_PREFILTER_SHARE")
+    waf_prefilter_max_entries: int = Field(10000, alias="WAF_PREFILTER_MAX_ENTRIES")
+    waf_mem_max_keys: int = Field(50000, alias="WAF_MEM_MAX_KEYS")
 
     # Model provider (Step 7)
     model_calls_enabled: int = Field(1, alias="MODEL_CALLS_ENABLED")
@@ -82,6 +90,12 @@ class Settings(BaseSettings):
     cost_breaker_cooldown_seconds: int = Field(120, alias="COST_BREAKER_COOLDOWN_SECONDS")
     cost_events_ring_size: int = Field(500, alias="COST_EVENTS_RING_SIZE")
     cost_log_level: str = Field("INFO", alias="COST_LOG_LEVEL")
+    limiter_backend: str = Field("memory", alias="LIMITER_BACKEND")
+    limiter_shm_path: Optional[str] = Field(None, alias="LIMITER_SHM_PATH")
+    limiter_redis_url: Optional[str] = Field(None, alias="LIMITER_REDIS_URL")
+    limiter_flush_interval_ms: int = Field(250, alias="LIMITER_FLUSH_INTERVAL_MS")
+    limiter_batch_max: int = Field(64, alias="LIMITER_BATCH_MAX")
+    limiter_token_lease: int = Field(4, alias="LIMITER_TOKEN_LEASE")
 
     # Performance budgets (Phase 16 Step 2)
     api_chat_total_timeout_ms: Optional[int] = Field(None, alias="API_CHAT_TOTAL_TIMEOUT_MS")
@@ -99,6 +113,10 @@ class Settings(BaseSettings):
     llm_api_base: Optional[str] = Field(None, alias="LLM_API_BASE")
     llm_api_key: Optional[str] = Field(None, alias="LLM_API_KEY")
 
+    # Legacy session memory (ConversationService)
+    redis_url: str = Field("redis://localhost:6379/0", alias="REDIS_URL")
+    session_ttl_seconds: int = Field(86400, alias="SESSION_TTL_SECONDS")
+
     @field_validator(
         "model_calls_enabled",
         "debug_errors",
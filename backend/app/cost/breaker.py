@@ -4,6 +4,9 @@ import time
 from dataclasses import dataclass, field
 from typing import Dict, Tuple
 
+from backend.app.observability.metrics import counter
+from backend.app.perf.striped import StripedLocks
+
 from .budgets import (
     cost_breaker_cooldown_seconds,
     cost_breaker_fail_threshold,
@@ -19,11 +22,18 @@ class _BreakerState:
     failures: Dict[int, int] = field(default_factory=dict)
 
 
+def _transition(st: _BreakerState, state: BreakerState) -> None:
+    if st.state != state:
+        counter("cost_breaker_transitions", 1, {"to": state.value})
+    st.state = state
+
+
 class CircuitBreaker:
     """In-memory circuit breaker keyed by provider+model."""
 
     def __init__(self) -> None:
         self._states: Dict[str, _BreakerState] = {}
+        self._locks = StripedLocks()
 
     def _get(self, key: str) -> _BreakerState:
         if key not in self._states:
@@ -38,13 +48,16 @@ class CircuitBreaker:
 
     def precheck(self, key: str, now: float | None = None) -> BudgetDecision:
         ts = now or time.time()
-        st = self._get(key)
+        with self._locks.hold(key):
+            return self._precheck_locked(self._get(key), ts)
+
+    def _precheck_locked(self, st: _BreakerState, ts: float) -> BudgetDecision:
         self._prune(st, ts)
         cooldown = cost_breaker_cooldown_seconds()
 
         if st.state == BreakerState.OPEN:
             if ts - st.opened_at >= cooldown:
-                st.state = BreakerState.HALF_OPEN
+                _transition(st, BreakerState.HALF_OPEN)
                 return BudgetDecision(allowed=True, scope="breaker", reason="half_open_probe")
             return BudgetDecision(allowed=False, scope="breaker", reason="open", retry_after_s=int(cooldown - (ts - st.opened_at)))
 
@@ -55,22 +68,24 @@ class CircuitBreaker:
         # CLOSED
         recent_failures = sum(st.failures.values())
         if recent_failures >= cost_breaker_fail_threshold():
-            st.state = BreakerState.OPEN
+            _transition(st, BreakerState.OPEN)
             st.opened_at = ts
             return BudgetDecision(allowed=False, scope="breaker", reason="open", retry_after_s=cooldown)
         return BudgetDecision(allowed=True, scope=None)
 
     def on_failure(self, key: str, now: float | None = None) -> None:
         ts = int(now or time.time())
-        st = self._get(key)
-        st.failures[ts] = st.failures.get(ts, 0) + 1
-        self._prune(st, ts)
-        if sum(st.failures.values()) >= cost_breaker_fail_threshold():
-            st.state = BreakerState.OPEN
-            st.opened_at = ts
+        with self._locks.hold(key):
+            st = self._get(key)
+            st.failures[ts] = st.failures.get(ts, 0) + 1
+            self._prune(st, ts)
+            if sum(st.failures.values()) >= cost_breaker_fail_threshold():
+                _transition(st, BreakerState.OPEN)
+                st.opened_at = ts
 
     def on_success(self, key: str) -> None:
-        st = self._get(key)
-        st.state = BreakerState.CLOSED
-        st.failures.clear()
-        st.opened_at = 0.0
+        with self._locks.hold(key):
+            st = self._get(key)
+            _transition(st, BreakerState.CLOSED)
+            st.failures.clear()
+            st.opened_at = 0.0
@@ -4,6 +4,8 @@ import functools
 from typing import Optional
 
 from backend.app.config import get_settings
+from backend.app.observability.metrics import counter
+from backend.app.perf.shared_counters import shared_counter_backend
 
 from .accounting import Accounting
 from .breaker import CircuitBreaker
@@ -24,9 +26,10 @@ class CostPolicy:
     """Deterministic, in-memory cost control policy."""
 
     def __init__(self) -> None:
-        self.global_daily = DailyCounter()
-        self.actor_daily = DailyCounter()
-        self.ip_window = RollingWindowCounter(cost_ip_window_seconds())
+        shared = shared_counter_backend()
+        self.global_daily = DailyCounter(shared, namespace="cost:global")
+        self.actor_daily = DailyCounter(shared, namespace="cost:actor")
+        self.ip_window = RollingWindowCounter(cost_ip_window_seconds(), shared, namespace="cost:ip")
         self.breaker = CircuitBreaker()
         self.accounting = Accounting(cost_events_ring_size())
         self._settings = get_settings()
@@ -52,6 +55,11 @@ class CostPolicy:
         est_input_tokens: int,
         est_output_cap: int,
     ) -> BudgetDecision:
+        decision = self._precheck(actor_key=actor_key, ip_hash=ip_hash, est_input_tokens=est_input_tokens, est_output_cap=est_output_cap)
+        counter("cost_precheck", 1, {"scope": decision.scope or "none", "allowed": str(decision.allowed).lower()})
+        return decision
+
+    def _precheck(self, *, actor_key: str, ip_hash: str, est_input_tokens: int, est_output_cap: int) -> BudgetDecision:
         total_est = max(0, est_input_tokens) + max(0, est_output_cap)
         if total_est > cost_request_max_tokens():
             return BudgetDecision(allowed=False, scope="request_cap", reason="request_tokens_exceeded")
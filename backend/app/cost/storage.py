@@ -2,15 +2,34 @@ from __future__ import annotations
 
 import time
 from collections import defaultdict, deque
-from typing import Deque, Dict, List, Tuple
+from typing import Deque, Dict, List, Optional, Tuple
+
+from backend.app.perf.shared_counters import CounterBackend
+from backend.app.perf.striped import StripedLocks
+
+# A shared rolling window is kept as this many slices (one key each) instead of per-second buckets.
+_SHARED_WINDOW_SLICES = 12
+_SHARED_DAY_TTL_S = 2 * 86400
 
 
 class RollingWindowCounter:
-    """Token counter per key using fixed-size time buckets."""
+    """Token counter per key using fixed-size time buckets.
 
-    def __init__(self, window_seconds: int) -> None:
+    With a shared backend the window is split into coarser slices, so totals
+    may include up to one slice of older tokens (never fewer).
+    """
+
+    def __init__(self, window_seconds: int, backend: Optional[CounterBackend] = None, namespace: str = "window") -> None:
         self.window_seconds = max(1, int(window_seconds))
         self._buckets: Dict[str, Dict[int, int]] = defaultdict(dict)
+        self._locks = StripedLocks()
+        self._backend = backend
+        self._namespace = namespace
+        self._slice = max(1, self.window_seconds // _SHARED_WINDOW_SLICES)
+
+    def _slice_keys(self, key: str, ts: int) -> List[str]:
+        first = (ts - self.window_seconds) // self._slice
+        return [f"{self._namespace}:{key}:{idx}" for idx in range(first, ts // self._slice + 1)]
 
     def _prune(self, key: str, now: float) -> None:
         cutoff = int(now) - self.window_seconds
@@ -21,34 +40,51 @@ class RollingWindowCounter:
 
     def add(self, key: str, tokens: int, now: float | None = None) -> None:
         ts = int(now or time.time())
-        buckets = self._buckets[key]
-        buckets[ts] = buckets.get(ts, 0) + max(0, int(tokens))
-        self._prune(key, ts)
+        if self._backend is not None:
+            slice_key = f"{self._namespace}:{key}:{ts // self._slice}"
+            self._backend.incr(slice_key, max(0, int(tokens)), self.window_seconds + self._slice)
+            return
+        with self._locks.hold(key):
+            buckets = self._buckets[key]
+            buckets[ts] = buckets.get(ts, 0) + max(0, int(tokens))
+            self._prune(key, ts)
 
     def total(self, key: str, now: float | None = None) -> int:
         ts = int(now or time.time())
-        self._prune(key, ts)
-        return sum(self._buckets.get(key, {}).values())
+        if self._backend is not None:
+            return sum(self._backend.get_many(self._slice_keys(key, ts)).values())
+        with self._locks.hold(key):
+            self._prune(key, ts)
+            return sum(self._buckets.get(key, {}).values())
 
 
 class DailyCounter:
     """Daily token counter per key, resets when the date changes."""
 
-    def __init__(self) -> None:
+    def __init__(self, backend: Optional[CounterBackend] = None, namespace: str = "daily") -> None:
         self._counts: Dict[str, Tuple[str, int]] = {}
+        self._locks = StripedLocks()
+        self._backend = backend
+        self._namespace = namespace
 
     def add(self, key: str, tokens: int, now: float | None = None) -> None:
         ts = int(now or time.time())
         day = time.strftime("%Y-%m-%d", time.gmtime(ts))
-        existing_day, count = self._counts.get(key, (day, 0))
-        if existing_day != day:
-            self._counts[key] = (day, max(0, int(tokens)))
+        if self._backend is not None:
+            self._backend.incr(f"{self._namespace}:{day}:{key}", max(0, int(tokens)), _SHARED_DAY_TTL_S)
             return
-        self._counts[key] = (existing_day, count + max(0, int(tokens)))
+        with self._locks.hold(key):
+            existing_day, count = self._counts.get(key, (day, 0))
+            if existing_day != day:
+                self._counts[key] = (day, max(0, int(tokens)))
+                return
+            self._counts[key] = (existing_day, count + max(0, int(tokens)))
 
     def total(self, key: str, now: float | None = None) -> int:
         ts = int(now or time.time())
         day = time.strftime("%Y-%m-%d", time.gmtime(ts))
+        if self._backend is not None:
+            return self._backend.get(f"{self._namespace}:{day}:{key}")
         existing_day, count = self._counts.get(key, (day, 0))
         if existing_day != day:
             return 0
@@ -1,12 +1,38 @@
 # Database utilities for Phase 15 Step 2 (Supabase Postgres)
 from .database import (
+    acquire_db_connection,
+    aclose_db_pools,
+    async_db_connection,
+    awarm_db_pools,
     check_db_connection,
     cleanup_expired_records,
+    close_db_pools,
+    db_connection,
+    db_pool_stats,
+    get_async_db_pool,
     get_db_connection,
+    get_db_pool,
+    release_db_connection,
 )
+from .pool import AsyncConnectionPool, ConnectionPool, PoolClosedError, PoolStats, PoolTimeoutError
 
 __all__ = [
+    "acquire_db_connection",
+    "aclose_db_pools",
+    "async_db_connection",
+    "awarm_db_pools",
     "check_db_connection",
     "cleanup_expired_records",
+    "close_db_pools",
+    "db_connection",
+    "db_pool_stats",
+    "get_async_db_pool",
     "get_db_connection",
+    "get_db_pool",
+    "release_db_connection",
+    "AsyncConnectionPool",
+    "ConnectionPool",
+    "PoolClosedError",
+    "PoolStats",
+    "PoolTimeoutError",
 ]
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import os
+import threading
 import time
-from contextlib import suppress
-from typing import Any, Iterable, Optional
+from contextlib import asynccontextmanager, contextmanager, suppress
+from typing import Any, AsyncIterator, Iterable, Iterator, Optional
 
 try:
     import psycopg
@@ -11,14 +13,57 @@ except ImportError:  # pragma: no cover
     psycopg = None  # type: ignore
 
 
+from backend.app.db.pool import (
+    POOL_HEALTH_CHECK_IDLE_S_DEFAULT,
+    POOL_MAX_IDLE_S_DEFAULT,
+    POOL_MAX_SIZE_DEFAULT,
+    POOL_MIN_SIZE_DEFAULT,
+    POOL_WAIT_TIMEOUT_S_DEFAULT,
+    AsyncConnectionPool,
+    ConnectionPool,
+    PoolStats,
+)
+
+
 DB_CONNECT_TIMEOUT = 3  # seconds
 
+_pool_lock = threading.Lock()
+_sync_pool: Optional[ConnectionPool] = None
+_async_pool: Optional[AsyncConnectionPool] = None
+
 
 def _database_url(env: Optional[dict[str, str]] = None) -> str | None:
     env_map = env or os.environ
     return env_map.get("DATABASE_URL")
 
 
+def _env_int(name: str, default: int) -> int:
+    try:
+        v = int(os.environ.get(name, default))
+        return v if v >= 0 else default
+    except Exception:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        v = float(os.environ.get(name, default))
+        return v if v >= 0 else default
+    except Exception:
+        return default
+
+
+def _pool_kwargs() -> dict[str, Any]:
+    return {
+        "min_size": _env_int("DB_POOL_MIN_SIZE", POOL_MIN_SIZE_DEFAULT),
+        "max_size": max(1, _env_int("DB_POOL_MAX_SIZE", POOL_MAX_SIZE_DEFAULT)),
+        "connect_timeout": DB_CONNECT_TIMEOUT,
+        "wait_timeout_s": _env_float("DB_POOL_WAIT_TIMEOUT_S", POOL_WAIT_TIMEOUT_S_DEFAULT),
+        "health_check_idle_s": _env_float("DB_POOL_HEALTH_CHECK_IDLE_S", POOL_HEALTH_CHECK_IDLE_S_DEFAULT),
+        "max_idle_s": _env_float("DB_POOL_MAX_IDLE_S", POOL_MAX_IDLE_S_DEFAULT),
+    }
+
+
 def get_db_connection():
     """
     Return a psycopg connection using DATABASE_URL.
@@ -33,6 +78,137 @@ def get_db_connection():
     return psycopg.connect(url, connect_timeout=DB_CONNECT_TIMEOUT)
 
 
+def get_db_pool() -> ConnectionPool:
+    """
+    Return the process-wide sync pool, creating it lazily for DATABASE_URL.
+    A pool whose DATABASE_URL no longer matches the environment is replaced.
+    """
+    global _sync_pool
+    url = _database_url()
+    if not url:
+        raise RuntimeError("DATABASE_URL not configured")
+    if psycopg is None:
+        raise ModuleNotFoundError("psycopg not installed")
+    pool = _sync_pool
+    if pool is not None and not pool.closed and pool.conninfo == url:
+        return pool
+    stale: Optional[ConnectionPool] = None
+    with _pool_lock:
+        pool = _sync_pool
+        if pool is None or pool.closed or pool.conninfo != url:
+            stale = pool
+            pool = ConnectionPool(url, **_pool_kwargs())
+            _sync_pool = pool
+    if stale is not None:
+        stale.close()
+    return pool
+
+
+def get_async_db_pool() -> AsyncConnectionPool:
+    """Return the process-wide async pool (psycopg AsyncConnection) for DATABASE_URL."""
+    global _async_pool
+    url = _database_url()
+    if not url:
+        raise RuntimeError("DATABASE_URL not configured")
+    if psycopg is None:
+        raise ModuleNotFoundError("psycopg not installed")
+    stale: Optional[AsyncConnectionPool] = None
+    with _pool_lock:
+        pool = _async_pool
+        if pool is None or pool.closed or pool.conninfo != url:
+            stale = pool
+            pool = AsyncConnectionPool(url, **_pool_kwargs())
+            _async_pool = pool
+    if stale is not None:
+        stale.close_nowait()
+    return pool
+
+
+def acquire_db_connection():
+    """
+    Borrow a pooled connection. Pair with release_db_connection().
+    Raises on missing config/driver, pool exhaustion or connect errors.
+    """
+    return get_db_pool().getconn()
+
+
+def release_db_connection(conn: Any, *, discard: bool = False) -> None:
+    """Return a connection obtained from acquire_db_connection(); never raises."""
+    if conn is None:
+        return
+    pool = _sync_pool
+    try:
+        if pool is None:
+            conn.close()
+            return
+        pool.putconn(conn, discard=discard)
+    except Exception:
+        return
+
+
+@contextmanager
+def db_connection() -> Iterator[Any]:
+    """
+    Pooled drop-in for `with get_db_connection() as conn:` — commits on clean
+    exit, rolls back on error, and returns the connection to the pool.
+    """
+    with get_db_pool().connection() as conn:
+        yield conn
+
+
+@asynccontextmanager
+async def async_db_connection() -> AsyncIterator[Any]:
+    """Async counterpart of db_connection() backed by the async pool."""
+    async with get_async_db_pool().connection() as conn:
+        yield conn
+
+
+async def awarm_db_pools() -> None:
+    """
+    Open min_size connections in both pools at startup. No-op without
+    DATABASE_URL or psycopg; connect failures are left for lazy retries.
+    """
+    if not _database_url() or psycopg is None:
+        return
+    await asyncio.to_thread(get_db_pool().warm)
+    await get_async_db_pool().warm()
+
+
+def db_pool_stats() -> dict[str, dict[str, Any]]:
+    """Snapshot of pool counters (connections opened, checkouts, waits)."""
+    out: dict[str, dict[str, Any]] = {}
+    for name, pool in (("sync", _sync_pool), ("async", _async_pool)):
+        if pool is None:
+            continue
+        stats: PoolStats = pool.stats()
+        out[name] = {**stats.as_dict(), "size": pool.size, "idle": pool.idle_count, "max_size": pool.max_size}
+    return out
+
+
+def close_db_pools() -> None:
+    """Close the sync pool and the async pool; prefer aclose_db_pools() from inside the event loop."""
+    global _sync_pool, _async_pool
+    with _pool_lock:
+        pool, _sync_pool = _sync_pool, None
+        apool, _async_pool = _async_pool, None
+    if pool is not None:
+        pool.close()
+    if apool is not None:
+        with suppress(Exception):
+            apool.close_nowait()
+
+
+async def aclose_db_pools() -> None:
+    """Close both pools from within the event loop (app shutdown)."""
+    global _async_pool
+    with _pool_lock:
+        apool, _async_pool = _async_pool, None
+    if apool is not None:
+        with suppress(Exception):
+            await apool.close()
+    close_db_pools()
+
+
 def check_db_connection() -> tuple[bool, str | None]:
     """
     Deterministic, fail-closed database connectivity check.
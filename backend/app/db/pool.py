@@ -0,0 +1,575 @@
+"""
+Process-wide Postgres connection pools (sync + async).
+
+Request-path DB touches (WAF limiter, quotas, session recording, invocation
+logs) borrow connections from a bounded pool instead of paying a full
+connect handshake per call. Pools are fail-closed: when a connection cannot
+be obtained within the wait budget a PoolTimeoutError is raised and callers
+fall back exactly as they did when psycopg.connect failed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Iterator, Optional, Tuple
+
+try:
+    import psycopg
+except ImportError:  # pragma: no cover
+    psycopg = None  # type: ignore
+
+try:
+    from backend.app.observability.metrics import counter, histogram
+except Exception:  # pragma: no cover - metrics are best effort
+    counter = None  # type: ignore[assignment]
+    histogram = None  # type: ignore[assignment]
+
+
+POOL_MIN_SIZE_DEFAULT = 1
+POOL_MAX_SIZE_DEFAULT = 10
+POOL_WAIT_TIMEOUT_S_DEFAULT = 2.0
+POOL_HEALTH_CHECK_IDLE_S_DEFAULT = 30.0
+POOL_MAX_IDLE_S_DEFAULT = 300.0
+
+# Waits shorter than this are not worth a metric line.
+_WAIT_METRIC_FLOOR_MS = 1.0
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no pooled connection became available within the wait budget."""
+
+
+class PoolClosedError(Exception):
+    """Raised when borrowing from a pool that has been closed."""
+
+
+@dataclass
+class PoolStats:
+    connections_opened: int = 0
+    connections_closed: int = 0
+    connect_failures: int = 0
+    checkouts: int = 0
+    waits: int = 0
+    wait_timeouts: int = 0
+    wait_ms_total: float = 0.0
+    wait_ms_max: float = 0.0
+    health_checks: int = 0
+    health_check_failures: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _emit_counter(name: str, value: int = 1) -> None:
+    try:
+        if counter:
+            counter(name, value)
+    except Exception:
+        return
+
+
+def _emit_wait(wait_ms: float) -> None:
+    if wait_ms < _WAIT_METRIC_FLOOR_MS:
+        return
+    try:
+        if histogram:
+            histogram("db_pool_wait_ms", wait_ms)
+    except Exception:
+        return
+
+
+def _is_broken(conn: Any) -> bool:
+    return bool(getattr(conn, "closed", False) or getattr(conn, "broken", False))
+
+
+def _in_transaction(conn: Any) -> bool:
+    info = getattr(conn, "info", None)
+    status = getattr(info, "transaction_status", None)
+    if status is None or psycopg is None:
+        return False
+    return status != psycopg.pq.TransactionStatus.IDLE
+
+
+def _safe_close(conn: Any) -> None:
+    try:
+        conn.close()
+    except Exception:
+        return
+
+
+class _PoolBase:
+    def __init__(
+        self,
+        *,
+        min_size: int,
+        max_size: int,
+        wait_timeout_s: float,
+        health_check_idle_s: float,
+        max_idle_s: float,
+    ) -> None:
+        self.max_size = max(1, int(max_size))
+        self.min_size = max(0, min(int(min_size), self.max_size))
+        self.wait_timeout_s = max(0.0, float(wait_timeout_s))
+        self.health_check_idle_s = max(0.0, float(health_check_idle_s))
+        self.max_idle_s = max(0.0, float(max_idle_s))
+        self._idle: Deque[Tuple[Any, float]] = deque()
+        self._size = 0
+        self._closed = False
+        self._stats = PoolStats()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def stats(self) -> PoolStats:
+        return PoolStats(**self._stats.as_dict())
+
+    def _record_wait(self, wait_ms: float, waited: bool) -> None:
+        self._stats.checkouts += 1
+        if waited:
+            self._stats.waits += 1
+            self._stats.wait_ms_total += wait_ms
+            self._stats.wait_ms_max = max(self._stats.wait_ms_max, wait_ms)
+
+    def _pop_idle(self, now: float) -> Tuple[Optional[Any], bool, list]:
+        """Pop the most recently used idle connection; returns (conn, needs_check, expired)."""
+        expired = []
+        while self._idle:
+            conn, released_at = self._idle.pop()
+            idle_for = now - released_at
+            if _is_broken(conn) or (self.max_idle_s and idle_for > self.max_idle_s and self._size > self.min_size):
+                expired.append(conn)
+                self._size -= 1
+                continue
+            return conn, idle_for >= self.health_check_idle_s, expired
+        return None, False, expired
+
+
+class ConnectionPool(_PoolBase):
+    """Bounded, thread-safe pool of synchronous psycopg connections."""
+
+    def __init__(
+        self,
+        conninfo: str = "",
+        *,
+        min_size: int = POOL_MIN_SIZE_DEFAULT,
+        max_size: int = POOL_MAX_SIZE_DEFAULT,
+        connect_timeout: float = 3,
+        wait_timeout_s: float = POOL_WAIT_TIMEOUT_S_DEFAULT,
+        health_check_idle_s: float = POOL_HEALTH_CHECK_IDLE_S_DEFAULT,
+        max_idle_s: float = POOL_MAX_IDLE_S_DEFAULT,
+        connect_fn: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        super().__init__(
+            min_size=min_size,
+            max_size=max_size,
+            wait_timeout_s=wait_timeout_s,
+            health_check_idle_s=health_check_idle_s,
+            max_idle_s=max_idle_s,
+        )
+        self.conninfo = conninfo
+        self.connect_timeout = connect_timeout
+        self._connect_fn = connect_fn
+        self._cond = threading.Condition()
+
+    def _connect(self) -> Any:
+        try:
+            if self._connect_fn is not None:
+                conn = self._connect_fn()
+            else:
+                if psycopg is None:
+                    raise ModuleNotFoundError("psycopg not installed")
+                conn = psycopg.connect(self.conninfo, connect_timeout=self.connect_timeout)
+        except Exception:
+            with self._cond:
+                self._stats.connect_failures += 1
+            _emit_counter("db_pool_connect_failures")
+            raise
+        with self._cond:
+            self._stats.connections_opened += 1
+        return conn
+
+    def _health_check(self, conn: Any) -> bool:
+        with self._cond:
+            self._stats.health_checks += 1
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1;")
+                cur.fetchone()
+            if _in_transaction(conn):
+                conn.rollback()
+            return True
+        except Exception:
+            with self._cond:
+                self._stats.health_check_failures += 1
+            return False
+
+    def _discard(self, conn: Any) -> None:
+        _safe_close(conn)
+        with self._cond:
+            self._stats.connections_closed += 1
+
+    def warm(self) -> None:
+        """Open connections up to min_size; failures are left for lazy retries."""
+        while True:
+            with self._cond:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                conn = self._connect()
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                return
+            self.putconn(conn)
+
+    def getconn(self, timeout: Optional[float] = None) -> Any:
+        wait_budget = self.wait_timeout_s if timeout is None else max(0.0, float(timeout))
+        started = time.monotonic()
+        deadline = started + wait_budget
+        waited = False
+        while True:
+            expired: list = []
+            with self._cond:
+                if self._closed:
+                    raise PoolClosedError("connection pool is closed")
+                conn, needs_check, expired = self._pop_idle(time.monotonic())
+                reserve = False
+                if conn is None:
+                    if self._size < self.max_size:
+                        self._size += 1
+                        reserve = True
+                    else:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self._stats.wait_timeouts += 1
+                            _emit_counter("db_pool_wait_timeouts")
+                            raise PoolTimeoutError("timed out waiting for a pooled connection")
+                        waited = True
+                        self._cond.wait(remaining)
+                        continue
+                wait_ms = (time.monotonic() - started) * 1000.0
+            for stale in expired:
+                self._discard(stale)
+            if reserve:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+            elif needs_check and not self._health_check(conn):
+                self._discard(conn)
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                continue
+            with self._cond:
+                self._record_wait(wait_ms, waited)
+            if waited:
+                _emit_wait(wait_ms)
+            return conn
+
+    def putconn(self, conn: Any, *, discard: bool = False) -> None:
+        if not discard and not _is_broken(conn) and _in_transaction(conn):
+            try:
+                conn.rollback()
+            except Exception:
+                discard = True
+        with self._cond:
+            if discard or self._closed or _is_broken(conn):
+                self._size = max(0, self._size - 1)
+                self._cond.notify()
+                keep = False
+            else:
+                self._idle.append((conn, time.monotonic()))
+                self._cond.notify()
+                keep = True
+        if not keep:
+            self._discard(conn)
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """
+        Borrow a connection with psycopg `with conn:` semantics:
+        commit on clean exit, rollback on error, then return to the pool.
+        """
+        conn = self.getconn(timeout)
+        discard = False
+        try:
+            yield conn
+            if not _is_broken(conn):
+                conn.commit()
+        except BaseException:
+            try:
+                conn.rollback()
+            except Exception:
+                discard = True
+            raise
+        finally:
+            self.putconn(conn, discard=discard)
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            idle = [conn for conn, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for conn in idle:
+            self._discard(conn)
+
+
+class AsyncConnectionPool(_PoolBase):
+    """Bounded pool of psycopg AsyncConnections for use from a single event loop."""
+
+    def __init__(
+        self,
+        conninfo: str = "",
+        *,
+        min_size: int = POOL_MIN_SIZE_DEFAULT,
+        max_size: int = POOL_MAX_SIZE_DEFAULT,
+        connect_timeout: float = 3,
+        wait_timeout_s: float = POOL_WAIT_TIMEOUT_S_DEFAULT,
+        health_check_idle_s: float = POOL_HEALTH_CHECK_IDLE_S_DEFAULT,
+        max_idle_s: float = POOL_MAX_IDLE_S_DEFAULT,
+        connect_fn: Optional[Callable[[], Awaitable[Any]]] = None,
+    ) -> None:
+        super().__init__(
+            min_size=min_size,
+            max_size=max_size,
+            wait_timeout_s=wait_timeout_s,
+            health_check_idle_s=health_check_idle_s,
+            max_idle_s=max_idle_s,
+        )
+        self.conninfo = conninfo
+        self.connect_timeout = connect_timeout
+        self._connect_fn = connect_fn
+        self._cond: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._close_tasks: set = set()
+
+    def _condition(self) -> Tuple[asyncio.Condition, list]:
+        """Return the condition for the running loop plus idle connections orphaned by a previous loop."""
+        loop = asyncio.get_running_loop()
+        stale: list = []
+        if self._cond is None or self._loop is not loop:
+            # Connections are bound to the loop that created them.
+            stale = [conn for conn, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(stale)
+            self._cond = asyncio.Condition()
+            self._loop = loop
+        return self._cond, stale
+
+    async def _connect(self) -> Any:
+        try:
+            if self._connect_fn is not None:
+                conn = await self._connect_fn()
+            else:
+                if psycopg is None:
+                    raise ModuleNotFoundError("psycopg not installed")
+                conn = await psycopg.AsyncConnection.connect(self.conninfo, connect_timeout=self.connect_timeout)
+        except Exception:
+            self._stats.connect_failures += 1
+            _emit_counter("db_pool_connect_failures")
+            raise
+        self._stats.connections_opened += 1
+        return conn
+
+    async def _health_check(self, conn: Any) -> bool:
+        self._stats.health_checks += 1
+        try:
+            async with conn.cursor() as cur:
+                await cur.execute("SELECT 1;")
+                await cur.fetchone()
+            if _in_transaction(conn):
+                await conn.rollback()
+            return True
+        except Exception:
+            self._stats.health_check_failures += 1
+            return False
+
+    async def _discard(self, conn: Any) -> None:
+        try:
+            await conn.close()
+        except Exception:
+            pass
+        self._stats.connections_closed += 1
+
+    async def warm(self) -> None:
+        """Open connections up to min_size on the running loop; failures are left for lazy retries."""
+        cond, orphans = self._condition()
+        await self._discard_all(orphans)
+        while True:
+            async with cond:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                conn = await self._connect()
+            except Exception:
+                async with cond:
+                    self._size -= 1
+                    cond.notify()
+                return
+            await self.putconn(conn)
+
+    async def _discard_all(self, conns: list) -> None:
+        for conn in conns:
+            await self._discard(conn)
+
+    async def getconn(self, timeout: Optional[float] = None) -> Any:
+        cond, orphans = self._condition()
+        await self._discard_all(orphans)
+        wait_budget = self.wait_timeout_s if timeout is None else max(0.0, float(timeout))
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + wait_budget
+        waited = False
+        while True:
+            async with cond:
+                if self._closed:
+                    raise PoolClosedError("connection pool is closed")
+                conn, needs_check, expired = self._pop_idle(time.monotonic())
+                reserve = False
+                if conn is None:
+                    if self._size < self.max_size:
+                        self._size += 1
+                        reserve = True
+                    else:
+                        remaining = deadline - loop.time()
+                        if remaining <= 0:
+                            self._stats.wait_timeouts += 1
+                            _emit_counter("db_pool_wait_timeouts")
+                            raise PoolTimeoutError("timed out waiting for a pooled connection")
+                        waited = True
+                        try:
+                            await asyncio.wait_for(cond.wait(), remaining)
+                        except asyncio.TimeoutError:
+                            pass
+                        continue
+            for stale in expired:
+                await self._discard(stale)
+            if reserve:
+                try:
+                    conn = await self._connect()
+                except Exception:
+                    async with cond:
+                        self._size -= 1
+                        cond.notify()
+                    raise
+            elif needs_check and not await self._health_check(conn):
+                await self._discard(conn)
+                async with cond:
+                    self._size -= 1
+                    cond.notify()
+                continue
+            wait_ms = (loop.time() - started) * 1000.0
+            self._record_wait(wait_ms, waited)
+            if waited:
+                _emit_wait(wait_ms)
+            return conn
+
+    async def putconn(self, conn: Any, *, discard: bool = False) -> None:
+        cond, orphans = self._condition()
+        await self._discard_all(orphans)
+        if not discard and not _is_broken(conn) and _in_transaction(conn):
+            try:
+                await conn.rollback()
+            except Exception:
+                discard = True
+        async with cond:
+            if discard or self._closed or _is_broken(conn):
+                self._size = max(0, self._size - 1)
+                keep = False
+            else:
+                self._idle.append((conn, time.monotonic()))
+                keep = True
+            cond.notify()
+        if not keep:
+            await self._discard(conn)
+
+    @asynccontextmanager
+    async def connection(self, timeout: Optional[float] = None) -> AsyncIterator[Any]:
+        conn = await self.getconn(timeout)
+        discard = False
+        try:
+            yield conn
+            if not _is_broken(conn):
+                await conn.commit()
+        except BaseException:
+            try:
+                await conn.rollback()
+            except Exception:
+                discard = True
+            raise
+        finally:
+            await self.putconn(conn, discard=discard)
+
+    async def close(self) -> None:
+        self._closed = True
+        idle = [conn for conn, _ in self._idle]
+        self._idle.clear()
+        self._size -= len(idle)
+        if self._cond is not None and self._loop is asyncio.get_running_loop():
+            async with self._cond:
+                self._cond.notify_all()
+        await self._discard_all(idle)
+
+    def close_nowait(self) -> None:
+        """
+        Close the pool from synchronous code. Idle connections are closed on
+        the running loop, on the pool's own loop if it is still running in
+        another thread, or in a short-lived loop otherwise.
+        """
+        self._closed = True
+        idle = [conn for conn, _ in self._idle]
+        self._idle.clear()
+        self._size -= len(idle)
+        if not idle:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is not None:
+            task = running.create_task(self._discard_all(idle))
+            self._close_tasks.add(task)
+            task.add_done_callback(self._close_tasks.discard)
+            return
+        owner = self._loop
+        if owner is not None and owner.is_running() and not owner.is_closed():
+            asyncio.run_coroutine_threadsafe(self._discard_all(idle), owner)
+            return
+        asyncio.run(self._discard_all(idle))
+
+
+__all__ = [
+    "AsyncConnectionPool",
+    "ConnectionPool",
+    "PoolClosedError",
+    "PoolStats",
+    "PoolTimeoutError",
+    "POOL_MIN_SIZE_DEFAULT",
+    "POOL_MAX_SIZE_DEFAULT",
+    "POOL_WAIT_TIMEOUT_S_DEFAULT",
+    "POOL_HEALTH_CHECK_IDLE_S_DEFAULT",
+    "POOL_MAX_IDLE_S_DEFAULT",
+]
@@ -15,7 +15,12 @@ from backend.app.deepthink.router import Plan, StopReason
 from backend.app.deepthink.schema import PatchOp, DecisionDelta
 from backend.app.deepthink.validator import validate_delta
 from backend.app.deepthink.patch import apply_delta, PatchError
-from backend.app.deepthink.telemetry import compute_decision_signature, build_telemetry_event
+from backend.app.deepthink.scheduler import PassAccess, PassScheduler
+from backend.app.deepthink.telemetry import (
+    build_telemetry_event,
+    compute_decision_signature,
+    encode_deltas_structure,
+)
 
 
 # Stop priority order (fixed, deterministic)
@@ -97,6 +102,8 @@ class EngineInput:
     plan: Plan  # From router
     context: EngineContext
     pass_runner: Callable[[str, Dict[str, Any], EngineContext], PassRunResult]
+    max_parallel: int = 1  # >1: speculative parallel passes (see scheduler.py)
+    pass_access: Optional[Dict[str, PassAccess]] = None  # Defaults to scheduler.PASS_ACCESS
 
 
 @dataclass
@@ -157,6 +164,14 @@ def run_engine(engine_input: EngineInput) -> EngineOutput:
     passes_executed = 0
     start_time_ms = context.now_ms()
     applied_deltas: List[DecisionDelta] = []  # Track applied deltas for signature
+    applied_structure: List[Dict[str, Any]] = []  # Signature encoding, built per pass
+    scheduler = PassScheduler(
+        pass_plan=plan.pass_plan,
+        pass_runner=pass_runner,
+        context=context,
+        max_parallel=engine_input.max_parallel,
+        pass_access=engine_input.pass_access,
+    )
     
     # Execute passes in order
     for pass_idx, pass_type in enumerate(plan.pass_plan):
@@ -181,6 +196,7 @@ def run_engine(engine_input: EngineInput) -> EngineOutput:
                 request_signature=engine_input.request_signature,
                 plan=plan,
                 applied_deltas=applied_deltas,
+                applied_structure=applied_structure,
                 context=context,
             )
         
@@ -190,7 +206,7 @@ def run_engine(engine_input: EngineInput) -> EngineOutput:
         
         # Execute pass
         try:
-            pass_result = pass_runner(pass_type, current_state, context)
+            pass_result = scheduler.run(pass_idx, current_state)
         except Exception as e:
             # Pass runner failed -> internal inconsistency
             pass_summaries.append(PassSummary(
@@ -262,6 +278,7 @@ def run_engine(engine_input: EngineInput) -> EngineOutput:
                 current_state = apply_delta(current_state, pass_result.delta)
                 patch_applied = True
                 applied_deltas.extend(pass_result.delta)  # Track for signature
+                applied_structure.extend(encode_deltas_structure(pass_result.delta))
             except PatchError as e:
                 # Patch application failed -> treat as validation strike
                 validator_strikes += 1
@@ -310,6 +327,7 @@ def run_engine(engine_input: EngineInput) -> EngineOutput:
         request_signature=engine_input.request_signature,
         plan=plan,
         applied_deltas=applied_deltas,
+        applied_structure=applied_structure,
         context=context,
     )
 
@@ -409,6 +427,7 @@ def _finalize_output(
     plan: Plan,
     applied_deltas: List[DecisionDelta],
     context: EngineContext,
+    applied_structure: Optional[List[Dict[str, Any]]] = None,
 ) -> EngineOutput:
     """
     Create final output with safe decision signature (no user text).
@@ -420,6 +439,7 @@ def _finalize_output(
         pass_plan=plan.pass_plan,
         deltas=applied_deltas,
         meta={"validator_failures": validator_failures, "stop_reason": stop_reason},
+        deltas_structure=applied_structure,
     )
     
     # Build telemetry event
@@ -2,10 +2,14 @@
 Phase 17 Step 2: DecisionDelta Patch Applier
 
 Applies validated deltas to decision state with strict guardrails.
+
+States are persistent: apply_delta path-copies only the dicts on the patched
+paths (the root and "decision" for every allowlisted path) and shares all
+other branches with the input state. States must therefore be treated as
+immutable once built; nothing in the engine or the passes mutates them.
 """
 
-from typing import Any, Dict
-from copy import deepcopy
+from typing import Any, Dict, Set
 
 from backend.app.deepthink.schema import (
     PatchOp,
@@ -30,7 +34,8 @@ def apply_delta(state: Dict[str, Any], delta: DecisionDelta) -> Dict[str, Any]:
         delta: List of PatchOp to apply
     
     Returns:
-        New state with patches applied (original state unchanged)
+        New state with patches applied (original state unchanged; untouched
+        branches are shared with it)
     
     Raises:
         PatchError: If any guardrail is violated
@@ -42,8 +47,9 @@ def apply_delta(state: Dict[str, Any], delta: DecisionDelta) -> Dict[str, Any]:
         - Type and bounds checked
         - Deterministic application order (sorted by path)
     """
-    # Deep copy to avoid mutating original
-    new_state = deepcopy(state)
+    # Path-copy: the root now, each parent dict on first write below
+    new_state = dict(state)
+    copied: Set[str] = set()
     
     # Sort ops by path for deterministic ordering
     sorted_ops = sorted(delta, key=lambda op: op.path)
@@ -67,25 +73,39 @@ def apply_delta(state: Dict[str, Any], delta: DecisionDelta) -> Dict[str, Any]:
             _validate_value_for_apply(op.path, op.value, spec)
         
         # Apply the patch
-        _set_nested_value(new_state, op.path, op.value)
+        _set_nested_value(new_state, op.path, op.value, copied)
     
     return new_state
 
 
-def _set_nested_value(state: Dict[str, Any], path: str, value: Any) -> None:
+def _set_nested_value(state: Dict[str, Any], path: str, value: Any, copied: Set[str]) -> None:
     """
     Set a nested value in state dict using dot-notation path.
     
     Example: path="decision.action" sets state["decision"]["action"] = value
+    
+    Parent dicts are copied the first time a path through them is written
+    (tracked in `copied` by path prefix), so the caller's input is never
+    mutated and siblings stay shared.
     """
     parts = path.split(".")
     current = state
+    prefix = ""
     
-    # Navigate to parent
+    # Navigate to parent, copying each dict on the way
     for part in parts[:-1]:
-        if part not in current:
-            current[part] = {}
-        current = current[part]
+        prefix = f"{prefix}.{part}" if prefix else part
+        child = current.get(part)
+        if prefix not in copied:
+            if child is None:
+                child = {}
+            elif isinstance(child, dict):
+                child = dict(child)
+            else:
+                raise PatchError(f"Path '{path}' crosses non-object value at '{prefix}'")
+            current[part] = child
+            copied.add(prefix)
+        current = child
     
     # Set the final value
     current[parts[-1]] = value
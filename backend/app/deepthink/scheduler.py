@@ -0,0 +1,151 @@
+"""
+Phase 17: Parallel Pass Scheduling
+
+Runs deepthink passes speculatively in parallel while keeping the engine's
+serial semantics: the engine still checks stop conditions, validates and
+applies deltas one pass at a time in plan order.
+
+- Every pass type declares the state paths it reads (PASS_ACCESS). Passes
+  without a declaration always run serially.
+- When pass i is due and has no speculative result, the scheduler starts a
+  wave: pass i plus the following declared passes (up to max_parallel), all
+  against the current state, on a thread pool.
+- When a later pass of the wave comes due, its result is used only if none
+  of its declared reads changed since the wave started (earlier passes
+  emitted no delta, or set the same values). Otherwise it is re-run serially
+  on the current state.
+
+So outputs and decision signatures are identical to serial mode, provided
+each runner is a function of its declared reads and of the immutable parts
+of the context (request_signature). Runners in a wave see the budget as of
+the wave start and must not depend on it. Latency approaches the slowest
+pass of a wave when passes do not invalidate each other.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+# Decision fields every built-in pass inspects before emitting its delta
+_DECISION_READS = frozenset([
+    "request_text",
+    "decision.action",
+    "decision.answer",
+    "decision.rationale",
+    "decision.clarify_question",
+])
+
+
+@dataclass(frozen=True)
+class PassAccess:
+    """
+    Declared state access for a pass type (dot-notation paths).
+    """
+    reads: FrozenSet[str]
+
+
+# Declared access for built-in pass types (REFINE has no declaration: serial)
+PASS_ACCESS: Dict[str, PassAccess] = {
+    "COUNTERARG": PassAccess(reads=_DECISION_READS),
+    "STRESS_TEST": PassAccess(reads=_DECISION_READS),
+    "ALTERNATIVES": PassAccess(reads=_DECISION_READS),
+    "REGRET": PassAccess(reads=_DECISION_READS),
+}
+
+# Shared by all engine runs; a wave never uses more than max_parallel of it
+PASS_POOL_MAX_WORKERS = 8
+
+_MISSING = object()
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=PASS_POOL_MAX_WORKERS, thread_name_prefix="deepthink-pass")
+    return _executor
+
+
+def read_paths(state: Dict[str, Any], paths: FrozenSet[str]) -> Tuple[Any, ...]:
+    """
+    Values at each path (sorted order); missing paths read as a sentinel.
+    """
+    values = []
+    for path in sorted(paths):
+        current: Any = state
+        for part in path.split("."):
+            if not isinstance(current, dict) or part not in current:
+                current = _MISSING
+                break
+            current = current[part]
+        values.append(current)
+    return tuple(values)
+
+
+@dataclass
+class _Speculation:
+    future: "Future[Any]"
+    base_state: Dict[str, Any]
+    reads: FrozenSet[str]
+    base_values: Tuple[Any, ...]
+
+
+class PassScheduler:
+    """
+    Hands the engine one pass result at a time, in plan order.
+
+    max_parallel <= 1 is plain serial execution (no threads). Speculative
+    results the engine never asks for (early stop) are simply dropped.
+    """
+
+    def __init__(
+        self,
+        pass_plan: List[str],
+        pass_runner: Callable[[str, Dict[str, Any], Any], Any],
+        context: Any,
+        max_parallel: int = 1,
+        pass_access: Optional[Dict[str, PassAccess]] = None,
+    ) -> None:
+        self._plan = list(pass_plan)
+        self._runner = pass_runner
+        self._context = context
+        self._max_parallel = min(max(1, int(max_parallel)), PASS_POOL_MAX_WORKERS)
+        self._access = PASS_ACCESS if pass_access is None else pass_access
+        self._pending: Dict[int, _Speculation] = {}
+        self.speculative_hits = 0
+        self.speculative_misses = 0
+
+    def run(self, pass_idx: int, state: Dict[str, Any]) -> Any:
+        """
+        Result of pass pass_idx on `state`; raises whatever the runner raised.
+        """
+        pass_type = self._plan[pass_idx]
+        speculation = self._pending.pop(pass_idx, None)
+        if speculation is not None:
+            if speculation.base_state is state or speculation.base_values == read_paths(state, speculation.reads):
+                self.speculative_hits += 1
+                return speculation.future.result()
+            self.speculative_misses += 1
+            speculation.future.cancel()
+        elif self._max_parallel > 1 and pass_type in self._access:
+            # Later passes of the wave start on the pool; this one runs inline
+            self._start_wave(pass_idx, state)
+        return self._runner(pass_type, state, self._context)
+
+    def _start_wave(self, first_idx: int, state: Dict[str, Any]) -> None:
+        end = min(first_idx + self._max_parallel, len(self._plan))
+        for idx in range(first_idx + 1, end):
+            pass_type = self._plan[idx]
+            access = self._access.get(pass_type)
+            if access is None:
+                break
+            self._pending[idx] = _Speculation(
+                future=_get_executor().submit(self._runner, pass_type, state, self._context),
+                base_state=state,
+                reads=access.reads,
+                base_values=read_paths(state, access.reads),
+            )
@@ -8,8 +8,8 @@ Non-agentic, deterministic, privacy-preserving.
 """
 
 from typing import Dict, Any, List, Optional
-import hashlib
-import json
+
+from backend.app.perf.canonical import canonical_sha256
 
 
 # Forbidden keys that contain user/assistant text (must be redacted)
@@ -34,6 +34,7 @@ def compute_decision_signature(
     pass_plan: List[str],
     deltas: List[Any],
     meta: Optional[Dict[str, Any]] = None,
+    deltas_structure: Optional[List[Dict[str, Any]]] = None,
 ) -> str:
     """
     Compute deterministic decision signature with NO user text.
@@ -43,6 +44,9 @@ def compute_decision_signature(
         pass_plan: List of pass type strings
         deltas: List of PatchOp objects (will extract structure only)
         meta: Optional metadata (validator_failures, stop_reason)
+        deltas_structure: Optional pre-encoded structure of deltas (from
+            encode_deltas_structure, accumulated as deltas are applied);
+            used instead of re-encoding `deltas`
     
     Returns:
         SHA256 hex digest (64 chars)
@@ -56,7 +60,7 @@ def compute_decision_signature(
     sig_data = {
         "stable_inputs": _sanitize_stable_inputs(stable_inputs),
         "pass_plan": pass_plan,
-        "deltas_structure": _encode_deltas_structure(deltas),
+        "deltas_structure": deltas_structure if deltas_structure is not None else _encode_deltas_structure(deltas),
     }
     
     # Add safe meta fields if provided
@@ -67,10 +71,7 @@ def compute_decision_signature(
             sig_data["stop_reason"] = meta["stop_reason"]
     
     # Canonical JSON serialization
-    sig_json = json.dumps(sig_data, sort_keys=True, separators=(',', ':'), ensure_ascii=True)
-    sig_hash = hashlib.sha256(sig_json.encode('utf-8')).hexdigest()
-    
-    return sig_hash
+    return canonical_sha256(sig_data)
 
 
 def build_telemetry_event(
@@ -197,6 +198,11 @@ def _encode_deltas_structure(deltas: List[Any]) -> List[Dict[str, Any]]:
     return encoded
 
 
+def encode_deltas_structure(deltas: List[Any]) -> List[Dict[str, Any]]:
+    """Structure-only encoding of deltas, as used in the decision signature."""
+    return _encode_deltas_structure(deltas)
+
+
 def _encode_value_metadata(value: Any) -> Dict[str, Any]:
     """
     Encode value as metadata (type, length, count) but NOT content.
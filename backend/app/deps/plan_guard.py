@@ -5,6 +5,7 @@ from typing import Optional
 from fastapi.responses import JSONResponse
 
 from backend.app.auth.identity import IdentityContext
+from backend.app.observability.metrics import counter
 from backend.app.plans.policy import Plan, PlanLimits, get_plan_limits, resolve_plan
 from backend.app.plans.quota import check_request_limit, check_token_budget, increment_usage
 from backend.app.plans.tokens import estimate_tokens_from_text, estimate_total_tokens
@@ -20,6 +21,7 @@ def _error_payload(
     used: int,
     reset_at: Optional[str],
 ) -> JSONResponse:
+    counter("quota_decisions", 1, {"plan": plan.value, "decision": error_code})
     body = {
         "status": "error",
         "error_code": error_code,
@@ -101,6 +103,7 @@ def precheck_plan_and_quotas(user_text: str, identity: IdentityContext) -> tuple
             budget_estimate,
         )
 
+    counter("quota_decisions", 1, {"plan": plan.value, "decision": "allowed"})
     return plan, limits, None, input_tokens, budget_estimate
 
 
@@ -21,8 +21,16 @@ from .policy_engine import (
     decide_policy,
 )
 
+from .policy_cache import (
+    PolicyDecisionCache,
+    get_policy_cache,
+    invalidate_policy_cache,
+    policy_request_scope,
+)
+
 from .audit import (
     AuditEvent,
+    AuditCheckpoint,
     AuditLog,
     AuditOperationType,
     AuditDecision,
@@ -47,6 +55,8 @@ from .export import (
     ExportOutcome,
     ExportReasonCode,
     build_export_bundle,
+    ExportStream,
+    build_export_stream,
     EXPORT_VERSION,
 )
 
@@ -85,7 +95,12 @@ __all__ = [
     "LoggingLevel",
     "EnvMode",
     "decide_policy",
+    "PolicyDecisionCache",
+    "get_policy_cache",
+    "invalidate_policy_cache",
+    "policy_request_scope",
     "AuditEvent",
+    "AuditCheckpoint",
     "AuditLog",
     "AuditOperationType",
     "AuditDecision",
@@ -104,6 +119,8 @@ __all__ = [
     "ExportOutcome",
     "ExportReasonCode",
     "build_export_bundle",
+    "ExportStream",
+    "build_export_stream",
     "EXPORT_VERSION",
     "Role",
     "AdminOperation",
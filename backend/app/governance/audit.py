@@ -5,14 +5,16 @@ Implements compliance-grade audit trail without content leakage.
 All events are structure-only, deterministically signed, and append-only.
 """
 
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, List, Dict, Any, Tuple
-import json
+from typing import Optional, List, Dict, Any, Sequence, Tuple
 import hashlib
 import re
 from copy import deepcopy
 
+from backend.app.perf.canonical import canonical_dumps, canonical_sha256
+
 
 # ============================================================================
 # CONSTANTS
@@ -33,6 +35,10 @@ SAFE_INT_MAX = 2**31 - 1
 # Time bucket size (1 minute)
 DEFAULT_TS_BUCKET_MS = 60_000
 
+# Verified checkpoint every N events; parallel verification segment count
+AUDIT_CHECKPOINT_INTERVAL = 1024
+AUDIT_VERIFY_SEGMENTS = 4
+
 # Forbidden keys (case-insensitive patterns)
 FORBIDDEN_KEY_PATTERNS = frozenset([
     "user", "prompt", "message", "text", "content", "body", "snippet", "excerpt",
@@ -117,6 +123,13 @@ class AuditEvent:
         }
 
 
+@dataclass(frozen=True)
+class AuditCheckpoint:
+    """Index and signature of an event whose chain prefix was verified."""
+    index: int
+    signature: str
+
+
 # ============================================================================
 # SANITIZATION AND REDACTION
 # ============================================================================
@@ -320,8 +333,7 @@ def _sort_dict_recursively(obj: Any) -> Any:
 
 def canonical_json(obj: Any) -> str:
     """Create canonical JSON representation."""
-    sorted_obj = _sort_dict_recursively(obj)
-    return json.dumps(sorted_obj, sort_keys=True, separators=(',', ':'))
+    return canonical_dumps(obj)
 
 
 def compute_tenant_ref(tenant_id: str) -> str:
@@ -358,8 +370,7 @@ def compute_signature_and_id(core_pack: Dict[str, Any]) -> Tuple[str, str]:
     Compute deterministic signature and event ID.
     Returns: (signature, event_id)
     """
-    canonical_core = canonical_json(core_pack)
-    core_hash = hashlib.sha256(canonical_core.encode('utf-8')).hexdigest()
+    core_hash = canonical_sha256(core_pack)
     
     # Chain-aware signature
     prev_sig = core_pack.get("prev_sig", "")
@@ -377,11 +388,46 @@ def compute_signature_and_id(core_pack: Dict[str, Any]) -> Tuple[str, str]:
 # APPEND-ONLY LOG STORE
 # ============================================================================
 
+def _event_is_valid(event: AuditEvent, expected_prev_sig: str) -> bool:
+    """Check one event's link and recompute its signature and ID."""
+    if event.prev_sig != expected_prev_sig:
+        return False
+    core_pack = create_event_core_pack(
+        event.event_version, event.ts_bucket_ms, event.tenant_ref,
+        event.operation, event.decision, event.reason,
+        event.struct_meta, event.prev_sig
+    )
+    expected_signature, expected_event_id = compute_signature_and_id(core_pack)
+    return event.signature == expected_signature and event.event_id == expected_event_id
+
+
+def _verify_segment(events: Sequence[AuditEvent], offset: int, expected_prev_sig: str) -> Optional[int]:
+    """
+    Verify a contiguous run of events starting at absolute index `offset`.
+    Returns the first bad absolute index, or None.
+    """
+    for i, event in enumerate(events):
+        if not _event_is_valid(event, expected_prev_sig):
+            return offset + i
+        expected_prev_sig = event.signature
+    return None
+
+
 class AuditLog:
-    """Append-only audit log with chain verification."""
+    """
+    Append-only audit log with chain verification.
+
+    verify_chain() is incremental: it records a verified checkpoint
+    (index + signature) every checkpoint_interval events and at the last
+    verified event, and later calls only verify events after that point.
+    Checkpoints trust that already-verified events are never rewritten (the
+    store is append-only); verify_chain(full=True) re-verifies from index 0.
+    """
     
-    def __init__(self):
+    def __init__(self, checkpoint_interval: int = AUDIT_CHECKPOINT_INTERVAL):
         self._events: List[AuditEvent] = []
+        self._checkpoint_interval = max(1, int(checkpoint_interval))
+        self._checkpoints: List[AuditCheckpoint] = []
     
     def append(self, event: AuditEvent) -> int:
         """Append event and return index."""
@@ -398,7 +444,11 @@ class AuditLog:
             return ""
         return self._events[-1].signature
     
-    def verify_chain(self) -> Tuple[bool, Optional[int]]:
+    def checkpoints(self) -> List[AuditCheckpoint]:
+        """Return copy of verified checkpoints (ascending index)."""
+        return list(self._checkpoints)
+    
+    def verify_chain(self, full: bool = False) -> Tuple[bool, Optional[int]]:
         """
         Verify signature chain integrity.
         Returns: (ok, first_bad_index)
@@ -406,33 +456,93 @@ class AuditLog:
         if not self._events:
             return True, None
         
-        expected_prev_sig = ""
+        start, expected_prev_sig = 0, ""
+        if not full and self._checkpoints:
+            tip = self._checkpoints[-1]
+            # A checkpoint only anchors the chain if its event is still in place
+            if tip.index < len(self._events) and self._events[tip.index].signature == tip.signature:
+                start, expected_prev_sig = tip.index + 1, tip.signature
+        if full or start == 0:
+            self._checkpoints = []
         
-        for i, event in enumerate(self._events):
-            # Check prev_sig matches expected
-            if event.prev_sig != expected_prev_sig:
-                return False, i
-            
-            # Recompute signature
-            core_pack = create_event_core_pack(
-                event.event_version, event.ts_bucket_ms, event.tenant_ref,
-                event.operation, event.decision, event.reason,
-                event.struct_meta, event.prev_sig
-            )
-            
-            expected_signature, expected_event_id = compute_signature_and_id(core_pack)
-            
-            # Check signature matches
-            if event.signature != expected_signature:
-                return False, i
-            
-            # Check event_id matches
-            if event.event_id != expected_event_id:
-                return False, i
-            
-            expected_prev_sig = event.signature
+        bad_index = _verify_segment(self._events[start:], start, expected_prev_sig)
+        self._record_verified(start, len(self._events) if bad_index is None else bad_index)
+        return bad_index is None, bad_index
+    
+    def verify_range(self, start: int, end: Optional[int] = None) -> Tuple[bool, Optional[int]]:
+        """
+        Verify events[start:end] and their link to the stored signature of
+        events[start - 1]. Events before `start` are not re-verified.
+        Returns: (ok, first_bad_index)
+        """
+        start, end = self._clamp_range(start, end)
+        bad_index = _verify_segment(self._events[start:end], start, self._anchor(start))
+        return bad_index is None, bad_index
+    
+    def verify_parallel(
+        self,
+        start: int = 0,
+        end: Optional[int] = None,
+        segments: int = AUDIT_VERIFY_SEGMENTS,
+        executor: Optional[Executor] = None,
+    ) -> Tuple[bool, Optional[int]]:
+        """
+        Verify events[start:end] as independent segments in parallel.
+        
+        Each segment is anchored on the stored signature of the event before
+        it (its prev_sig boundary), which the previous segment verifies, so
+        the combined result equals a sequential pass. Uses a process pool
+        (one worker per segment) unless an executor is given.
+        Returns: (ok, first_bad_index)
+        """
+        start, end = self._clamp_range(start, end)
+        count = end - start
+        if count == 0:
+            return True, None
+        segments = max(1, min(int(segments), count))
+        size = -(-count // segments)
+        bounds = [(lo, min(lo + size, end)) for lo in range(start, end, size)]
         
-        return True, None
+        own_executor = executor is None
+        pool = executor or ProcessPoolExecutor(max_workers=len(bounds))
+        try:
+            futures = [
+                pool.submit(_verify_segment, self._events[lo:hi], lo, self._anchor(lo))
+                for lo, hi in bounds
+            ]
+            bad = [index for index in (f.result() for f in futures) if index is not None]
+        finally:
+            if own_executor:
+                pool.shutdown()
+        
+        bad_index = min(bad) if bad else None
+        if start == 0:
+            self._checkpoints = []
+            self._record_verified(0, end if bad_index is None else bad_index)
+        return bad_index is None, bad_index
+    
+    def _clamp_range(self, start: int, end: Optional[int]) -> Tuple[int, int]:
+        total = len(self._events)
+        end = total if end is None else max(0, min(int(end), total))
+        return max(0, min(int(start), end)), end
+    
+    def _anchor(self, index: int) -> str:
+        """Expected prev_sig of events[index]: the stored signature before it."""
+        return self._events[index - 1].signature if index > 0 else ""
+    
+    def _record_verified(self, start: int, end: int) -> None:
+        """Record checkpoints for verified events[start:end] (contiguous with the last one)."""
+        if end <= start:
+            return
+        interval = self._checkpoint_interval
+        first = -(-(start + 1) // interval) * interval - 1
+        if self._checkpoints and self._checkpoints[-1].index % interval != interval - 1:
+            # Replace the previous tip; periodic checkpoints are kept
+            self._checkpoints.pop()
+        for index in range(first, end, interval):
+            self._checkpoints.append(AuditCheckpoint(index, self._events[index].signature))
+        if not self._checkpoints or self._checkpoints[-1].index != end - 1:
+            self._checkpoints.append(AuditCheckpoint(end - 1, self._events[end - 1].signature))
     
     def recompute_signatures(self) -> List[AuditEvent]:
         """Recompute all signatures without mutating stored events."""
@@ -448,6 +558,12 @@ class AuditLog:
             
             signature, event_id = compute_signature_and_id(core_pack)
             
+            if (signature, event_id, prev_sig) == (event.signature, event.event_id, event.prev_sig):
+                # Already correct: reuse the stored (frozen) event instead of copying it
+                recomputed.append(event)
+                prev_sig = signature
+                continue
+            
             recomputed_event = AuditEvent(
                 event_id=event_id,
                 event_version=event.event_version,
@@ -7,15 +7,17 @@ All outputs are structure-only and deterministic.
 """
 
 import hashlib
-import json
 import re
 from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, Any, List, Optional, Union
 
+from backend.app.perf.canonical import canonical_sha256
+
 from .tenant import TenantConfig
 from .rbac import Role, AdminOperation, authorize_admin_action
 from .audit import AuditLog, AuditOperationType, AuditDecision, AuditReasonCode, record_audit_event
+from .policy_cache import invalidate_policy_cache, tenant_id_of
 
 
 # ============================================================================
@@ -120,11 +122,6 @@ def _compute_tenant_hash(tenant_id: str) -> str:
     return hash_obj.hexdigest()[:12]
 
 
-def _canonical_json(obj: Any) -> str:
-    """Generate canonical JSON string for signatures."""
-    return json.dumps(obj, sort_keys=True, separators=(',', ':'))
-
-
 def _compute_change_signature(decision_data: Dict[str, Any]) -> str:
     """Compute deterministic signature for change decision."""
     # Create signature pack without the signature field itself
@@ -136,9 +133,7 @@ def _compute_change_signature(decision_data: Dict[str, Any]) -> str:
         "audit_event_signature": decision_data.get("audit_event_signature"),
     }
     
-    canonical = _canonical_json(signature_pack)
-    hash_obj = hashlib.sha256(canonical.encode('utf-8'))
-    return hash_obj.hexdigest()
+    return canonical_sha256(signature_pack)
 
 
 def _parse_version(version: str) -> Optional[tuple]:
@@ -463,6 +458,10 @@ def apply_change_control(tenant_config: TenantConfig,
             "audit_event_signature": audit_event_signature,
         }
         
+        # New config version: cached policy decisions of this tenant are stale
+        for tenant_id in {tenant_id_of(tenant_config), change_req.tenant_id}:
+            invalidate_policy_cache(tenant_id)
+        
         return ChangeDecision(
             allow=True,
             reason=ChangeReason.OK,
@@ -8,12 +8,15 @@ text-free, deterministic, and versioned.
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Callable, Iterable, Iterator, Tuple
 import json
 import hashlib
 import re
+import zlib
 from copy import deepcopy
 
+from backend.app.perf.canonical import canonical_dumps, canonical_dumps_bytes, canonical_sha256
+
 # Import existing governance components
 from .tenant import TenantConfig, PlanTier, resolve_tenant_caps
 
@@ -34,6 +37,11 @@ MAX_STRING_LENGTH = 100
 MAX_LIST_LENGTH = 64
 MAX_DICT_KEYS = 64
 
+# Streaming export (NDJSON) bounds
+EXPORT_PAGE_SIZE = 500
+EXPORT_CHUNK_BYTES = 64 * 1024
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
 # Time constants
 HOUR_MS = 60 * 60 * 1000
 DEFAULT_BUCKET_MS = HOUR_MS
@@ -124,6 +132,20 @@ class ExportOutcome:
     telemetry: Dict[str, Any]
 
 
+@dataclass(frozen=True)
+class ExportStream:
+    """
+    Streaming export handle. `chunks` is None when the export was refused;
+    otherwise it yields NDJSON bytes (gzip-compressed when gzip is True).
+    """
+    ok: bool
+    reason_code: ExportReasonCode
+    chunks: Optional[Iterator[bytes]]
+    gzip: bool
+    tenant_hash: str
+    export_version: str
+
+
 # ============================================================================
 # SANITIZATION AND REDACTION
 # ============================================================================
@@ -351,21 +373,19 @@ def _sort_dict_recursively(obj: Any) -> Any:
 
 def canonical_json(obj: Any) -> str:
     """Create canonical JSON representation."""
-    sorted_obj = _sort_dict_recursively(obj)
-    return json.dumps(sorted_obj, sort_keys=True, separators=(',', ':'))
+    return canonical_dumps(obj)
 
 
 def canonical_json_bytes(obj: Any) -> bytes:
     """Create canonical JSON as bytes."""
-    return canonical_json(obj).encode('utf-8')
+    return canonical_dumps_bytes(obj)
 
 
 def compute_export_signature(bundle_struct: Dict[str, Any]) -> str:
     """Compute deterministic signature for export bundle."""
     # Exclude signature field itself
     bundle_for_signing = {k: v for k, v in bundle_struct.items() if k != "export_signature"}
-    canonical = canonical_json(bundle_for_signing)
-    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+    return canonical_sha256(bundle_for_signing)
 
 
 def compute_tenant_hash(tenant_id: str) -> str:
@@ -384,6 +404,68 @@ def compute_bucket_start(now_ms: int, bucket_ms: int = DEFAULT_BUCKET_MS) -> int
 # EXPORT BUILDER
 # ============================================================================
 
+def _policy_versions() -> Dict[str, str]:
+    """Policy versions recorded in every export."""
+    return {
+        "phase16": "UNKNOWN",
+        "phase18": "UNKNOWN",
+        "phase19": "UNKNOWN",
+        "phase20": "20.0.0"
+    }
+
+
+def _tenant_snapshot(tenant_config: TenantConfig, caps: Any) -> Dict[str, Any]:
+    """Structure-only tenant snapshot."""
+    return {
+        "plan": tenant_config.plan.value,
+        "regions": sorted(tenant_config.regions[:MAX_DOMAINS]),
+        "enabled_features": sorted([f.value for f in tenant_config.enabled_features]),
+        "resolved_caps": {
+            "allowed_tools": sorted([t.value for t in caps.allowed_tools]),
+            "deepthink_max_passes": caps.deepthink_max_passes,
+            "memory_ttl_cap": caps.memory_ttl_cap.value if hasattr(caps.memory_ttl_cap, 'value') else str(caps.memory_ttl_cap),
+            "memory_max_facts_per_request": caps.memory_max_facts_per_request,
+            "export_allowed": caps.export_allowed
+        }
+    }
+
+
+def _filter_audit_event(event: Any) -> Dict[str, Any]:
+    """Sanitize one audit event and keep only allowlisted fields."""
+    safe_event, _, _, _ = _sanitize_export_payload(event)
+    filtered_event = {}
+    if isinstance(safe_event, dict):
+        for key in ["timestamp_ms", "operation", "decision", "reason", "signature", "event_id"]:
+            if key in safe_event:
+                filtered_event[key] = safe_event[key]
+    return filtered_event
+
+
+def _empty_metrics() -> Dict[str, Any]:
+    """Bounded histograms/tallies, all zero."""
+    return {
+        "tool_calls_count": 0,
+        "domains_used": [],
+        "grade_histogram": {"A": 0, "B": 0, "C": 0, "D": 0, "E": 0, "UNKNOWN": 0},
+        "stop_reason_histogram": {},
+        "memory_write_counts": {"attempted": 0, "accepted": 0, "rejected": 0},
+        "rejection_reason_histogram": {},
+        "ttl_class_histogram": {"TTL_1H": 0, "TTL_1D": 0, "TTL_10D": 0},
+        "bundle_size_bucket": "0"
+    }
+
+
+def _tally_memory_event(metrics: Dict[str, Any], event: Any) -> None:
+    """Count a memory telemetry event into metrics."""
+    if isinstance(event, dict):
+        if event.get("operation") == "write":
+            metrics["memory_write_counts"]["attempted"] += 1
+            if event.get("success"):
+                metrics["memory_write_counts"]["accepted"] += 1
+            else:
+                metrics["memory_write_counts"]["rejected"] += 1
+
+
 def build_export_bundle(
     tenant_config: TenantConfig,
     request_flags: Optional[Dict[str, Any]] = None,
@@ -430,26 +512,10 @@ def build_export_bundle(
         generated_at_bucket_ms = compute_bucket_start(now_ms)
         
         # Build policy versions
-        policy_versions = {
-            "phase16": "UNKNOWN",
-            "phase18": "UNKNOWN", 
-            "phase19": "UNKNOWN",
-            "phase20": "20.0.0"
-        }
+        policy_versions = _policy_versions()
         
         # Build tenant snapshot (structure-only)
-        tenant_snapshot = {
-            "plan": tenant_config.plan.value,
-            "regions": sorted(tenant_config.regions[:MAX_DOMAINS]),
-            "enabled_features": sorted([f.value for f in tenant_config.enabled_features]),
-            "resolved_caps": {
-                "allowed_tools": sorted([t.value for t in caps.allowed_tools]),
-                "deepthink_max_passes": caps.deepthink_max_passes,
-                "memory_ttl_cap": caps.memory_ttl_cap.value if hasattr(caps.memory_ttl_cap, 'value') else str(caps.memory_ttl_cap),
-                "memory_max_facts_per_request": caps.memory_max_facts_per_request,
-                "export_allowed": caps.export_allowed
-            }
-        }
+        tenant_snapshot = _tenant_snapshot(tenant_config, caps)
         
         # Process audit events (structure-only)
         processed_audit_events = []
@@ -463,15 +529,9 @@ def build_export_bundle(
             ))
             
             for event in sorted_events[:MAX_AUDIT_EVENTS]:
-                safe_event, _, _, _ = _sanitize_export_payload(event)
-                if isinstance(safe_event, dict):
-                    # Keep only allowlisted fields
-                    filtered_event = {}
-                    for key in ["timestamp_ms", "operation", "decision", "reason", "signature", "event_id"]:
-                        if key in safe_event:
-                            filtered_event[key] = safe_event[key]
-                    if filtered_event:
-                        processed_audit_events.append(filtered_event)
+                filtered_event = _filter_audit_event(event)
+                if filtered_event:
+                    processed_audit_events.append(filtered_event)
         
         # Collect signatures (hashes only)
         signatures = {
@@ -488,27 +548,12 @@ def build_export_bundle(
                         signatures["decision_signatures"].append(sig)
         
         # Build metrics (bounded histograms/tallies)
-        metrics = {
-            "tool_calls_count": 0,
-            "domains_used": [],
-            "grade_histogram": {"A": 0, "B": 0, "C": 0, "D": 0, "E": 0, "UNKNOWN": 0},
-            "stop_reason_histogram": {},
-            "memory_write_counts": {"attempted": 0, "accepted": 0, "rejected": 0},
-            "rejection_reason_histogram": {},
-            "ttl_class_histogram": {"TTL_1H": 0, "TTL_1D": 0, "TTL_10D": 0},
-            "bundle_size_bucket": "0"
-        }
+        metrics = _empty_metrics()
         
         # Process telemetry events for metrics
         if memory_telemetry_events:
             for event in memory_telemetry_events:
-                if isinstance(event, dict):
-                    if event.get("operation") == "write":
-                        metrics["memory_write_counts"]["attempted"] += 1
-                        if event.get("success"):
-                            metrics["memory_write_counts"]["accepted"] += 1
-                        else:
-                            metrics["memory_write_counts"]["rejected"] += 1
+                _tally_memory_event(metrics, event)
         
         # Build encryption metadata (stub)
         encryption_meta = {
@@ -563,8 +608,7 @@ def build_export_bundle(
         )
         
         # Check bundle size
-        bundle_json = canonical_json(bundle.as_dict())
-        bundle_size_kb = len(bundle_json.encode('utf-8')) / 1024
+        bundle_size_kb = len(canonical_json_bytes(bundle.as_dict())) / 1024
         
         if bundle_size_kb > MAX_BUNDLE_SIZE_KB:
             return _create_fail_outcome(ExportReasonCode.BUNDLE_TOO_LARGE, now_ms)
@@ -609,3 +653,228 @@ def _create_fail_outcome(reason: ExportReasonCode, now_ms: int) -> ExportOutcome
         signature="",
         telemetry=telemetry
     )
+
+
+# ============================================================================
+# STREAMING EXPORT (NDJSON)
+# ============================================================================
+
+def iter_pages(
+    fetch_page: Callable[[Optional[Any], int], Tuple[List[Dict[str, Any]], Optional[Any]]],
+    page_size: int = EXPORT_PAGE_SIZE
+) -> Iterator[Dict[str, Any]]:
+    """
+    Flatten a paged source into records.
+    fetch_page(cursor, limit) returns (records, next_cursor); None ends the scan.
+    """
+    cursor = None
+    while True:
+        records, cursor = fetch_page(cursor, page_size)
+        for record in records:
+            yield record
+        if cursor is None or not records:
+            return
+
+
+def audit_log_pages(audit_log: Any, page_size: int = EXPORT_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Audit events of a governance/audit.py AuditLog as dicts, read one page at
+    a time (no full copy of the log).
+    """
+    events = audit_log._events
+
+    def fetch_page(cursor: Optional[int], limit: int) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        start = cursor or 0
+        page = [event.as_dict() for event in events[start:start + limit]]
+        return page, (start + len(page) if page else None)
+
+    return iter_pages(fetch_page, page_size)
+
+
+def _ndjson_line(record: Dict[str, Any]) -> bytes:
+    return canonical_json_bytes(record) + b"\n"
+
+
+def _export_lines(
+    tenant_config: TenantConfig,
+    caps: Any,
+    audit_events: Iterable[Dict[str, Any]],
+    policy_decisions: Iterable[Dict[str, Any]],
+    memory_telemetry_events: Iterable[Dict[str, Any]],
+    research_telemetry_events: Iterable[Dict[str, Any]],
+    now_ms: int,
+    export_version: str
+) -> Iterator[bytes]:
+    """
+    NDJSON records: header, one line per record, trailer. The trailer signs
+    the SHA-256 of every preceding line (stream_sha256) together with the
+    counts and metrics via compute_export_signature.
+    """
+    running = hashlib.sha256()
+    counts = {"audit_events": 0, "decision_signatures": 0, "memory_telemetry": 0, "research_telemetry": 0}
+    metrics = _empty_metrics()
+    diagnostics = {"dropped_fields_count": 0, "had_forbidden_keys": False}
+
+    def emit(record: Dict[str, Any]) -> bytes:
+        line = _ndjson_line(record)
+        running.update(line)
+        return line
+
+    try:
+        yield emit({
+            "type": "header",
+            "export_version": export_version,
+            "generated_at_bucket_ms": compute_bucket_start(now_ms),
+            "tenant_hash": compute_tenant_hash(tenant_config.tenant_id),
+            "policy_versions": _policy_versions(),
+            "tenant_snapshot": _tenant_snapshot(tenant_config, caps),
+        })
+
+        for event in audit_events:
+            filtered_event = _filter_audit_event(event)
+            if filtered_event:
+                counts["audit_events"] += 1
+                yield emit({"type": "audit_event", "record": filtered_event})
+
+        for decision in policy_decisions:
+            if isinstance(decision, dict) and "signature" in decision:
+                sig = str(decision["signature"])
+                if HASH_PATTERN.match(sig):
+                    counts["decision_signatures"] += 1
+                    yield emit({"type": "decision_signature", "signature": sig})
+
+        for kind, events in (("memory_telemetry", memory_telemetry_events), ("research_telemetry", research_telemetry_events)):
+            for event in events:
+                if kind == "memory_telemetry":
+                    _tally_memory_event(metrics, event)
+                safe_event, dropped, _, had_forbidden = _sanitize_export_payload(event)
+                diagnostics["dropped_fields_count"] += dropped
+                diagnostics["had_forbidden_keys"] = diagnostics["had_forbidden_keys"] or had_forbidden
+                if isinstance(safe_event, dict) and safe_event:
+                    counts[kind] += 1
+                    yield emit({"type": kind, "record": safe_event})
+
+        trailer = {
+            "type": "trailer",
+            "ok": True,
+            "export_version": export_version,
+            "stream_sha256": running.hexdigest(),
+            "counts": counts,
+            "metrics": metrics,
+            "diagnostics": diagnostics,
+        }
+        trailer["export_signature"] = compute_export_signature(trailer)
+        yield _ndjson_line(trailer)
+
+    except Exception:
+        # Fail-closed: unsigned error trailer, consumers must discard the export
+        yield _ndjson_line({"type": "trailer", "ok": False, "reason": ExportReasonCode.INTERNAL_ERROR.value})
+
+
+def _chunked(lines: Iterator[bytes], use_gzip: bool, chunk_bytes: int) -> Iterator[bytes]:
+    """Group lines into chunks of about chunk_bytes, optionally gzip-compressed."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if use_gzip else None
+    buffer: List[bytes] = []
+    size = 0
+    for line in lines:
+        buffer.append(line)
+        size += len(line)
+        if size >= chunk_bytes:
+            data = b"".join(buffer)
+            buffer, size = [], 0
+            if compressor is not None:
+                data = compressor.compress(data)
+            if data:
+                yield data
+    data = b"".join(buffer)
+    if compressor is not None:
+        data = compressor.compress(data) + compressor.flush()
+    if data:
+        yield data
+
+
+def build_export_stream(
+    tenant_config: TenantConfig,
+    audit_events: Optional[Iterable[Dict[str, Any]]] = None,
+    policy_decisions: Optional[Iterable[Dict[str, Any]]] = None,
+    memory_telemetry_events: Optional[Iterable[Dict[str, Any]]] = None,
+    research_telemetry_events: Optional[Iterable[Dict[str, Any]]] = None,
+    now_ms: int = 0,
+    export_version: str = EXPORT_VERSION,
+    gzip: bool = False,
+    chunk_bytes: int = EXPORT_CHUNK_BYTES
+) -> ExportStream:
+    """
+    Build a streaming NDJSON export with fail-closed eligibility checks.
+    
+    Unlike build_export_bundle there is no MAX_AUDIT_EVENTS or bundle size
+    cap: sources are consumed lazily (pass generators, e.g. iter_pages or
+    audit_log_pages) and each record is sanitized on its own, so memory stays
+    bounded by one record plus one chunk. Records are emitted in source order.
+    
+    Returns:
+        ExportStream; chunks is None when the export is refused
+    """
+    try:
+        if tenant_config is None:
+            return _create_fail_stream(ExportReasonCode.TENANT_INVALID, export_version)
+        try:
+            caps = resolve_tenant_caps(tenant_config)
+            if not caps.export_allowed:
+                return _create_fail_stream(ExportReasonCode.EXPORT_DISABLED, export_version)
+        except Exception:
+            return _create_fail_stream(ExportReasonCode.TENANT_INVALID, export_version)
+
+        lines = _export_lines(
+            tenant_config, caps,
+            audit_events or (), policy_decisions or (),
+            memory_telemetry_events or (), research_telemetry_events or (),
+            now_ms, export_version
+        )
+        return ExportStream(
+            ok=True,
+            reason_code=ExportReasonCode.OK,
+            chunks=_chunked(lines, gzip, max(1, int(chunk_bytes))),
+            gzip=gzip,
+            tenant_hash=compute_tenant_hash(tenant_config.tenant_id),
+            export_version=export_version
+        )
+
+    except Exception:
+        return _create_fail_stream(ExportReasonCode.INTERNAL_ERROR, export_version)
+
+
+def verify_export_stream(lines: Iterable[bytes]) -> bool:
+    """
+    Check an (uncompressed) NDJSON export against its trailer signature.
+    """
+    running = hashlib.sha256()
+    trailer = None
+    for line in lines:
+        if not line.strip():
+            continue
+        if trailer is not None:
+            return False
+        record = json.loads(line)
+        if record.get("type") == "trailer":
+            trailer = record
+        else:
+            running.update(line if line.endswith(b"\n") else line + b"\n")
+    if trailer is None or not trailer.get("ok"):
+        return False
+    return (
+        trailer.get("stream_sha256") == running.hexdigest()
+        and trailer.get("export_signature") == compute_export_signature(trailer)
+    )
+
+
+def _create_fail_stream(reason: ExportReasonCode, export_version: str) -> ExportStream:
+    """Create fail-closed (refused) export stream."""
+    return ExportStream(
+        ok=False,
+        reason_code=reason,
+        chunks=None,
+        gzip=False,
+        tenant_hash="",
+        export_version=export_version
+    )
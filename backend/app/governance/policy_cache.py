@@ -0,0 +1,214 @@
+"""
+Phase 20 Step 2: Policy Decision Cache
+
+decide_policy is a pure function of (tenant config, operation, request hints,
+requested params): env_mode and now_ms never change the outcome. Governed ops
+within one request repeat the same inputs, so decisions are memoized at two
+levels:
+
+- PolicyDecisionCache: process-wide bounded LRU of signed decisions, keyed by
+  (tenant config fingerprint, operation, hints key, requested key). Entries
+  are indexed by tenant_id so an accepted change control drops every decision
+  of that tenant at once (invalidate_policy_cache).
+- policy_request_scope(): per-request memo (contextvar) of the normalized
+  tenant config and resolved caps, so one request resolves tenant caps once
+  even when operations and requested params differ.
+
+Keys are exact: values are frozen with their types (1, 1.0, True, "1", a
+tuple and a list are all different keys), because the normalizers treat
+those differently. Inputs that cannot be frozen (unhashable or unknown
+objects) are not cached.
+"""
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from typing import Any, Dict, Hashable, Iterator, Optional, Set, Tuple
+
+
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+POLICY_CACHE_MAX_ENTRIES = 4096
+
+# Nesting deeper than this is not cached (request dicts are shallow)
+MAX_FREEZE_DEPTH = 16
+
+
+class Unfreezable(Exception):
+    """Input cannot be turned into an exact cache key."""
+
+
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+# ============================================================================
+# KEYS
+# ============================================================================
+
+def freeze(value: Any, depth: int = 0) -> Hashable:
+    """
+    Hashable, type-tagged snapshot of a request value.
+
+    Raises Unfreezable for objects that have no exact key.
+    """
+    if depth > MAX_FREEZE_DEPTH:
+        raise Unfreezable("too deep")
+    kind = type(value)
+    if value is None or kind in (str, int, float, bool):
+        return (kind, value)
+    if isinstance(value, Enum):
+        return value
+    if kind is dict:
+        try:
+            items = sorted(value.items(), key=lambda item: (type(item[0]).__name__, item[0]))
+        except TypeError:
+            raise Unfreezable("unsortable keys")
+        return (dict, tuple((freeze(k, depth + 1), freeze(v, depth + 1)) for k, v in items))
+    if kind is list or kind is tuple:
+        return (kind, tuple(freeze(item, depth + 1) for item in value))
+    if kind is set or kind is frozenset:
+        return (kind, frozenset(freeze(item, depth + 1) for item in value))
+    names = _FIELD_NAMES.get(kind)
+    if names is None:
+        if not is_dataclass(value) or isinstance(value, type):
+            raise Unfreezable(kind.__name__)
+        names = _FIELD_NAMES[kind] = tuple(f.name for f in fields(value))
+    return (kind, tuple(freeze(getattr(value, name), depth + 1) for name in names))
+
+
+def tenant_id_of(tenant_config: Any) -> Optional[str]:
+    """Raw tenant_id of a TenantConfig or config dict (None if absent)."""
+    tenant_id = tenant_config.get("tenant_id") if isinstance(tenant_config, dict) else getattr(tenant_config, "tenant_id", None)
+    return tenant_id if isinstance(tenant_id, str) else None
+
+
+# ============================================================================
+# PROCESS-WIDE DECISION CACHE
+# ============================================================================
+
+class PolicyDecisionCache:
+    """
+    Bounded LRU of policy decisions with per-tenant invalidation.
+
+    Values are stored as given; callers copy mutable decisions on the way
+    out. Thread-safe.
+    """
+
+    def __init__(self, max_entries: int = POLICY_CACHE_MAX_ENTRIES):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be > 0")
+        self.max_entries = int(max_entries)
+        self._entries: "OrderedDict[Hashable, Tuple[Optional[str], Any]]" = OrderedDict()
+        self._by_tenant: Dict[Optional[str], Set[Hashable]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, tenant_id: Optional[str], value: Any) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return
+            self._entries[key] = (tenant_id, value)
+            self._by_tenant.setdefault(tenant_id, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                old_key, (old_tenant, _) = self._entries.popitem(last=False)
+                self._unlink(old_key, old_tenant)
+
+    def _unlink(self, key: Hashable, tenant_id: Optional[str]) -> None:
+        keys = self._by_tenant.get(tenant_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_tenant[tenant_id]
+
+    def invalidate_tenant(self, tenant_id: Optional[str]) -> int:
+        """Drop every decision cached for tenant_id; returns how many."""
+        with self._lock:
+            keys = self._by_tenant.pop(tenant_id, set())
+            for key in keys:
+                self._entries.pop(key, None)
+            self.invalidations += 1
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_tenant.clear()
+
+
+_decision_cache = PolicyDecisionCache()
+
+
+def get_policy_cache() -> PolicyDecisionCache:
+    """Process-wide decision cache used by decide_policy."""
+    return _decision_cache
+
+
+def configure_policy_cache(max_entries: int = POLICY_CACHE_MAX_ENTRIES) -> PolicyDecisionCache:
+    """Replace the process-wide cache (drops every entry)."""
+    global _decision_cache
+    _decision_cache = PolicyDecisionCache(max_entries)
+    return _decision_cache
+
+
+# ============================================================================
+# PER-REQUEST MEMO
+# ============================================================================
+
+_request_memo: ContextVar[Optional[Dict[Hashable, Any]]] = ContextVar("policy_request_memo", default=None)
+
+
+@contextmanager
+def policy_request_scope() -> Iterator[Dict[Hashable, Any]]:
+    """
+    Memoize tenant normalization and caps resolution for one request.
+
+    Nested scopes share the outermost memo.
+    """
+    memo = _request_memo.get()
+    if memo is not None:
+        yield memo
+        return
+    memo = {}
+    token = _request_memo.set(memo)
+    try:
+        yield memo
+    finally:
+        _request_memo.reset(token)
+
+
+def current_request_memo() -> Optional[Dict[Hashable, Any]]:
+    """Memo of the active policy_request_scope (None outside a scope)."""
+    return _request_memo.get()
+
+
+def invalidate_policy_cache(tenant_id: Optional[str]) -> int:
+    """
+    Drop cached decisions and the current request memo for a tenant.
+
+    Called when change control accepts a new config version.
+    """
+    memo = _request_memo.get()
+    if memo is not None:
+        memo.clear()
+    return _decision_cache.invalidate_tenant(tenant_id)
@@ -5,17 +5,21 @@ Implements deterministic policy decisions with fail-closed behavior.
 Every sensitive action gets an explicit policy decision with structure-only output.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import Optional, List, Dict, Union, Any
-import json
+from typing import Optional, List, Dict, Hashable, Tuple, Union, Any
 import hashlib
 import re
 
+from backend.app.perf.canonical import canonical_dumps
+
 from .tenant import (
     TenantConfig, RequestHints, ResolvedTenantCaps, ToolKind, TTLClassLabel,
     resolve_tenant_caps, validate_tenant_config, PlanTier, FeatureFlag
 )
+from .policy_cache import (
+    Unfreezable, current_request_memo, freeze, get_policy_cache, tenant_id_of
+)
 
 
 # ============================================================================
@@ -405,7 +409,7 @@ def _canonicalize_decision_data(decision: PolicyDecision) -> str:
     }
     
     # Sort keys and use compact representation
-    return json.dumps(canonical_data, sort_keys=True, separators=(',', ':'))
+    return canonical_dumps(canonical_data)
 
 
 def _generate_decision_signature(decision: PolicyDecision) -> str:
@@ -423,29 +427,109 @@ def decide_policy(req: PolicyRequest) -> PolicyDecision:
     Make policy decision with fail-closed behavior.
     
     Critical: requested flags can only clamp down, never expand tenant caps.
+    
+    Decisions are served from the policy decision cache when the same
+    (tenant config, operation, hints, requested) was decided before; each
+    call gets its own copy. See policy_cache.
     """
-    clamp_notes = []
+    try:
+        tenant_key = freeze(req.tenant_config)
+        hints_key = freeze(req.request_hints)
+        key = (tenant_key, freeze(req.operation), hints_key, freeze(req.requested))
+    except (Unfreezable, RecursionError):
+        return _decide_policy(req, None)
     
     try:
-        # Validate tenant config
-        if req.tenant_config is None:
-            return _fail_closed_decision(PolicyDecisionReason.POLICY_PACK_MISSING)
-        
-        tenant_config = _normalize_tenant_config(req.tenant_config)
-        if tenant_config is None:
-            return _fail_closed_decision(PolicyDecisionReason.TENANT_INVALID)
-        
-        # Validate tenant config structure
-        config_valid, _ = validate_tenant_config(tenant_config)
-        if not config_valid:
-            return _fail_closed_decision(PolicyDecisionReason.TENANT_INVALID)
-        
-        # Resolve tenant capabilities
-        request_hints = _normalize_request_hints(req.request_hints)
+        cache = get_policy_cache()
+        cached = cache.get(key)
+    except Exception:
+        return _decide_policy(req, None)
+    if cached is not None:
+        return _copy_decision(cached)
+    
+    decision = _decide_policy(req, (tenant_key, hints_key))
+    # Internal errors may be transient: never pin them in the cache
+    if decision.reason != PolicyDecisionReason.INTERNAL_INCONSISTENCY:
         try:
-            caps = resolve_tenant_caps(tenant_config, request_hints)
+            cache.put(key, tenant_id_of(req.tenant_config), _copy_decision(decision))
         except Exception:
-            return _fail_closed_decision(PolicyDecisionReason.CAPS_RESOLUTION_FAILED)
+            pass
+    return decision
+
+
+def _copy_decision(decision: PolicyDecision) -> PolicyDecision:
+    """Copy a decision deep enough that callers cannot mutate a cached one."""
+    limits = decision.limits
+    return replace(
+        decision,
+        limits=replace(
+            limits,
+            allowed_tools=list(limits.allowed_tools),
+            export_scope_allowlist=list(limits.export_scope_allowlist),
+            admin_actions_allowlist=list(limits.admin_actions_allowlist),
+            regions_allowed=list(limits.regions_allowed),
+            clamp_notes=list(limits.clamp_notes),
+        ),
+    )
+
+
+def _resolve_tenant_and_caps(
+    req: PolicyRequest,
+) -> Tuple[Optional[PolicyDecisionReason], Optional[TenantConfig], Optional[ResolvedTenantCaps]]:
+    """Normalize and validate the tenant config and resolve its caps."""
+    if req.tenant_config is None:
+        return PolicyDecisionReason.POLICY_PACK_MISSING, None, None
+    
+    tenant_config = _normalize_tenant_config(req.tenant_config)
+    if tenant_config is None:
+        return PolicyDecisionReason.TENANT_INVALID, None, None
+    
+    # Validate tenant config structure
+    config_valid, _ = validate_tenant_config(tenant_config)
+    if not config_valid:
+        return PolicyDecisionReason.TENANT_INVALID, None, None
+    
+    # Resolve tenant capabilities
+    request_hints = _normalize_request_hints(req.request_hints)
+    try:
+        caps = resolve_tenant_caps(tenant_config, request_hints)
+    except Exception:
+        return PolicyDecisionReason.CAPS_RESOLUTION_FAILED, None, None
+    return None, tenant_config, caps
+
+
+def _memoized_tenant_and_caps(
+    req: PolicyRequest, memo_key: Optional[Tuple[Hashable, Hashable]]
+) -> Tuple[Optional[PolicyDecisionReason], Optional[TenantConfig], Optional[ResolvedTenantCaps]]:
+    """_resolve_tenant_and_caps, memoized for the active policy_request_scope."""
+    memo = current_request_memo()
+    if memo is None or memo_key is None:
+        return _resolve_tenant_and_caps(req)
+    key = ("tenant_caps", memo_key)
+    resolved = memo.get(key)
+    if resolved is None:
+        reason, tenant_config, caps = _resolve_tenant_and_caps(req)
+        if tenant_config is not None:
+            # Snapshot: the caller may mutate its config later in the request
+            tenant_config = TenantConfig(
+                tenant_id=tenant_config.tenant_id,
+                plan=tenant_config.plan,
+                regions=list(tenant_config.regions),
+                enabled_features=set(tenant_config.enabled_features),
+            )
+        resolved = (reason, tenant_config, caps)
+        memo[key] = resolved
+    return resolved
+
+
+def _decide_policy(req: PolicyRequest, memo_key: Optional[Tuple[Hashable, Hashable]]) -> PolicyDecision:
+    """Uncached policy decision (memo_key enables per-request caps reuse)."""
+    clamp_notes = []
+    
+    try:
+        failure, tenant_config, caps = _memoized_tenant_and_caps(req, memo_key)
+        if failure is not None:
+            return _fail_closed_decision(failure)
         
         # Validate operation type
         if not isinstance(req.operation, OperationType):
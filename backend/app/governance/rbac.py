@@ -13,6 +13,8 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 from typing import Dict, Any, List, Optional, Union
 
+from backend.app.perf.canonical import canonical_sha256
+
 from .tenant import TenantConfig, resolve_tenant_caps
 
 
@@ -231,11 +233,6 @@ def _compute_tenant_hash(tenant_id: str) -> str:
     return hash_obj.hexdigest()[:12]  # 12-char prefix
 
 
-def _canonical_json(obj: Any) -> str:
-    """Generate canonical JSON string for signatures."""
-    return json.dumps(obj, sort_keys=True, separators=(',', ':'))
-
-
 def _compute_rbac_signature(decision_data: Dict[str, Any]) -> str:
     """Compute deterministic signature for RBAC decision."""
     # Create signature pack without the signature field itself
@@ -246,9 +243,7 @@ def _compute_rbac_signature(decision_data: Dict[str, Any]) -> str:
         "clamp_notes": decision_data["clamp_notes"],
     }
     
-    canonical = _canonical_json(signature_pack)
-    hash_obj = hashlib.sha256(canonical.encode('utf-8'))
-    return hash_obj.hexdigest()
+    return canonical_sha256(signature_pack)
 
 
 def assert_no_text_leakage(obj: Any, sentinels: List[str]) -> None:
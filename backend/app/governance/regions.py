@@ -6,13 +6,14 @@ Deterministic, enforceable region compliance modes that clamp capabilities
 across tools, telemetry, and export with fail-closed behavior.
 """
 
-import hashlib
 import json
 import re
 from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, Any, List, Optional, Union, Set
 
+from backend.app.perf.canonical import canonical_sha256
+
 from .tenant import ToolKind, ResolvedTenantCaps
 
 
@@ -298,11 +299,6 @@ def clamp_domains(tenant_domains: Set[str], region_caps: RegionCaps) -> List[str
         return []
 
 
-def _canonical_json(obj: Any) -> str:
-    """Generate canonical JSON string for signatures."""
-    return json.dumps(obj, sort_keys=True, separators=(',', ':'))
-
-
 def compute_region_signature(caps: ResolvedRegionCaps) -> str:
     """
     Compute deterministic signature for resolved region capabilities.
@@ -320,9 +316,7 @@ def compute_region_signature(caps: ResolvedRegionCaps) -> str:
         "clamp_notes": caps.clamp_notes,
     }
     
-    canonical = _canonical_json(signature_pack)
-    hash_obj = hashlib.sha256(canonical.encode('utf-8'))
-    return hash_obj.hexdigest()
+    return canonical_sha256(signature_pack)
 
 
 def assert_no_text_leakage(obj: Any, sentinels: List[str]) -> None:
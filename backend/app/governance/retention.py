@@ -18,6 +18,8 @@ import hashlib
 import re
 from copy import deepcopy
 
+from backend.app.perf.canonical import canonical_dumps, canonical_sha256
+
 # Import existing governance components
 from .tenant import TenantConfig, PlanTier, resolve_tenant_caps
 
@@ -416,26 +418,14 @@ def get_memory_ttl_cutoff(tenant_config: Optional[TenantConfig], now_ms: int) ->
 # CANONICALIZATION AND SIGNING
 # ============================================================================
 
-def _sort_dict_recursively(obj: Any) -> Any:
-    """Sort dictionary keys recursively for canonical representation."""
-    if isinstance(obj, dict):
-        return {key: _sort_dict_recursively(value) for key, value in sorted(obj.items())}
-    elif isinstance(obj, list):
-        return [_sort_dict_recursively(item) for item in obj]
-    else:
-        return obj
-
-
 def canonical_json(obj: Any) -> str:
     """Create canonical JSON representation."""
-    sorted_obj = _sort_dict_recursively(obj)
-    return json.dumps(sorted_obj, sort_keys=True, separators=(',', ':'))
+    return canonical_dumps(obj)
 
 
 def compute_plan_signature(plan_data: Dict[str, Any]) -> str:
     """Compute deterministic signature for deletion plan."""
-    canonical = canonical_json(plan_data)
-    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+    return canonical_sha256(plan_data)
 
 
 # ============================================================================
@@ -12,19 +12,22 @@ Contract guarantees:
 - Export/admin require governance allow (decision-only stubs)
 - Deterministic outcomes for same inputs
 - Structure-only outputs, no raw user text
+
+Callers wrap the governed ops of one chat turn in governed_request_scope()
+so policy decisions inside it resolve tenant caps once.
 """
 
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
-import json
 import hashlib
 import time
 
 from backend.app.governance import (
     resolve_tenant_caps, decide_policy, record_audit_event,
     resolve_region_caps, PolicyRequest, PolicyDecision,
-    ResolvedTenantCaps, RegionMode, AuditOperationType
+    ResolvedTenantCaps, RegionMode, AuditOperationType, policy_request_scope
 )
 from backend.app.integration.research_wiring import (
     run_policy_gated_research, ResearchPolicyDecision, ResearchOutcome
@@ -34,6 +37,7 @@ from backend.app.integration.memory_wiring import (
     run_policy_gated_memory_write_from_research, MemoryPolicyDecision,
     MemoryIntegrationOutcome
 )
+from backend.app.perf.canonical import canonical_dumps
 
 # ============================================================================
 # ENUMS AND DATACLASSES
@@ -107,7 +111,7 @@ def canonical_json(obj: Any) -> str:
             return item
     
     sanitized = sanitize_for_json(obj)
-    return json.dumps(sanitized, sort_keys=True, separators=(",", ":"))
+    return canonical_dumps(sanitized)
 
 def sha256_hash(data: str) -> str:
     """Compute SHA256 hash of string."""
@@ -202,6 +206,16 @@ def resolve_governance_context(
 # POLICY DECISION BRIDGE
 # ============================================================================
 
+@contextmanager
+def governed_request_scope():
+    """
+    Scope for the governed ops of one request (tool calls, memory reads and
+    writes, telemetry): tenant normalization and caps are memoized inside it.
+    """
+    with policy_request_scope():
+        yield
+
+
 def decide_governed_op(
     context: GovernanceContext,
     op: GovernanceOp,
@@ -15,8 +15,6 @@ Contract guarantees:
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
-import json
-import hashlib
 
 from backend.app.memory.adapter import (
     write_memory, MemoryWriteRequest, WriteResult, MemoryStore
@@ -33,6 +31,7 @@ from backend.app.memory.telemetry import (
     compute_memory_signature, sanitize_structure
 )
 from backend.app.memory.ttl_policy import resolve_ttl
+from backend.app.perf.canonical import canonical_sha256
 
 # ============================================================================
 # REASON CODES (DETERMINISTIC PRIORITY ORDER)
@@ -160,8 +159,7 @@ def _compute_structure_signature(data: Dict[str, Any]) -> str:
             return obj
     
     serializable_data = convert_to_dict(data)
-    json_str = json.dumps(serializable_data, sort_keys=True, separators=(",", ":"))
-    return hashlib.sha256(json_str.encode('utf-8')).hexdigest()[:16]
+    return canonical_sha256(serializable_data)[:16]
 
 def _extract_delta_facts(delta_like: Any, now_ms: int) -> List[MemoryFact]:
     """
@@ -543,9 +543,12 @@ def run_policy_gated_research(
             # Use provided sandbox state or create new one
             current_sandbox_state = sandbox_state if sandbox_state is not None else create_sandbox_state(now_ms)
             
+            # Fan out across tools within what is left of the sandbox budget
+            remaining_ms = policy.caps.total_timeout_ms - (now_ms - current_sandbox_state.started_at_ms)
+            
             # Wrap adapter.retrieve() with sandbox
             def _do_retrieve():
-                return retrieve(retrieval_request)
+                return retrieve(retrieval_request, concurrent=True, deadline_ms=remaining_ms)
             
             new_sandbox_state, sandbox_result = run_sandboxed_call(
                 caps=policy.caps,
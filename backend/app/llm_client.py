@@ -4,12 +4,13 @@ import json
 import logging
 import os
 import re
-from typing import Any, Dict, Union, Optional
+from typing import Any, AsyncIterator, Dict, Union, Optional
 
 import httpx
 
 from backend.app.config import get_settings
-from backend.app.perf.http_client import get_shared_httpx_client
+from backend.app.observability.log_pipeline import lazy
+from backend.app.perf.http_client import get_shared_async_httpx_client, get_shared_httpx_client
 from backend.app.perf.budgets import (
     outbound_http_connect_timeout_s,
     outbound_http_read_timeout_s,
@@ -92,6 +93,10 @@ def _resolve_api_base() -> Optional[str]:
     return None
 
 
+def _sanitize_base_url(api_base: str) -> str:
+    return api_base.split("//")[-1].split("/")[0] if "//" in api_base else api_base
+
+
 def _resolve_api_key() -> Optional[str]:
     """Resolve API key from env vars with fallbacks.
     
@@ -177,7 +182,7 @@ class LLMClient:
         self.reasoning_model_name = s.llm_reasoning_model
         self.expression_model_name = s.llm_expression_model
 
-    def _post(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    def _prepare_post(self, payload: Dict[str, Any]) -> tuple[str, Dict[str, str], httpx.Timeout]:
         if not self.api_base or not self.api_key:
             raise RuntimeError("LLM configuration missing (api_base / api_key)")
 
@@ -198,11 +203,10 @@ class LLMClient:
         )
 
         # Connectivity sanity log
-        base_url_sanitized = self.api_base.split("//")[-1].split("/")[0] if "//" in self.api_base else self.api_base
         logger.info(
             "[LLM] Connectivity check",
             extra={
-                "resolved_base_url": base_url_sanitized,
+                "resolved_base_url": lazy(_sanitize_base_url, self.api_base),
                 "final_url": url,
             }
         )
@@ -217,34 +221,36 @@ class LLMClient:
                 "request_id": self.request_id_value,
             }
         )
+        return url, headers, timeout
 
-        client = get_shared_httpx_client()
+    def _decode_response(self, resp: httpx.Response, payload: Dict[str, Any]) -> Dict[str, Any]:
+        resp.raise_for_status()
         try:
-            resp = client.post(url, headers=headers, json=payload, timeout=timeout)
-            resp.raise_for_status()
-            try:
-                data = resp.json()
-                logger.info(
-                    "[LLM] HTTP response OK",
-                    extra={
-                        "status_code": resp.status_code,
-                        "model": payload.get("model"),
-                    }
-                )
-            except ValueError as exc:
-                logger.error(
-                    "[LLM] Non-JSON response",
-                    extra={
-                        "status_code": resp.status_code,
-                        "response_preview": resp.text[:300] if resp.text else "",
-                    }
-                )
-                raise build_failure(
-                    violation_class=ViolationClass.STRUCTURAL_VIOLATION,
-                    reason="LLM adapter returned non-JSON response",
-                    detail={"error": str(exc), "status_code": resp.status_code},
-                ) from exc
-        except httpx.TimeoutException as exc:
+            data = resp.json()
+            logger.info(
+                "[LLM] HTTP response OK",
+                extra={
+                    "status_code": resp.status_code,
+                    "model": payload.get("model"),
+                }
+            )
+        except ValueError as exc:
+            logger.error(
+                "[LLM] Non-JSON response",
+                extra={
+                    "status_code": resp.status_code,
+                    "response_preview": resp.text[:300] if resp.text else "",
+                }
+            )
+            raise build_failure(
+                violation_class=ViolationClass.STRUCTURAL_VIOLATION,
+                reason="LLM adapter returned non-JSON response",
+                detail={"error": str(exc), "status_code": resp.status_code},
+            ) from exc
+        return data
+
+    def _http_failure(self, exc: httpx.HTTPError, url: str) -> Exception:
+        if isinstance(exc, httpx.TimeoutException):
             logger.error(
                 "[LLM] HTTP timeout",
                 extra={
@@ -254,12 +260,12 @@ class LLMClient:
                     "error": str(exc),
                 }
             )
-            raise build_failure(
+            return build_failure(
                 violation_class=ViolationClass.EXTERNAL_DEPENDENCY_FAILURE,
                 reason="LLM adapter HTTP request timeout",
                 detail={"error": str(exc), "url": url, "timeout_s": self.timeout_seconds},
-            ) from exc
-        except httpx.HTTPStatusError as exc:
+            )
+        if isinstance(exc, httpx.HTTPStatusError):
             # HTTP error with response (4xx, 5xx)
             status_code = exc.response.status_code
             response_text = exc.response.text[:300] if exc.response.text else ""
@@ -272,7 +278,7 @@ class LLMClient:
                     "error_type": type(exc).__name__,
                 }
             )
-            raise build_failure(
+            return build_failure(
                 violation_class=ViolationClass.EXTERNAL_DEPENDENCY_FAILURE,
                 reason=f"LLM adapter HTTP {status_code} error",
                 detail={
@@ -281,34 +287,50 @@ class LLMClient:
                     "response_preview": response_text,
                     "url": url,
                 },
-            ) from exc
-        except httpx.HTTPError as exc:
-            # Other HTTP errors (connection, DNS, etc.)
-            base_url_sanitized = self.api_base.split("//")[-1].split("/")[0] if "//" in self.api_base else self.api_base
-            logger.error(
-                "[LLM] HTTP connection error",
-                extra={
-                    "request_id": self.request_id_value,
-                    "final_url": url,
-                    "method": "POST",
-                    "timeout_seconds": self.timeout_seconds,
-                    "exception_class": type(exc).__name__,
-                    "exception_message": str(exc),
-                    "base_url": base_url_sanitized,
-                }
             )
-            raise build_failure(
-                violation_class=ViolationClass.EXTERNAL_DEPENDENCY_FAILURE,
-                reason="LLM adapter HTTP request failed",
-                detail={
-                    "error": str(exc),
-                    "error_type": type(exc).__name__,
-                    "url": url,
-                    "request_id": self.request_id_value,
-                },
-            ) from exc
+        # Other HTTP errors (connection, DNS, etc.)
+        base_url_sanitized = _sanitize_base_url(self.api_base)
+        logger.error(
+            "[LLM] HTTP connection error",
+            extra={
+                "request_id": self.request_id_value,
+                "final_url": url,
+                "method": "POST",
+                "timeout_seconds": self.timeout_seconds,
+                "exception_class": type(exc).__name__,
+                "exception_message": str(exc),
+                "base_url": base_url_sanitized,
+            }
+        )
+        return build_failure(
+            violation_class=ViolationClass.EXTERNAL_DEPENDENCY_FAILURE,
+            reason="LLM adapter HTTP request failed",
+            detail={
+                "error": str(exc),
+                "error_type": type(exc).__name__,
+                "url": url,
+                "request_id": self.request_id_value,
+            },
+        )
 
-        return data
+    def _post(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        url, headers, timeout = self._prepare_post(payload)
+        client = get_shared_httpx_client()
+        try:
+            resp = client.post(url, headers=headers, json=payload, timeout=timeout)
+            return self._decode_response(resp, payload)
+        except httpx.HTTPError as exc:
+            raise self._http_failure(exc, url) from exc
+
+    async def _post_async(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Async _post on the shared AsyncClient; cancellation aborts the upstream request."""
+        url, headers, timeout = self._prepare_post(payload)
+        client = get_shared_async_httpx_client()
+        try:
+            resp = await client.post(url, headers=headers, json=payload, timeout=timeout)
+            return self._decode_response(resp, payload)
+        except httpx.HTTPError as exc:
+            raise self._http_failure(exc, url) from exc
 
     # ------------------------
     # LLM #1: Reasoning engine
@@ -329,6 +351,29 @@ class LLMClient:
         - Follow the ReasoningOutput schema.
         """
 
+        payload = self._reasoning_payload(user_message, intent, style, session_summary, current_hypotheses)
+        return self._reasoning_output(self._post(payload))
+
+    async def call_reasoning_model_async(
+        self,
+        user_message: UserMessage,
+        intent: Intent,
+        style: CognitiveStyle,
+        session_summary: Dict[str, Any],
+        current_hypotheses: list[Hypothesis],
+    ) -> ReasoningOutput:
+        """Async variant of call_reasoning_model (same prompt, parsing and checks)."""
+        payload = self._reasoning_payload(user_message, intent, style, session_summary, current_hypotheses)
+        return self._reasoning_output(await self._post_async(payload))
+
+    def _reasoning_payload(
+        self,
+        user_message: UserMessage,
+        intent: Intent,
+        style: CognitiveStyle,
+        session_summary: Dict[str, Any],
+        current_hypotheses: list[Hypothesis],
+    ) -> Dict[str, Any]:
         adapter_input = ReasoningAdapterInput(
             user_message=user_message,
             intent=intent,
@@ -341,11 +386,11 @@ class LLMClient:
         logger.info(
             "[LLM#1] Reasoning input",
             extra={
-                "user_message": adapter_input.user_message.model_dump(),
-                "intent": adapter_input.intent.model_dump(),
-                "style": adapter_input.cognitive_style.model_dump(),
+                "user_message": lazy(adapter_input.user_message.model_dump),
+                "intent": lazy(adapter_input.intent.model_dump),
+                "style": lazy(adapter_input.cognitive_style.model_dump),
                 "session_summary": adapter_input.session_summary,
-                "current_hypotheses": [h.model_dump() for h in adapter_input.current_hypotheses],
+                "current_hypotheses": lazy(lambda: [h.model_dump() for h in adapter_input.current_hypotheses]),
             },
         )
 
@@ -409,21 +454,19 @@ class LLMClient:
                 {"role": "user", "content": json.dumps(user_payload)},
             ],
         }
+        return payload
 
-        def _invoke_reasoning(p: Dict[str, Any]) -> ReasoningOutput:
-            data = self._post(p)
-            try:
-                content = data["choices"][0]["message"]["content"]
-            except Exception as exc:  # noqa: BLE001
-                logger.error("[LLM#1] Unexpected response structure", exc_info=exc)
-                raise build_failure(
-                    ViolationClass.STRUCTURAL_VIOLATION,
-                    "Reasoning adapter response missing expected choices/message/content",
-                ) from exc
-
-            return parse_reasoning_output(content)
+    def _reasoning_output(self, data: Dict[str, Any]) -> ReasoningOutput:
+        try:
+            content = data["choices"][0]["message"]["content"]
+        except Exception as exc:  # noqa: BLE001
+            logger.error("[LLM#1] Unexpected response structure", exc_info=exc)
+            raise build_failure(
+                ViolationClass.STRUCTURAL_VIOLATION,
+                "Reasoning adapter response missing expected choices/message/content",
+            ) from exc
 
-        output = _invoke_reasoning(payload)
+        output = parse_reasoning_output(content)
 
         # Second-person ban post-check (logging only)
         summary_text = output.reasoning_trace.summary
@@ -439,7 +482,7 @@ class LLMClient:
                 },
             )
 
-        logger.info("[LLM#1] Reasoning output", extra={"output": output.model_dump()})
+        logger.info("[LLM#1] Reasoning output", extra={"output": lazy(output.model_dump)})
         return output
 
     # ---------------------------
@@ -460,6 +503,65 @@ class LLMClient:
         - Produce a single natural-language reply string.
         """
 
+        adapter_input, payload = self._expression_payload(user_message, style, plan, intermediate)
+        return self._expression_output(self._post(payload), adapter_input)
+
+    async def call_expression_model_async(
+        self,
+        user_message: UserMessage,
+        style: CognitiveStyle,
+        plan: ExpressionPlan,
+        intermediate: IntermediateAnswer,
+    ) -> RenderedMessage:
+        """Async variant of call_expression_model (same prompt and validation)."""
+        adapter_input, payload = self._expression_payload(user_message, style, plan, intermediate)
+        return self._expression_output(await self._post_async(payload), adapter_input)
+
+    async def stream_expression_model(
+        self,
+        user_message: UserMessage,
+        style: CognitiveStyle,
+        plan: ExpressionPlan,
+        intermediate: IntermediateAnswer,
+    ) -> AsyncIterator[str]:
+        """Streaming call_expression_model: yields content deltas as they arrive.
+
+        Same prompt as call_expression_model, sent through OpenAIProvider on the
+        shared pooled AsyncClient. The caller must run validate_expression_output
+        over the joined text; HTTP errors map to the same failures as _post.
+        """
+        # Local import: backend.app.providers imports this module
+        from backend.app.providers.base import LLMProviderError, LLMRequest
+        from backend.app.providers.openai_provider import OpenAIProvider
+
+        _, payload = self._expression_payload(user_message, style, plan, intermediate)
+        url, headers, _ = self._prepare_post(payload)
+        provider = OpenAIProvider(
+            api_key=self.api_key,
+            base_url=url,
+            timeout_seconds=self.timeout_seconds or outbound_http_timeout_s(),
+            connect_timeout_seconds=self.connect_timeout_seconds or outbound_http_connect_timeout_s(),
+            extra_headers={k: v for k, v in headers.items() if k not in {"Authorization", "Content-Type"}},
+        )
+        request = LLMRequest(messages=payload["messages"], model=payload["model"], temperature=None, stream=True)
+        deltas = provider.stream_completion(request)
+        try:
+            async for delta in deltas:
+                yield delta
+        except LLMProviderError as exc:
+            if isinstance(exc.original_error, httpx.HTTPError):
+                raise self._http_failure(exc.original_error, url) from exc
+            raise
+        finally:
+            await deltas.aclose()
+
+    def _expression_payload(
+        self,
+        user_message: UserMessage,
+        style: CognitiveStyle,
+        plan: ExpressionPlan,
+        intermediate: IntermediateAnswer,
+    ) -> tuple[ExpressionAdapterInput, Dict[str, Any]]:
         adapter_input = ExpressionAdapterInput(
             user_message=user_message,
             cognitive_style=style,
@@ -471,10 +573,10 @@ class LLMClient:
         logger.info(
             "[LLM#2] Expression input",
             extra={
-                "user_message": adapter_input.user_message.model_dump(),
-                "style": adapter_input.cognitive_style.model_dump(),
-                "plan": adapter_input.expression_plan.model_dump(),
-                "intermediate_answer": adapter_input.intermediate_answer.model_dump(),
+                "user_message": lazy(adapter_input.user_message.model_dump),
+                "style": lazy(adapter_input.cognitive_style.model_dump),
+                "plan": lazy(adapter_input.expression_plan.model_dump),
+                "intermediate_answer": lazy(adapter_input.intermediate_answer.model_dump),
             },
         )
 
@@ -513,9 +615,9 @@ class LLMClient:
                 {"role": "user", "content": json.dumps(user_payload)},
             ],
         }
+        return adapter_input, payload
 
-        data = self._post(payload)
-
+    def _expression_output(self, data: Dict[str, Any], adapter_input: ExpressionAdapterInput) -> RenderedMessage:
         try:
             content = data["choices"][0]["message"]["content"]
         except Exception as exc:  # noqa: BLE001
@@ -526,5 +628,5 @@ class LLMClient:
             ) from exc
 
         rendered = validate_expression_output(content, intermediate=adapter_input.intermediate_answer)
-        logger.info("[LLM#2] Expression output", extra={"rendered": rendered.model_dump()})
+        logger.info("[LLM#2] Expression output", extra={"rendered": lazy(rendered.model_dump)})
         return rendered
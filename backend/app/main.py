@@ -9,12 +9,13 @@ import os
 import re
 import time
 import hashlib
+from contextlib import aclosing
 from logging.config import dictConfig
 from typing import Any, Dict, Optional
 
 from fastapi import Depends, FastAPI, Path, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from jose import jwt
 from pydantic import ValidationError
@@ -26,7 +27,7 @@ from backend.app.middleware.request_id import RequestIdMiddleware
 
 from backend.app.auth.identity import ANON_COOKIE_NAME, IdentityContext
 from backend.app.deps.identity import identity_dependency
-from backend.app.routers import auth
+from backend.app.routers import auth, metrics as metrics_router
 from backend.app.chat_contract import (
     ChatAction,
     ChatRequest as ContractChatRequest,
@@ -36,20 +37,25 @@ from backend.app.chat_contract import (
     MAX_PAYLOAD_BYTES,
 )
 from backend.app.cost import get_cost_policy
-from backend.mci_backend.governed_response_runtime import render_governed_response
+from backend.mci_backend.governed_response_runtime import (
+    render_governed_response_async,
+    stream_governed_response_async,
+)
 from backend.mci_backend.model_contract import ModelFailureType, ModelInvocationResult
 from backend.app.schemas import ChatRequest, ChatResponse
 from backend.app.service import ConversationService
 from backend.app.config import get_settings, safe_error_detail, settings_public_summary
 from backend.app.config.redaction import redact_secrets
 from backend.app.config.settings import validate_for_env
-from backend.app.db import check_db_connection
+from backend.app.db import aclose_db_pools, awarm_db_pools, check_db_connection
 from backend.app.deps.plan_guard import post_accounting, precheck_plan_and_quotas
 from backend.app.llm_client import LLMClient
 from backend.app.observability import hash_subject, record_invocation, structured_log
 from backend.app.observability.request_id import get_request_id
-from backend.app.perf.http_client import get_shared_httpx_client
+from backend.app.perf.http_client import aclose_shared_async_httpx_client, get_shared_httpx_client
 from backend.app.observability.logging import safe_redact
+from backend.app.observability.log_pipeline import install_log_pipeline, stop_log_pipeline
+from backend.app.observability.metrics import counter, flush_rollup, histogram
 from backend.app.plans.policy import Plan
 from backend.app.plans.tokens import clamp_text_to_token_limit, estimate_tokens_from_text
 from backend.app.security.entitlements import EntitlementsContext, decide_entitlements
@@ -80,7 +86,7 @@ from backend.app.reliability import (
     evaluate_breaker,
     force_budget_blocked,
 )
-from backend.app.reliability.engine import Step5Context, run_step5
+from backend.app.reliability.engine import Step5Context, Step5Result, run_step5, run_step5_stream
 from backend.app.ux import UXState, build_ux_headers, decide_ux_state, extract_cooldown_seconds
 from backend.app.utils.request_helpers import get_request_scheme
 
@@ -106,6 +112,8 @@ LOGGING_CONFIG = {
 
 
 dictConfig(LOGGING_CONFIG)
+# Console writes move to a listener thread behind a bounded queue (LOG_QUEUE_SIZE)
+install_log_pipeline()
 logger = logging.getLogger(__name__)
 
 APP_VERSION = "2026.15.1"
@@ -193,7 +201,8 @@ cost_policy = get_cost_policy()
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize LLM client on startup. Never crash - store error if config missing."""
+    """Initialize LLM client and warm DB pools on startup. Never crash - store error if config missing."""
+    install_log_pipeline()
     try:
         llm_client = LLMClient()
         service.llm = llm_client
@@ -210,9 +219,29 @@ async def startup_event():
             "[LLM] Startup: LLM client initialization failed - server will return 503 for /api/chat",
             extra={"error": str(exc), "error_type": type(exc).__name__}
         )
+    try:
+        await awarm_db_pools()
+    except Exception:
+        logger.warning("[DB] Startup: pool warm-up failed")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release pooled DB and outbound HTTP connections and drain logs on shutdown. Best effort."""
+    try:
+        await aclose_db_pools()
+    except Exception:
+        logger.warning("[DB] Shutdown: pool close failed")
+    try:
+        await aclose_shared_async_httpx_client()
+    except Exception:
+        logger.warning("[HTTP] Shutdown: async client close failed")
+    flush_rollup()
+    stop_log_pipeline()
 
 # Include auth router
 app.include_router(auth.router)
+app.include_router(metrics_router.router)
 
 
 @app.post("/v1/sessions/{session_id}/messages", response_model=ChatResponse)
@@ -251,6 +280,38 @@ def _extract_rendered_text(result: ModelInvocationResult) -> str:
     return ""
 
 
+def _attempt_text(result: ModelInvocationResult) -> str:
+    if not result.ok:
+        raise RuntimeError("provider_failure")
+    output_text = result.output_text or ""
+    if not output_text and result.output_json and isinstance(result.output_json, dict):
+        maybe_text = result.output_json.get("message") or result.output_json.get("text")
+        if isinstance(maybe_text, str):
+            output_text = maybe_text
+    return output_text
+
+
+def _stream_requested(request: Request, payload: Any) -> bool:
+    if isinstance(payload, dict) and payload.get("stream") is True:
+        return True
+    return "text/event-stream" in (request.headers.get("accept") or "").lower()
+
+
+def _sse_event(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+def _sse_done(status_code: int, payload: ContractChatResponse) -> str:
+    ux_state = decide_ux_state(
+        status_code=status_code,
+        action=payload.action.value,
+        failure_type=payload.failure_type.value if payload.failure_type else None,
+        failure_reason=payload.failure_reason,
+    )
+    payload = payload.model_copy(update={"ux_state": ux_state.value, "cooldown_seconds": None})
+    return _sse_event("done", {"status_code": status_code, **json.loads(payload.json())})
+
+
 def _apply_ux_signals(
     resp: JSONResponse,
     *,
@@ -469,7 +530,7 @@ async def _invoke_with_route_plan(user_text: str, route_plan: ModelRoutePlan, ti
     for route in route_plan.routes:
         try:
             result = await enforce_timeout(
-                lambda: asyncio.to_thread(render_governed_response, user_text),
+                lambda: render_governed_response_async(user_text),
                 timeout_ms,
             )
         except Exception as exc:
@@ -535,6 +596,8 @@ def _log_chat_summary(
     abuse_allowed: bool | None = None,
     abuse_reason: str | None = None,
 ) -> None:
+    histogram("chat_latency_ms", latency_ms, labels={"plan": plan_value, "status": f"{status_code // 100}xx"})
+    counter("chat_requests", 1, labels={"status": str(status_code), "action": action or "unknown"})
     waf_info = _waf_meta(request)
     plan_info = _plan_meta(request)
     hashed = hash_subject(subject_type, subject_id)
@@ -1021,6 +1084,7 @@ async def governed_chat(request: Request, identity: IdentityContext = Depends(wa
 
         chat_user_text = user_text.strip()
         requested_mode = _requested_mode(request, payload)
+        stream_requested = _stream_requested(request, payload)
         requested_model_class = None
         if isinstance(payload, dict):
             maybe_model_class = payload.get("model_class")
@@ -1411,15 +1475,7 @@ async def governed_chat(request: Request, identity: IdentityContext = Depends(wa
             )
 
         async def _invoke_attempt(attempt_idx: int) -> str:
-            result = await asyncio.to_thread(render_governed_response, chat_user_text)
-            if not result.ok:
-                raise RuntimeError("provider_failure")
-            output_text = result.output_text or ""
-            if not output_text and result.output_json and isinstance(result.output_json, dict):
-                maybe_text = result.output_json.get("message") or result.output_json.get("text")
-                if isinstance(maybe_text, str):
-                    output_text = maybe_text
-            return output_text
+            return _attempt_text(await render_governed_response_async(chat_user_text))
 
         step5_ctx = Step5Context(
             request_id=rid,
@@ -1434,126 +1490,185 @@ async def governed_chat(request: Request, identity: IdentityContext = Depends(wa
             model_class_effective=route_plan.primary.model_class.value,
         )
 
-        step5_result = await run_step5(step5_ctx, _invoke_attempt)
-
-        output_tokens_est = estimate_tokens_from_text(step5_result.rendered_text)
-        tokens_used = (input_tokens or 0) + (output_tokens_est or 0)
-        latency_ms = int((time.monotonic() - start_ts) * 1000)
+        def _finalize(step5_result: Step5Result) -> tuple[int, ContractChatResponse, Dict[str, str]]:
+            # Accounting, summary logs and response shared by the JSON and SSE paths
+            output_tokens_est = estimate_tokens_from_text(step5_result.rendered_text)
+            tokens_used = (input_tokens or 0) + (output_tokens_est or 0)
+            latency_ms = int((time.monotonic() - start_ts) * 1000)
+
+            provider_failure_types = {
+                FailureType.PROVIDER_TIMEOUT,
+                FailureType.PROVIDER_RATE_LIMIT,
+                FailureType.PROVIDER_AUTH_ERROR,
+                FailureType.PROVIDER_BAD_RESPONSE,
+                FailureType.PROVIDER_UNAVAILABLE,
+            }
+            is_provider_failure = step5_result.failure_type in provider_failure_types
 
-        provider_failure_types = {
-            FailureType.PROVIDER_TIMEOUT,
-            FailureType.PROVIDER_RATE_LIMIT,
-            FailureType.PROVIDER_AUTH_ERROR,
-            FailureType.PROVIDER_BAD_RESPONSE,
-            FailureType.PROVIDER_UNAVAILABLE,
-        }
-        is_provider_failure = step5_result.failure_type in provider_failure_types
+            status_code = 200
+            if step5_result.failure_type == FailureType.BUDGET_EXCEEDED:
+                status_code = 429
+            elif step5_result.failure_type == FailureType.PROVIDER_UNAVAILABLE:
+                status_code = 503
 
-        status_code = 200
-        if step5_result.failure_type == FailureType.BUDGET_EXCEEDED:
-            status_code = 429
-        elif step5_result.failure_type == FailureType.PROVIDER_UNAVAILABLE:
-            status_code = 503
+            headers = {}
+            if getattr(request.state, "waf_used_memory", False):
+                headers["X-WAF-Limiter"] = "memory-fallback"
 
-        headers = {}
-        if getattr(request.state, "waf_used_memory", False):
-            headers["X-WAF-Limiter"] = "memory-fallback"
+            if step5_result.failure_type:
+                post_accounting(identity, tokens_used)
+                outcome = "provider_failure" if is_provider_failure else "step5_failure"
+                cost_policy.record_failure(
+                    request_id=rid,
+                    actor_key=actor_key,
+                    ip_hash=identity.ip_hash,
+                    outcome=outcome,
+                    latency_ms=latency_ms,
+                    is_provider_failure=is_provider_failure,
+                    budget_scope=None,
+                )
+                response = ContractChatResponse(
+                    action=step5_result.action,
+                    rendered_text=step5_result.rendered_text or "Governed response unavailable.",
+                    failure_type=step5_result.failure_type,
+                    failure_reason=step5_result.failure_reason,
+                )
+            else:
+                post_accounting(identity, tokens_used)
+                cost_policy.record_success(
+                    request_id=rid,
+                    actor_key=actor_key,
+                    ip_hash=identity.ip_hash,
+                    input_tokens=input_tokens,
+                    output_tokens=output_tokens_est,
+                    latency_ms=latency_ms,
+                    outcome="step5_success",
+                    budget_scope=None,
+                )
+                response = ContractChatResponse(
+                    action=step5_result.action,
+                    rendered_text=step5_result.rendered_text if step5_result.rendered_text.strip() else "Governed response unavailable.",
+                    failure_type=None,
+                    failure_reason=None,
+                )
 
-        if step5_result.failure_type:
-            post_accounting(identity, tokens_used)
-            outcome = "provider_failure" if is_provider_failure else "step5_failure"
-            cost_policy.record_failure(
+            json_payload = json.loads(response.json())
+            _log_chat_summary(
+                request=request,
                 request_id=rid,
-                actor_key=actor_key,
-                ip_hash=identity.ip_hash,
-                outcome=outcome,
+                status_code=status_code,
                 latency_ms=latency_ms,
-                is_provider_failure=is_provider_failure,
-                budget_scope=None,
-            )
-            response = ContractChatResponse(
-                action=step5_result.action,
-                rendered_text=step5_result.rendered_text or "Governed response unavailable.",
-                failure_type=step5_result.failure_type,
-                failure_reason=step5_result.failure_reason,
-            )
-        else:
-            post_accounting(identity, tokens_used)
-            cost_policy.record_success(
-                request_id=rid,
-                actor_key=actor_key,
-                ip_hash=identity.ip_hash,
+                plan_value=plan.value,
+                subject_type=identity.subject_type,
+                subject_id=identity.subject_id,
                 input_tokens=input_tokens,
-                output_tokens=output_tokens_est,
-                latency_ms=latency_ms,
-                outcome="step5_success",
+                output_tokens_est=limits.max_output_tokens,
+                error_code=step5_result.failure_type.value if step5_result.failure_type else None,
+                waf_limiter=waf_limiter,
+                budget_ms_total=budget_ms_total,
+                budget_ms_remaining_at_model_start=budget_remaining_before_model,
+                timeout_where=step5_result.timeout_where,
+                model_timeout_ms=effective_model_timeout_ms,
+                http_timeout_ms=http_timeout_ms,
+                action=response.action.value,
+                failure_type=response.failure_type.value if response.failure_type else None,
+                failure_reason=response.failure_reason,
+                requested_mode=ent_requested_mode.value if ent_requested_mode else None,
+                granted_mode=route_plan.effective_mode.value,
+                model_class=route_plan.primary.model_class.value,
+                model_class_cap=ent_model_class_cap,
+                effective_model_class=ent_effective_model_class,
+                breaker_open=forced_breaker,
+                budget_block=forced_budget,
+                ip_hash=identity.ip_hash,
                 budget_scope=None,
+                entitlements_reason=(ent_reason_code or "")[:200],
+                quota_reason=None,
+                actor_hash=actor_hash,
+                abuse_score=abuse_score,
+                abuse_action=abuse_action,
+                abuse_allowed=abuse_allowed,
+                abuse_reason=abuse_reason,
             )
-            response = ContractChatResponse(
-                action=step5_result.action,
-                rendered_text=step5_result.rendered_text if step5_result.rendered_text.strip() else "Governed response unavailable.",
-                failure_type=None,
-                failure_reason=None,
+            logger.info(
+                "[API] step5.summary",
+                extra={
+                    "request_id": rid,
+                    "status_code": status_code,
+                    "action": response.action.value,
+                    "failure_type": response.failure_type.value if response.failure_type else None,
+                    "failure_reason": response.failure_reason[:200] if response.failure_reason else None,
+                    "plan_value": plan.value,
+                    "mode_requested": ent_requested_mode.value if ent_requested_mode else None,
+                    "mode_effective": route_plan.effective_mode.value,
+                    "model_class_effective": route_plan.primary.model_class.value,
+                    "attempts": step5_result.attempts,
+                    "breaker_open": forced_breaker,
+                    "budget_blocked": forced_budget,
+                    "timeout_where": step5_result.timeout_where,
+                    "latency_ms": latency_ms,
+                    "entitlements_reason": (ent_reason_code or "")[:200],
+                },
             )
-
-        json_payload = json.loads(response.json())
-        _log_chat_summary(
-            request=request,
-            request_id=rid,
-            status_code=status_code,
-            latency_ms=latency_ms,
-            plan_value=plan.value,
-            subject_type=identity.subject_type,
-            subject_id=identity.subject_id,
-            input_tokens=input_tokens,
-            output_tokens_est=limits.max_output_tokens,
-            error_code=step5_result.failure_type.value if step5_result.failure_type else None,
-            waf_limiter=waf_limiter,
-            budget_ms_total=budget_ms_total,
-            budget_ms_remaining_at_model_start=budget_remaining_before_model,
-            timeout_where=step5_result.timeout_where,
-            model_timeout_ms=effective_model_timeout_ms,
-            http_timeout_ms=http_timeout_ms,
-            action=response.action.value,
-            failure_type=response.failure_type.value if response.failure_type else None,
-            failure_reason=response.failure_reason,
-            requested_mode=ent_requested_mode.value if ent_requested_mode else None,
-            granted_mode=route_plan.effective_mode.value,
-            model_class=route_plan.primary.model_class.value,
-            model_class_cap=ent_model_class_cap,
-            effective_model_class=ent_effective_model_class,
-            breaker_open=forced_breaker,
-            budget_block=forced_budget,
-            ip_hash=identity.ip_hash,
-            budget_scope=None,
-            entitlements_reason=(ent_reason_code or "")[:200],
-            quota_reason=None,
-            actor_hash=actor_hash,
-            abuse_score=abuse_score,
-            abuse_action=abuse_action,
-            abuse_allowed=abuse_allowed,
-            abuse_reason=abuse_reason,
-        )
-        logger.info(
-            "[API] step5.summary",
-            extra={
-                "request_id": rid,
-                "status_code": status_code,
-                "action": response.action.value,
-                "failure_type": response.failure_type.value if response.failure_type else None,
-                "failure_reason": response.failure_reason[:200] if response.failure_reason else None,
-                "plan_value": plan.value,
-                "mode_requested": ent_requested_mode.value if ent_requested_mode else None,
-                "mode_effective": route_plan.effective_mode.value,
-                "model_class_effective": route_plan.primary.model_class.value,
-                "attempts": step5_result.attempts,
-                "breaker_open": forced_breaker,
-                "budget_blocked": forced_budget,
-                "timeout_where": step5_result.timeout_where,
-                "latency_ms": latency_ms,
-                "entitlements_reason": (ent_reason_code or "")[:200],
-            },
-        )
+            return status_code, response, headers
+
+        if stream_requested:
+            # Every provider delta, including text later reset, is charged if the stream is cut short
+            produced: list[str] = []
+
+            async def _open_stream():
+                async for event in stream_governed_response_async(chat_user_text):
+                    if event.kind == "result":
+                        yield ("final", _attempt_text(event.result))
+                    else:
+                        if event.kind == "delta" and event.text:
+                            produced.append(event.text)
+                        yield (event.kind, event.text)
+
+            async def _sse_body():
+                first_delta = True
+                finalized = False
+                try:
+                    async with aclosing(run_step5_stream(step5_ctx, _open_stream)) as events:
+                        async for kind, value in events:
+                            if kind == "delta":
+                                if first_delta:
+                                    first_delta = False
+                                    histogram(
+                                        "chat_stream_ttft_ms",
+                                        (time.monotonic() - start_ts) * 1000,
+                                        labels={"plan": plan.value},
+                                    )
+                                yield _sse_event("delta", {"text": value})
+                            elif kind == "reset":
+                                yield _sse_event("reset", {})
+                            else:
+                                finalized = True
+                                status_code, response, _ = _finalize(value)
+                                yield _sse_done(status_code, response)
+                finally:
+                    if not finalized:
+                        # Client disconnect or stream error before the result: still account for it
+                        try:
+                            _finalize(
+                                Step5Result(
+                                    action=ChatAction.FALLBACK,
+                                    rendered_text="".join(produced),
+                                    failure_type=FailureType.GOVERNED_PIPELINE_ABORTED,
+                                    failure_reason="stream_aborted",
+                                    attempts=1,
+                                    timeout_where=None,
+                                )
+                            )
+                        except Exception:
+                            logger.warning("[API] stream accounting failed", extra={"request_id": rid})
+
+            stream_headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no", "X-Request-Id": rid}
+            if getattr(request.state, "waf_used_memory", False):
+                stream_headers["X-WAF-Limiter"] = "memory-fallback"
+            return StreamingResponse(_sse_body(), media_type="text/event-stream", headers=stream_headers)
+
+        status_code, response, headers = _finalize(await run_step5(step5_ctx, _invoke_attempt))
         return _json_response_with_ux(
             status_code=status_code,
             payload=response,
@@ -1608,6 +1723,7 @@ async def governed_chat(request: Request, identity: IdentityContext = Depends(wa
 @app.exception_handler(WAFError)
 async def handle_waf_error(request: Request, exc: WAFError) -> JSONResponse:  # noqa: D401
     rid = _request_id(request)
+    counter("waf_rejections", 1, labels={"error_code": exc.error_code})
     headers = exc.to_headers()
     headers["X-Request-Id"] = rid
     if getattr(request.state, "waf_used_memory", False):
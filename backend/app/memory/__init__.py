@@ -46,6 +46,8 @@ from backend.app.memory.ttl_policy import (
 # Phase 19 Step 4: Memory Store (Append-only Log + Derived View)
 from backend.app.memory.store import (
     MEMORY_STORE_VERSION,
+    MEMORY_SNAPSHOT_VERSION,
+    SNAPSHOT_INTERVAL_EVENTS,
     EventType,
     StoreCaps,
     MemoryEvent,
@@ -55,6 +57,10 @@ from backend.app.memory.store import (
     ActiveFactMeta,
     CurrentView,
     MemoryEventLogStore,
+    MaterializedView,
+    MemorySnapshot,
+    build_snapshot,
+    verify_snapshot,
     recompute_current_view,
     create_event_log_store,
     create_memory_store,
@@ -102,6 +108,14 @@ from backend.app.memory.legacy import (
     save_session_summary,
 )
 
+# Batched session state (one MGET per load, one MULTI/EXEC per save)
+from backend.app.memory.session_state import (
+    SessionState,
+    SessionStateStats,
+    SessionStateRepository,
+    get_session_state_repository,
+)
+
 __all__ = [
     # Phase 19 schema
     "MemoryFact",
@@ -134,6 +148,8 @@ __all__ = [
     "REQUEST_TIME_BUCKET_MS",
     # Phase 19 store
     "MEMORY_STORE_VERSION",
+    "MEMORY_SNAPSHOT_VERSION",
+    "SNAPSHOT_INTERVAL_EVENTS",
     "EventType",
     "StoreCaps",
     "MemoryEvent",
@@ -143,6 +159,10 @@ __all__ = [
     "ActiveFactMeta",
     "CurrentView",
     "MemoryEventLogStore",
+    "MaterializedView",
+    "MemorySnapshot",
+    "build_snapshot",
+    "verify_snapshot",
     "recompute_current_view",
     "create_event_log_store",
     "create_memory_store",
@@ -176,4 +196,9 @@ __all__ = [
     "save_hypotheses",
     "load_session_summary",
     "save_session_summary",
+    # Batched session state
+    "SessionState",
+    "SessionStateStats",
+    "SessionStateRepository",
+    "get_session_state_repository",
 ]
@@ -16,6 +16,7 @@ from typing import Optional
 import redis
 
 from backend.app.config import settings
+from backend.app.memory.session_state import VERSION_SUFFIX
 from backend.app.schemas import CognitiveStyle, Hypothesis, SessionSummary
 
 
@@ -35,6 +36,16 @@ def _session_key(session_id: str, suffix: str) -> str:
     return f"session:{session_id}:{suffix}"
 
 
+def _set_versioned(r: redis.Redis, session_id: str, key: str, payload: str) -> None:
+    """SET one session key and bump the session version stamp in one MULTI/EXEC."""
+    version_key = _session_key(session_id, VERSION_SUFFIX)
+    pipe = r.pipeline(transaction=True)
+    pipe.set(key, payload, ex=settings.session_ttl_seconds)
+    pipe.incr(version_key)
+    pipe.expire(version_key, settings.session_ttl_seconds)
+    pipe.execute()
+
+
 def load_cognitive_style(session_id: str) -> Optional[CognitiveStyle]:
     """Load cognitive style from session storage."""
     r = get_redis()
@@ -49,7 +60,7 @@ def save_cognitive_style(session_id: str, style: CognitiveStyle) -> None:
     """Save cognitive style to session storage."""
     r = get_redis()
     key = _session_key(session_id, "style")
-    r.set(key, style.model_dump_json(), ex=settings.session_ttl_seconds)
+    _set_versioned(r, session_id, key, style.model_dump_json())
 
 
 def load_hypotheses(session_id: str) -> list[Hypothesis]:
@@ -67,7 +78,7 @@ def save_hypotheses(session_id: str, hypotheses: list[Hypothesis]) -> None:
     r = get_redis()
     key = _session_key(session_id, "hypotheses")
     payload = [h.model_dump() for h in hypotheses]
-    r.set(key, json.dumps(payload), ex=settings.session_ttl_seconds)
+    _set_versioned(r, session_id, key, json.dumps(payload))
 
 
 def load_session_summary(session_id: str) -> SessionSummary:
@@ -84,4 +95,4 @@ def save_session_summary(session_id: str, summary: SessionSummary) -> None:
     """Save session summary to storage."""
     r = get_redis()
     key = _session_key(session_id, "summary")
-    r.set(key, summary.model_dump_json(), ex=settings.session_ttl_seconds)
+    _set_versioned(r, session_id, key, summary.model_dump_json())
@@ -13,15 +13,14 @@ Contract guarantees:
 - Fail-closed behavior on invalid inputs
 """
 
-import json
 import re
 from dataclasses import dataclass
 from enum import Enum
-from hashlib import sha256
 from typing import Dict, List, Optional, Protocol, Tuple
 
 from backend.app.memory.schema import MemoryFact, MemoryCategory
 from backend.app.memory.store import StoreCaps
+from backend.app.perf.canonical import canonical_sha256
 
 
 # ============================================================================
@@ -320,8 +319,7 @@ def _compute_tie_break_hash(fact: MemoryFact) -> str:
         data["provenance_type"] = fact.provenance.source_type.value
     
     # Canonical JSON
-    json_str = json.dumps(data, sort_keys=True, separators=(',', ':'))
-    return sha256(json_str.encode('utf-8')).hexdigest()[:16]
+    return canonical_sha256(data)[:16]
 
 
 def _compute_sort_key(fact: MemoryFact) -> Tuple:
@@ -13,14 +13,13 @@ Contract guarantees:
 - Deterministic reason codes with stable priority ordering
 """
 
-import json
 import re
 from dataclasses import dataclass
 from enum import Enum
-from hashlib import sha256
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from backend.app.memory.schema import MemoryFact
+from backend.app.perf.canonical import canonical_sha256
 
 
 # ============================================================================
@@ -299,8 +298,9 @@ def _scan_text_for_patterns(
     reason: ForbiddenReason,
 ) -> List[ForbiddenMatch]:
     """
-    Scan text for forbidden patterns.
+    Scan text for one group of forbidden patterns (reference implementation).
     
+    scan_fact_forbidden uses _scan_field, which covers all groups in one pass.
     Returns list of matches found.
     """
     if not text:
@@ -340,6 +340,181 @@ def _scan_text_for_patterns(
     return matches
 
 
+# ============================================================================
+# COMPILED SINGLE-PASS MATCHER
+# ============================================================================
+
+_WORD_RE = re.compile(r'\w+')
+
+# Non-ASCII chars that re.IGNORECASE matches against ASCII 'i'/'s' and that
+# survive str.lower() (dotless i, long s)
+_IGNORECASE_FOLD = str.maketrans({'\u0131': 'i', '\u017f': 's'})
+
+_LITERAL_ALTERNATIVE_RE = re.compile(r'[a-z0-9]+(?: [a-z0-9]+)*')
+
+_Token = Tuple[str, int, int]  # (folded word, start, end)
+
+
+def _parse_literal_pattern(pattern: str) -> Optional[List[Tuple[str, ...]]]:
+    """
+    Parse \\bphrase\\b or \\b(?:alt1|alt2)\\b patterns into word tuples.
+    
+    Returns None for anything else (such rules use their regex directly).
+    """
+    if not (pattern.startswith('\\b') and pattern.endswith('\\b')):
+        return None
+    body = pattern[2:-2]
+    if body.startswith('(?:') and body.endswith(')'):
+        body = body[3:-1]
+    alternatives = body.split('|')
+    if not all(_LITERAL_ALTERNATIVE_RE.fullmatch(alt) for alt in alternatives):
+        return None
+    return [tuple(alt.split(' ')) for alt in alternatives]
+
+
+def _tokenize(normalized: str) -> List[_Token]:
+    return [
+        (m.group().translate(_IGNORECASE_FOLD), m.start(), m.end())
+        for m in _WORD_RE.finditer(normalized)
+    ]
+
+
+class _PhraseMatcher:
+    """
+    Word-level keyword automaton over a list of patterns.
+    
+    Literal \\b-delimited phrases are indexed by first word and matched in a
+    single pass over the token stream; counts follow re.findall semantics
+    (leftmost, first alternative wins, non-overlapping per pattern).
+    Non-literal patterns fall back to their own compiled regex.
+    """
+    
+    def __init__(self, patterns: List[str]):
+        self._by_first_word: Dict[str, List[Tuple[Tuple[str, ...], int, int]]] = {}
+        self._fallback: List[Tuple[int, Optional["re.Pattern[str]"]]] = []
+        for index, pattern in enumerate(patterns):
+            phrases = _parse_literal_pattern(pattern)
+            if phrases is None:
+                try:
+                    self._fallback.append((index, re.compile(pattern, re.IGNORECASE)))
+                except re.error:
+                    self._fallback.append((index, None))
+                continue
+            for alt_index, words in enumerate(phrases):
+                self._by_first_word.setdefault(words[0], []).append((words, index, alt_index))
+    
+    def _occurrences(self, normalized: str, tokens: List[_Token]) -> Dict[int, List[Tuple[int, int, int]]]:
+        found: Dict[int, List[Tuple[int, int, int]]] = {}
+        n_tokens = len(tokens)
+        for i, (word, start, _) in enumerate(tokens):
+            candidates = self._by_first_word.get(word)
+            if not candidates:
+                continue
+            for words, index, alt_index in candidates:
+                last = i + len(words) - 1
+                if last >= n_tokens:
+                    continue
+                ok = True
+                for j in range(1, len(words)):
+                    prev_end = tokens[i + j - 1][2]
+                    token = tokens[i + j]
+                    if token[0] != words[j] or token[1] != prev_end + 1 or normalized[prev_end] != ' ':
+                        ok = False
+                        break
+                if ok:
+                    found.setdefault(index, []).append((start, alt_index, tokens[last][2]))
+        return found
+    
+    def count(self, normalized: str, tokens: List[_Token]) -> Dict[int, int]:
+        """Return {pattern_index: match_count} (-1 marks a regex error)."""
+        counts: Dict[int, int] = {}
+        for index, occurrences in self._occurrences(normalized, tokens).items():
+            occurrences.sort()
+            taken = 0
+            last_end = -1
+            for start, _, end in occurrences:
+                if start >= last_end:
+                    taken += 1
+                    last_end = end
+            counts[index] = taken
+        for index, compiled in self._fallback:
+            if compiled is None:
+                counts[index] = -1
+                continue
+            hits = len(compiled.findall(normalized))
+            if hits:
+                counts[index] = hits
+        return counts
+    
+    def any(self, normalized: str, tokens: List[_Token], *, error_matches: bool = True) -> bool:
+        """
+        True if any pattern matched. A regex error counts as a match only when
+        error_matches is set, so callers can pick the fail-closed reading.
+        """
+        counts = self.count(normalized, tokens)
+        return any(value > 0 or (value < 0 and error_matches) for value in counts.values())
+
+
+# Flattened rules in PATTERN_GROUPS order: (rule_id, reason)
+_RULES: List[Tuple[str, ForbiddenReason]] = [
+    (rule_id, reason) for patterns, reason in PATTERN_GROUPS for _, rule_id in patterns
+]
+_FORBIDDEN_MATCHER = _PhraseMatcher([pattern for patterns, _ in PATTERN_GROUPS for pattern, _ in patterns])
+_ACADEMIC_MATCHER = _PhraseMatcher(ACADEMIC_EXCEPTIONS)
+_AFFILIATION_MATCHER = _PhraseMatcher(AFFILIATION_VERBS)
+
+
+def _scan_field(text: str, field_name: str) -> List[ForbiddenMatch]:
+    """
+    Scan one field against all pattern groups in a single pass.
+    
+    Produces the same matches, in the same order, as running
+    _scan_text_for_patterns for every group in PATTERN_GROUPS.
+    """
+    if not text:
+        return []
+    
+    normalized = _normalize_text(text)
+    if not normalized:
+        return []
+    
+    tokens = _tokenize(normalized)
+    
+    # Check for academic exception (but only if no affiliation verbs); a regex
+    # error never grants the exemption
+    academic = _ACADEMIC_MATCHER.any(normalized, tokens, error_matches=False)
+    if academic and not _AFFILIATION_MATCHER.any(normalized, tokens, error_matches=True):
+        return []
+    
+    counts = _FORBIDDEN_MATCHER.count(normalized, tokens)
+    if not counts:
+        return []
+    
+    field = field_name[:MAX_FIELD_LEN]
+    matches = []
+    for index in sorted(counts):
+        match_count = counts[index]
+        if match_count < 0:
+            # Fail-closed: treat regex error as forbidden
+            matches.append(ForbiddenMatch(
+                reason=ForbiddenReason.FORBIDDEN_INTERNAL_ERROR,
+                matched_rule_id="REGEX_ERROR",
+                field=field,
+                match_count=1,
+                evidence_len=len(normalized),
+            ))
+            continue
+        rule_id, reason = _RULES[index]
+        matches.append(ForbiddenMatch(
+            reason=reason,
+            matched_rule_id=rule_id[:MAX_RULE_ID_LEN],
+            field=field,
+            match_count=match_count,
+            evidence_len=len(normalized),
+        ))
+    return matches
+
+
 # ============================================================================
 # SIGNATURE COMPUTATION
 # ============================================================================
@@ -373,10 +548,7 @@ def _compute_signature(matches: List[ForbiddenMatch]) -> str:
     signature_data["fields"].sort()
     
     # Convert to canonical JSON
-    json_str = json.dumps(signature_data, sort_keys=True, separators=(',', ':'), ensure_ascii=True)
-    
-    # Hash
-    return sha256(json_str.encode('utf-8')).hexdigest()
+    return canonical_sha256(signature_data)
 
 
 # ============================================================================
@@ -394,32 +566,24 @@ def scan_fact_forbidden(fact: MemoryFact) -> ForbiddenScanResult:
         
         # Scan key
         if fact.key:
-            for patterns, reason in PATTERN_GROUPS:
-                matches = _scan_text_for_patterns(fact.key, "key", patterns, reason)
-                all_matches.extend(matches)
+            all_matches.extend(_scan_field(fact.key, "key"))
         
         # Scan value_str
         if fact.value_str:
-            for patterns, reason in PATTERN_GROUPS:
-                matches = _scan_text_for_patterns(fact.value_str, "value_str", patterns, reason)
-                all_matches.extend(matches)
+            all_matches.extend(_scan_field(fact.value_str, "value_str"))
         
         # Scan value_list_str
         if fact.value_list_str:
-            for i, item in enumerate(fact.value_list_str):
+            for item in fact.value_list_str:
                 normalized_item = _normalize_list_item(item)
                 if normalized_item:
-                    for patterns, reason in PATTERN_GROUPS:
-                        matches = _scan_text_for_patterns(normalized_item, "value_str_list", patterns, reason)
-                        all_matches.extend(matches)
+                    all_matches.extend(_scan_field(normalized_item, "value_str_list"))
         
         # Scan tags
         if fact.tags:
             for tag in fact.tags:
                 if tag:
-                    for patterns, reason in PATTERN_GROUPS:
-                        matches = _scan_text_for_patterns(tag, "tags", patterns, reason)
-                        all_matches.extend(matches)
+                    all_matches.extend(_scan_field(tag, "tags"))
         
         # Limit matches
         if len(all_matches) > MAX_MATCHES_RETURNED:
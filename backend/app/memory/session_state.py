@@ -0,0 +1,244 @@
+"""
+Batched Session State Repository
+
+Loads and stores the three legacy per-session keys (style, hypotheses,
+summary) in one Redis round trip each way:
+- load: a single MGET of the three payloads plus a version stamp
+- save: a single MULTI/EXEC pipeline that SETs every payload with the session
+  TTL, INCRs the version stamp and refreshes its TTL
+
+Key layout is unchanged from legacy.py, so the legacy load_*/save_* helpers
+and this repository read and write the same data.
+
+Optionally (cache_entries > 0) keeps decoded pydantic objects per process. A
+cached entry is only reused when the version stamp and the raw payloads
+returned by MGET equal the ones it was decoded from, so expired keys or writes
+from other processes are never masked. Callers get copies and may mutate them
+freely; since a pydantic copy costs about as much as a validated decode of a
+small session, the cache is off by default.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from pydantic import TypeAdapter
+
+from backend.app.config import settings
+from backend.app.schemas import CognitiveStyle, Hypothesis, SessionSummary
+
+STYLE_SUFFIX = "style"
+HYPOTHESES_SUFFIX = "hypotheses"
+SUMMARY_SUFFIX = "summary"
+VERSION_SUFFIX = "version"
+
+_HYPOTHESES = TypeAdapter(List[Hypothesis])
+
+
+def session_key(session_id: str, suffix: str) -> str:
+    """Build session key for Redis."""
+    return f"session:{session_id}:{suffix}"
+
+
+def session_keys(session_id: str) -> Tuple[str, str, str, str]:
+    """Keys read by one MGET: style, hypotheses, summary, version."""
+    return (
+        session_key(session_id, STYLE_SUFFIX),
+        session_key(session_id, HYPOTHESES_SUFFIX),
+        session_key(session_id, SUMMARY_SUFFIX),
+        session_key(session_id, VERSION_SUFFIX),
+    )
+
+
+@dataclass
+class SessionState:
+    """Decoded per-session memory; version is the stamp it was read or written at."""
+
+    style: Optional[CognitiveStyle] = None
+    hypotheses: List[Hypothesis] = field(default_factory=list)
+    summary: SessionSummary = field(default_factory=SessionSummary)
+    version: int = 0
+
+    def copy(self) -> "SessionState":
+        return SessionState(
+            style=self.style.model_copy(deep=True) if self.style is not None else None,
+            hypotheses=[h.model_copy() for h in self.hypotheses],
+            summary=self.summary.model_copy(deep=True),
+            version=self.version,
+        )
+
+
+@dataclass(frozen=True)
+class SessionStateStats:
+    loads: int
+    saves: int
+    cache_hits: int
+    cache_entries: int
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    raws: Tuple[object, object, object]
+    state: SessionState
+
+
+def _decode_version(raw) -> int:
+    try:
+        return int(raw) if raw else 0
+    except (TypeError, ValueError):
+        return 0
+
+
+def decode_session_state(raw_style, raw_hypotheses, raw_summary, version: int = 0) -> SessionState:
+    """Decode MGET payloads with the same defaults as the legacy load_* helpers."""
+    return SessionState(
+        style=CognitiveStyle(**json.loads(raw_style)) if raw_style else None,
+        hypotheses=_HYPOTHESES.validate_json(raw_hypotheses) if raw_hypotheses else [],
+        summary=SessionSummary(**json.loads(raw_summary)) if raw_summary else SessionSummary(),
+        version=version,
+    )
+
+
+class SessionStateRepository:
+    """One-round-trip load/save of legacy session memory, with an optional decode cache."""
+
+    def __init__(
+        self,
+        client=None,
+        ttl_seconds: Optional[int] = None,
+        cache_entries: int = 0,
+    ) -> None:
+        """
+        Args:
+            client: redis.Redis-compatible client (mget/pipeline); defaults to legacy get_redis()
+            ttl_seconds: session TTL; defaults to settings.session_ttl_seconds
+            cache_entries: max decoded sessions kept per process (0 disables the cache)
+        """
+        self._client = client
+        self._ttl_seconds = ttl_seconds
+        self._cache_entries = max(0, int(cache_entries))
+        self._cache: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._loads = 0
+        self._saves = 0
+        self._cache_hits = 0
+
+    def _redis(self):
+        if self._client is None:
+            from backend.app.memory.legacy import get_redis
+
+            self._client = get_redis()
+        return self._client
+
+    def _ttl(self) -> int:
+        return self._ttl_seconds if self._ttl_seconds is not None else settings.session_ttl_seconds
+
+    def _cached(self, session_id: str, version: int, raws: Tuple[object, object, object]) -> Optional[SessionState]:
+        if not self._cache_entries or not version:
+            return None
+        with self._lock:
+            entry = self._cache.get(session_id)
+            if entry is None or entry.state.version != version or entry.raws != raws:
+                return None
+            self._cache.move_to_end(session_id)
+            self._cache_hits += 1
+            return entry.state.copy()
+
+    def _remember(self, session_id: str, raws: Tuple[object, object, object], state: SessionState) -> None:
+        if not self._cache_entries or not state.version:
+            return
+        with self._lock:
+            self._cache[session_id] = _CacheEntry(raws=raws, state=state.copy())
+            self._cache.move_to_end(session_id)
+            while len(self._cache) > self._cache_entries:
+                self._cache.popitem(last=False)
+
+    def load(self, session_id: str) -> SessionState:
+        """Read style, hypotheses and summary with one MGET."""
+        raw_style, raw_hypotheses, raw_summary, raw_version = self._redis().mget(session_keys(session_id))
+        with self._lock:
+            self._loads += 1
+        raws = (raw_style, raw_hypotheses, raw_summary)
+        version = _decode_version(raw_version)
+        cached = self._cached(session_id, version, raws)
+        if cached is not None:
+            return cached
+        state = decode_session_state(raw_style, raw_hypotheses, raw_summary, version)
+        self._remember(session_id, raws, state)
+        return state
+
+    def save(self, session_id: str, state: SessionState) -> SessionState:
+        """Write all payloads, bump the version stamp and refresh TTLs in one MULTI/EXEC."""
+        style_key, hypotheses_key, summary_key, version_key = session_keys(session_id)
+        ttl = self._ttl()
+        raw_style = state.style.model_dump_json() if state.style is not None else None
+        raw_hypotheses = _HYPOTHESES.dump_json(state.hypotheses).decode("utf-8")
+        raw_summary = state.summary.model_dump_json()
+
+        pipe = self._redis().pipeline(transaction=True)
+        if raw_style is not None:
+            pipe.set(style_key, raw_style, ex=ttl)
+        else:
+            pipe.delete(style_key)
+        pipe.set(hypotheses_key, raw_hypotheses, ex=ttl)
+        pipe.set(summary_key, raw_summary, ex=ttl)
+        pipe.incr(version_key)
+        pipe.expire(version_key, ttl)
+        results = pipe.execute()
+
+        saved = SessionState(
+            style=state.style,
+            hypotheses=list(state.hypotheses),
+            summary=state.summary,
+            version=_decode_version(results[-2]),
+        )
+        with self._lock:
+            self._saves += 1
+        self._remember(session_id, (raw_style, raw_hypotheses, raw_summary), saved)
+        return saved
+
+    def invalidate(self, session_id: Optional[str] = None) -> None:
+        """Drop one cached session, or all of them."""
+        with self._lock:
+            if session_id is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(session_id, None)
+
+    def stats(self) -> SessionStateStats:
+        with self._lock:
+            return SessionStateStats(
+                loads=self._loads,
+                saves=self._saves,
+                cache_hits=self._cache_hits,
+                cache_entries=len(self._cache),
+            )
+
+
+_repository: Optional[SessionStateRepository] = None
+_repository_lock = threading.Lock()
+
+
+def get_session_state_repository() -> SessionStateRepository:
+    """Process-wide repository bound to the legacy Redis client."""
+    global _repository
+    if _repository is None:
+        with _repository_lock:
+            if _repository is None:
+                _repository = SessionStateRepository()
+    return _repository
+
+
+__all__ = [
+    "SessionState",
+    "SessionStateStats",
+    "SessionStateRepository",
+    "decode_session_state",
+    "get_session_state_repository",
+    "session_key",
+    "session_keys",
+]
@@ -13,6 +13,8 @@ Contract guarantees:
 - Caps enforcement is deterministic with stable priority ordering
 """
 
+import heapq
+from bisect import bisect_left, insort
 from dataclasses import dataclass, field
 from enum import Enum
 from hashlib import sha256
@@ -36,6 +38,11 @@ MAX_SCOPE_ID_LEN = 128
 MAX_REASON_CODE_LEN = 32
 MAX_EVENTS_PER_SCOPE = 10000
 
+# Snapshot + compaction
+MEMORY_SNAPSHOT_VERSION = "19.4.1"
+SNAPSHOT_INTERVAL_EVENTS = 1000
+SNAPSHOT_GENESIS_SIGNATURE = "0" * 64
+
 # Default caps (safe fallback)
 DEFAULT_MAX_FACTS_TOTAL = 100
 DEFAULT_MAX_FACTS_PER_CATEGORY = 25
@@ -171,6 +178,37 @@ class CurrentView:
         return sorted(self.active_facts.keys())
 
 
+# ============================================================================
+# SNAPSHOT (COMPACTED LOG PREFIX)
+# ============================================================================
+
+@dataclass(frozen=True)
+class MemorySnapshot:
+    """
+    Deterministic snapshot of the replay state for a compacted log prefix.
+    
+    Holds the accepted FACT_ADDED event per fact (first-insertion order) and
+    the revoked/expired fact_id sets; independent of now_ms and caps, so
+    replay(snapshot + tail) == replay(full log) for any read.
+    
+    signature chains prev_signature to last_event_id and the retained
+    event ids (structure-only, no raw user text).
+    """
+    scope_id: str
+    last_event_id: str
+    event_count: int
+    facts: Tuple[FactAddedEvent, ...]
+    revoked_ids: Tuple[str, ...]
+    expired_ids: Tuple[str, ...]
+    prev_signature: str
+    signature: str
+    snapshot_version: str = MEMORY_SNAPSHOT_VERSION
+    
+    def record_count(self) -> int:
+        """Records retained in place of event_count compacted events."""
+        return len(self.facts) + len(self.revoked_ids) + len(self.expired_ids)
+
+
 # ============================================================================
 # EVENT ID GENERATION (DETERMINISTIC)
 # ============================================================================
@@ -276,10 +314,53 @@ def _compute_priority_key(meta: ActiveFactMeta) -> Tuple:
 # DERIVED VIEW COMPUTATION
 # ============================================================================
 
+def _fold_events(
+    events: List[MemoryEvent],
+    snapshot: Optional["MemorySnapshot"] = None,
+) -> Tuple[Dict[str, FactAddedEvent], set, set]:
+    """
+    Fold events (optionally on top of a snapshot) into replay state.
+    
+    Returns (accepted FACT_ADDED event per fact_id in first-insertion order,
+    revoked fact_ids, expired fact_ids). Independent of now_ms and caps.
+    """
+    added: Dict[str, FactAddedEvent] = {}
+    revoked_ids: set = set()
+    expired_ids: set = set()
+    if snapshot is not None:
+        for event in snapshot.facts:
+            added[event.fact_id] = event
+        revoked_ids.update(snapshot.revoked_ids)
+        expired_ids.update(snapshot.expired_ids)
+    
+    # Replay events in log order
+    for event in events:
+        if isinstance(event, FactAddedEvent):
+            # Reject duplicate FACT_ADDED unless previously revoked
+            if event.fact_id in added and event.fact_id not in revoked_ids:
+                # Duplicate - skip (policy: reject duplicates)
+                continue
+            
+            # If previously revoked, allow re-add
+            revoked_ids.discard(event.fact_id)
+            added[event.fact_id] = event
+        
+        elif isinstance(event, FactExpiredEvent):
+            # Mark as expired (event dominates)
+            expired_ids.add(event.fact_id)
+        
+        elif isinstance(event, FactRevokedEvent):
+            # Mark as revoked (revocation dominates)
+            revoked_ids.add(event.fact_id)
+    
+    return added, revoked_ids, expired_ids
+
+
 def recompute_current_view(
     events: List[MemoryEvent],
     now_ms: int,
     caps: StoreCaps,
+    snapshot: Optional["MemorySnapshot"] = None,
 ) -> CurrentView:
     """
     Recompute current facts view from event log.
@@ -287,9 +368,10 @@ def recompute_current_view(
     Deterministic: same inputs => identical output.
     
     Args:
-        events: List of events in log order
+        events: List of events in log order (after the snapshot, if given)
         now_ms: Current time in milliseconds
         caps: Store caps for enforcement
+        snapshot: Optional snapshot to start replay from
     
     Returns:
         CurrentView with active facts and metadata
@@ -305,59 +387,17 @@ def recompute_current_view(
             error_code="INVALID_CAPS",
         )
     
-    # Track fact states
-    facts_by_id: Dict[str, ActiveFactMeta] = {}
-    revoked_ids: set = set()
-    expired_ids: set = set()
-    
-    # Replay events in log order
-    for event in events:
-        if isinstance(event, FactAddedEvent):
-            # Reject duplicate FACT_ADDED unless previously revoked
-            if event.fact_id in facts_by_id and event.fact_id not in revoked_ids:
-                # Duplicate - skip (policy: reject duplicates)
-                continue
-            
-            # If previously revoked, allow re-add
-            if event.fact_id in revoked_ids:
-                revoked_ids.discard(event.fact_id)
-            
-            # Check derived expiry
-            is_expired = event.expires_at_ms <= now_ms
-            
-            facts_by_id[event.fact_id] = ActiveFactMeta(
-                fact=event.fact,
-                expires_at_ms=event.expires_at_ms,
-                is_expired=is_expired,
-                is_revoked=False,
-                added_at_ms=event.created_at_ms,
-            )
-        
-        elif isinstance(event, FactExpiredEvent):
-            # Mark as expired (event dominates)
-            expired_ids.add(event.fact_id)
-            if event.fact_id in facts_by_id:
-                meta = facts_by_id[event.fact_id]
-                facts_by_id[event.fact_id] = ActiveFactMeta(
-                    fact=meta.fact,
-                    expires_at_ms=meta.expires_at_ms,
-                    is_expired=True,
-                    is_revoked=meta.is_revoked,
-                    added_at_ms=meta.added_at_ms,
-                )
-        
-        elif isinstance(event, FactRevokedEvent):
-            # Mark as revoked (revocation dominates)
-            revoked_ids.add(event.fact_id)
-            if event.fact_id in facts_by_id:
-                meta = facts_by_id[event.fact_id]
-                facts_by_id[event.fact_id] = ActiveFactMeta(
-                    fact=meta.fact,
-                    expires_at_ms=meta.expires_at_ms,
-                    is_expired=meta.is_expired,
-                    is_revoked=True,
-                    added_at_ms=meta.added_at_ms,
-                )
+    added, revoked_ids, expired_ids = _fold_events(events, snapshot)
+    facts_by_id: Dict[str, ActiveFactMeta] = {
+        fact_id: ActiveFactMeta(
+            fact=event.fact,
+            expires_at_ms=event.expires_at_ms,
+            is_expired=event.expires_at_ms <= now_ms,
+            is_revoked=False,
+            added_at_ms=event.created_at_ms,
+        )
+        for fact_id, event in added.items()
+    }
     
     # Filter to only active facts (not expired, not revoked)
     active_facts: Dict[str, ActiveFactMeta] = {}
@@ -426,6 +466,242 @@ def recompute_current_view(
     )
 
 
+# ============================================================================
+# INCREMENTAL MATERIALIZED VIEW
+# ============================================================================
+
+class MaterializedView:
+    """
+    Incrementally maintained derived view for a single scope.
+    
+    Applies each appended event once, mirroring the replay semantics of
+    recompute_current_view(), so reads cost O(live facts) instead of
+    O(events):
+    - Facts keep first-insertion order (matches replay dict ordering)
+    - Per-category priority index, sorted on _compute_priority_key
+    - Expiry index (expires_at_ms, fact_id) for time-based expiry
+    - Last (now_ms, caps) view is memoized until the next event
+    """
+    
+    def __init__(self):
+        self._entries: Dict[str, ActiveFactMeta] = {}
+        self._seq: Dict[str, int] = {}
+        self._keys: Dict[str, Tuple] = {}
+        self._by_category: Dict[str, List[Tuple]] = {}
+        self._expiry: List[Tuple[int, str]] = []
+        self._revoked: set = set()
+        self._expired: set = set()
+        self._version = 0
+        self._memo: Optional[Tuple[int, int, StoreCaps, CurrentView]] = None
+    
+    @property
+    def version(self) -> int:
+        """Monotonic counter of applied events."""
+        return self._version
+    
+    def live_count(self) -> int:
+        """Facts not revoked or expired by event (time expiry not applied)."""
+        return len(self._keys)
+    
+    def _index(self, fact_id: str, meta: ActiveFactMeta) -> None:
+        key = _compute_priority_key(meta)
+        self._keys[fact_id] = key
+        insort(self._by_category.setdefault(meta.fact.category.value, []), key)
+        insort(self._expiry, (meta.expires_at_ms, fact_id))
+    
+    def _unindex(self, fact_id: str) -> None:
+        key = self._keys.pop(fact_id, None)
+        if key is None:
+            return
+        meta = self._entries[fact_id]
+        items = self._by_category[meta.fact.category.value]
+        del items[bisect_left(items, key)]
+        del self._expiry[bisect_left(self._expiry, (meta.expires_at_ms, fact_id))]
+    
+    def apply(self, event: MemoryEvent) -> None:
+        """Apply one event in log order. Index upkeep is an O(log n) search plus an O(n) list insert/delete."""
+        self._version += 1
+        self._memo = None
+        fact_id = event.fact_id
+        
+        if isinstance(event, FactAddedEvent):
+            # Reject duplicate FACT_ADDED unless previously revoked
+            if fact_id in self._entries and fact_id not in self._revoked:
+                return
+            self._revoked.discard(fact_id)
+            meta = ActiveFactMeta(
+                fact=event.fact,
+                expires_at_ms=event.expires_at_ms,
+                is_expired=False,
+                is_revoked=False,
+                added_at_ms=event.created_at_ms,
+            )
+            if fact_id not in self._seq:
+                self._seq[fact_id] = len(self._seq)
+            self._entries[fact_id] = meta
+            if fact_id not in self._expired:
+                self._index(fact_id, meta)
+        
+        elif isinstance(event, FactExpiredEvent):
+            self._expired.add(fact_id)
+            self._unindex(fact_id)
+        
+        elif isinstance(event, FactRevokedEvent):
+            self._revoked.add(fact_id)
+            self._unindex(fact_id)
+    
+    def view(self, now_ms: int, caps: StoreCaps) -> CurrentView:
+        """
+        Materialize the view for (now_ms, caps).
+        
+        Identical to recompute_current_view(events, now_ms, caps) for the
+        events applied so far.
+        """
+        if not caps.is_valid():
+            return recompute_current_view([], now_ms, caps)
+        
+        memo = self._memo
+        if memo is None or memo[0] != self._version or memo[1] != now_ms or memo[2] != caps:
+            memo = (self._version, now_ms, caps, self._build(now_ms, caps))
+            self._memo = memo
+        cached = memo[3]
+        return CurrentView(
+            active_facts=dict(cached.active_facts),
+            dropped_due_to_caps=list(cached.dropped_due_to_caps),
+            total_active=cached.total_active,
+            per_category_active=dict(cached.per_category_active),
+            store_version=cached.store_version,
+            error_code=cached.error_code,
+        )
+    
+    def _build(self, now_ms: int, caps: StoreCaps) -> CurrentView:
+        # Expiry index tells us whether any live fact is time-expired at now_ms
+        check_expiry = bool(self._expiry) and self._expiry[0][0] <= now_ms
+        entries = self._entries
+        dropped_due_to_caps: List[str] = []
+        
+        # Stage A: Per-category cap (indexes are already in priority order)
+        kept_by_category: List[List[Tuple]] = []
+        for items in self._by_category.values():
+            kept: List[Tuple] = []
+            for key in items:
+                fact_id = key[-1]
+                if check_expiry and entries[fact_id].expires_at_ms <= now_ms:
+                    continue
+                if len(kept) < caps.max_facts_per_category:
+                    kept.append(key)
+                else:
+                    dropped_due_to_caps.append(fact_id)
+            if kept:
+                kept_by_category.append(kept)
+        
+        # Stage B: Total cap over the merged priority order
+        merged = list(heapq.merge(*kept_by_category))
+        if len(merged) > caps.max_facts_total:
+            dropped_due_to_caps.extend(key[-1] for key in merged[caps.max_facts_total:])
+            merged = merged[:caps.max_facts_total]
+        
+        dropped_due_to_caps.sort()
+        
+        seq = self._seq
+        active_ids = sorted((key[-1] for key in merged), key=seq.__getitem__)
+        active_facts: Dict[str, ActiveFactMeta] = {fact_id: entries[fact_id] for fact_id in active_ids}
+        
+        per_category_active: Dict[str, int] = {}
+        for meta in active_facts.values():
+            cat = meta.fact.category.value
+            per_category_active[cat] = per_category_active.get(cat, 0) + 1
+        
+        return CurrentView(
+            active_facts=active_facts,
+            dropped_due_to_caps=dropped_due_to_caps,
+            total_active=len(active_facts),
+            per_category_active=per_category_active,
+            store_version=MEMORY_STORE_VERSION,
+            error_code=None,
+        )
+
+
+# ============================================================================
+# SNAPSHOT BUILD + VERIFY
+# ============================================================================
+
+def _compute_snapshot_signature(
+    prev_signature: str,
+    scope_id: str,
+    last_event_id: str,
+    event_count: int,
+    facts: Tuple[FactAddedEvent, ...],
+    revoked_ids: Tuple[str, ...],
+    expired_ids: Tuple[str, ...],
+) -> str:
+    """Compute chained snapshot signature via SHA256 (structure-only content)."""
+    content = "|".join([
+        MEMORY_SNAPSHOT_VERSION,
+        prev_signature,
+        scope_id,
+        last_event_id,
+        str(event_count),
+        ",".join(event.event_id for event in facts),
+        ",".join(revoked_ids),
+        ",".join(expired_ids),
+    ])
+    return sha256(content.encode("utf-8")).hexdigest()
+
+
+def build_snapshot(
+    scope_id: str,
+    events: List[MemoryEvent],
+    prev: Optional[MemorySnapshot] = None,
+) -> Optional[MemorySnapshot]:
+    """
+    Fold events (the log tail after prev) into a new snapshot.
+    
+    Returns prev unchanged if there are no events to compact.
+    """
+    if not events:
+        return prev
+    added, revoked_ids, expired_ids = _fold_events(events, prev)
+    facts = tuple(added.values())
+    revoked = tuple(sorted(revoked_ids))
+    expired = tuple(sorted(expired_ids))
+    prev_signature = prev.signature if prev else SNAPSHOT_GENESIS_SIGNATURE
+    event_count = (prev.event_count if prev else 0) + len(events)
+    last_event_id = events[-1].event_id
+    return MemorySnapshot(
+        scope_id=scope_id,
+        last_event_id=last_event_id,
+        event_count=event_count,
+        facts=facts,
+        revoked_ids=revoked,
+        expired_ids=expired,
+        prev_signature=prev_signature,
+        signature=_compute_snapshot_signature(
+            prev_signature, scope_id, last_event_id, event_count, facts, revoked, expired
+        ),
+    )
+
+
+def verify_snapshot(snapshot: MemorySnapshot, prev_signature: Optional[str] = None) -> bool:
+    """
+    Verify a snapshot's signature (and chain link if prev_signature given).
+    """
+    if prev_signature is not None and snapshot.prev_signature != prev_signature:
+        return False
+    if snapshot.snapshot_version != MEMORY_SNAPSHOT_VERSION:
+        return False
+    expected = _compute_snapshot_signature(
+        snapshot.prev_signature,
+        snapshot.scope_id,
+        snapshot.last_event_id,
+        snapshot.event_count,
+        snapshot.facts,
+        snapshot.revoked_ids,
+        snapshot.expired_ids,
+    )
+    return expected == snapshot.signature
+
+
 # ============================================================================
 # MEMORY EVENT LOG STORE
 # ============================================================================
@@ -438,10 +714,18 @@ class MemoryEventLogStore:
     - Events are immutable once appended
     - read_events returns copies
     - Recomputation is deterministic
+    - recompute() reads an incrementally maintained view; replay() is the
+      reference path (latest snapshot + log tail) and yields an identical view
+    - Every snapshot_interval appended events the log is compacted: the tail
+      is folded into a chained snapshot and superseded events are dropped
+      (snapshot_interval=0 disables automatic compaction)
     """
     
-    def __init__(self):
+    def __init__(self, snapshot_interval: int = SNAPSHOT_INTERVAL_EVENTS):
         self._events_by_scope: Dict[str, List[MemoryEvent]] = {}
+        self._views_by_scope: Dict[str, MaterializedView] = {}
+        self._snapshots_by_scope: Dict[str, MemorySnapshot] = {}
+        self._snapshot_interval = max(0, int(snapshot_interval))
     
     def append_event(self, scope_id: str, event: MemoryEvent) -> bool:
         """
@@ -457,12 +741,18 @@ class MemoryEventLogStore:
         if scope_id not in self._events_by_scope:
             self._events_by_scope[scope_id] = []
         
-        # Check max events
-        if len(self._events_by_scope[scope_id]) >= MAX_EVENTS_PER_SCOPE:
+        # Check max retained records (snapshot records + log tail)
+        if self.retained_count(scope_id) >= MAX_EVENTS_PER_SCOPE:
             return False
         
         # Append (immutable - we store the event as-is)
         self._events_by_scope[scope_id].append(event)
+        if scope_id not in self._views_by_scope:
+            self._views_by_scope[scope_id] = MaterializedView()
+        self._views_by_scope[scope_id].apply(event)
+        
+        if self._snapshot_interval and len(self._events_by_scope[scope_id]) >= self._snapshot_interval:
+            self.compact(scope_id)
         return True
     
     def append_events(self, scope_id: str, events: List[MemoryEvent]) -> int:
@@ -479,7 +769,7 @@ class MemoryEventLogStore:
     
     def read_events(self, scope_id: str) -> List[MemoryEvent]:
         """
-        Read all events for a scope.
+        Read the log tail for a scope (events after the latest snapshot).
         
         Returns a copy of the event list.
         """
@@ -493,15 +783,50 @@ class MemoryEventLogStore:
         Recompute current view for a scope.
         
         Deterministic: same (events, now_ms, caps) => identical view.
+        Served from the scope's materialized view (no log replay).
         """
+        view = self._views_by_scope.get(scope_id)
+        if view is None:
+            return recompute_current_view([], now_ms, caps)
+        return view.view(now_ms, caps)
+    
+    def replay(self, scope_id: str, now_ms: int, caps: StoreCaps) -> CurrentView:
+        """Recompute the view by replaying the log from the latest snapshot (reference path)."""
         events = self.read_events(scope_id)
-        return recompute_current_view(events, now_ms, caps)
+        return recompute_current_view(events, now_ms, caps, self._snapshots_by_scope.get(scope_id))
+    
+    def compact(self, scope_id: str) -> Optional[MemorySnapshot]:
+        """
+        Fold the log tail into a new chained snapshot and truncate it.
+        
+        Returns the latest snapshot (None if the scope has never had events).
+        """
+        prev = self._snapshots_by_scope.get(scope_id)
+        events = self._events_by_scope.get(scope_id)
+        if not events:
+            return prev
+        snapshot = build_snapshot(scope_id, events, prev)
+        if snapshot is None:
+            return prev
+        self._snapshots_by_scope[scope_id] = snapshot
+        self._events_by_scope[scope_id] = []
+        return snapshot
+    
+    def get_snapshot(self, scope_id: str) -> Optional[MemorySnapshot]:
+        """Get the latest snapshot for a scope (None if never compacted)."""
+        return self._snapshots_by_scope.get(scope_id)
     
     def event_count(self, scope_id: str) -> int:
-        """Get event count for a scope."""
-        if scope_id not in self._events_by_scope:
-            return 0
-        return len(self._events_by_scope[scope_id])
+        """Get total event count for a scope (compacted + tail)."""
+        snapshot = self._snapshots_by_scope.get(scope_id)
+        compacted = snapshot.event_count if snapshot else 0
+        return compacted + len(self._events_by_scope.get(scope_id, []))
+    
+    def retained_count(self, scope_id: str) -> int:
+        """Records held for a scope: snapshot records + log tail length."""
+        snapshot = self._snapshots_by_scope.get(scope_id)
+        records = snapshot.record_count() if snapshot else 0
+        return records + len(self._events_by_scope.get(scope_id, []))
 
 
 # ============================================================================
@@ -599,9 +924,9 @@ class MemoryStore:
 # FACTORY FUNCTIONS
 # ============================================================================
 
-def create_event_log_store() -> MemoryEventLogStore:
+def create_event_log_store(snapshot_interval: int = SNAPSHOT_INTERVAL_EVENTS) -> MemoryEventLogStore:
     """Create a new event log store instance."""
-    return MemoryEventLogStore()
+    return MemoryEventLogStore(snapshot_interval=snapshot_interval)
 
 
 def create_memory_store(scope_id: str = "default") -> MemoryStore:
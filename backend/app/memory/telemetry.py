@@ -12,12 +12,12 @@ HARD RULES:
 - FAIL-CLOSED: Sanitize unexpected inputs, never crash
 """
 
-import hashlib
-import json
 import re
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+from backend.app.perf.canonical import canonical_dumps, canonical_sha256
+
 
 # ============================================================================
 # CONSTANTS
@@ -295,7 +295,7 @@ def canonical_json(obj: Any) -> str:
     Convert object to canonical JSON string.
     Deterministic ordering with sorted keys.
     """
-    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+    return canonical_dumps(obj)
 
 
 def compute_memory_signature(struct_pack: Dict[str, Any]) -> str:
@@ -305,8 +305,7 @@ def compute_memory_signature(struct_pack: Dict[str, Any]) -> str:
     """
     # Create signature pack without the signature field itself
     sig_pack = {k: v for k, v in struct_pack.items() if k != "memory_signature"}
-    canonical = canonical_json(sig_pack)
-    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    return canonical_sha256(sig_pack)
 
 
 # ============================================================================
@@ -489,7 +488,7 @@ def assert_no_text_leakage(event_obj: Any, sentinels: List[str]) -> None:
     Assert that none of the sentinel strings appear in the event JSON.
     Used in tests only; not for production runtime.
     """
-    event_json = canonical_json(asdict(event_obj) if hasattr(event_obj, '__dataclass_fields__') else event_obj)
+    event_json = canonical_json(event_obj)
     
     for sentinel in sentinels:
         if sentinel in event_json:
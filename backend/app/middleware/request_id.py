@@ -12,6 +12,8 @@ import uuid
 import logging
 from typing import Optional
 
+from backend.app.observability.log_pipeline import bind_log_sample_key, reset_log_sample_key
+
 logger = logging.getLogger(__name__)
 
 # Safe pattern for incoming X-Request-ID: hex/uuid-ish, max 64 chars
@@ -71,6 +73,8 @@ class RequestIdMiddleware:
             else:
                 await send(message)
         
+        # Sampled log events are kept or dropped together for this request
+        sample_token = bind_log_sample_key(request_id)
         try:
             await self.app(scope, receive, send_wrapper)
         finally:
@@ -86,6 +90,7 @@ class RequestIdMiddleware:
                     "request_id": request_id,
                 }
             )
+            reset_log_sample_key(sample_token)
     
     def _generate_request_id(self, scope) -> str:
         """Generate or extract request ID with safe pattern validation."""
@@ -3,6 +3,7 @@ from __future__ import annotations
 from .request_id import get_request_id
 from .logging import structured_log, safe_redact, hash_subject
 from .invocation_log import record_invocation
+from .log_pipeline import lazy, lazy_json, set_log_sampling
 from .metrics import counter, gauge, histogram, event, should_sample, build_chat_summary_fields
 
 __all__ = [
@@ -11,6 +12,9 @@ __all__ = [
     "safe_redact",
     "hash_subject",
     "record_invocation",
+    "lazy",
+    "lazy_json",
+    "set_log_sampling",
     "counter",
     "gauge",
     "histogram",
@@ -11,15 +11,15 @@ def record_invocation(event: Dict[str, Any]) -> bool:
     Expected columns: ts (timestamptz), route, status_code, latency_ms, error_code,
     hashed_subject, session_id, model_used.
     """
+    conn = None
     try:
         try:
-            from backend.app.db.database import get_db_connection  # type: ignore
+            from backend.app.db.database import acquire_db_connection, release_db_connection  # type: ignore
         except Exception:
             return False
 
-        conn = None
         try:
-            conn = get_db_connection()
+            conn = acquire_db_connection()
         except Exception:
             return False
         if conn is None:
@@ -46,6 +46,9 @@ def record_invocation(event: Dict[str, Any]) -> bool:
         return True
     except Exception:
         return False
+    finally:
+        if conn is not None:
+            release_db_connection(conn)
 
 
 __all__ = ["record_invocation"]
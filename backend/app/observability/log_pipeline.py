@@ -0,0 +1,375 @@
+"""
+Asynchronous log pipeline.
+
+Handlers attached to the root logger by dictConfig write synchronously on the
+event loop or worker thread that logged. install_log_pipeline() moves them
+behind a queue:
+
+- BoundedQueueHandler: the only root handler; enqueues with put_nowait into a
+  queue of LOG_QUEUE_SIZE records and never blocks. Records that do not fit
+  are dropped and counted (per level, and as the log_records_dropped metric)
+- a QueueListener thread formats and writes the records with the original
+  handlers (their own levels still apply)
+- lazy payloads: lazy(fn, ...) / lazy_json(obj) defer building an extra or an
+  argument. Disabled levels and sampled-out records never build it. Lazy
+  arguments of accepted records are built on the logging thread (the message
+  is a snapshot); lazy extras stay deferred until a formatter reads them on
+  the listener thread, so extras the format string ignores are never built
+- per-event sampling: set_log_sampling(event, rate_or_hook) keeps a fraction
+  of the INFO/DEBUG records of one event (the literal message, or the
+  event_name extra set by structured_log). The decision is stable per request
+  (bind_log_sample_key), so a kept request keeps all of its sampled events.
+  WARNING and above are never sampled out.
+
+LOG_QUEUE_SIZE=0 keeps the synchronous handlers (sampling still applies).
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import logging
+import queue
+import random
+import threading
+from contextvars import ContextVar, Token
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Dict, List, Optional, Union
+
+LOG_QUEUE_SIZE_DEFAULT = 10000
+
+SampleHook = Callable[[logging.LogRecord], bool]
+
+
+# ---------------------------
+# Lazy payloads
+# ---------------------------
+
+
+class Lazy:
+    """Deferred log value; built at most once, only if a handler takes the record."""
+
+    __slots__ = ("_fn", "_args", "_value", "_built")
+
+    def __init__(self, fn: Callable[..., Any], *args: Any) -> None:
+        self._fn = fn
+        self._args = args
+        self._value: Any = None
+        self._built = False
+
+    def resolve(self) -> Any:
+        if not self._built:
+            try:
+                self._value = self._fn(*self._args)
+            except Exception as exc:
+                # logging must never break the request path
+                self._value = f"<unavailable: {type(exc).__name__}>"
+            self._built = True
+            self._fn = None  # type: ignore[assignment]
+            self._args = ()
+        return self._value
+
+    def __str__(self) -> str:
+        return str(self.resolve())
+
+    def __repr__(self) -> str:
+        return repr(self.resolve())
+
+
+def lazy(fn: Callable[..., Any], *args: Any) -> Lazy:
+    return Lazy(fn, *args)
+
+
+def _dumps(obj: Any) -> str:
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def lazy_json(obj: Any) -> Lazy:
+    """Compact JSON of obj, serialized only when the record is emitted."""
+    return Lazy(_dumps, obj)
+
+
+def resolve_lazy_args(record: logging.LogRecord) -> logging.LogRecord:
+    """Replace Lazy message args of record with their values (in place)."""
+    args = record.args
+    if isinstance(args, tuple):
+        if any(isinstance(a, Lazy) for a in args):
+            record.args = tuple(a.resolve() if isinstance(a, Lazy) else a for a in args)
+    elif isinstance(args, dict):
+        if any(isinstance(a, Lazy) for a in args.values()):
+            record.args = {k: (v.resolve() if isinstance(v, Lazy) else v) for k, v in args.items()}
+    return record
+
+
+def resolve_lazy(record: logging.LogRecord) -> logging.LogRecord:
+    """Replace Lazy args and extras of record with their values (in place), for sinks that read extras as data."""
+    resolve_lazy_args(record)
+    attrs = record.__dict__
+    for key, value in attrs.items():
+        if isinstance(value, Lazy):
+            attrs[key] = value.resolve()
+    return record
+
+
+# ---------------------------
+# Per-event sampling
+# ---------------------------
+
+_sample_key: ContextVar[Optional[str]] = ContextVar("log_sample_key", default=None)
+
+
+def bind_log_sample_key(key: Optional[str]) -> Token:
+    """Make sampling decisions stable for the current request (usually its request id)."""
+    return _sample_key.set(key)
+
+
+def reset_log_sample_key(token: Token) -> None:
+    _sample_key.reset(token)
+
+
+def _keep(key: str, rate: float) -> bool:
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / float(1 << 64) < rate
+
+
+def event_name_of(record: logging.LogRecord) -> Optional[str]:
+    name = getattr(record, "event_name", None)
+    if name:
+        return name
+    return record.msg if isinstance(record.msg, str) else None
+
+
+class EventSampler(logging.Filter):
+    """Handler filter applying per-event sample rates or hooks below WARNING."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._rules: Dict[str, Union[float, SampleHook]] = {}
+
+    def set(self, event: str, rule: Union[float, SampleHook, None]) -> None:
+        if rule is None:
+            self._rules.pop(event, None)
+        elif callable(rule):
+            self._rules[event] = rule
+        else:
+            self._rules[event] = max(0.0, min(1.0, float(rule)))
+
+    def clear(self) -> None:
+        self._rules.clear()
+
+    def rules(self) -> Dict[str, Union[float, SampleHook]]:
+        return dict(self._rules)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not self._rules or record.levelno >= logging.WARNING:
+            return True
+        event = event_name_of(record)
+        rule = self._rules.get(event) if event is not None else None
+        if rule is None:
+            return True
+        if callable(rule):
+            try:
+                return bool(rule(record))
+            except Exception:
+                return True
+        if rule >= 1.0:
+            return True
+        if rule <= 0.0:
+            return False
+        key = _sample_key.get()
+        if key is None:
+            return random.random() < rule
+        return _keep(key, rule)
+
+
+_sampler = EventSampler()
+
+
+def set_log_sampling(event: str, rule: Union[float, SampleHook, None]) -> None:
+    """
+    Sample the INFO/DEBUG records of one event.
+
+    rule is a keep rate in [0, 1], a hook (record -> keep?) or None to log
+    every record again.
+    """
+    _sampler.set(event, rule)
+
+
+def parse_sample_rates(spec: Optional[str]) -> Dict[str, float]:
+    """Parse LOG_SAMPLE_RATES ("event=rate,event=rate"); malformed entries are skipped."""
+    rates: Dict[str, float] = {}
+    for part in (spec or "").split(","):
+        event, sep, rate = part.rpartition("=")
+        event = event.strip()
+        if not sep or not event:
+            continue
+        try:
+            rates[event] = max(0.0, min(1.0, float(rate)))
+        except ValueError:
+            continue
+    return rates
+
+
+# ---------------------------
+# Queue handler / listener
+# ---------------------------
+
+
+_exc_formatter = logging.Formatter()
+
+
+class BoundedQueueHandler(QueueHandler):
+    """QueueHandler that drops (and counts) records instead of blocking when full."""
+
+    def __init__(self, maxsize: int) -> None:
+        # SimpleQueue (C, lock-free put) bounded by a qsize check: the bound
+        # may be overshot by concurrent producers, never by more than one
+        # record each
+        super().__init__(queue.SimpleQueue())
+        self.maxsize = max(1, int(maxsize))
+        self.dropped: Dict[str, int] = {}
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Snapshot on the caller (message, traceback text); the listener does
+        # the formatting. Lazy extras are left for the formatter, which only
+        # builds the ones its format string reads. The record is reused, not
+        # copied: later handlers format the same text from msg and exc_text.
+        resolve_lazy_args(record)
+        record.message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = _exc_formatter.formatException(record.exc_info)
+        record.msg = record.message
+        record.args = None
+        record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.queue.qsize() < self.maxsize:
+            self.queue.put_nowait(record)
+        else:
+            self.dropped[record.levelname] = self.dropped.get(record.levelname, 0) + 1
+            try:
+                from backend.app.observability.metrics import counter
+
+                counter("log_records_dropped", 1, labels={"level": record.levelname})
+            except Exception:
+                return
+
+
+class _Pipeline:
+    def __init__(self, logger: logging.Logger, handler: BoundedQueueHandler, listener: QueueListener, targets: List[logging.Handler]) -> None:
+        self.logger = logger
+        self.handler = handler
+        self.listener = listener
+        self.targets = targets
+
+
+_lock = threading.Lock()
+_pipelines: Dict[str, _Pipeline] = {}
+
+
+def _settings_value(name: str, default: Any) -> Any:
+    try:
+        from backend.app.config import get_settings
+
+        value = getattr(get_settings(), name, default)
+        return default if value is None else value
+    except Exception:
+        return default
+
+
+def install_log_pipeline(
+    queue_size: Optional[int] = None,
+    sample_rates: Optional[Dict[str, float]] = None,
+    logger: Optional[logging.Logger] = None,
+) -> Optional[BoundedQueueHandler]:
+    """
+    Put the handlers of logger (root by default) behind a bounded queue.
+
+    Defaults come from LOG_QUEUE_SIZE and LOG_SAMPLE_RATES. Idempotent while
+    the logger's pipeline is running. Returns the queue handler, or None when
+    the pipeline is disabled (queue_size <= 0) or there is nothing to move.
+    """
+    if queue_size is None:
+        queue_size = int(_settings_value("log_queue_size", LOG_QUEUE_SIZE_DEFAULT))
+    if sample_rates is None:
+        sample_rates = parse_sample_rates(_settings_value("log_sample_rates", ""))
+    for event, rate in sample_rates.items():
+        _sampler.set(event, rate)
+
+    target = logger or logging.getLogger()
+    with _lock:
+        running = _pipelines.get(target.name)
+        if running is not None:
+            return running.handler
+        targets = [h for h in target.handlers if not isinstance(h, BoundedQueueHandler)]
+        if queue_size <= 0 or not targets:
+            for h in targets:
+                if _sampler not in h.filters:
+                    h.addFilter(_sampler)
+            return None
+        handler = BoundedQueueHandler(queue_size)
+        handler.addFilter(_sampler)
+        listener = QueueListener(handler.queue, *targets, respect_handler_level=True)
+        for h in targets:
+            target.removeHandler(h)
+        target.addHandler(handler)
+        listener.start()
+        _pipelines[target.name] = _Pipeline(target, handler, listener, targets)
+        return handler
+
+
+def stop_log_pipeline(logger: Optional[logging.Logger] = None) -> None:
+    """Restore the synchronous handlers of logger, then drain the queue and stop the listener."""
+    target = logger or logging.getLogger()
+    with _lock:
+        pipeline = _pipelines.pop(target.name, None)
+    if pipeline is None:
+        return
+    for h in pipeline.targets:
+        target.addHandler(h)
+    target.removeHandler(pipeline.handler)
+    pipeline.listener.stop()
+    # Queued records were sampled when logged; later ones are sampled by the handlers
+    for h in pipeline.targets:
+        if _sampler not in h.filters:
+            h.addFilter(_sampler)
+
+
+def _stop_all() -> None:
+    for pipeline in list(_pipelines.values()):
+        stop_log_pipeline(pipeline.logger)
+
+
+def log_pipeline_stats(logger: Optional[logging.Logger] = None) -> Dict[str, Any]:
+    pipeline = _pipelines.get((logger or logging.getLogger()).name)
+    if pipeline is None:
+        return {"running": False, "queued": 0, "queue_size": 0, "dropped": {}}
+    return {
+        "running": True,
+        "queued": pipeline.handler.queue.qsize(),
+        "queue_size": pipeline.handler.maxsize,
+        "dropped": dict(pipeline.handler.dropped),
+    }
+
+
+atexit.register(_stop_all)
+
+
+__all__ = [
+    "Lazy",
+    "lazy",
+    "lazy_json",
+    "resolve_lazy",
+    "resolve_lazy_args",
+    "EventSampler",
+    "set_log_sampling",
+    "parse_sample_rates",
+    "bind_log_sample_key",
+    "reset_log_sample_key",
+    "BoundedQueueHandler",
+    "install_log_pipeline",
+    "stop_log_pipeline",
+    "log_pipeline_stats",
+]
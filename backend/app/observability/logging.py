@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import logging
 from typing import Any, Dict
 
 from backend.app.config import get_settings
+from backend.app.observability.log_pipeline import lazy_json
 
 logger = logging.getLogger(__name__)
 
@@ -30,9 +30,13 @@ def safe_redact(event: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def structured_log(event: Dict[str, Any]) -> None:
+    # Serialized only if a handler takes the record (level, sampling by event/type)
+    if not logger.isEnabledFor(logging.INFO):
+        return
     try:
         safe_event = safe_redact(event)
-        logger.info(json.dumps(safe_event, separators=(",", ":")))
+        name = safe_event.get("event") or safe_event.get("type")
+        logger.info("%s", lazy_json(safe_event), extra={"event_name": name if isinstance(name, str) else None})
     except Exception:
         # logging must never break the request path
         return
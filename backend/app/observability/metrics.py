@@ -1,9 +1,36 @@
+"""
+In-process metrics registry.
+
+counter/histogram/gauge aggregate in memory instead of logging every sample:
+
+- per-thread shards: each thread writes its own dicts without taking a lock;
+  a scrape or rollup merges all shards (shards of finished threads are folded
+  into a retired total)
+- fixed-bucket histograms (DEFAULT_BUCKETS_MS unless set with
+  set_histogram_buckets before the first observation) with sum and count
+- label cardinality cap: a metric admits at most METRICS_MAX_SERIES_PER_METRIC
+  label sets; later ones are counted under {overflow="true"}
+- every METRICS_ROLLUP_INTERVAL_SECONDS one structured log line per metric
+  carries the deltas since the previous rollup (0 disables rollups)
+- render_prometheus() returns the merged state in Prometheus text format,
+  served at /metrics when METRICS_ENABLED=1
+
+Labels must stay low-cardinality and structure-only (plan, status, scope);
+never subject ids, IPs or user text.
+"""
+
 from __future__ import annotations
 
 import hashlib
+import itertools
 import json
 import logging
-from typing import Any, Dict
+import math
+import re
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 try:
     from backend.app.observability.logging import structured_log, safe_redact
@@ -13,6 +40,22 @@ except Exception:  # pragma: no cover - fallback when imports unavailable
 
 logger = logging.getLogger(__name__)
 
+METRICS_MAX_SERIES_PER_METRIC_DEFAULT = 64
+METRICS_ROLLUP_INTERVAL_SECONDS_DEFAULT = 60
+MAX_LABEL_VALUE_CHARS = 64
+
+# Latency buckets (ms); +Inf is implicit
+DEFAULT_BUCKETS_MS: Tuple[float, ...] = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+OVERFLOW_LABELS: Tuple[Tuple[str, str], ...] = (("overflow", "true"),)
+
+SeriesKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+_NAME_INVALID = re.compile(r"[^a-zA-Z0-9_:]")
+_LABEL_INVALID = re.compile(r"[^a-zA-Z0-9_]")
+
 
 def _safe_structured(payload: Dict[str, Any]) -> None:
     try:
@@ -29,19 +72,398 @@ def _safe_structured(payload: Dict[str, Any]) -> None:
         return
 
 
+class _Histogram:
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+
+class _Shard:
+    """One thread's samples. Only the owning thread writes to it."""
+
+    __slots__ = ("counters", "gauges", "histograms", "series", "thread")
+
+    def __init__(self, thread: Optional[threading.Thread]) -> None:
+        self.counters: Dict[SeriesKey, float] = {}
+        self.gauges: Dict[SeriesKey, Tuple[int, float]] = {}  # (write seq, value)
+        self.histograms: Dict[SeriesKey, _Histogram] = {}
+        # (name, raw label items) -> admitted series key
+        self.series: Dict[Tuple[str, Any], SeriesKey] = {}
+        self.thread = thread
+
+
+class MetricsSnapshot:
+    """Merged registry state at one point in time."""
+
+    def __init__(
+        self,
+        kinds: Dict[str, str],
+        counters: Dict[SeriesKey, float],
+        gauges: Dict[SeriesKey, float],
+        histograms: Dict[SeriesKey, Tuple[Tuple[float, ...], List[int], float]],
+    ) -> None:
+        self.kinds = kinds
+        self.counters = counters
+        self.gauges = gauges
+        self.histograms = histograms
+
+
+def _merge_shard(
+    shard: _Shard,
+    counters: Dict[SeriesKey, float],
+    gauges: Dict[SeriesKey, Tuple[int, float]],
+    histograms: Dict[SeriesKey, Tuple[Tuple[float, ...], List[int], float]],
+) -> None:
+    # dict()/list() copies are atomic under the GIL, so a concurrent writer
+    # never breaks iteration; a histogram may trail its sum by one sample.
+    for key, value in dict(shard.counters).items():
+        counters[key] = counters.get(key, 0) + value
+    for key, entry in dict(shard.gauges).items():
+        current = gauges.get(key)
+        if current is None or entry[0] > current[0]:
+            gauges[key] = entry
+    for key, cell in dict(shard.histograms).items():
+        counts = list(cell.counts)
+        merged = histograms.get(key)
+        if merged is None or merged[0] != cell.bounds:
+            histograms[key] = (cell.bounds, counts, cell.sum)
+        else:
+            histograms[key] = (cell.bounds, [a + b for a, b in zip(merged[1], counts)], merged[2] + cell.sum)
+
+
+class MetricsRegistry:
+    """Sharded counters, gauges and histograms (see module docstring)."""
+
+    def __init__(
+        self,
+        *,
+        max_series_per_metric: int = METRICS_MAX_SERIES_PER_METRIC_DEFAULT,
+        rollup_interval_s: float = METRICS_ROLLUP_INTERVAL_SECONDS_DEFAULT,
+        clock=time.monotonic,
+    ) -> None:
+        if max_series_per_metric <= 0:
+            raise ValueError("max_series_per_metric must be > 0")
+        self.max_series_per_metric = int(max_series_per_metric)
+        self.rollup_interval_s = max(0.0, float(rollup_interval_s))
+        self._clock = clock
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: List[_Shard] = []
+        self._retired = _Shard(None)
+        self._kinds: Dict[str, str] = {}
+        self._admitted: Dict[str, Set[Tuple[Tuple[str, str], ...]]] = {}
+        self._buckets: Dict[str, Tuple[float, ...]] = {}
+        self._seq = itertools.count(1)
+        self.overflowed = 0
+        self._rollup_lock = threading.Lock()
+        self._last_rollup: Optional[MetricsSnapshot] = None
+        self._last_rollup_at = clock()
+        self._next_rollup = self._last_rollup_at + self.rollup_interval_s if self.rollup_interval_s else math.inf
+
+    # -- write path -----------------------------------------------------
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _Shard(threading.current_thread())
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+        return shard
+
+    def _series(self, shard: _Shard, kind: str, name: str, labels: Optional[Dict[str, Any]]) -> Optional[SeriesKey]:
+        raw = tuple(labels.items()) if labels else ()
+        try:
+            key = shard.series.get((name, raw))
+        except TypeError:  # unhashable label values
+            raw = tuple((k, str(v)) for k, v in raw)
+            key = shard.series.get((name, raw))
+        if key is None:
+            key = self._admit(kind, name, raw)
+            if key is None:
+                return None
+            shard.series[(name, raw)] = key
+        return key
+
+    def _admit(self, kind: str, name: str, raw: Tuple[Tuple[Any, Any], ...]) -> Optional[SeriesKey]:
+        label_set = tuple(sorted(
+            (_LABEL_INVALID.sub("_", str(k)) or "_", str(v)[:MAX_LABEL_VALUE_CHARS]) for k, v in raw
+        ))
+        with self._lock:
+            known = self._kinds.setdefault(name, kind)
+            if known != kind:
+                # One name, one type: a conflicting sample is dropped
+                return None
+            admitted = self._admitted.setdefault(name, set())
+            if label_set not in admitted:
+                if len(admitted) >= self.max_series_per_metric:
+                    self.overflowed += 1
+                    return (name, OVERFLOW_LABELS)
+                admitted.add(label_set)
+        return (name, label_set)
+
+    def inc(self, name: str, value: float = 1, labels: Optional[Dict[str, Any]] = None) -> None:
+        shard = self._shard()
+        key = self._series(shard, "counter", name, labels)
+        if key is not None:
+            shard.counters[key] = shard.counters.get(key, 0) + value
+        self._maybe_rollup()
+
+    def set(self, name: str, value: float, labels: Optional[Dict[str, Any]] = None) -> None:
+        shard = self._shard()
+        key = self._series(shard, "gauge", name, labels)
+        if key is not None:
+            shard.gauges[key] = (next(self._seq), value)
+        self._maybe_rollup()
+
+    def observe(self, name: str, value: float, labels: Optional[Dict[str, Any]] = None) -> None:
+        shard = self._shard()
+        key = self._series(shard, "histogram", name, labels)
+        if key is not None:
+            cell = shard.histograms.get(key)
+            if cell is None:
+                cell = shard.histograms[key] = _Histogram(self._buckets.get(name, DEFAULT_BUCKETS_MS))
+            cell.observe(value)
+        self._maybe_rollup()
+
+    def set_buckets(self, name: str, buckets: Iterable[float]) -> None:
+        """Bucket upper bounds for a histogram; applies to series created afterwards."""
+        bounds = tuple(sorted(float(b) for b in buckets if not math.isinf(float(b))))
+        if not bounds:
+            raise ValueError("at least one finite bucket is required")
+        self._buckets[name] = bounds
+
+    # -- read path ------------------------------------------------------
+
+    def snapshot(self) -> MetricsSnapshot:
+        counters: Dict[SeriesKey, float] = {}
+        gauges: Dict[SeriesKey, Tuple[int, float]] = {}
+        histograms: Dict[SeriesKey, Tuple[Tuple[float, ...], List[int], float]] = {}
+        with self._lock:
+            live = []
+            for shard in self._shards:
+                if shard.thread is not None and not shard.thread.is_alive():
+                    # Finished threads never write again: fold them in once
+                    self._fold(shard)
+                else:
+                    live.append(shard)
+            self._shards = live
+            shards = [self._retired] + live
+            kinds = dict(self._kinds)
+        for shard in shards:
+            _merge_shard(shard, counters, gauges, histograms)
+        return MetricsSnapshot(kinds, counters, {k: v for k, (_, v) in gauges.items()}, histograms)
+
+    def _fold(self, shard: _Shard) -> None:
+        retired = self._retired
+        for key, value in shard.counters.items():
+            retired.counters[key] = retired.counters.get(key, 0) + value
+        for key, entry in shard.gauges.items():
+            current = retired.gauges.get(key)
+            if current is None or entry[0] > current[0]:
+                retired.gauges[key] = entry
+        for key, cell in shard.histograms.items():
+            target = retired.histograms.get(key)
+            if target is None or target.bounds != cell.bounds:
+                retired.histograms[key] = cell
+                continue
+            target.counts = [a + b for a, b in zip(target.counts, cell.counts)]
+            target.sum += cell.sum
+
+    def render_prometheus(self) -> str:
+        snap = self.snapshot()
+        by_name: Dict[str, List[SeriesKey]] = {}
+        for table in (snap.counters, snap.gauges, snap.histograms):
+            for key in table:
+                by_name.setdefault(key[0], []).append(key)
+        lines: List[str] = []
+        for name in sorted(by_name):
+            kind = snap.kinds.get(name, "untyped")
+            metric = _metric_name(name)
+            lines.append(f"# TYPE {metric} {kind}")
+            for key in sorted(by_name[name]):
+                labels = key[1]
+                if kind == "histogram":
+                    bounds, counts, total = snap.histograms[key]
+                    cumulative = 0
+                    for bound, count in zip(bounds, counts):
+                        cumulative += count
+                        lines.append(f"{metric}_bucket{_labels(labels, ('le', _number(bound)))} {cumulative}")
+                    cumulative += counts[-1]
+                    lines.append(f"{metric}_bucket{_labels(labels, ('le', '+Inf'))} {cumulative}")
+                    lines.append(f"{metric}_sum{_labels(labels)} {_number(total)}")
+                    lines.append(f"{metric}_count{_labels(labels)} {cumulative}")
+                else:
+                    table = snap.counters if kind == "counter" else snap.gauges
+                    lines.append(f"{metric}{_labels(labels)} {_number(table[key])}")
+        lines.append("# TYPE metrics_series_overflow counter")
+        lines.append(f"metrics_series_overflow {self.overflowed}")
+        return "\n".join(lines) + "\n"
+
+    # -- rollups --------------------------------------------------------
+
+    def _maybe_rollup(self) -> None:
+        if self._clock() < self._next_rollup:
+            return
+        if not self._rollup_lock.acquire(blocking=False):
+            return
+        try:
+            if self._clock() >= self._next_rollup:
+                self._rollup()
+        finally:
+            self._rollup_lock.release()
+
+    def flush_rollup(self) -> int:
+        """Emit a rollup now (e.g. on shutdown); returns the number of log lines."""
+        with self._rollup_lock:
+            return self._rollup()
+
+    def _rollup(self) -> int:
+        now = self._clock()
+        interval = now - self._last_rollup_at
+        self._last_rollup_at = now
+        if self.rollup_interval_s:
+            self._next_rollup = now + self.rollup_interval_s
+        snap = self.snapshot()
+        previous = self._last_rollup
+        self._last_rollup = snap
+        emitted = 0
+        for name, series in sorted(_rollup_series(snap, previous).items()):
+            _safe_structured({
+                "type": "metric_rollup",
+                "metric_type": snap.kinds.get(name, "untyped"),
+                "name": name,
+                "interval_s": round(interval, 3),
+                "series": series,
+            })
+            emitted += 1
+        return emitted
+
+
+def _rollup_series(snap: MetricsSnapshot, previous: Optional[MetricsSnapshot]) -> Dict[str, List[Dict[str, Any]]]:
+    out: Dict[str, List[Dict[str, Any]]] = {}
+    for key, value in sorted(snap.counters.items()):
+        delta = value - (previous.counters.get(key, 0) if previous else 0)
+        if delta:
+            out.setdefault(key[0], []).append({"labels": dict(key[1]), "value": delta})
+    for key, value in sorted(snap.gauges.items()):
+        if previous is None or previous.gauges.get(key) != value:
+            out.setdefault(key[0], []).append({"labels": dict(key[1]), "value": value})
+    for key, (bounds, counts, total) in sorted(snap.histograms.items()):
+        before = previous.histograms.get(key) if previous else None
+        if before is not None and before[0] == bounds:
+            counts = [a - b for a, b in zip(counts, before[1])]
+            total -= before[2]
+        count = sum(counts)
+        if count:
+            entry: Dict[str, Any] = {"labels": dict(key[1]), "count": count, "sum": round(total, 3)}
+            for quantile in (0.5, 0.95, 0.99):
+                entry[f"p{int(quantile * 100)}_le"] = _bucket_quantile(bounds, counts, quantile)
+            out.setdefault(key[0], []).append(entry)
+    return out
+
+
+def _bucket_quantile(bounds: Sequence[float], counts: Sequence[int], quantile: float) -> Optional[float]:
+    """Upper bound of the bucket holding the quantile (None: above the last bound)."""
+    target = quantile * sum(counts)
+    cumulative = 0
+    for bound, count in zip(bounds, counts):
+        cumulative += count
+        if cumulative >= target:
+            return bound
+    return None
+
+
+def _metric_name(name: str) -> str:
+    cleaned = _NAME_INVALID.sub("_", name) or "_"
+    return "_" + cleaned if cleaned[0].isdigit() else cleaned
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Tuple[Tuple[str, str], ...], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels)
+    if extra is not None:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _number(value: float) -> str:
+    if isinstance(value, int) or (isinstance(value, float) and value.is_integer()):
+        return str(int(value))
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+def _settings_int(name: str, default: int) -> int:
+    try:
+        from backend.app.config import get_settings
+
+        value = getattr(get_settings(), name, default)
+        return int(value) if value is not None else default
+    except Exception:
+        return default
+
+
+_registry = MetricsRegistry(
+    max_series_per_metric=max(1, _settings_int("metrics_max_series_per_metric", METRICS_MAX_SERIES_PER_METRIC_DEFAULT)),
+    rollup_interval_s=max(0, _settings_int("metrics_rollup_interval_seconds", METRICS_ROLLUP_INTERVAL_SECONDS_DEFAULT)),
+)
+
+
+def get_registry() -> MetricsRegistry:
+    return _registry
+
+
+def set_histogram_buckets(name: str, buckets: Iterable[float]) -> None:
+    _registry.set_buckets(name, buckets)
+
+
+def render_prometheus() -> str:
+    return _registry.render_prometheus()
+
+
+def flush_rollup() -> int:
+    try:
+        return _registry.flush_rollup()
+    except Exception:
+        return 0
+
+
 def counter(name: str, value: int = 1, labels: dict[str, str] | None = None) -> None:
-    payload = {"type": "metric", "metric_type": "counter", "name": name, "value": int(value), "labels": labels or {}}
-    _safe_structured(payload)
+    try:
+        _registry.inc(name, value, labels)
+    except Exception:
+        # metrics must never break the request path
+        return
 
 
 def histogram(name: str, value: float, labels: dict[str, str] | None = None) -> None:
-    payload = {"type": "metric", "metric_type": "histogram", "name": name, "value": float(value), "labels": labels or {}}
-    _safe_structured(payload)
+    try:
+        _registry.observe(name, float(value), labels)
+    except Exception:
+        return
 
 
 def gauge(name: str, value: float, labels: dict[str, str] | None = None) -> None:
-    payload = {"type": "metric", "metric_type": "gauge", "name": name, "value": float(value), "labels": labels or {}}
-    _safe_structured(payload)
+    try:
+        _registry.set(name, float(value), labels)
+    except Exception:
+        return
 
 
 def event(name: str, fields: Dict[str, Any]) -> None:
@@ -113,6 +535,13 @@ def build_chat_summary_fields(
 
 
 __all__ = [
+    "MetricsRegistry",
+    "PROMETHEUS_CONTENT_TYPE",
+    "DEFAULT_BUCKETS_MS",
+    "get_registry",
+    "set_histogram_buckets",
+    "render_prometheus",
+    "flush_rollup",
     "counter",
     "histogram",
     "gauge",
@@ -16,7 +16,19 @@ from .budgets import (
     outbound_http_read_timeout_s,
     outbound_http_timeout_s,
 )
-from .http_client import get_shared_httpx_client
+from .canonical import canonical_dumps, canonical_dumps_bytes, canonical_sha256
+from .http_client import aclose_shared_async_httpx_client, get_shared_async_httpx_client, get_shared_httpx_client
+from .limiter_store import LimiterStore, LimiterStoreStats
+from .shared_counters import (
+    BatchingCounterBackend,
+    CounterBackend,
+    InProcessCounterBackend,
+    RedisCounterBackend,
+    SharedMemoryCounterBackend,
+    get_counter_backend,
+    shared_counter_backend,
+)
+from .striped import StripedLocks
 from .timeouts import PerfTimeoutError, enforce_timeout, remaining_budget_ms
 
 __all__ = [
@@ -36,7 +48,22 @@ __all__ = [
     "outbound_http_max_connections",
     "outbound_http_max_keepalive_connections",
     "outbound_http_keepalive_expiry_s",
+    "canonical_dumps",
+    "canonical_dumps_bytes",
+    "canonical_sha256",
     "get_shared_httpx_client",
+    "get_shared_async_httpx_client",
+    "aclose_shared_async_httpx_client",
+    "LimiterStore",
+    "LimiterStoreStats",
+    "StripedLocks",
+    "CounterBackend",
+    "InProcessCounterBackend",
+    "SharedMemoryCounterBackend",
+    "RedisCounterBackend",
+    "BatchingCounterBackend",
+    "get_counter_backend",
+    "shared_counter_backend",
     "PerfTimeoutError",
     "enforce_timeout",
     "remaining_budget_ms",
@@ -0,0 +1,121 @@
+"""
+Shared canonical JSON encoder for signatures.
+
+Canonical form is what every signature in governance, memory, research and
+deepthink has always hashed:
+
+    json.dumps(obj, sort_keys=True, separators=(",", ":"))   # ensure_ascii
+
+(json.dumps already sorts nested keys, so the recursive pre-sort some
+modules did before it never changed the output.)
+
+- When orjson is installed it encodes with OPT_SORT_KEYS. Its output is used
+  only where it is byte-identical to the json module: the value tree holds
+  no floats (repr formats differ, NaN becomes null) and the output is
+  printable ASCII (json escapes everything else). Anything else, including
+  ints beyond 64 bits, non-str keys and unsupported types, goes through the
+  pure-Python encoder, so results never depend on which backend is present.
+- Enums encode as their value and dataclasses as a dict of their fields, on
+  both backends, without building intermediate copies (no asdict()).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, Enum):
+        return obj.value
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+_JSON_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), default=_default)
+_ORJSON_OPTIONS = (orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS) if orjson is not None else 0
+_use_orjson = orjson is not None
+
+
+# orjson refuses deeper nesting; the json encoder handles (or rejects) it
+_MAX_DEPTH = 254
+
+
+def _orjson_compatible(obj: Any, depth: int = 0) -> bool:
+    """No floats and only types both backends encode the same way."""
+    kind = type(obj)
+    if kind is str or kind is int or kind is bool or obj is None:
+        return True
+    if depth >= _MAX_DEPTH:
+        return False
+    if kind is dict:
+        for value in obj.values():
+            if not _orjson_compatible(value, depth + 1):
+                return False
+        return True
+    if kind is list or kind is tuple:
+        for item in obj:
+            if not _orjson_compatible(item, depth + 1):
+                return False
+        return True
+    if kind is float:
+        return False
+    if isinstance(obj, Enum):
+        return _orjson_compatible(obj.value, depth + 1)
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return all(_orjson_compatible(getattr(obj, f.name), depth + 1) for f in fields(obj))
+    if isinstance(obj, float):
+        return False
+    if isinstance(obj, (str, int)):
+        return True
+    if isinstance(obj, dict):
+        return _orjson_compatible(dict(obj), depth)
+    if isinstance(obj, (list, tuple)):
+        return _orjson_compatible(list(obj), depth)
+    return False
+
+
+def canonical_backend() -> str:
+    """Name of the active encoder backend ("orjson" or "json")."""
+    return "orjson" if _use_orjson else "json"
+
+
+def set_canonical_backend(name: str) -> None:
+    """Select "orjson" (if installed) or "json"; used by tests and benchmarks."""
+    global _use_orjson
+    if name not in ("orjson", "json"):
+        raise ValueError(f"unknown canonical backend: {name}")
+    _use_orjson = name == "orjson" and orjson is not None
+
+
+def canonical_dumps_bytes(obj: Any) -> bytes:
+    """Canonical JSON of obj as ASCII bytes."""
+    if _use_orjson and _orjson_compatible(obj):
+        try:
+            encoded = orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+        except TypeError:
+            encoded = None
+        if encoded is not None and encoded.isascii() and b"\x7f" not in encoded:
+            return encoded
+    return _JSON_ENCODER.encode(obj).encode("ascii")
+
+
+def canonical_dumps(obj: Any) -> str:
+    """Canonical JSON of obj as str."""
+    if _use_orjson:
+        return canonical_dumps_bytes(obj).decode("ascii")
+    return _JSON_ENCODER.encode(obj)
+
+
+def canonical_sha256(obj: Any) -> str:
+    """SHA-256 hex digest of the canonical JSON of obj."""
+    return hashlib.sha256(canonical_dumps_bytes(obj)).hexdigest()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 import httpx
 
 from backend.app.perf.budgets import (
@@ -12,21 +14,82 @@ from backend.app.perf.budgets import (
 )
 
 _shared_client: httpx.Client | None = None
+_shared_async_client: httpx.AsyncClient | None = None
+_shared_async_loop: asyncio.AbstractEventLoop | None = None
+# Close tasks for clients replaced after a loop change (kept so they are not collected mid-close)
+_retiring: set[asyncio.Future] = set()
 
 
-def get_shared_httpx_client() -> httpx.Client:
-    global _shared_client
-    if _shared_client is not None:
-        return _shared_client
-    timeout = httpx.Timeout(
+def _default_timeout() -> httpx.Timeout:
+    return httpx.Timeout(
         outbound_http_timeout_s(),
         connect=outbound_http_connect_timeout_s(),
         read=outbound_http_read_timeout_s(),
     )
-    limits = httpx.Limits(
+
+
+def _default_limits() -> httpx.Limits:
+    return httpx.Limits(
         max_connections=outbound_http_max_connections(),
         max_keepalive_connections=outbound_http_max_keepalive_connections(),
         keepalive_expiry=outbound_http_keepalive_expiry_s(),
     )
-    _shared_client = httpx.Client(timeout=timeout, limits=limits)
+
+
+def get_shared_httpx_client() -> httpx.Client:
+    global _shared_client
+    if _shared_client is not None:
+        return _shared_client
+    _shared_client = httpx.Client(timeout=_default_timeout(), limits=_default_limits())
     return _shared_client
+
+
+def get_shared_async_httpx_client() -> httpx.AsyncClient:
+    """
+    Shared AsyncClient for the running event loop.
+
+    Its connection pool belongs to the loop that created it, so a new client is
+    built if the loop changed (e.g. a fresh asyncio.run in tests/scripts).
+    In-flight concurrency is bounded by outbound_http_max_connections sockets.
+    """
+    global _shared_async_client, _shared_async_loop
+    loop = asyncio.get_running_loop()
+    if _shared_async_client is not None and _shared_async_loop is loop and not _shared_async_client.is_closed:
+        return _shared_async_client
+    if _shared_async_client is not None:
+        _retire_async_client(_shared_async_client, _shared_async_loop, loop)
+    _shared_async_client = httpx.AsyncClient(timeout=_default_timeout(), limits=_default_limits())
+    _shared_async_loop = loop
+    return _shared_async_client
+
+
+async def _aclose_quietly(client: httpx.AsyncClient) -> None:
+    try:
+        await client.aclose()
+    except Exception:
+        return
+
+
+def _retire_async_client(
+    client: httpx.AsyncClient,
+    owner: asyncio.AbstractEventLoop | None,
+    current: asyncio.AbstractEventLoop,
+) -> None:
+    """Close a client replaced after a loop change: on its own loop if that still runs, else on this one."""
+    if client.is_closed:
+        return
+    if owner is not None and owner is not current and owner.is_running() and not owner.is_closed():
+        future: asyncio.Future = asyncio.wrap_future(asyncio.run_coroutine_threadsafe(_aclose_quietly(client), owner), loop=current)
+    else:
+        future = current.create_task(_aclose_quietly(client))
+    _retiring.add(future)
+    future.add_done_callback(_retiring.discard)
+
+
+async def aclose_shared_async_httpx_client() -> None:
+    global _shared_async_client, _shared_async_loop
+    client = _shared_async_client
+    _shared_async_client = None
+    _shared_async_loop = None
+    if client is not None and not client.is_closed:
+        await client.aclose()
@@ -0,0 +1,219 @@
+"""
+Bounded, self-pruning key/value store for in-process limiter state.
+
+Used by the WAF memory fallback, the WAF prefilter and the quota token
+buckets, where a new key appears per subject (and per window bucket) and
+plain dicts grew without bound.
+
+- LRU order over an OrderedDict: insert, touch and capacity eviction are O(1)
+- optional per-key TTL; expiry slots (expires_at // resolution_s) form a
+  time wheel indexed by a min-heap of slot ids, so a prune pops only the
+  slots that are due and costs O(expired keys), not O(size)
+- hard ceiling of max_keys entries: inserting past it evicts the least
+  recently used key
+- prune runs lazily from get/set at most once per slot, and eviction counts
+  go to metrics on the same cadence; an expired entry is never returned even
+  if its slot has not been swept yet
+
+Each store takes "now" from its caller (wall clock for the WAF, monotonic for
+quotas) or from `clock`; a single store must be fed one clock consistently.
+"""
+
+from __future__ import annotations
+
+import heapq
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, Hashable, List, Optional, Set, Tuple, TypeVar
+
+try:
+    from backend.app.observability.metrics import counter
+except Exception:  # pragma: no cover - metrics are best effort
+    counter = None  # type: ignore[assignment]
+
+LIMITER_STORE_MAX_KEYS_DEFAULT = 10_000
+LIMITER_STORE_RESOLUTION_S_DEFAULT = 1.0
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class LimiterStoreStats:
+    size: int
+    max_keys: int
+    inserts: int
+    expired: int
+    evicted: int
+
+
+def _emit_counter(name: str, value: int, store: str) -> None:
+    try:
+        if counter and value:
+            counter(name, value, {"store": store})
+    except Exception:
+        return
+
+
+class LimiterStore(Generic[V]):
+    """LRU map with per-key TTL and a hard size ceiling (see module docstring)."""
+
+    def __init__(
+        self,
+        max_keys: int = LIMITER_STORE_MAX_KEYS_DEFAULT,
+        *,
+        resolution_s: float = LIMITER_STORE_RESOLUTION_S_DEFAULT,
+        clock: Callable[[], float] = time.monotonic,
+        name: str = "limiter",
+    ) -> None:
+        if max_keys <= 0:
+            raise ValueError("max_keys must be > 0")
+        if resolution_s <= 0:
+            raise ValueError("resolution_s must be > 0")
+        self.max_keys = int(max_keys)
+        self.resolution_s = float(resolution_s)
+        self.name = name
+        self._clock = clock
+        # key -> (value, expires_at or None, slot or None)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Optional[float], Optional[int]]]" = OrderedDict()
+        self._slots: Dict[int, Set[Hashable]] = {}
+        self._slot_heap: List[int] = []
+        self._scheduled: Set[int] = set()
+        self._pruned_slot: Optional[int] = None
+        self._lock = threading.Lock()
+        self._inserts = 0
+        self._expired = 0
+        self._evicted = 0
+        self._reported_evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def _slot(self, ts: float) -> int:
+        return int(ts // self.resolution_s)
+
+    def _unlink(self, key: Hashable, slot: Optional[int]) -> None:
+        if slot is None:
+            return
+        keys = self._slots.get(slot)
+        if keys is not None:
+            keys.discard(key)
+            # Sets never shrink, so drop emptied slots instead of keeping their tables.
+            if not keys:
+                del self._slots[slot]
+
+    def _prune_locked(self, now: float) -> int:
+        current = self._slot(now)
+        if self._pruned_slot is not None and current <= self._pruned_slot:
+            return 0
+        self._pruned_slot = current
+        self._report()
+        expired = 0
+        # A slot holds keys expiring within it, so only slots strictly before
+        # the current one are entirely due; the rest is checked on read.
+        while self._slot_heap and self._slot_heap[0] < current:
+            slot = heapq.heappop(self._slot_heap)
+            self._scheduled.discard(slot)
+            for key in self._slots.pop(slot, ()):
+                self._entries.pop(key, None)
+                expired += 1
+        self._expired += expired
+        return expired
+
+    def _report(self) -> None:
+        # Evictions are reported once per swept slot rather than per key.
+        delta = self._evicted - self._reported_evicted
+        if delta:
+            self._reported_evicted = self._evicted
+            _emit_counter("limiter_store_evictions", delta, self.name)
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Drop every key whose TTL slot has passed; returns how many were dropped."""
+        now = self._clock() if now is None else now
+        with self._lock:
+            return self._prune_locked(now)
+
+    def get(self, key: Hashable, default: Any = None, now: Optional[float] = None) -> Any:
+        """Value for key (refreshing its LRU position), or default if absent or expired."""
+        now = self._clock() if now is None else now
+        with self._lock:
+            self._prune_locked(now)
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            value, expires_at, slot = entry
+            if expires_at is not None and expires_at <= now:
+                del self._entries[key]
+                self._unlink(key, slot)
+                self._expired += 1
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: V, ttl_s: Optional[float] = None, now: Optional[float] = None) -> None:
+        """Insert or replace key; ttl_s=None keeps it until evicted or popped."""
+        now = self._clock() if now is None else now
+        expires_at = now + ttl_s if ttl_s is not None else None
+        slot = self._slot(expires_at) if expires_at is not None else None
+        with self._lock:
+            self._prune_locked(now)
+            previous = self._entries.get(key)
+            if previous is not None:
+                if previous[2] != slot:
+                    self._unlink(key, previous[2])
+            else:
+                self._inserts += 1
+            self._entries[key] = (value, expires_at, slot)
+            self._entries.move_to_end(key)
+            if slot is not None and (previous is None or previous[2] != slot):
+                keys = self._slots.get(slot)
+                if keys is None:
+                    keys = self._slots[slot] = set()
+                    if slot not in self._scheduled:
+                        self._scheduled.add(slot)
+                        heapq.heappush(self._slot_heap, slot)
+                keys.add(key)
+            while len(self._entries) > self.max_keys:
+                old_key, (_, _, old_slot) = self._entries.popitem(last=False)
+                self._unlink(old_key, old_slot)
+                self._evicted += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return default
+            self._unlink(key, entry[2])
+            return entry[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._slots.clear()
+            self._slot_heap.clear()
+            self._scheduled.clear()
+            self._pruned_slot = None
+
+    def stats(self) -> LimiterStoreStats:
+        with self._lock:
+            return LimiterStoreStats(
+                size=len(self._entries),
+                max_keys=self.max_keys,
+                inserts=self._inserts,
+                expired=self._expired,
+                evicted=self._evicted,
+            )
+
+
+__all__ = [
+    "LIMITER_STORE_MAX_KEYS_DEFAULT",
+    "LIMITER_STORE_RESOLUTION_S_DEFAULT",
+    "LimiterStore",
+    "LimiterStoreStats",
+]
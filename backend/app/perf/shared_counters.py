@@ -0,0 +1,645 @@
+"""
+Counters and token buckets shared across uvicorn workers.
+
+Quota buckets and the cost budgets used to live in per-process maps, so with
+N workers every limit was effectively N times its configured value and the
+"global" daily cost budget was per worker. This module puts that state
+behind one small interface with three backends:
+
+- InProcessCounterBackend: per-process maps (the previous behaviour; also
+  the fallback while a shared backend is unreachable)
+- SharedMemoryCounterBackend: a fixed-size hash table in an mmap'd file
+  (e.g. under /dev/shm) shared by every worker on the host. Slots are
+  grouped into stripes; a stripe is guarded by a thread lock plus a POSIX
+  byte-range lock on its region, so updates are atomic across processes
+- RedisCounterBackend: cluster-wide state, with INCRBY and the token-bucket
+  refill/take done in Lua scripts so each update is one atomic round trip
+
+BatchingCounterBackend wraps a remote backend so the request path rarely
+waits on it: increments accumulate locally and are flushed in one pipelined
+round trip every flush interval (or once max_pending calls are queued),
+totals are cached for the same interval, and token buckets are leased in
+small batches (tokens are debited remotely before they are spent locally, so
+a limit is never exceeded, only held back by at most one lease per worker).
+Counters may trail other workers' increments by one flush interval.
+
+Backend selection comes from settings (LIMITER_BACKEND=memory|shm|redis);
+shared_counter_backend() returns None for the in-process default so callers
+keep their existing local fast path.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from hashlib import blake2b
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .limiter_store import LimiterStore
+from .striped import StripedLocks
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+LIMITER_BACKEND_DEFAULT = "memory"
+LIMITER_FLUSH_INTERVAL_MS_DEFAULT = 250
+LIMITER_BATCH_MAX_DEFAULT = 64
+LIMITER_TOKEN_LEASE_DEFAULT = 4
+SHM_SLOTS_DEFAULT = 65_536
+
+# key -> (amount, ttl_s)
+Increments = Mapping[str, Tuple[int, float]]
+
+
+class CounterBackend(ABC):
+    """Atomic counters and multi-key token buckets keyed by string."""
+
+    # True when state is private to this process (callers may keep a local fast path).
+    process_local: bool = False
+
+    @abstractmethod
+    def incr_many(self, items: Increments) -> Dict[str, int]:
+        """Add each amount (creating the key with ttl_s if absent); return new totals."""
+
+    @abstractmethod
+    def get_many(self, keys: Sequence[str]) -> Dict[str, int]:
+        """Current totals; missing or expired keys read as 0."""
+
+    @abstractmethod
+    def take_tokens(
+        self,
+        keys: Sequence[str],
+        capacity: float,
+        refill_per_s: float,
+        *,
+        ttl_s: float,
+        want: int = 1,
+        need: int = 1,
+        now: Optional[float] = None,
+    ) -> Tuple[int, float]:
+        """
+        Refill every bucket in keys (new buckets start full), then take the
+        same number of tokens from all of them: min(want, floor(min tokens))
+        if every bucket holds at least `need`, else nothing.
+
+        Returns (granted, retry_after_s); retry_after_s is 0.0 when granted.
+        """
+
+    def incr(self, key: str, amount: int, ttl_s: float) -> int:
+        return self.incr_many({key: (amount, ttl_s)})[key]
+
+    def get(self, key: str) -> int:
+        return self.get_many([key]).get(key, 0)
+
+    def flush(self) -> None:
+        """Push locally buffered updates, if the backend buffers any."""
+
+    def close(self) -> None:
+        """Release connections or mappings."""
+
+
+def _refill(tokens: float, updated_at: float, capacity: float, refill_per_s: float, now: float) -> float:
+    if now > updated_at:
+        tokens = min(capacity, tokens + (now - updated_at) * refill_per_s)
+    return tokens
+
+
+def _retry_after(tokens: Sequence[float], need: int, refill_per_s: float) -> float:
+    short = max(need - t for t in tokens)
+    if short <= 0:
+        return 0.0
+    if refill_per_s <= 0:
+        return 60.0
+    return short / refill_per_s
+
+
+class InProcessCounterBackend(CounterBackend):
+    """Per-process state in bounded LimiterStores (wall clock)."""
+
+    process_local = True
+
+    def __init__(self, max_keys: int = 50_000, *, clock: Callable[[], float] = time.time) -> None:
+        self._clock = clock
+        # key -> (count, expires_at); the expiry is fixed when the key is created.
+        self._counts: LimiterStore[Tuple[int, float]] = LimiterStore(max_keys, clock=clock, name="shared_counts_local")
+        self._buckets: LimiterStore[Tuple[float, float]] = LimiterStore(max_keys, clock=clock, name="shared_buckets_local")
+        self._locks = StripedLocks()
+
+    def incr_many(self, items: Increments) -> Dict[str, int]:
+        now = self._clock()
+        totals: Dict[str, int] = {}
+        for key, (amount, ttl_s) in items.items():
+            with self._locks.hold(key):
+                count, expires_at = self._counts.get(key, (0, now + ttl_s), now=now)
+                count += int(amount)
+                self._counts.set(key, (count, expires_at), ttl_s=expires_at - now, now=now)
+                totals[key] = count
+        return totals
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, int]:
+        now = self._clock()
+        return {key: self._counts.get(key, (0, now), now=now)[0] for key in keys}
+
+    def take_tokens(self, keys, capacity, refill_per_s, *, ttl_s, want=1, need=1, now=None):
+        now = self._clock() if now is None else now
+        with self._locks.hold_many(keys):
+            tokens = []
+            for key in keys:
+                state = self._buckets.get(key, None, now=now)
+                if state is None:
+                    tokens.append(float(capacity))
+                else:
+                    tokens.append(_refill(state[0], state[1], capacity, refill_per_s, now))
+            retry = _retry_after(tokens, need, refill_per_s)
+            if retry > 0:
+                return 0, retry
+            granted = min(int(want), int(math.floor(min(tokens))))
+            for key, available in zip(keys, tokens):
+                self._buckets.set(key, (available - granted, now), ttl_s=ttl_s, now=now)
+            return granted, 0.0
+
+    def clear(self) -> None:
+        self._counts.clear()
+        self._buckets.clear()
+
+
+_SHM_MAGIC = b"CSCNT001"
+_SHM_HEADER = struct.Struct("<8sQ")
+_SHM_HEADER_SIZE = 64
+# key hash, expires_at, a (count or tokens), b (bucket updated_at)
+_SLOT = struct.Struct("<Qddd")
+_STRIPE_SLOTS = 64
+
+
+def _key_hash(key: str) -> int:
+    h = int.from_bytes(blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+    return h or 1
+
+
+class SharedMemoryCounterBackend(CounterBackend):
+    """
+    Host-wide state in an mmap'd file shared by every worker process.
+
+    The table has `slots` fixed 32-byte slots split into stripes of 64. A key
+    hashes to one stripe and probes only inside it, so one stripe lock covers
+    every slot the key can touch. Expired slots are reused in place; when a
+    stripe is full of live keys the one closest to expiry is evicted. Keys
+    are stored as 64-bit hashes.
+    """
+
+    def __init__(self, path: str, *, slots: int = SHM_SLOTS_DEFAULT, clock: Callable[[], float] = time.time) -> None:
+        if fcntl is None:
+            raise RuntimeError("shared-memory counters need fcntl (POSIX)")
+        if slots < _STRIPE_SLOTS or slots % _STRIPE_SLOTS:
+            raise ValueError(f"slots must be a positive multiple of {_STRIPE_SLOTS}")
+        self.path = path
+        self._clock = clock
+        size = _SHM_HEADER_SIZE + slots * _SLOT.size
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, _SHM_HEADER_SIZE, 0)
+            try:
+                if os.fstat(self._fd).st_size < size:
+                    os.ftruncate(self._fd, size)
+                header = os.pread(self._fd, _SHM_HEADER.size, 0)
+                magic, existing = _SHM_HEADER.unpack(header)
+                if magic != _SHM_MAGIC:
+                    os.pwrite(self._fd, _SHM_HEADER.pack(_SHM_MAGIC, slots), 0)
+                elif existing != slots:
+                    raise ValueError(f"{path} holds {existing} slots, expected {slots}")
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, _SHM_HEADER_SIZE, 0)
+            self._mm = mmap.mmap(self._fd, size)
+        except Exception:
+            os.close(self._fd)
+            raise
+        self._stripes = slots // _STRIPE_SLOTS
+        self._thread_locks = [threading.Lock() for _ in range(self._stripes)]
+
+    # -- locking ---------------------------------------------------------
+
+    def _stripe_of(self, h: int) -> int:
+        return (h >> 32) % self._stripes
+
+    def _lock(self, stripes: Sequence[int]) -> None:
+        for stripe in stripes:
+            self._thread_locks[stripe].acquire()
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, _STRIPE_SLOTS * _SLOT.size, self._offset(stripe * _STRIPE_SLOTS))
+
+    def _unlock(self, stripes: Sequence[int]) -> None:
+        for stripe in reversed(stripes):
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, _STRIPE_SLOTS * _SLOT.size, self._offset(stripe * _STRIPE_SLOTS))
+            self._thread_locks[stripe].release()
+
+    # -- slots -----------------------------------------------------------
+
+    @staticmethod
+    def _offset(index: int) -> int:
+        return _SHM_HEADER_SIZE + index * _SLOT.size
+
+    def _find(self, h: int, now: float, create: bool) -> Tuple[Optional[int], bool]:
+        """(slot index, live) for hash h in its (held) stripe; index None if absent and not create."""
+        base = self._stripe_of(h) * _STRIPE_SLOTS
+        home = h % _STRIPE_SLOTS
+        reusable: Optional[int] = None
+        oldest: Tuple[float, int] = (math.inf, base)
+        for probe in range(_STRIPE_SLOTS):
+            index = base + (home + probe) % _STRIPE_SLOTS
+            slot_hash, expires_at, _, _ = _SLOT.unpack_from(self._mm, self._offset(index))
+            if slot_hash == h:
+                return index, expires_at > now
+            if slot_hash == 0:
+                return (reusable if reusable is not None else index) if create else None, False
+            if expires_at <= now:
+                if reusable is None:
+                    reusable = index
+            elif expires_at < oldest[0]:
+                oldest = (expires_at, index)
+        if not create:
+            return None, False
+        return (reusable if reusable is not None else oldest[1]), False
+
+    def _read(self, index: int) -> Tuple[int, float, float, float]:
+        return _SLOT.unpack_from(self._mm, self._offset(index))
+
+    def _write(self, index: int, h: int, expires_at: float, a: float, b: float) -> None:
+        _SLOT.pack_into(self._mm, self._offset(index), h, expires_at, a, b)
+
+    # -- CounterBackend --------------------------------------------------
+
+    def incr_many(self, items: Increments) -> Dict[str, int]:
+        totals: Dict[str, int] = {}
+        for key, (amount, ttl_s) in items.items():
+            h = _key_hash(key)
+            stripes = [self._stripe_of(h)]
+            self._lock(stripes)
+            try:
+                now = self._clock()
+                index, live = self._find(h, now, create=True)
+                if live:
+                    _, expires_at, value, _ = self._read(index)
+                else:
+                    expires_at, value = now + ttl_s, 0.0
+                value += int(amount)
+                self._write(index, h, expires_at, value, 0.0)
+            finally:
+                self._unlock(stripes)
+            totals[key] = int(value)
+        return totals
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, int]:
+        totals: Dict[str, int] = {}
+        for key in keys:
+            h = _key_hash(key)
+            stripes = [self._stripe_of(h)]
+            self._lock(stripes)
+            try:
+                index, live = self._find(h, self._clock(), create=False)
+                totals[key] = int(self._read(index)[2]) if index is not None and live else 0
+            finally:
+                self._unlock(stripes)
+        return totals
+
+    def take_tokens(self, keys, capacity, refill_per_s, *, ttl_s, want=1, need=1, now=None):
+        hashes = [_key_hash(key) for key in keys]
+        stripes = sorted({self._stripe_of(h) for h in hashes})
+        self._lock(stripes)
+        try:
+            now = self._clock() if now is None else now
+            slots: List[Tuple[int, int]] = []
+            tokens: List[float] = []
+            for h in hashes:
+                index, live = self._find(h, now, create=True)
+                if live:
+                    _, _, available, updated_at = self._read(index)
+                    tokens.append(_refill(available, updated_at, capacity, refill_per_s, now))
+                else:
+                    tokens.append(float(capacity))
+                slots.append((index, h))
+            retry = _retry_after(tokens, need, refill_per_s)
+            if retry > 0:
+                return 0, retry
+            granted = min(int(want), int(math.floor(min(tokens))))
+            for (index, h), available in zip(slots, tokens):
+                self._write(index, h, now + ttl_s, available - granted, now)
+            return granted, 0.0
+        finally:
+            self._unlock(stripes)
+
+    def close(self) -> None:
+        try:
+            self._mm.close()
+        finally:
+            os.close(self._fd)
+
+
+_INCR_LUA = """
+local total = redis.call('INCRBY', KEYS[1], ARGV[1])
+if redis.call('TTL', KEYS[1]) < 0 then
+  redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return total
+"""
+
+# ARGV: capacity, refill_per_s, want, need, now, ttl_ms
+_TAKE_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local want = tonumber(ARGV[3])
+local need = tonumber(ARGV[4])
+local now = tonumber(ARGV[5])
+local tokens = {}
+local granted = want
+local short = 0
+for i, key in ipairs(KEYS) do
+  local state = redis.call('HMGET', key, 't', 'u')
+  local t = tonumber(state[1])
+  local u = tonumber(state[2])
+  if t == nil or u == nil then
+    t = capacity
+  elseif now > u then
+    t = math.min(capacity, t + (now - u) * rate)
+  end
+  tokens[i] = t
+  if need - t > short then short = need - t end
+  granted = math.min(granted, math.floor(t))
+end
+if short > 0 then
+  if rate <= 0 then return {0, '60'} end
+  return {0, tostring(short / rate)}
+end
+for i, key in ipairs(KEYS) do
+  redis.call('HSET', key, 't', tostring(tokens[i] - granted), 'u', tostring(now))
+  redis.call('PEXPIRE', key, ARGV[6])
+end
+return {granted, '0'}
+"""
+
+
+class RedisCounterBackend(CounterBackend):
+    """
+    Cluster-wide state in Redis. Every update is one Lua script call; bucket
+    refill uses the caller's wall clock, so hosts need NTP-level agreement.
+    Multi-key token takes must hit one node (single instance, or keys that
+    share a hash tag under Redis Cluster).
+    """
+
+    def __init__(self, client: Any, *, prefix: str = "limiter:") -> None:
+        self._client = client
+        self._prefix = prefix
+        self._incr = client.register_script(_INCR_LUA)
+        self._take = client.register_script(_TAKE_LUA)
+
+    def _key(self, key: str) -> str:
+        return self._prefix + key
+
+    def incr_many(self, items: Increments) -> Dict[str, int]:
+        if not items:
+            return {}
+        pipe = self._client.pipeline(transaction=False)
+        for key, (amount, ttl_s) in items.items():
+            self._incr(keys=[self._key(key)], args=[int(amount), max(1, int(math.ceil(ttl_s)))], client=pipe)
+        results = pipe.execute()
+        return {key: int(total) for key, total in zip(items, results)}
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, int]:
+        if not keys:
+            return {}
+        values = self._client.mget([self._key(key) for key in keys])
+        return {key: int(value or 0) for key, value in zip(keys, values)}
+
+    def take_tokens(self, keys, capacity, refill_per_s, *, ttl_s, want=1, need=1, now=None):
+        now = time.time() if now is None else now
+        granted, retry = self._take(
+            keys=[self._key(key) for key in keys],
+            args=[capacity, refill_per_s, int(want), int(need), repr(float(now)), max(1, int(ttl_s * 1000))],
+        )
+        return int(granted), float(retry)
+
+    def close(self) -> None:
+        try:
+            self._client.close()
+        except Exception:
+            return
+
+
+class BatchingCounterBackend(CounterBackend):
+    """
+    Buffers updates to a remote backend (see module docstring).
+
+    While the inner backend is failing, counters are served from the last
+    known totals plus local increments (retried on the next flush) and token
+    buckets fall back to a per-process InProcessCounterBackend.
+    """
+
+    def __init__(
+        self,
+        inner: CounterBackend,
+        *,
+        flush_interval_s: float = LIMITER_FLUSH_INTERVAL_MS_DEFAULT / 1000.0,
+        max_pending: int = LIMITER_BATCH_MAX_DEFAULT,
+        token_lease: int = LIMITER_TOKEN_LEASE_DEFAULT,
+        max_keys: int = 50_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.inner = inner
+        self.flush_interval_s = max(0.0, float(flush_interval_s))
+        self.max_pending = max(1, int(max_pending))
+        self.token_lease = max(1, int(token_lease))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: Dict[str, List[float]] = {}
+        self._pending_calls = 0
+        self._in_flight: Dict[str, int] = {}
+        self._last_flush = clock()
+        # key -> (remote total, fetched_at); stale entries still serve as an outage fallback.
+        self._known: LimiterStore[Tuple[int, float]] = LimiterStore(max_keys, clock=clock, name="shared_counts_known")
+        # tuple(keys) -> tokens already debited remotely but not yet spent here.
+        self._leases: LimiterStore[int] = LimiterStore(max_keys, clock=clock, name="shared_token_leases")
+        self._fallback = InProcessCounterBackend(max_keys)
+        self._failing = False
+
+    def _local_view(self, key: str, remote: int) -> int:
+        pending = self._pending.get(key)
+        return remote + self._in_flight.get(key, 0) + (int(pending[0]) if pending else 0)
+
+    def _note_failure(self, what: str, exc: Exception) -> None:
+        if not self._failing:
+            logger.warning("[LIMITER] shared counter %s failed, using local state: %s", what, type(exc).__name__)
+        self._failing = True
+
+    def incr_many(self, items: Increments) -> Dict[str, int]:
+        now = self._clock()
+        with self._lock:
+            for key, (amount, ttl_s) in items.items():
+                entry = self._pending.setdefault(key, [0, ttl_s])
+                entry[0] += int(amount)
+            self._pending_calls += 1
+            due = self._pending_calls >= self.max_pending or now - self._last_flush >= self.flush_interval_s
+        if due:
+            self.flush()
+        with self._lock:
+            return {key: self._local_view(key, self._known.get(key, (0, 0.0), now=now)[0]) for key in items}
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, int]:
+        now = self._clock()
+        with self._lock:
+            known = {key: self._known.get(key, None, now=now) for key in keys}
+        stale = [key for key, entry in known.items() if entry is None or now - entry[1] >= self.flush_interval_s]
+        if stale:
+            try:
+                fresh = self.inner.get_many(stale)
+            except Exception as exc:  # noqa: BLE001
+                self._note_failure("read", exc)
+            else:
+                self._failing = False
+                with self._lock:
+                    for key, value in fresh.items():
+                        self._known.set(key, (value, now), ttl_s=3600, now=now)
+                        known[key] = (value, now)
+        with self._lock:
+            return {key: self._local_view(key, (known[key] or (0, 0.0))[0]) for key in keys}
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    self._last_flush = self._clock()
+                    return
+                batch = self._pending
+                self._pending = {}
+                self._pending_calls = 0
+                self._in_flight = {key: int(entry[0]) for key, entry in batch.items()}
+                self._last_flush = self._clock()
+            try:
+                totals = self.inner.incr_many({key: (int(entry[0]), entry[1]) for key, entry in batch.items()})
+            except Exception as exc:  # noqa: BLE001
+                self._note_failure("flush", exc)
+                with self._lock:
+                    for key, entry in batch.items():
+                        merged = self._pending.setdefault(key, [0, entry[1]])
+                        merged[0] += entry[0]
+                    self._in_flight = {}
+                return
+            self._failing = False
+            now = self._clock()
+            with self._lock:
+                for key, total in totals.items():
+                    self._known.set(key, (total, now), ttl_s=3600, now=now)
+                self._in_flight = {}
+
+    def take_tokens(self, keys, capacity, refill_per_s, *, ttl_s, want=1, need=1, now=None):
+        lease_key = tuple(keys)
+        local_now = self._clock()
+        with self._lock:
+            leased = self._leases.get(lease_key, 0, now=local_now)
+            if leased >= need:
+                self._leases.set(lease_key, leased - need, ttl_s=ttl_s, now=local_now)
+                return need, 0.0
+        ask = max(int(need), int(want), self.token_lease)
+        try:
+            granted, retry = self.inner.take_tokens(keys, capacity, refill_per_s, ttl_s=ttl_s, want=ask, need=need)
+            self._failing = False
+        except Exception as exc:  # noqa: BLE001
+            self._note_failure("take", exc)
+            return self._fallback.take_tokens(keys, capacity, refill_per_s, ttl_s=ttl_s, want=want, need=need)
+        if granted < need:
+            return 0, retry
+        with self._lock:
+            leased = self._leases.get(lease_key, 0, now=local_now)
+            self._leases.set(lease_key, leased + granted - need, ttl_s=ttl_s, now=local_now)
+        return need, 0.0
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self.inner.close()
+
+
+def _default_shm_path() -> str:
+    root = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(root, "cognitivesystem-limiter")
+
+
+def build_counter_backend(settings: Any) -> CounterBackend:
+    """Backend for LIMITER_BACKEND; unknown names fall back to in-process."""
+    kind = (getattr(settings, "limiter_backend", "") or LIMITER_BACKEND_DEFAULT).strip().lower()
+    if kind == "shm":
+        return SharedMemoryCounterBackend(getattr(settings, "limiter_shm_path", None) or _default_shm_path())
+    if kind == "redis":
+        import redis
+
+        url = getattr(settings, "limiter_redis_url", None) or settings.redis_url
+        client = redis.Redis.from_url(url, decode_responses=True, socket_timeout=0.5, socket_connect_timeout=0.5)
+        return BatchingCounterBackend(
+            RedisCounterBackend(client),
+            flush_interval_s=max(0, int(settings.limiter_flush_interval_ms)) / 1000.0,
+            max_pending=settings.limiter_batch_max,
+            token_lease=settings.limiter_token_lease,
+        )
+    if kind != "memory":
+        logger.warning("[LIMITER] unknown LIMITER_BACKEND=%r, using memory", kind)
+    return InProcessCounterBackend()
+
+
+_backend: Optional[CounterBackend] = None
+_backend_lock = threading.Lock()
+
+
+def get_counter_backend() -> CounterBackend:
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                from backend.app.config import get_settings
+
+                try:
+                    _backend = build_counter_backend(get_settings())
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning("[LIMITER] shared counter backend unavailable, using memory: %s", exc)
+                    _backend = InProcessCounterBackend()
+    return _backend
+
+
+def shared_counter_backend() -> Optional[CounterBackend]:
+    """The configured backend, or None when limits are per-process."""
+    backend = get_counter_backend()
+    return None if backend.process_local else backend
+
+
+def set_counter_backend(backend: Optional[CounterBackend]) -> None:
+    """Install a backend (tests, benchmarks); None re-reads settings on next use."""
+    global _backend
+    with _backend_lock:
+        _backend = backend
+
+
+__all__ = [
+    "LIMITER_BACKEND_DEFAULT",
+    "LIMITER_FLUSH_INTERVAL_MS_DEFAULT",
+    "LIMITER_BATCH_MAX_DEFAULT",
+    "LIMITER_TOKEN_LEASE_DEFAULT",
+    "SHM_SLOTS_DEFAULT",
+    "CounterBackend",
+    "InProcessCounterBackend",
+    "SharedMemoryCounterBackend",
+    "RedisCounterBackend",
+    "BatchingCounterBackend",
+    "build_counter_backend",
+    "get_counter_backend",
+    "shared_counter_backend",
+    "set_counter_backend",
+]
@@ -0,0 +1,63 @@
+"""
+Striped locks for per-key read-modify-write on shared in-process state.
+
+Quota buckets, cost counters and circuit breakers keep per-actor (or
+per-provider) state in process-wide maps that are updated from the event loop,
+from asyncio.to_thread workers and from extra uvicorn threads. One global lock
+would serialise unrelated actors; a lock per key would grow without bound.
+StripedLocks hashes each key onto a fixed set of locks instead:
+
+- the same key always maps to the same stripe, so updates to one actor are
+  serialised and none are lost
+- different actors usually land on different stripes and do not contend
+- hold_many() takes several stripes in index order, so callers updating two
+  keys at once (actor and actor|ip) cannot deadlock each other
+
+Stripes are reentrant so a helper can take the lock its caller already holds.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from typing import Hashable, Iterable, Iterator, List
+
+STRIPES_DEFAULT = 64
+
+
+class StripedLocks:
+    """Fixed pool of reentrant locks addressed by key hash."""
+
+    def __init__(self, stripes: int = STRIPES_DEFAULT) -> None:
+        if stripes <= 0:
+            raise ValueError("stripes must be > 0")
+        size = 1
+        while size < stripes:
+            size <<= 1
+        self._mask = size - 1
+        self._locks: List[threading.RLock] = [threading.RLock() for _ in range(size)]
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+    def index(self, key: Hashable) -> int:
+        return hash(key) & self._mask
+
+    def hold(self, key: Hashable) -> threading.RLock:
+        """The key's stripe, for use as `with locks.hold(key):`."""
+        return self._locks[hash(key) & self._mask]
+
+    @contextmanager
+    def hold_many(self, keys: Iterable[Hashable]) -> Iterator[None]:
+        """Hold the stripes of every key, acquired in stripe order."""
+        locks = [self._locks[i] for i in sorted({self.index(k) for k in keys})]
+        for lock in locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+
+__all__ = ["STRIPES_DEFAULT", "StripedLocks"]
@@ -6,9 +6,10 @@ from datetime import date, datetime, time, timedelta, timezone
 from typing import Optional, Tuple
 
 try:
-    from backend.app.db.database import get_db_connection
+    from backend.app.db.database import acquire_db_connection, release_db_connection
 except Exception:  # pragma: no cover
-    get_db_connection = None  # type: ignore
+    acquire_db_connection = None  # type: ignore
+    release_db_connection = None  # type: ignore
 
 
 @dataclass
@@ -28,14 +29,20 @@ def _today_window() -> tuple[date, datetime]:
 
 
 def _connect():
-    if get_db_connection is None:
+    if acquire_db_connection is None:
         return None
     try:
-        return get_db_connection()
+        return acquire_db_connection()
     except Exception:
         return None
 
 
+def _release(conn) -> None:
+    if release_db_connection is None:
+        return
+    release_db_connection(conn)
+
+
 def _ensure_row(conn, subject_type: str, subject_id: str, window_date: date, reset_at: datetime) -> None:
     with conn.cursor() as cur:
         cur.execute(
@@ -77,10 +84,7 @@ def get_or_create_quota(subject_type: str, subject_id: str) -> Optional[QuotaSta
     except Exception:
         return None
     finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
+        _release(conn)
 
 
 def increment_usage(subject_type: str, subject_id: str, requests_inc: int, tokens_inc: int) -> Optional[QuotaState]:
@@ -109,10 +113,7 @@ def increment_usage(subject_type: str, subject_id: str, requests_inc: int, token
     except Exception:
         return None
     finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
+        _release(conn)
 
 
 def check_request_limit(subject_type: str, subject_id: str, limit: int) -> tuple[bool, Optional[QuotaState]]:
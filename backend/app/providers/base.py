@@ -12,7 +12,7 @@ class LLMRequest:
     """Unified request format for all LLM providers."""
     messages: list[Dict[str, str]]
     model: str
-    temperature: float = 0.7
+    temperature: Optional[float] = 0.7  # None: omit and use the provider default
     max_tokens: Optional[int] = None
     stream: bool = False
     extra_params: Optional[Dict[str, Any]] = None
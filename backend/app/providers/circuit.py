@@ -3,10 +3,15 @@ from __future__ import annotations
 import time
 from typing import Dict, List, Tuple
 
+from backend.app.observability.metrics import counter, gauge
+from backend.app.perf.striped import StripedLocks
+
 # key -> list of failure timestamps
 _FAILURES: Dict[str, List[float]] = {}
 # key -> open_until timestamp
 _OPEN_UNTIL: Dict[str, float] = {}
+# Guards per-key updates of both maps across threads
+_LOCKS = StripedLocks()
 
 
 def _now() -> float:
@@ -18,24 +23,38 @@ def is_open(key: str, *, open_seconds: int) -> Tuple[bool, int | None]:
     until = _OPEN_UNTIL.get(key, 0.0)
     if until > now:
         retry = int(max(1, until - now))
+        counter("provider_circuit_rejections", 1, {"circuit": key})
         return True, retry
+    if until:
+        # Open window lapsed without a success: close it so the gauge does not stay at 1
+        with _LOCKS.hold(key):
+            if 0.0 < _OPEN_UNTIL.get(key, 0.0) <= now:
+                _OPEN_UNTIL.pop(key, None)
+                gauge("provider_circuit_open", 0, {"circuit": key})
     return False, None
 
 
 def record_failure(key: str, *, window_seconds: int, failure_threshold: int, open_seconds: int) -> None:
     now = _now()
     window_start = now - window_seconds
-    bucket = _FAILURES.get(key, [])
-    bucket = [ts for ts in bucket if ts >= window_start]
-    bucket.append(now)
-    _FAILURES[key] = bucket
-    if len(bucket) >= failure_threshold:
-        _OPEN_UNTIL[key] = now + open_seconds
+    with _LOCKS.hold(key):
+        bucket = _FAILURES.get(key, [])
+        bucket = [ts for ts in bucket if ts >= window_start]
+        bucket.append(now)
+        _FAILURES[key] = bucket
+        counter("provider_failures", 1, {"circuit": key})
+        if len(bucket) >= failure_threshold:
+            if _OPEN_UNTIL.get(key, 0.0) <= now:
+                counter("provider_circuit_opened", 1, {"circuit": key})
+            _OPEN_UNTIL[key] = now + open_seconds
+            gauge("provider_circuit_open", 1, {"circuit": key})
 
 
 def record_success(key: str) -> None:
-    _FAILURES.pop(key, None)
-    _OPEN_UNTIL.pop(key, None)
+    with _LOCKS.hold(key):
+        _FAILURES.pop(key, None)
+        if _OPEN_UNTIL.pop(key, None) is not None:
+            gauge("provider_circuit_open", 0, {"circuit": key})
 
 
 __all__ = ["is_open", "record_failure", "record_success"]
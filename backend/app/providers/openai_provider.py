@@ -3,15 +3,21 @@
 from __future__ import annotations
 
 import json
-from typing import AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, Dict, Optional
 
 import httpx
 
+from backend.app.perf.http_client import get_shared_async_httpx_client
+
 from .base import LLMProvider, LLMRequest, LLMResponse, LLMProviderError
 
 
 class OpenAIProvider(LLMProvider):
-    """OpenAI API provider implementation."""
+    """OpenAI API provider implementation.
+
+    Requests go through the shared pooled AsyncClient (perf.http_client), so
+    connections are reused across calls instead of a fresh client per request.
+    """
     
     def __init__(
         self,
@@ -19,46 +25,57 @@ class OpenAIProvider(LLMProvider):
         base_url: str = "https://api.openai.com/v1/chat/completions",
         timeout_seconds: float = 30.0,
         connect_timeout_seconds: float = 10.0,
+        extra_headers: Optional[Dict[str, str]] = None,
     ):
         self.api_key = api_key
         self.base_url = base_url
         self.timeout_seconds = timeout_seconds
         self.connect_timeout_seconds = connect_timeout_seconds
+        self.extra_headers = dict(extra_headers or {})
     
-    async def chat_completion(self, request: LLMRequest) -> LLMResponse:
-        """Execute OpenAI chat completion."""
-        payload = {
+    def _payload(self, request: LLMRequest, *, stream: bool) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {
             "model": request.model,
             "messages": request.messages,
-            "temperature": request.temperature,
         }
+        if request.temperature is not None:
+            payload["temperature"] = request.temperature
+        if stream:
+            payload["stream"] = True
         
         if request.max_tokens:
             payload["max_tokens"] = request.max_tokens
         
         if request.extra_params:
             payload.update(request.extra_params)
-        
+        return payload
+    
+    def _headers(self) -> Dict[str, str]:
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
-        
-        timeout = httpx.Timeout(
+        headers.update(self.extra_headers)
+        return headers
+    
+    def _timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
             self.timeout_seconds,
             connect=self.connect_timeout_seconds,
         )
-        
+    
+    async def chat_completion(self, request: LLMRequest) -> LLMResponse:
+        """Execute OpenAI chat completion."""
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.post(
-                    self.base_url,
-                    headers=headers,
-                    json=payload,
-                    timeout=timeout,
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            client = get_shared_async_httpx_client()
+            resp = await client.post(
+                self.base_url,
+                headers=self._headers(),
+                json=self._payload(request, stream=False),
+                timeout=self._timeout(),
+            )
+            resp.raise_for_status()
+            data = resp.json()
         except httpx.TimeoutException as exc:
             raise LLMProviderError(
                 "OpenAI request timeout",
@@ -98,54 +115,40 @@ class OpenAIProvider(LLMProvider):
             ) from exc
     
     async def stream_completion(self, request: LLMRequest) -> AsyncGenerator[str, None]:
-        """Execute OpenAI streaming chat completion."""
-        payload = {
-            "model": request.model,
-            "messages": request.messages,
-            "temperature": request.temperature,
-            "stream": True,
-        }
-        
-        if request.max_tokens:
-            payload["max_tokens"] = request.max_tokens
-        
-        if request.extra_params:
-            payload.update(request.extra_params)
-        
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-        
-        timeout = httpx.Timeout(
-            self.timeout_seconds,
-            connect=self.connect_timeout_seconds,
-        )
+        """Execute OpenAI streaming chat completion.
+
+        Closing the generator early (consumer stops, task cancelled) closes the
+        upstream response and returns its connection to the pool.
+        """
+        payload = self._payload(request, stream=True)
         
         try:
-            async with httpx.AsyncClient() as client:
-                async with client.stream(
-                    "POST",
-                    self.base_url,
-                    headers=headers,
-                    json=payload,
-                    timeout=timeout,
-                ) as resp:
-                    resp.raise_for_status()
-                    async for line in resp.aiter_lines():
-                        if not line.strip() or line.strip() == "data: [DONE]":
-                            continue
-                        
-                        if line.startswith("data: "):
-                            line = line[6:]
-                        
-                        try:
-                            chunk = json.loads(line)
-                            delta = chunk["choices"][0]["delta"]
-                            if "content" in delta:
-                                yield delta["content"]
-                        except (json.JSONDecodeError, KeyError, IndexError):
-                            continue
+            client = get_shared_async_httpx_client()
+            async with client.stream(
+                "POST",
+                self.base_url,
+                headers=self._headers(),
+                json=payload,
+                timeout=self._timeout(),
+            ) as resp:
+                if resp.is_error:
+                    # Read the body so HTTPStatusError carries a usable response
+                    await resp.aread()
+                resp.raise_for_status()
+                async for line in resp.aiter_lines():
+                    if not line.strip() or line.strip() == "data: [DONE]":
+                        continue
+                    
+                    if line.startswith("data: "):
+                        line = line[6:]
+                    
+                    try:
+                        chunk = json.loads(line)
+                        delta = chunk["choices"][0]["delta"]
+                        if delta.get("content"):
+                            yield delta["content"]
+                    except (json.JSONDecodeError, KeyError, IndexError, TypeError, AttributeError):
+                        continue
         except httpx.TimeoutException as exc:
             raise LLMProviderError(
                 "OpenAI streaming timeout",
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import time
 from dataclasses import dataclass
-from typing import Awaitable, Callable, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Tuple
 
 from backend.app.chat_contract import ChatAction, FailureType
 from backend.app.reliability.breaker import (
@@ -11,7 +12,8 @@ from backend.app.reliability.breaker import (
     force_safety_block,
 )
 from backend.app.quality.gate import clarifying_prompt, evaluate_quality
-from backend.app.safety.envelope import apply_safety, refusal_text
+from backend.app.safety.envelope import BLOCK_KEYWORDS, apply_safety, refusal_text
+from backend.mci_backend.model_output_verify import StreamingOutputVerifier
 from backend.app.perf import enforce_timeout, PerfTimeoutError
 
 
@@ -39,13 +41,7 @@ class Step5Result:
     timeout_where: str | None
 
 
-async def run_step5(ctx: Step5Context, invoke_attempt: Callable[[int], Awaitable[str]]) -> Step5Result:
-    start_ts = time.monotonic()
-
-    def _elapsed_ms() -> int:
-        return int((time.monotonic() - start_ts) * 1000)
-
-    # Breaker or budget blocks short-circuit
+def _blocked_result(ctx: Step5Context) -> Step5Result | None:
     if ctx.breaker_open:
         return Step5Result(
             action=ChatAction.FALLBACK,
@@ -64,6 +60,42 @@ async def run_step5(ctx: Step5Context, invoke_attempt: Callable[[int], Awaitable
             attempts=0,
             timeout_where=None,
         )
+    return None
+
+
+def _exhausted_result(failure_type: FailureType, attempts: int, timeout_where: str | None) -> Step5Result:
+    reason = "timeout" if failure_type == FailureType.TIMEOUT else "provider_unavailable"
+    return Step5Result(
+        action=ChatAction.FALLBACK,
+        rendered_text="Governed response unavailable.",
+        failure_type=failure_type,
+        failure_reason=reason,
+        attempts=attempts,
+        timeout_where=timeout_where,
+    )
+
+
+def _safety_blocked_result(safety_reason: str | None, attempts: int) -> Step5Result:
+    return Step5Result(
+        action=ChatAction.FALLBACK,
+        rendered_text=refusal_text(),
+        failure_type=FailureType.SAFETY_BLOCKED,
+        failure_reason=safety_reason,
+        attempts=attempts,
+        timeout_where=None,
+    )
+
+
+async def run_step5(ctx: Step5Context, invoke_attempt: Callable[[int], Awaitable[str]]) -> Step5Result:
+    start_ts = time.monotonic()
+
+    def _elapsed_ms() -> int:
+        return int((time.monotonic() - start_ts) * 1000)
+
+    # Breaker or budget blocks short-circuit
+    blocked = _blocked_result(ctx)
+    if blocked is not None:
+        return blocked
 
     forced_timeout = force_provider_timeout()
     forced_quality = force_quality_fail()
@@ -134,16 +166,131 @@ async def run_step5(ctx: Step5Context, invoke_attempt: Callable[[int], Awaitable
         )
 
     # Exhausted attempts
-    failure_type = last_failure or FailureType.PROVIDER_UNAVAILABLE
-    reason = "timeout" if failure_type == FailureType.TIMEOUT else "provider_unavailable"
-    return Step5Result(
-        action=ChatAction.FALLBACK,
-        rendered_text="Governed response unavailable.",
-        failure_type=failure_type,
-        failure_reason=reason,
-        attempts=attempts,
-        timeout_where=timeout_where,
+    return _exhausted_result(last_failure or FailureType.PROVIDER_UNAVAILABLE, attempts, timeout_where)
+
+
+StreamItem = Tuple[str, Any]
+
+
+async def run_step5_stream(
+    ctx: Step5Context,
+    open_stream: Callable[[], AsyncIterator[StreamItem]],
+) -> AsyncIterator[StreamItem]:
+    """
+    Streaming run_step5. Attempts are retried like run_step5 (same total
+    deadline and per-attempt cap) only while no delta has been released; once
+    text is out there is no retry.
+
+    open_stream yields ("delta", text), ("reset", None) and finally
+    ("final", text); raising means provider failure. Yields ("delta", text) and
+    ("reset", None) for the client, then ("result", Step5Result). The safety
+    envelope runs over a sliding window as deltas arrive and over the full text
+    at the end; any rejection after text was released emits a reset first.
+    """
+    blocked = _blocked_result(ctx)
+    if blocked is not None:
+        yield ("result", blocked)
+        return
+    if force_provider_timeout():
+        yield ("result", _exhausted_result(FailureType.TIMEOUT, max(1, ctx.max_attempts), "provider"))
+        return
+    if force_safety_block():
+        # The forced block rejects any text, so nothing is requested or released
+        _, safety_reason = apply_safety("", force_block=True)
+        yield ("result", _safety_blocked_result(safety_reason, 0))
+        return
+
+    forced_quality = force_quality_fail()
+    start_ts = time.monotonic()
+
+    def _elapsed_ms() -> int:
+        return int((time.monotonic() - start_ts) * 1000)
+
+    deadline_ms = ctx.total_timeout_ms
+    released = False
+    final_text: str | None = None
+    failure: Step5Result | None = None
+    attempts = 0
+
+    for attempt_idx in range(max(1, ctx.max_attempts)):
+        if attempt_idx and (released or _elapsed_ms() >= deadline_ms):
+            break
+        attempts = attempt_idx + 1
+        attempt_deadline_ms = max(100, min(ctx.per_attempt_timeout_ms, max(0, deadline_ms - _elapsed_ms())))
+        attempt_start = time.monotonic()
+        guard = StreamingOutputVerifier(BLOCK_KEYWORDS)
+        final_text = None
+        failure = None
+
+        stream = open_stream()
+        try:
+            while True:
+                remaining_s = (attempt_deadline_ms - (time.monotonic() - attempt_start) * 1000) / 1000.0
+                try:
+                    if remaining_s <= 0:
+                        raise asyncio.TimeoutError
+                    kind, value = await asyncio.wait_for(stream.__anext__(), timeout=remaining_s)
+                except StopAsyncIteration:
+                    break
+                except asyncio.TimeoutError:
+                    failure = _exhausted_result(FailureType.TIMEOUT, attempts, "provider")
+                    break
+                except Exception:
+                    failure = _exhausted_result(FailureType.PROVIDER_BAD_RESPONSE, attempts, None)
+                    break
+                if kind == "delta":
+                    delta = guard.feed(value)
+                    if guard.violation is not None:
+                        failure = _safety_blocked_result("disallowed_content", attempts)
+                        break
+                    if delta:
+                        released = True
+                        yield ("delta", delta)
+                elif kind == "reset":
+                    guard = StreamingOutputVerifier(BLOCK_KEYWORDS)
+                    if released:
+                        released = False
+                        yield ("reset", None)
+                elif kind == "final":
+                    final_text = value or ""
+                    break
+        finally:
+            await stream.aclose()
+
+        if failure is None and final_text is None:
+            failure = _exhausted_result(FailureType.PROVIDER_BAD_RESPONSE, attempts, None)
+        if failure is None or failure.failure_type == FailureType.SAFETY_BLOCKED:
+            break
+
+    if failure is None:
+        allowed, safety_reason = apply_safety(final_text)
+        if not allowed:
+            failure = _safety_blocked_result(safety_reason, attempts)
+    if failure is not None:
+        if released:
+            yield ("reset", None)
+        yield ("result", failure)
+        return
+
+    evaluate_quality(final_text, force_fail=forced_quality)
+    rendered_text = final_text.strip() or "Governed response unavailable."
+    tail = guard.finish()
+    if guard.text == rendered_text:
+        if tail:
+            yield ("delta", tail)
+    elif released:
+        yield ("reset", None)
+    yield (
+        "result",
+        Step5Result(
+            action=ChatAction.ANSWER,
+            rendered_text=rendered_text,
+            failure_type=None,
+            failure_reason=None,
+            attempts=attempts,
+            timeout_where=None,
+        ),
     )
 
 
-__all__ = ["run_step5", "Step5Context", "Step5Result"]
+__all__ = ["run_step5", "run_step5_stream", "Step5Context", "Step5Result"]
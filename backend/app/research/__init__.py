@@ -43,6 +43,10 @@ from backend.app.research.injection_defense import (
 )
 from backend.app.research.cache import (
     ResearchCache,
+    CacheBackend,
+    CacheStats,
+    InMemoryCacheBackend,
+    RedisCacheBackend,
     CacheKeyParts,
     make_cache_key,
     canonicalize_query,
@@ -86,6 +90,10 @@ __all__ = [
     "sanitize_tool_output",
     "INJECTION_MODEL_VERSION",
     "ResearchCache",
+    "CacheBackend",
+    "CacheStats",
+    "InMemoryCacheBackend",
+    "RedisCacheBackend",
     "CacheKeyParts",
     "make_cache_key",
     "canonicalize_query",
@@ -5,13 +5,17 @@ Deterministic cache keys, canonicalization, and in-memory bounded cache.
 All operations are deterministic and fail-closed.
 """
 
-import hashlib
 import json
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, asdict
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Protocol, Tuple
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 
+from backend.app.perf.canonical import canonical_dumps, canonical_sha256
+from backend.app.retrieval.types import SourceBundle, SourceSnippet, ToolKind
+
 
 DEFAULT_WEB_BUCKET_MS = 900000  # 15 minutes
 DEFAULT_DOCS_BUCKET_MS = 3600000  # 60 minutes
@@ -167,10 +171,7 @@ def compute_canonical_source_id(
         'metadata_keys': metadata_keys,
     }
     
-    canonical_json = json.dumps(structure, sort_keys=True, separators=(',', ':'), ensure_ascii=True)
-    hash_digest = hashlib.sha256(canonical_json.encode('utf-8')).hexdigest()
-    
-    return hash_digest[:12]
+    return canonical_sha256(structure)[:12]
 
 
 def compute_time_bucket(now_ms: int, bucket_ms: int) -> int:
@@ -222,6 +223,21 @@ class CacheEntry:
     value: Any
     created_bucket: int
     inserted_seq: int
+    size_bytes: int = 0
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Cache counters (structure only, no keys or values)."""
+    entries: int
+    bytes_used: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    rejected: int
+    backend_hits: int
+    backend_errors: int
 
 
 def make_cache_key(
@@ -267,46 +283,281 @@ def make_cache_key(
         time_bucket=time_bucket,
     )
     
-    key_dict = asdict(key_parts)
-    key_json = json.dumps(key_dict, sort_keys=True, separators=(',', ':'), ensure_ascii=True)
-    key_hash = hashlib.sha256(key_json.encode('utf-8')).hexdigest()
+    key_hash = canonical_sha256(key_parts)
     
     return (key_hash, key_parts)
 
 
+def estimate_value_bytes(value: Any) -> int:
+    """
+    Estimate cached value size deterministically.
+    
+    SourceBundle lists (the research payload) are sized from their text
+    fields; other values from their canonical JSON encoding.
+    
+    Args:
+        value: Value to size
+    
+    Returns:
+        Approximate size in bytes
+    """
+    if isinstance(value, str):
+        return len(value.encode('utf-8'))
+    if isinstance(value, SourceBundle):
+        size = len(value.source_id) + len(value.url) + len(value.domain) + len(value.retrieved_at)
+        size += len(value.title.encode('utf-8')) if value.title else 0
+        size += sum(len(snippet.text.encode('utf-8')) + 16 for snippet in value.snippets)
+        size += sum(len(str(k)) + len(str(v)) for k, v in value.metadata.items())
+        return size + 64
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_value_bytes(item) for item in value) + 8 * len(value)
+    try:
+        return len(json.dumps(value, sort_keys=True, separators=(',', ':'), default=str).encode('utf-8'))
+    except (TypeError, ValueError):
+        return len(repr(value).encode('utf-8'))
+
+
+def encode_cache_value(value: Any) -> str:
+    """
+    Encode a cache value for a shared backend (JSON, never pickle).
+    
+    Args:
+        value: SourceBundle list or JSON-serializable value
+    
+    Returns:
+        JSON string
+    """
+    if isinstance(value, list) and value and all(isinstance(item, SourceBundle) for item in value):
+        items = []
+        for bundle in value:
+            item = asdict(bundle)
+            item['tool'] = bundle.tool.value
+            items.append(item)
+        payload = {'kind': 'source_bundles', 'items': items}
+    else:
+        payload = {'kind': 'json', 'value': value}
+    return canonical_dumps(payload)
+
+
+def decode_cache_value(raw: str) -> Any:
+    """
+    Decode a value written by encode_cache_value.
+    
+    Args:
+        raw: JSON string
+    
+    Returns:
+        Decoded value
+    
+    Raises:
+        ValueError: If payload is malformed
+    """
+    payload = json.loads(raw)
+    kind = payload.get('kind')
+    if kind == 'json':
+        return payload.get('value')
+    if kind == 'source_bundles':
+        bundles = []
+        for item in payload['items']:
+            bundles.append(SourceBundle(
+                source_id=item['source_id'],
+                tool=ToolKind(item['tool']),
+                url=item['url'],
+                domain=item['domain'],
+                title=item['title'],
+                retrieved_at=item['retrieved_at'],
+                snippets=[SourceSnippet(**snippet) for snippet in item['snippets']],
+                metadata=item['metadata'],
+            ))
+        return bundles
+    raise ValueError(f"Unknown cache payload kind: {kind}")
+
+
+class CacheBackend(Protocol):
+    """Shared second-level store so multiple workers can reuse research results."""
+    
+    def get(self, key: str) -> Optional[Tuple[Any, int]]:
+        """Return (value, created_bucket) or None."""
+        ...
+    
+    def put(self, key: str, value: Any, created_bucket: int) -> None:
+        ...
+    
+    def delete(self, key: str) -> None:
+        ...
+    
+    def clear(self) -> None:
+        ...
+
+
+class InMemoryCacheBackend:
+    """
+    Process-local shared backend (one instance shared by several caches).
+    
+    Stores encoded values so readers never alias a writer's objects.
+    """
+    
+    def __init__(self):
+        self._data: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Tuple[Any, int]]:
+        with self._lock:
+            item = self._data.get(key)
+        if item is None:
+            return None
+        raw, created_bucket = item
+        return decode_cache_value(raw), created_bucket
+    
+    def put(self, key: str, value: Any, created_bucket: int) -> None:
+        raw = encode_cache_value(value)
+        with self._lock:
+            self._data[key] = (raw, created_bucket)
+    
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class RedisCacheBackend:
+    """
+    Redis-backed shared backend.
+    
+    Values are JSON (encode_cache_value) under "<namespace>:<key>" with a
+    server-side expiry, so workers share results without shared memory.
+    """
+    
+    def __init__(self, client: Any, namespace: str = "research_cache", ttl_seconds: int = 3600):
+        """
+        Args:
+            client: redis.Redis-compatible client (get/set/delete/scan_iter)
+            namespace: Key prefix
+            ttl_seconds: Server-side expiry for entries
+        """
+        self._client = client
+        self._namespace = namespace
+        self._ttl_seconds = max(1, int(ttl_seconds))
+    
+    def _key(self, key: str) -> str:
+        return f"{self._namespace}:{key}"
+    
+    def get(self, key: str) -> Optional[Tuple[Any, int]]:
+        raw = self._client.get(self._key(key))
+        if raw is None:
+            return None
+        if isinstance(raw, bytes):
+            raw = raw.decode('utf-8')
+        envelope = json.loads(raw)
+        return decode_cache_value(envelope['payload']), int(envelope['created_bucket'])
+    
+    def put(self, key: str, value: Any, created_bucket: int) -> None:
+        envelope = json.dumps(
+            {'created_bucket': created_bucket, 'payload': encode_cache_value(value)},
+            sort_keys=True,
+            separators=(',', ':'),
+        )
+        self._client.set(self._key(key), envelope, ex=self._ttl_seconds)
+    
+    def delete(self, key: str) -> None:
+        self._client.delete(self._key(key))
+    
+    def clear(self) -> None:
+        for redis_key in self._client.scan_iter(match=f"{self._namespace}:*"):
+            self._client.delete(redis_key)
+
+
 class ResearchCache:
     """
     In-memory bounded cache with deterministic eviction.
     
-    Eviction policy: FIFO by inserted_seq.
+    Eviction policy: LRU (OrderedDict order; put and get both refresh recency),
+    bounded by entry count and optionally by estimated bytes. Without reads
+    between puts this is exactly FIFO by inserted_seq. Entries may expire by
+    time bucket (ttl_buckets), and an optional shared backend acts as a
+    second level for other workers. All operations are O(1) and fail-closed
+    (errors read as misses).
     """
     
-    def __init__(self, max_entries: int = 128):
+    def __init__(
+        self,
+        max_entries: int = 128,
+        max_bytes: Optional[int] = None,
+        ttl_buckets: Optional[int] = None,
+        backend: Optional[CacheBackend] = None,
+        sizer=estimate_value_bytes,
+    ):
         """
         Initialize cache.
         
         Args:
             max_entries: Maximum number of entries
+            max_bytes: Optional budget for summed estimated value sizes
+            ttl_buckets: Optional age (in time buckets) after which entries expire
+            backend: Optional shared backend consulted on local misses
+            sizer: Value size estimator (defaults to estimate_value_bytes)
         """
         self.max_entries = max_entries
-        self._cache: Dict[str, CacheEntry] = {}
+        self.max_bytes = max_bytes
+        self.ttl_buckets = ttl_buckets
+        self._backend = backend
+        self._sizer = sizer
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
         self._seq_counter = 0
-    
-    def get(self, key: str) -> Optional[Any]:
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._rejected = 0
+        self._backend_hits = 0
+        self._backend_errors = 0
+    
+    def _is_expired(self, created_bucket: int, current_bucket: Optional[int]) -> bool:
+        if self.ttl_buckets is None or current_bucket is None:
+            return False
+        return current_bucket - created_bucket >= self.ttl_buckets
+    
+    def get(self, key: str, current_bucket: Optional[int] = None) -> Optional[Any]:
         """
         Get value from cache.
         
         Args:
             key: Cache key
+            current_bucket: Optional current time bucket (enables TTL check)
         
         Returns:
             Cached value or None if miss
         """
         try:
-            entry = self._cache.get(key)
-            if entry is None:
-                return None
-            return entry.value
+            with self._lock:
+                entry = self._cache.get(key)
+                if entry is not None:
+                    if self._is_expired(entry.created_bucket, current_bucket):
+                        self._remove(key)
+                        self._expirations += 1
+                    else:
+                        self._cache.move_to_end(key)
+                        self._hits += 1
+                        return entry.value
+            
+            if self._backend is not None:
+                found = self._backend_get(key, current_bucket)
+                if found is not None:
+                    value, created_bucket = found
+                    with self._lock:
+                        self._backend_hits += 1
+                        self._hits += 1
+                        self._insert(key, value, created_bucket)
+                    return value
+            
+            with self._lock:
+                self._misses += 1
+            return None
         except Exception:
             return None
     
@@ -320,31 +571,101 @@ class ResearchCache:
             created_bucket: Time bucket when value was created
         """
         try:
-            if len(self._cache) >= self.max_entries and key not in self._cache:
-                self._evict_one()
-            
-            self._seq_counter += 1
-            self._cache[key] = CacheEntry(
-                value=value,
-                created_bucket=created_bucket,
-                inserted_seq=self._seq_counter,
-            )
+            with self._lock:
+                accepted = self._insert(key, value, created_bucket)
+            if self._backend is not None:
+                try:
+                    if accepted:
+                        self._backend.put(key, value, created_bucket)
+                    else:
+                        # Never share a value this cache refused; drop the superseded one too
+                        self._backend.delete(key)
+                except Exception:
+                    with self._lock:
+                        self._backend_errors += 1
         except Exception:
             pass
     
+    def _backend_get(self, key: str, current_bucket: Optional[int]) -> Optional[Tuple[Any, int]]:
+        try:
+            found = self._backend.get(key)
+        except Exception:
+            with self._lock:
+                self._backend_errors += 1
+            return None
+        if found is None:
+            return None
+        if self._is_expired(found[1], current_bucket):
+            return None
+        return found
+    
+    def _insert(self, key: str, value: Any, created_bucket: int) -> bool:
+        """
+        Insert under lock; evicts least recently used entries to fit.
+        Returns False if the value alone exceeds max_bytes and was rejected.
+        """
+        size = self._sizer(value) if self.max_bytes is not None else 0
+        if key in self._cache:
+            self._remove(key)
+        if self.max_bytes is not None and size > self.max_bytes:
+            self._rejected += 1
+            return False
+        
+        while self._cache and (
+            len(self._cache) >= self.max_entries
+            or (self.max_bytes is not None and self._bytes + size > self.max_bytes)
+        ):
+            self._evict_one()
+        
+        self._seq_counter += 1
+        self._cache[key] = CacheEntry(
+            value=value,
+            created_bucket=created_bucket,
+            inserted_seq=self._seq_counter,
+            size_bytes=size,
+        )
+        self._bytes += size
+        return True
+    
+    def _remove(self, key: str) -> None:
+        entry = self._cache.pop(key)
+        self._bytes -= entry.size_bytes
+    
     def _evict_one(self) -> None:
-        """Evict oldest entry by inserted_seq (FIFO)."""
+        """Evict least recently used entry (O(1))."""
         if not self._cache:
             return
         
-        oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k].inserted_seq)
-        del self._cache[oldest_key]
+        _, entry = self._cache.popitem(last=False)
+        self._bytes -= entry.size_bytes
+        self._evictions += 1
     
     def clear(self) -> None:
-        """Clear all cache entries."""
-        self._cache.clear()
-        self._seq_counter = 0
+        """Clear all cache entries (local only; the shared backend is left intact)."""
+        with self._lock:
+            self._cache.clear()
+            self._seq_counter = 0
+            self._bytes = 0
     
     def size(self) -> int:
         """Get current cache size."""
         return len(self._cache)
+    
+    def bytes_used(self) -> int:
+        """Get summed estimated size of cached values (0 without max_bytes)."""
+        return self._bytes
+    
+    def stats(self) -> CacheStats:
+        """Get cache counters (hits include backend_hits)."""
+        with self._lock:
+            return CacheStats(
+                entries=len(self._cache),
+                bytes_used=self._bytes,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                rejected=self._rejected,
+                backend_hits=self._backend_hits,
+                backend_errors=self._backend_errors,
+            )
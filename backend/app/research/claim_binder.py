@@ -330,10 +330,77 @@ def compute_tie_break_hash(claim_id: str, source_id: str, snippet_index: int) ->
     return hash_digest[:8]
 
 
+@dataclass(frozen=True)
+class _BindingSource:
+    """Internal: per-source binding fields, resolved once per binding call."""
+    position: int
+    bundle: object
+    credibility: Optional[object]
+    credibility_score: int
+    published_date: Optional[str]
+
+
+def _binding_source(position: int, source, grade_to_score: Dict[str, int]) -> _BindingSource:
+    """Resolve bundle, credibility score and published date for one source."""
+    if hasattr(source, 'source'):
+        bundle = source.source
+        credibility = getattr(source, 'credibility', None)
+    else:
+        bundle = source
+        credibility = None
+    
+    credibility_score = 0
+    if credibility:
+        credibility_score = getattr(credibility, 'score', 0)
+        if credibility_score is None:
+            grade = getattr(credibility, 'grade', 'UNKNOWN')
+            credibility_score = grade_to_score.get(grade, 0)
+    
+    published_date = None
+    if hasattr(bundle, 'metadata') and bundle.metadata:
+        for date_field in ['published_at', 'date', 'updated_at']:
+            if date_field in bundle.metadata:
+                published_date = bundle.metadata[date_field]
+                break
+    
+    return _BindingSource(
+        position=position,
+        bundle=bundle,
+        credibility=credibility,
+        credibility_score=credibility_score,
+        published_date=published_date,
+    )
+
+
+def build_snippet_index(entries: List[_BindingSource]) -> Dict[str, List[Tuple[int, int]]]:
+    """
+    Build inverted index token -> [(source position, snippet index)].
+    
+    Each snippet is tokenized once (same tokens as tokenize_text).
+    
+    Args:
+        entries: Resolved binding sources
+    
+    Returns:
+        Postings per token, in (source, snippet) order
+    """
+    index: Dict[str, List[Tuple[int, int]]] = {}
+    for entry in entries:
+        for idx, snippet in enumerate(entry.bundle.snippets):
+            for token in set(tokenize_text(snippet.text)):
+                index.setdefault(token, []).append((entry.position, idx))
+    return index
+
+
 def bind_claims_to_sources(claims: List[Claim], sources: list) -> Dict[str, list]:
     """
     Bind claims to citations using token overlap.
     
+    Snippets are tokenized once into an inverted index; per claim only
+    snippets sharing >= 2 tokens (or all snippets of a source whose domain
+    contains a claim token) are scored, and CitationRefs are built for the
+    selected top MAX_CITATIONS_PER_CLAIM only.
+    
     Args:
         claims: List of claims
         sources: List of SourceBundle or GradedSource
@@ -343,81 +410,69 @@ def bind_claims_to_sources(claims: List[Claim], sources: list) -> Dict[str, list
     """
     from backend.app.research.citations import make_citation_ref, GRADE_TO_SCORE
     
+    entries = [_binding_source(pos, source, GRADE_TO_SCORE) for pos, source in enumerate(sources)]
+    index = build_snippet_index(entries)
+    
+    positions_by_domain: Dict[str, List[int]] = {}
+    for entry in entries:
+        positions_by_domain.setdefault(entry.bundle.domain.lower(), []).append(entry.position)
+    
     bindings = {}
     
     for claim in claims:
         claim_tokens = tokenize_text(claim.text)
         
-        candidates = []
+        overlaps: Dict[Tuple[int, int], int] = {}
+        for token in set(claim_tokens):
+            for posting in index.get(token, ()):
+                overlaps[posting] = overlaps.get(posting, 0) + 1
         
-        for source in sources:
-            if hasattr(source, 'source'):
-                bundle = source.source
-                credibility = getattr(source, 'credibility', None)
-            else:
-                bundle = source
-                credibility = None
-            
-            credibility_score = 0
-            if credibility:
-                credibility_score = getattr(credibility, 'score', 0)
-                if credibility_score is None:
-                    grade = getattr(credibility, 'grade', 'UNKNOWN')
-                    credibility_score = GRADE_TO_SCORE.get(grade, 0)
-            
-            published_date = None
-            if hasattr(bundle, 'metadata') and bundle.metadata:
-                for date_field in ['published_at', 'date', 'updated_at']:
-                    if date_field in bundle.metadata:
-                        published_date = bundle.metadata[date_field]
-                        break
-            
-            domain_lower = bundle.domain.lower()
-            
-            for idx, snippet in enumerate(bundle.snippets):
-                snippet_tokens = tokenize_text(snippet.text)
-                overlap_score = compute_overlap_score(claim_tokens, snippet_tokens)
-                
-                domain_match = any(token in domain_lower for token in claim_tokens)
-                
-                if overlap_score >= 2 or domain_match:
-                    tie_break = compute_tie_break_hash(claim.claim_id, bundle.source_id, idx)
-                    
-                    citation_ref = make_citation_ref(
-                        source_id=bundle.source_id,
-                        url=bundle.url,
-                        domain=bundle.domain,
-                        title=bundle.title,
-                        snippet_index=idx,
-                        snippet_len=len(snippet.text),
-                        published_date=published_date,
-                        credibility_report=credibility,
-                    )
-                    
-                    freshness_proxy = 1 if published_date else 0
-                    
-                    candidates.append((
-                        credibility_score,
-                        overlap_score,
-                        freshness_proxy,
-                        bundle.domain,
-                        bundle.url,
-                        idx,
-                        tie_break,
-                        citation_ref,
-                    ))
+        candidate_keys = {posting for posting, score in overlaps.items() if score >= 2}
+        
+        for domain_lower, positions in positions_by_domain.items():
+            if any(token in domain_lower for token in claim_tokens):
+                for pos in positions:
+                    candidate_keys.update((pos, idx) for idx in range(len(entries[pos].bundle.snippets)))
+        
+        candidates = []
+        for pos, idx in candidate_keys:
+            entry = entries[pos]
+            bundle = entry.bundle
+            candidates.append((
+                entry.credibility_score,
+                overlaps.get((pos, idx), 0),
+                1 if entry.published_date else 0,
+                bundle.domain,
+                bundle.url,
+                idx,
+                compute_tie_break_hash(claim.claim_id, bundle.source_id, idx),
+                pos,
+            ))
         
-        candidates.sort(key=lambda x: (-x[0], -x[1], -x[2], x[3], x[4], x[5], x[6]))
+        # Trailing source position reproduces (source, snippet) scan order on full ties
+        candidates.sort(key=lambda x: (-x[0], -x[1], -x[2], x[3], x[4], x[5], x[6], x[7]))
         
         seen_keys = set()
         selected_citations = []
         
         for candidate in candidates:
-            citation_ref = candidate[7]
-            key = (citation_ref.source_id, citation_ref.snippet_index)
+            entry = entries[candidate[7]]
+            bundle = entry.bundle
+            idx = candidate[5]
+            key = (bundle.source_id, idx)
             
             if key not in seen_keys:
-                selected_citations.append(citation_ref)
+                snippet = bundle.snippets[idx]
+                selected_citations.append(make_citation_ref(
+                    source_id=bundle.source_id,
+                    url=bundle.url,
+                    domain=bundle.domain,
+                    title=bundle.title,
+                    snippet_index=idx,
+                    snippet_len=len(snippet.text),
+                    published_date=entry.published_date,
+                    credibility_report=entry.credibility,
+                ))
                 seen_keys.add(key)
             
             if len(selected_citations) >= MAX_CITATIONS_PER_CLAIM:
@@ -5,13 +5,14 @@ Deterministic, rule-based sanitization to prevent tool outputs from jailbreaking
 Tool output is UNTRUSTED input and can never override system rules or drive agentic actions.
 """
 
-import hashlib
-import json
 import re
+from bisect import bisect_left
 from dataclasses import dataclass, asdict
 from enum import Enum
 from typing import List, Optional, Tuple
 
+from backend.app.perf.canonical import canonical_sha256
+
 
 INJECTION_MODEL_VERSION = "18.5.0"
 
@@ -218,10 +219,71 @@ def expand_to_sentence_boundary(text: str, start: int, end: int) -> Tuple[int, i
     return new_start, new_end
 
 
+PATTERN_GROUPS = [
+    (InjectionFlag.OVERRIDE_INSTRUCTIONS, OVERRIDE_PATTERNS),
+    (InjectionFlag.CREDENTIAL_REQUEST, CREDENTIAL_PATTERNS),
+    (InjectionFlag.EXECUTION_ESCALATION, EXECUTION_PATTERNS),
+    (InjectionFlag.HIDDEN_INSTRUCTIONS, HIDDEN_PATTERNS),
+    (InjectionFlag.TOOL_POLICY_BYPASS, TOOL_POLICY_PATTERNS),
+]
+
+BASE64_PATTERN = r'[A-Za-z0-9+/]{40,}={0,2}'
+BASE64_MIN_CHARS = 60
+SENTENCE_SAFETY_MARGIN = 50
+
+_SENTENCE_STOP_RE = re.compile(r'[.!?\n]')
+_NON_SPACE_RE = re.compile(r'[^ \t\n]')
+_BASE64_RE = re.compile(BASE64_PATTERN)
+
+_COMPILED_PATTERNS = [
+    (re.compile(pattern), flag, FLAG_PRIORITY.index(flag))
+    for flag, patterns in PATTERN_GROUPS
+    for pattern in patterns
+]
+
+
+class _SentenceIndex:
+    """
+    Internal: sentence-stop positions of one document, so
+    expand_to_sentence_boundary semantics cost O(log n) per segment.
+    """
+    
+    __slots__ = ("_text", "_len", "_stops")
+    
+    def __init__(self, text: str):
+        self._text = text
+        self._len = len(text)
+        self._stops = [m.start() for m in _SENTENCE_STOP_RE.finditer(text)]
+    
+    def _past_stop(self, pos: int) -> int:
+        idx = bisect_left(self._stops, pos)
+        pos = self._stops[idx] if idx < len(self._stops) else max(pos, self._len)
+        if pos < self._len and self._text[pos] in '.!?':
+            pos += 1
+        return pos
+    
+    def expand(self, start: int, end: int) -> Tuple[int, int]:
+        """Same result as expand_to_sentence_boundary(text, start, end)."""
+        idx = bisect_left(self._stops, start)
+        new_start = self._stops[idx - 1] + 1 if idx else 0
+        
+        new_end = self._past_stop(end)
+        if new_end < self._len:
+            non_space = _NON_SPACE_RE.search(self._text, new_end)
+            new_end = non_space.start() if non_space else self._len
+        
+        new_end = min(new_end + SENTENCE_SAFETY_MARGIN, self._len)
+        return new_start, self._past_stop(new_end)
+
+
 def detect_injection_segments(text: str) -> List[_Segment]:
     """
     Detect injection segments using pattern matching.
     
+    Patterns are precompiled (each keeps its literal-prefix fast search) and
+    sentence boundaries are indexed once per document, so each match expands
+    in O(log n) instead of walking the text.
+    
     Args:
         text: Normalized text
     
@@ -230,72 +292,22 @@ def detect_injection_segments(text: str) -> List[_Segment]:
     """
     segments = []
     text_lower = text.lower()
+    sentences = _SentenceIndex(text)
     
-    for pattern in OVERRIDE_PATTERNS:
-        for match in re.finditer(pattern, text_lower):
-            priority_rank = FLAG_PRIORITY.index(InjectionFlag.OVERRIDE_INSTRUCTIONS)
-            start, end = expand_to_sentence_boundary(text, match.start(), match.end())
-            segments.append(_Segment(
-                start=start,
-                end=end,
-                flag=InjectionFlag.OVERRIDE_INSTRUCTIONS,
-                priority_rank=priority_rank,
-            ))
-    
-    for pattern in CREDENTIAL_PATTERNS:
-        for match in re.finditer(pattern, text_lower):
-            priority_rank = FLAG_PRIORITY.index(InjectionFlag.CREDENTIAL_REQUEST)
-            start, end = expand_to_sentence_boundary(text, match.start(), match.end())
-            segments.append(_Segment(
-                start=start,
-                end=end,
-                flag=InjectionFlag.CREDENTIAL_REQUEST,
-                priority_rank=priority_rank,
-            ))
+    for regex, flag, priority_rank in _COMPILED_PATTERNS:
+        for match in regex.finditer(text_lower):
+            start, end = sentences.expand(match.start(), match.end())
+            segments.append(_Segment(start=start, end=end, flag=flag, priority_rank=priority_rank))
     
-    for pattern in EXECUTION_PATTERNS:
-        for match in re.finditer(pattern, text_lower):
-            priority_rank = FLAG_PRIORITY.index(InjectionFlag.EXECUTION_ESCALATION)
-            start, end = expand_to_sentence_boundary(text, match.start(), match.end())
-            segments.append(_Segment(
-                start=start,
-                end=end,
-                flag=InjectionFlag.EXECUTION_ESCALATION,
-                priority_rank=priority_rank,
-            ))
-    
-    for pattern in HIDDEN_PATTERNS:
-        for match in re.finditer(pattern, text_lower):
-            priority_rank = FLAG_PRIORITY.index(InjectionFlag.HIDDEN_INSTRUCTIONS)
-            start, end = expand_to_sentence_boundary(text, match.start(), match.end())
-            segments.append(_Segment(
-                start=start,
-                end=end,
-                flag=InjectionFlag.HIDDEN_INSTRUCTIONS,
-                priority_rank=priority_rank,
-            ))
-    
-    for pattern in TOOL_POLICY_PATTERNS:
-        for match in re.finditer(pattern, text_lower):
-            priority_rank = FLAG_PRIORITY.index(InjectionFlag.TOOL_POLICY_BYPASS)
-            start, end = expand_to_sentence_boundary(text, match.start(), match.end())
-            segments.append(_Segment(
-                start=start,
-                end=end,
-                flag=InjectionFlag.TOOL_POLICY_BYPASS,
-                priority_rank=priority_rank,
-            ))
-    
-    base64_pattern = r'[A-Za-z0-9+/]{40,}={0,2}'
-    for match in re.finditer(base64_pattern, text):
-        if match.end() - match.start() >= 60:
-            priority_rank = FLAG_PRIORITY.index(InjectionFlag.OBFUSCATION)
-            start, end = expand_to_sentence_boundary(text, match.start(), match.end())
+    obfuscation_rank = FLAG_PRIORITY.index(InjectionFlag.OBFUSCATION)
+    for match in _BASE64_RE.finditer(text):
+        if match.end() - match.start() >= BASE64_MIN_CHARS:
+            start, end = sentences.expand(match.start(), match.end())
             segments.append(_Segment(
                 start=start,
                 end=end,
                 flag=InjectionFlag.OBFUSCATION,
-                priority_rank=priority_rank,
+                priority_rank=obfuscation_rank,
             ))
     
     segments.sort(key=lambda s: (s.start, s.end))
@@ -416,10 +428,7 @@ def compute_structure_signature(
         "version": INJECTION_MODEL_VERSION,
     }
     
-    canonical = json.dumps(structure, sort_keys=True, separators=(',', ':'))
-    hash_digest = hashlib.sha256(canonical.encode('utf-8')).hexdigest()
-    
-    return hash_digest[:16]
+    return canonical_sha256(structure)[:16]
 
 
 def sanitize_tool_output(
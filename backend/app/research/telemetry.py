@@ -4,11 +4,12 @@ Phase 18 Step 7: Research Telemetry (Structure-Only, No User Text)
 Deterministic, fail-closed telemetry builder and signature computation.
 """
 
-import hashlib
 import json
 from dataclasses import dataclass, asdict
 from typing import Any, Dict, List, Optional
 
+from backend.app.perf.canonical import canonical_sha256
+
 
 FORBIDDEN_KEYS = {
     "user_text",
@@ -239,9 +240,7 @@ def compute_research_signature(structure_pack: Dict[str, Any]) -> str:
         SHA256 hex string
     """
     sanitized_pack = sanitize_event(structure_pack)
-    canonical = json.dumps(sanitized_pack, sort_keys=True, separators=(',', ':'), ensure_ascii=True)
-    hash_digest = hashlib.sha256(canonical.encode('utf-8')).hexdigest()
-    return hash_digest
+    return canonical_sha256(sanitized_pack)
 
 
 def build_research_telemetry_event(
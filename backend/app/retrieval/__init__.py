@@ -4,7 +4,7 @@ Phase 18 Step 1: Retrieval Adapter Boundary
 Single chokepoint for all research/retrieval operations.
 """
 
-from backend.app.retrieval.adapter import retrieve, RetrievalRequest
+from backend.app.retrieval.adapter import retrieve, retrieve_async, RetrievalRequest
 from backend.app.retrieval.types import (
     ToolKind,
     EnvMode,
@@ -16,6 +16,7 @@ from backend.app.retrieval.types import (
 
 __all__ = [
     "retrieve",
+    "retrieve_async",
     "RetrievalRequest",
     "ToolKind",
     "EnvMode",
@@ -12,13 +12,18 @@ Contract guarantees:
 - Normalized SourceBundle output only
 """
 
-import hashlib
-import json
+import asyncio
+import inspect
 import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional
 from urllib.parse import urlparse
 
+from backend.app.perf.canonical import canonical_sha256
+
 from backend.app.retrieval.types import (
     ToolKind,
     EnvMode,
@@ -148,10 +153,7 @@ def compute_source_id(tool: ToolKind, url: str, domain: str, title: Optional[str
         "metadata_keys": sorted(metadata.keys()),
     }
     
-    canonical_json = json.dumps(id_data, sort_keys=True, separators=(',', ':'))
-    hash_digest = hashlib.sha256(canonical_json.encode('utf-8')).hexdigest()
-    
-    return hash_digest
+    return canonical_sha256(id_data)
 
 
 def validate_metadata(metadata: dict) -> bool:
@@ -269,7 +271,82 @@ def run_tool_stub(tool: ToolKind, query: str, caps: PolicyCaps) -> List[dict]:
     raise NotImplementedError(f"Tool {tool.value} not implemented in Step 18.1")
 
 
-def retrieve(req: RetrievalRequest) -> List[SourceBundle]:
+RETRIEVED_AT = "2026-01-29T00:00:00Z"
+FANOUT_MAX_WORKERS = 8
+
+_fanout_executor: Optional[ThreadPoolExecutor] = None
+_fanout_executor_lock = threading.Lock()
+
+
+def _get_fanout_executor() -> ThreadPoolExecutor:
+    global _fanout_executor
+    with _fanout_executor_lock:
+        if _fanout_executor is None:
+            _fanout_executor = ThreadPoolExecutor(
+                max_workers=FANOUT_MAX_WORKERS,
+                thread_name_prefix="retrieval-fanout",
+            )
+        return _fanout_executor
+
+
+def _validated_query(req: RetrievalRequest) -> Optional[str]:
+    """Return canonical query, or None if the request must yield []."""
+    if not req.query:
+        return None
+    
+    if not req.allowed_tools:
+        return None
+    
+    if req.policy_caps.max_results < 1 or req.policy_caps.max_results > 10:
+        return None
+    
+    canonical_query = canonicalize_query(req.query)
+    if not canonical_query:
+        return None
+    
+    return canonical_query
+
+
+def _normalize_tool_results(tool: ToolKind, raw_results, retrieved_at: str) -> List[SourceBundle]:
+    """Normalize one tool's raw results; keeps what was normalized before any failure."""
+    normalized_sources = []
+    try:
+        for raw in raw_results:
+            normalized = normalize_raw_source(tool, raw, retrieved_at)
+            if normalized:
+                normalized_sources.append(normalized)
+    except Exception:
+        pass
+    return normalized_sources
+
+
+def _merge_tool_results(req: RetrievalRequest, per_slot: Dict[int, List[SourceBundle]]) -> List[SourceBundle]:
+    """
+    Merge per-tool results in allowed_tools order (never completion order),
+    then bound and stable-sort exactly like the serial path.
+    """
+    all_sources = []
+    for slot in range(len(req.allowed_tools)):
+        all_sources.extend(per_slot.get(slot, []))
+    
+    all_sources = all_sources[:req.policy_caps.max_results]
+    
+    return stable_sort_sources(all_sources)
+
+
+def _tool_slots(req: RetrievalRequest) -> List[int]:
+    return [slot for slot, tool in enumerate(req.allowed_tools) if isinstance(tool, ToolKind)]
+
+
+def _fanout_deadline_ms(caps: PolicyCaps, deadline_ms: Optional[int]) -> int:
+    """Fan-out budget: the tighter of the caps and the caller's remaining deadline."""
+    budget_ms = min(caps.per_tool_timeout_ms, caps.total_timeout_ms)
+    if deadline_ms is not None:
+        budget_ms = min(budget_ms, deadline_ms)
+    return max(0, budget_ms)
+
+
+def retrieve(req: RetrievalRequest, concurrent: bool = False, deadline_ms: Optional[int] = None) -> List[SourceBundle]:
     """
     Single chokepoint for all retrieval operations.
     
@@ -282,51 +359,138 @@ def retrieve(req: RetrievalRequest) -> List[SourceBundle]:
     - Returns stable-sorted list
     - Fail-closed: returns [] on errors
     
+    With concurrent=True, tools run in parallel on a shared thread pool
+    (see retrieve_async for the event-loop variant); per_tool_timeout_ms and
+    total_timeout_ms are enforced and late tools contribute nothing. The
+    merged output order is the same as the serial path.
+    
     Args:
         req: RetrievalRequest with query, caps, tools, env, flags
+        concurrent: Fan out across tools instead of calling them in turn
+        deadline_ms: Caller's remaining budget; further bounds the fan-out
     
     Returns:
         List[SourceBundle]: Normalized, bounded, sorted sources
     """
     try:
-        if not req.query:
+        canonical_query = _validated_query(req)
+        if canonical_query is None:
             return []
         
-        if not req.allowed_tools:
-            return []
+        if concurrent:
+            per_slot = _fan_out_threads(req, canonical_query, _fanout_deadline_ms(req.policy_caps, deadline_ms))
+        else:
+            per_slot = {}
+            for slot in _tool_slots(req):
+                tool = req.allowed_tools[slot]
+                try:
+                    raw_results = run_tool_stub(tool, canonical_query, req.policy_caps)
+                    per_slot[slot] = _normalize_tool_results(tool, raw_results, RETRIEVED_AT)
+                except NotImplementedError:
+                    continue
+                except Exception:
+                    continue
         
-        if req.policy_caps.max_results < 1 or req.policy_caps.max_results > 10:
+        return _merge_tool_results(req, per_slot)
+    
+    except Exception:
+        return []
+
+
+def _fan_out_threads(req: RetrievalRequest, canonical_query: str, deadline_ms: int) -> Dict[int, List[SourceBundle]]:
+    """
+    Run every allowed tool on the shared pool, bounded by deadline_ms.
+    Futures not yet started at the deadline are cancelled; running threads
+    cannot be interrupted, so their results are simply discarded.
+    """
+    executor = _get_fanout_executor()
+    caps = req.policy_caps
+    
+    futures = {}
+    for slot in _tool_slots(req):
+        tool = req.allowed_tools[slot]
+        futures[executor.submit(run_tool_stub, tool, canonical_query, caps)] = slot
+    
+    # All tools start together, so the deadline counts from submission
+    deadline_ts = time.monotonic() + deadline_ms / 1000.0
+    per_slot: Dict[int, List[SourceBundle]] = {}
+    pending = set(futures)
+    while pending:
+        remaining_s = deadline_ts - time.monotonic()
+        if remaining_s <= 0:
+            break
+        done, pending = wait(pending, timeout=remaining_s, return_when=FIRST_COMPLETED)
+        for future in done:
+            slot = futures[future]
+            try:
+                raw_results = future.result()
+                per_slot[slot] = _normalize_tool_results(req.allowed_tools[slot], raw_results, RETRIEVED_AT)
+            except Exception:
+                continue
+    
+    for future in pending:
+        future.cancel()
+    
+    return per_slot
+
+
+async def _run_tool_async(tool: ToolKind, canonical_query: str, caps: PolicyCaps):
+    runner = run_tool_stub
+    if inspect.iscoroutinefunction(runner):
+        return await runner(tool, canonical_query, caps)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_fanout_executor(), runner, tool, canonical_query, caps)
+
+
+async def retrieve_async(req: RetrievalRequest, deadline_ms: Optional[int] = None) -> List[SourceBundle]:
+    """
+    Event-loop variant of retrieve(): all allowed tools run concurrently.
+    
+    Async tool runners are awaited directly (and cancelled at their deadline);
+    sync runners run on the shared fan-out pool. Each tool gets
+    min(per_tool_timeout_ms, remaining total_timeout_ms); late or failing
+    tools contribute nothing. Output is identical to retrieve(req).
+    
+    Args:
+        req: RetrievalRequest with query, caps, tools, env, flags
+        deadline_ms: Caller's remaining budget; further bounds the fan-out
+    
+    Returns:
+        List[SourceBundle]: Normalized, bounded, sorted sources
+    """
+    try:
+        canonical_query = _validated_query(req)
+        if canonical_query is None:
             return []
         
-        canonical_query = canonicalize_query(req.query)
-        if not canonical_query:
+        caps = req.policy_caps
+        slots = _tool_slots(req)
+        tasks = [
+            asyncio.ensure_future(
+                asyncio.wait_for(
+                    _run_tool_async(req.allowed_tools[slot], canonical_query, caps),
+                    timeout=max(0, caps.per_tool_timeout_ms) / 1000.0,
+                )
+            )
+            for slot in slots
+        ]
+        if not tasks:
             return []
         
-        retrieved_at = "2026-01-29T00:00:00Z"
+        total_ms = caps.total_timeout_ms if deadline_ms is None else min(caps.total_timeout_ms, deadline_ms)
+        done, pending = await asyncio.wait(tasks, timeout=max(0, total_ms) / 1000.0)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
         
-        all_sources = []
-        
-        for tool in req.allowed_tools:
-            if not isinstance(tool, ToolKind):
-                continue
-            
-            try:
-                raw_results = run_tool_stub(tool, canonical_query, req.policy_caps)
-                
-                for raw in raw_results:
-                    normalized = normalize_raw_source(tool, raw, retrieved_at)
-                    if normalized:
-                        all_sources.append(normalized)
-            except NotImplementedError:
+        per_slot: Dict[int, List[SourceBundle]] = {}
+        for slot, task in zip(slots, tasks):
+            if task not in done or task.cancelled() or task.exception() is not None:
                 continue
-            except Exception:
-                continue
-        
-        all_sources = all_sources[:req.policy_caps.max_results]
-        
-        sorted_sources = stable_sort_sources(all_sources)
+            per_slot[slot] = _normalize_tool_results(req.allowed_tools[slot], task.result(), RETRIEVED_AT)
         
-        return sorted_sources
+        return _merge_tool_results(req, per_slot)
     
     except Exception:
         return []
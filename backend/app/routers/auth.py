@@ -11,7 +11,7 @@ from pydantic import BaseModel, EmailStr
 
 from backend.app.auth.password import hash_password, verify_password
 from backend.app.config import get_settings
-from backend.app.db.database import get_db_connection
+from backend.app.db.database import db_connection
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 logger = logging.getLogger(__name__)
@@ -78,7 +78,7 @@ def _create_session(user_id: str) -> str:
     session_id = str(uuid.uuid4())
     expires_at = datetime.now(timezone.utc) + timedelta(days=SESSION_TTL_DAYS)
     
-    with get_db_connection() as conn:
+    with db_connection() as conn:
         with conn.cursor() as cur:
             cur.execute(
                 """
@@ -95,7 +95,7 @@ def _create_session(user_id: str) -> str:
 def _get_user_from_session(session_id: str) -> Optional[dict]:
     """Retrieve user from session_id."""
     try:
-        with get_db_connection() as conn:
+        with db_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(
                     """
@@ -117,7 +117,7 @@ def _get_user_from_session(session_id: str) -> Optional[dict]:
 def _delete_session(session_id: str) -> None:
     """Delete session from database."""
     try:
-        with get_db_connection() as conn:
+        with db_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute("DELETE FROM sessions WHERE id = %s", (uuid.UUID(session_id),))
             conn.commit()
@@ -129,7 +129,7 @@ def _delete_session(session_id: str) -> None:
 async def login(req: LoginRequest, response: Response):
     """Login with email and password."""
     try:
-        with get_db_connection() as conn:
+        with db_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(
                     "SELECT id, email, password_hash FROM users WHERE email = %s",
@@ -169,7 +169,7 @@ async def signup(req: SignupRequest, response: Response):
         password_hash = hash_password(req.password)
         user_id = str(uuid.uuid4())
         
-        with get_db_connection() as conn:
+        with db_connection() as conn:
             with conn.cursor() as cur:
                 try:
                     cur.execute(
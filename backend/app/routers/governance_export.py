@@ -0,0 +1,31 @@
+"""Chunked HTTP response for streaming governance exports (NDJSON)."""
+from __future__ import annotations
+
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+
+from backend.app.governance.export import NDJSON_CONTENT_TYPE, ExportReasonCode, ExportStream
+
+_REFUSAL_STATUS = {
+    ExportReasonCode.EXPORT_DISABLED: 403,
+    ExportReasonCode.TENANT_INVALID: 404,
+}
+
+
+def ndjson_export_response(stream: ExportStream) -> StreamingResponse:
+    """
+    Serve an ExportStream as a chunked response. Chunks are produced while
+    the client reads (sync iterator, run in the threadpool), so memory does
+    not grow with tenant size. Refused exports raise HTTPException.
+    """
+    if not stream.ok or stream.chunks is None:
+        raise HTTPException(status_code=_REFUSAL_STATUS.get(stream.reason_code, 500), detail=stream.reason_code.value)
+
+    headers = {
+        "Content-Disposition": f'attachment; filename="export-{stream.tenant_hash[:16]}.ndjson"',
+        "Cache-Control": "no-store",
+        "X-Export-Version": stream.export_version,
+    }
+    if stream.gzip:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(stream.chunks, media_type=NDJSON_CONTENT_TYPE, headers=headers)
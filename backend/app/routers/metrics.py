@@ -0,0 +1,17 @@
+"""Prometheus text endpoint for the in-process metrics registry."""
+from __future__ import annotations
+
+from fastapi import APIRouter, Response
+
+from backend.app.config import get_settings
+from backend.app.observability.metrics import PROMETHEUS_CONTENT_TYPE, render_prometheus
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Merged registry state; 404 unless METRICS_ENABLED=1."""
+    if int(get_settings().metrics_enabled or 0) != 1:
+        return Response(status_code=404)
+    return Response(content=render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
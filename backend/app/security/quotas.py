@@ -6,7 +6,15 @@ import time
 from dataclasses import dataclass
 from typing import Optional
 
+from backend.app.perf.limiter_store import LimiterStore
+from backend.app.perf.shared_counters import shared_counter_backend
+from backend.app.perf.striped import StripedLocks
+
 _MAX_KEYS = 10_000
+# A bucket idle this long has refilled to its rpm limit, so dropping it is lossless.
+_BUCKET_IDLE_TTL_S = 60.0
+# In-flight counts not released within this long are treated as leaked.
+_IN_FLIGHT_STALE_S = 600.0
 
 _PLAN_LIMITS = {
     "free": {"rpm": 20, "concurrency": 2, "max_output_cap": 256},
@@ -14,8 +22,10 @@ _PLAN_LIMITS = {
     "max": {"rpm": 120, "concurrency": 8, "max_output_cap": 1024},
 }
 
-_buckets: dict[str, dict] = {}
-_in_flight: dict[str, dict] = {}
+_buckets: LimiterStore[dict] = LimiterStore(_MAX_KEYS, name="quota_buckets")
+_in_flight: LimiterStore[dict] = LimiterStore(_MAX_KEYS, name="quota_in_flight")
+# Serialises read-modify-write of one actor's bucket/in-flight entries across threads.
+_locks = StripedLocks()
 
 
 @dataclass
@@ -37,20 +47,6 @@ class QuotaContext:
     now_monotonic: float
 
 
-def _evict_if_needed(store: dict) -> None:
-    if len(store) <= _MAX_KEYS:
-        return
-    oldest_key = None
-    oldest_ts = None
-    for key, meta in store.items():
-        ts = meta.get("last_seen", 0)
-        if oldest_ts is None or ts < oldest_ts:
-            oldest_key = key
-            oldest_ts = ts
-    if oldest_key is not None:
-        store.pop(oldest_key, None)
-
-
 def _refill(tokens: float, limit_per_minute: int, now: float, last_updated: float) -> tuple[float, float]:
     rate_per_sec = float(limit_per_minute) / 60.0
     if now > last_updated:
@@ -73,15 +69,21 @@ def _retry_after_seconds(needed_tokens: float, rate_per_sec: float) -> int:
     return max(1, int(math.ceil(needed_tokens / rate_per_sec)))
 
 
+def _effective_output_cap(ctx: QuotaContext, max_output_cap: int) -> int:
+    if ctx.est_output_cap is not None:
+        return min(ctx.est_output_cap, max_output_cap)
+    return max_output_cap
+
+
 def _touch_in_flight(actor_key: str, now: float, delta: int) -> None:
-    meta = _in_flight.get(actor_key, {"count": 0, "last_seen": now})
-    meta["count"] = max(0, meta.get("count", 0) + delta)
-    meta["last_seen"] = now
-    if meta["count"] <= 0:
-        _in_flight.pop(actor_key, None)
-    else:
-        _in_flight[actor_key] = meta
-        _evict_if_needed(_in_flight)
+    with _locks.hold(actor_key):
+        meta = _in_flight.get(actor_key, {"count": 0, "last_seen": now}, now=now)
+        meta["count"] = max(0, meta.get("count", 0) + delta)
+        meta["last_seen"] = now
+        if meta["count"] <= 0:
+            _in_flight.pop(actor_key, None)
+        else:
+            _in_flight.set(actor_key, meta, ttl_s=_IN_FLIGHT_STALE_S, now=now)
 
 
 def quota_begin(actor_key: str) -> None:
@@ -114,29 +116,33 @@ def quota_precheck(ctx: QuotaContext) -> QuotaDecision:
     if ctx.ip_hash:
         keys.append(f"{ctx.actor_key}|{ctx.ip_hash}")
 
+    shared = shared_counter_backend()
+    if shared is not None:
+        # Shared buckets run on wall-clock time; ctx.now_monotonic is per-process.
+        granted, retry_after_s = shared.take_tokens(keys, float(rpm_limit), float(rpm_limit) / 60.0, ttl_s=_BUCKET_IDLE_TTL_S)
+        if not granted:
+            return QuotaDecision(False, 429, max(1, int(math.ceil(retry_after_s))), "RATE_LIMIT", None)
+        return QuotaDecision(True, 200, None, "OK", _effective_output_cap(ctx, max_output_cap))
+
     pending_updates = []
     retry_after_candidates: list[int] = []
     now = ctx.now_monotonic
 
-    for key in keys:
-        bucket = _buckets.get(key, {"tokens": float(rpm_limit), "updated_at": now, "last_seen": now})
-        tokens_refilled, rate_per_sec = _refill(bucket.get("tokens", 0.0), rpm_limit, now, bucket.get("updated_at", now))
-        if tokens_refilled < 1.0:
-            retry_after_candidates.append(_retry_after_seconds(1.0 - tokens_refilled, rate_per_sec))
-        pending_updates.append((key, max(0.0, tokens_refilled - 1.0)))
+    with _locks.hold_many(keys):
+        for key in keys:
+            bucket = _buckets.get(key, {"tokens": float(rpm_limit), "updated_at": now, "last_seen": now}, now=now)
+            tokens_refilled, rate_per_sec = _refill(bucket.get("tokens", 0.0), rpm_limit, now, bucket.get("updated_at", now))
+            if tokens_refilled < 1.0:
+                retry_after_candidates.append(_retry_after_seconds(1.0 - tokens_refilled, rate_per_sec))
+            pending_updates.append((key, max(0.0, tokens_refilled - 1.0)))
 
-    if retry_after_candidates:
-        return QuotaDecision(False, 429, max(retry_after_candidates), "RATE_LIMIT", None)
+        if retry_after_candidates:
+            return QuotaDecision(False, 429, max(retry_after_candidates), "RATE_LIMIT", None)
 
-    for key, new_tokens in pending_updates:
-        _buckets[key] = {"tokens": new_tokens, "updated_at": now, "last_seen": now}
-    _evict_if_needed(_buckets)
-
-    effective_output_cap = max_output_cap
-    if ctx.est_output_cap is not None:
-        effective_output_cap = min(ctx.est_output_cap, max_output_cap)
+        for key, new_tokens in pending_updates:
+            _buckets.set(key, {"tokens": new_tokens, "updated_at": now, "last_seen": now}, ttl_s=_BUCKET_IDLE_TTL_S, now=now)
 
-    return QuotaDecision(True, 200, None, "OK", effective_output_cap)
+    return QuotaDecision(True, 200, None, "OK", _effective_output_cap(ctx, max_output_cap))
 
 
 def _reset_state() -> None:
@@ -6,14 +6,8 @@ from typing import List
 
 from .intent_style import infer_intent_and_style
 from .llm_client import LLMClient
-from .memory import (
-    load_cognitive_style,
-    load_hypotheses,
-    load_session_summary,
-    save_cognitive_style,
-    save_hypotheses,
-    save_session_summary,
-)
+from .observability.log_pipeline import lazy
+from .memory import SessionState, SessionStateRepository, get_session_state_repository
 from .schemas import (
     ChatResponse,
     CognitiveStyle,
@@ -29,33 +23,40 @@ logger = logging.getLogger(__name__)
 
 
 class ConversationService:
-    def __init__(self, llm_client: LLMClient | None = None) -> None:
+    def __init__(
+        self,
+        llm_client: LLMClient | None = None,
+        session_store: SessionStateRepository | None = None,
+    ) -> None:
         """Initialize ConversationService.
         
         Args:
             llm_client: Optional pre-initialized LLMClient. If None, will be set later.
+            session_store: Optional session state repository. Defaults to the shared
+                Redis-backed repository (one round trip per load and per save).
         """
         self.llm = llm_client
+        self.sessions = session_store or get_session_state_repository()
 
     def handle_message(self, session_id: str, text: str) -> ChatResponse:
         # 1) Intent + style + user message
         intent, inferred_style, user_message = infer_intent_and_style(text)
 
-        # 2) Load session memory
-        stored_style = load_cognitive_style(session_id)
-        style = self._merge_styles(stored_style, inferred_style)
-        hypotheses = load_hypotheses(session_id)
-        session_summary = load_session_summary(session_id)
+        # 2) Load session memory (single MGET)
+        session_state = self.sessions.load(session_id)
+        style = self._merge_styles(session_state.style, inferred_style)
+        hypotheses = session_state.hypotheses
+        session_summary = session_state.summary
 
         logger.info(
             "[Conversation] Start",
             extra={
                 "session_id": session_id,
-                "user_message": user_message.model_dump(),
-                "intent": intent.model_dump(),
-                "style": style.model_dump(),
-                "hypotheses": [h.model_dump() for h in hypotheses],
-                "session_summary": session_summary.model_dump(),
+                "user_message": lazy(user_message.model_dump),
+                "intent": lazy(intent.model_dump),
+                "style": lazy(style.model_dump),
+                "hypotheses": lazy(lambda: [h.model_dump() for h in hypotheses]),
+                "session_summary": lazy(session_summary.model_dump),
             },
         )
 
@@ -70,11 +71,12 @@ class ConversationService:
 
         # 4) Update beliefs (soft, no deletions)
         updated_hypotheses = self._apply_hypothesis_deltas(hypotheses, reasoning_output.updated_hypotheses)
-        save_hypotheses(session_id, updated_hypotheses)
 
-        # Session summary update is minimal in this slice
-        save_cognitive_style(session_id, style)
-        save_session_summary(session_id, session_summary)
+        # Session summary update is minimal in this slice; all keys go back in one MULTI/EXEC
+        self.sessions.save(
+            session_id,
+            SessionState(style=style, hypotheses=updated_hypotheses, summary=session_summary),
+        )
 
         # 5) Build expression plan (no LLM, simple rules)
         plan = self._build_expression_plan(style)
@@ -112,7 +114,7 @@ class ConversationService:
             "[Conversation] End",
             extra={
                 "session_id": session_id,
-                "rendered": rendered.model_dump(),
+                "rendered": lazy(rendered.model_dump),
             },
         )
 
@@ -15,13 +15,18 @@ from fastapi import Depends, Request
 
 from backend.app.auth.identity import IdentityContext
 from backend.app.deps.identity import identity_dependency
+from backend.app.observability.metrics import counter
 from backend.app.observability.request_id import get_request_id
 from backend.app.config import get_settings
+from backend.app.perf.limiter_store import LimiterStore
+from backend.app.waf.limiter import TokenBucketPrefilter, build_rate_check_sql, rate_check_params
 
 try:
-    from backend.app.db.database import get_db_connection
+    from backend.app.db.database import acquire_db_connection, async_db_connection, release_db_connection
 except Exception:  # pragma: no cover
-    get_db_connection = None  # type: ignore
+    acquire_db_connection = None  # type: ignore
+    async_db_connection = None  # type: ignore
+    release_db_connection = None  # type: ignore
 
 
 settings = get_settings()
@@ -48,6 +53,10 @@ WAF_LOCKOUT_COOLDOWN_SECONDS = int(settings.waf_lockout_cooldown_seconds)
 
 WAF_ENFORCE_ROUTES = {p.strip() for p in settings.waf_enforce_routes.split(",") if p.strip()}
 
+WAF_PREFILTER_SHARE = float(settings.waf_prefilter_share)
+WAF_PREFILTER_MAX_ENTRIES = int(settings.waf_prefilter_max_entries)
+WAF_MEM_MAX_KEYS = int(settings.waf_mem_max_keys)
+
 _HASH_SALT = settings.identity_hash_salt.encode("utf-8")
 
 logger = logging.getLogger(__name__)
@@ -136,6 +145,11 @@ def _get_client_ip(request: Request) -> str:
 
 
 def _safe_log_rate(request_path: str, key_scope: str, key_value: str, used_memory: bool, allowed: bool, retry_after: Optional[int]) -> None:
+    counter(
+        "waf_rate_checks",
+        1,
+        {"scope": key_scope, "decision": "allowed" if allowed else "blocked", "limiter": "memory" if used_memory else "db"},
+    )
     try:
         logger.info(
             "[WAF] rate check",
@@ -170,9 +184,12 @@ class LimitWindow:
     window_seconds: int
 
 
-# In-memory fallback limiter (per-process)
-_mem_windows: Dict[Tuple[str, str, int, int], int] = {}
-_mem_locks: Dict[Tuple[str, str], Tuple[int, float]] = {}
+# In-memory fallback limiter (per-process, bounded; entries expire with their window or cooldown)
+_mem_windows: LimiterStore[int] = LimiterStore(WAF_MEM_MAX_KEYS, clock=time.time, name="waf_windows")
+_mem_locks: LimiterStore[Tuple[int, float]] = LimiterStore(WAF_MEM_MAX_KEYS, clock=time.time, name="waf_locks")
+
+# Per-process prefilter in front of the async DB limiter
+_prefilter = TokenBucketPrefilter(WAF_PREFILTER_SHARE, WAF_PREFILTER_MAX_ENTRIES)
 
 
 def _now() -> float:
@@ -180,14 +197,20 @@ def _now() -> float:
 
 
 def _db_conn():
-    if get_db_connection is None:
+    if acquire_db_connection is None:
         return None
     try:
-        return get_db_connection()
+        return acquire_db_connection()
     except Exception:
         return None
 
 
+def _db_release(conn) -> None:
+    if conn is None or release_db_connection is None:
+        return
+    release_db_connection(conn)
+
+
 def _floor_window(ts: float, window: int) -> float:
     return ts - (ts % window)
 
@@ -296,50 +319,66 @@ def _increment_window_db(conn, key: RateKey, window: LimitWindow, now_ts: float)
         return 0
 
 
-def _increment_window_mem(key: RateKey, window: LimitWindow, now_ts: float) -> int:
+def _increment_window_mem(key: RateKey, window: LimitWindow, now_ts: float, increment: int = 1) -> int:
     hashed = key.hashed().value
     bucket = int(_floor_window(now_ts, window.window_seconds))
     k = (key.scope, hashed, window.window_seconds, bucket)
-    hits = _mem_windows.get(k, 0) + 1
-    _mem_windows[k] = hits
+    hits = _mem_windows.get(k, 0, now=now_ts) + increment
+    _mem_windows.set(k, hits, ttl_s=bucket + window.window_seconds - now_ts, now=now_ts)
     return hits
 
 
 def _apply_lockout_mem(key: RateKey, now_ts: float) -> int:
     hashed = key.hashed().value
-    strikes, last_blocked = _mem_locks.get((key.scope, hashed), (0, now_ts))
+    strikes, last_blocked = _mem_locks.get((key.scope, hashed), (0, now_ts), now=now_ts)
     if now_ts - last_blocked > WAF_LOCKOUT_COOLDOWN_SECONDS:
         strikes = 0
     strikes += 1
     idx = min(strikes - 1, len(WAF_LOCKOUT_SCHEDULE_SECONDS) - 1)
     duration = WAF_LOCKOUT_SCHEDULE_SECONDS[idx]
     blocked_until = now_ts + duration
-    _mem_locks[(key.scope, hashed)] = (strikes, blocked_until)
+    # Strikes are forgotten once the cooldown after this block has passed.
+    _mem_locks.set((key.scope, hashed), (strikes, blocked_until), ttl_s=duration + WAF_LOCKOUT_COOLDOWN_SECONDS, now=now_ts)
     return strikes
 
 
 def _check_lockout_mem(key: RateKey, now_ts: float) -> Optional[float]:
     hashed = key.hashed().value
-    strikes, blocked_until = _mem_locks.get((key.scope, hashed), (0, 0.0))
+    _strikes, blocked_until = _mem_locks.get((key.scope, hashed), (0, 0.0), now=now_ts)
     if blocked_until > now_ts:
         return blocked_until
-    if blocked_until and (now_ts - blocked_until) > WAF_LOCKOUT_COOLDOWN_SECONDS:
-        _mem_locks.pop((key.scope, hashed), None)
     return None
 
 
 def _rate_check(key: RateKey, windows: tuple[LimitWindow, LimitWindow], now_ts: float) -> Tuple[bool, Optional[int], bool]:
     conn = _db_conn()
+    try:
+        return _rate_check_with(conn, key, windows, now_ts)
+    finally:
+        _db_release(conn)
+
+
+def _rate_check_with(
+    conn,
+    key: RateKey,
+    windows: tuple[LimitWindow, LimitWindow],
+    now_ts: float,
+    increments: Optional[Tuple[int, ...]] = None,
+) -> Tuple[bool, Optional[int], bool]:
+    """increments (one per active window) replaces the default +1 on the in-memory path."""
     used_memory = conn is None
 
     locked = _get_lockout_db(conn, key, now_ts) if conn else _check_lockout_mem(key, now_ts)
     if locked and locked > now_ts:
         return False, int(max(1, locked - now_ts)), used_memory
 
+    active_idx = 0
     for window in windows:
         if window.limit <= 0 or window.window_seconds <= 0:
             continue
-        hits = _increment_window_db(conn, key, window, now_ts) if conn else _increment_window_mem(key, window, now_ts)
+        increment = increments[active_idx] if increments and active_idx < len(increments) else 1
+        active_idx += 1
+        hits = _increment_window_db(conn, key, window, now_ts) if conn else _increment_window_mem(key, window, now_ts, increment)
         if hits > window.limit:
             if conn:
                 result = _set_lockout_db(conn, key, now_ts)
@@ -357,6 +396,58 @@ def _rate_check(key: RateKey, windows: tuple[LimitWindow, LimitWindow], now_ts:
     return True, None, used_memory
 
 
+async def _rate_check_async(key: RateKey, windows: tuple[LimitWindow, LimitWindow], now_ts: float) -> Tuple[bool, Optional[int], bool]:
+    """
+    Same contract as _rate_check, but one statement on the async pool per DB
+    check, with the prefilter answering obviously-under-limit and locked-out
+    subjects locally. Falls back to the in-memory limiter if the DB is
+    unavailable or the statement fails.
+    """
+    active = tuple(w for w in windows if w.limit > 0 and w.window_seconds > 0)
+    hashed = key.hashed().value
+    prefilter_key = (key.scope, hashed)
+    buckets = tuple(int(_floor_window(now_ts, w.window_seconds)) for w in active)
+
+    local = _prefilter.admit(prefilter_key, buckets, now_ts)
+    if local is not None:
+        allowed, retry_after = local
+        return allowed, retry_after, False
+    if async_db_connection is None:
+        return _rate_check_with(None, key, windows, now_ts)
+
+    increments = _prefilter.take_pending(prefilter_key, buckets, now_ts)
+    params = rate_check_params(
+        key.scope,
+        hashed,
+        now_ts,
+        [(w.limit, w.window_seconds) for w in active],
+        increments,
+        WAF_LOCKOUT_SCHEDULE_SECONDS,
+        WAF_LOCKOUT_COOLDOWN_SECONDS,
+    )
+    try:
+        async with async_db_connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(build_rate_check_sql(len(active)), params)
+                row = await cur.fetchone()
+    except Exception:
+        # Hits the prefilter admitted locally were never written; count them in memory
+        return _rate_check_with(None, key, windows, now_ts, increments)
+    if not row:
+        return _rate_check_with(None, key, windows, now_ts, increments)
+
+    locked_until, _strikes, blocked_until, *hits = row
+    limits = [w.limit for w in active]
+    until = locked_until or blocked_until
+    if until is not None:
+        until_ts = until.timestamp()
+        _prefilter.record(prefilter_key, buckets, limits, hits, now_ts, locked_until=until_ts)
+        return False, int(max(1, until_ts - now_ts)), False
+    valid_until = max((b + w.window_seconds for b, w in zip(buckets, active)), default=None)
+    _prefilter.record(prefilter_key, buckets, limits, hits, now_ts, valid_until=valid_until)
+    return True, None, False
+
+
 async def waf_dependency(request: Request, identity: IdentityContext = Depends(identity_dependency)) -> IdentityContext:
     # Path scoping
     if request.url.path not in WAF_ENFORCE_ROUTES:
@@ -446,7 +537,7 @@ async def waf_dependency(request: Request, identity: IdentityContext = Depends(i
         LimitWindow(WAF_IP_BURST_LIMIT, WAF_IP_BURST_WINDOW_SECONDS),
         LimitWindow(WAF_IP_SUSTAIN_LIMIT, WAF_IP_SUSTAIN_WINDOW_SECONDS),
     )
-    ip_allowed, ip_retry, ip_used_mem = _rate_check(ip_key, ip_windows, now_ts)
+    ip_allowed, ip_retry, ip_used_mem = await _rate_check_async(ip_key, ip_windows, now_ts)
     _safe_log_rate(
         getattr(request.url, "path", "/api/chat"),
         ip_key.scope,
@@ -479,7 +570,7 @@ async def waf_dependency(request: Request, identity: IdentityContext = Depends(i
             LimitWindow(WAF_SUBJECT_BURST_LIMIT, WAF_SUBJECT_BURST_WINDOW_SECONDS),
             LimitWindow(WAF_SUBJECT_SUSTAIN_LIMIT, WAF_SUBJECT_SUSTAIN_WINDOW_SECONDS),
         )
-        sub_allowed, sub_retry, sub_used_mem = _rate_check(subject_key, subject_windows, now_ts)
+        sub_allowed, sub_retry, sub_used_mem = await _rate_check_async(subject_key, subject_windows, now_ts)
         _safe_log_rate(
             getattr(request.url, "path", "/api/chat"),
             subject_key.scope,
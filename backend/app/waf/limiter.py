@@ -0,0 +1,241 @@
+"""
+WAF Rate Limiter: single-statement DB check and in-process prefilter
+
+build_rate_check_sql(n) returns one statement that evaluates a subject's
+lockout row and its n active windows in a single round trip:
+- a subject still inside blocked_until is rejected without touching any window
+- otherwise windows are incremented in order; a window is only incremented
+  while every earlier window stayed within its limit (same short-circuit as the
+  per-statement path in guard.py)
+- if any window is exceeded, the lockout row is upserted in the same statement:
+  strikes reset to 1 once the previous block is older than the cooldown,
+  otherwise they escalate, and blocked_until follows the lockout schedule
+
+TokenBucketPrefilter keeps, per subject, a small allowance of tokens granted by
+the last DB answer: share * (smallest remaining headroom across windows). While
+the window buckets are unchanged, requests spend tokens without a DB round
+trip, and the hits they stand for are added to the next statement's
+increments, so DB counters stay exact once that subject talks to the DB again.
+With W workers the limit can be overshot by at most W * share * headroom while
+tokens are outstanding; share=0 disables local admission. Active lockouts are
+cached until blocked_until.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from backend.app.perf.limiter_store import LimiterStore
+
+PREFILTER_MAX_ENTRIES_DEFAULT = 10000
+
+_WINDOW_CTE = """
+w{i} AS (
+    INSERT INTO rate_limits (id, subject_type, subject_id, window_start, window_seconds, hits)
+    SELECT %(id{i})s, %(scope)s::rate_subject, %(subject)s, %(start{i})s, %(seconds{i})s, %(inc{i})s
+    FROM gate
+    WHERE gate.locked_until IS NULL{guard}
+    ON CONFLICT (subject_type, subject_id, window_start, window_seconds)
+    DO UPDATE SET hits = rate_limits.hits + EXCLUDED.hits
+    RETURNING hits
+)"""
+
+# New strike count on the lockout row; a NULL blocked_until simply escalates.
+_STRIKES = (
+    "CASE WHEN rate_limits.blocked_until < %(now)s - %(cooldown)s::int * INTERVAL '1 second'"
+    " THEN 1 ELSE rate_limits.hits + 1 END"
+)
+
+
+def _exceeded(i: int) -> str:
+    return f"EXISTS (SELECT 1 FROM w{i} WHERE hits > %(limit{i})s)"
+
+
+@lru_cache(maxsize=8)
+def build_rate_check_sql(window_count: int) -> str:
+    """One round-trip statement for `window_count` active windows (see module docstring)."""
+    if window_count < 0:
+        raise ValueError("window_count must be >= 0")
+    ctes = [
+        """
+lock_row AS (
+    SELECT hits, blocked_until FROM rate_limits
+    WHERE subject_type = %(scope)s::rate_subject AND subject_id = %(subject)s
+        AND window_start = %(lock_start)s AND window_seconds = 0
+)""",
+        """
+gate AS (
+    SELECT (SELECT blocked_until FROM lock_row WHERE blocked_until > %(now)s) AS locked_until
+)""",
+    ]
+    for i in range(window_count):
+        guard = "".join(f"\n        AND NOT {_exceeded(j)}" for j in range(i))
+        ctes.append(_WINDOW_CTE.format(i=i, guard=guard))
+    exceeded = " OR ".join(_exceeded(i) for i in range(window_count)) or "FALSE"
+    ctes.append(
+        f"""
+verdict AS (
+    SELECT gate.locked_until, ({exceeded}) AS exceeded FROM gate
+)"""
+    )
+    ctes.append(
+        f"""
+strike AS (
+    INSERT INTO rate_limits (id, subject_type, subject_id, window_start, window_seconds, hits, blocked_until)
+    SELECT %(lock_id)s, %(scope)s::rate_subject, %(subject)s, %(lock_start)s, 0, 1,
+        %(now)s + (%(schedule)s::int[])[1] * INTERVAL '1 second'
+    FROM verdict
+    WHERE verdict.exceeded
+    ON CONFLICT (subject_type, subject_id, window_start, window_seconds)
+    DO UPDATE SET
+        hits = {_STRIKES},
+        blocked_until = %(now)s
+            + (%(schedule)s::int[])[LEAST({_STRIKES}, cardinality(%(schedule)s::int[]))] * INTERVAL '1 second'
+    RETURNING hits, blocked_until
+)"""
+    )
+    hits = "".join(f",\n    (SELECT hits FROM w{i})" for i in range(window_count))
+    return (
+        "WITH"
+        + ",".join(ctes)
+        + f"\nSELECT verdict.locked_until, strike.hits, strike.blocked_until{hits}\n"
+        + "FROM verdict LEFT JOIN strike ON TRUE;"
+    )
+
+
+def _utc(ts: float) -> datetime:
+    return datetime.fromtimestamp(ts, tz=timezone.utc)
+
+
+def rate_check_params(
+    scope: str,
+    subject: str,
+    now_ts: float,
+    windows: Sequence[Tuple[int, int]],
+    increments: Sequence[int],
+    schedule: Sequence[int],
+    cooldown_seconds: int,
+) -> Dict[str, Any]:
+    """
+    Parameters for build_rate_check_sql(len(windows)).
+
+    Args:
+        windows: active (limit, window_seconds) pairs, in evaluation order
+        increments: hits to add per window (1 plus any prefilter-admitted hits)
+    """
+    params: Dict[str, Any] = {
+        "scope": scope,
+        "subject": subject,
+        "now": _utc(now_ts),
+        "lock_start": _utc(now_ts - (now_ts % 86400)),
+        "lock_id": uuid.uuid4(),
+        "schedule": [int(s) for s in schedule],
+        "cooldown": int(cooldown_seconds),
+    }
+    for i, ((limit, seconds), inc) in enumerate(zip(windows, increments)):
+        params[f"id{i}"] = uuid.uuid4()
+        params[f"start{i}"] = _utc(now_ts - (now_ts % seconds))
+        params[f"seconds{i}"] = int(seconds)
+        params[f"inc{i}"] = int(inc)
+        params[f"limit{i}"] = int(limit)
+    return params
+
+
+@dataclass
+class _Lease:
+    buckets: Tuple[int, ...]
+    tokens: int = 0
+    pending: int = 0
+    locked_until: float = 0.0
+
+
+class TokenBucketPrefilter:
+    """Per-process allowance of DB-granted tokens per rate-limit subject (see module docstring)."""
+
+    def __init__(self, share: float, max_entries: int = PREFILTER_MAX_ENTRIES_DEFAULT) -> None:
+        self.share = max(0.0, min(1.0, float(share)))
+        self.max_entries = max(1, int(max_entries))
+        self._leases: LimiterStore[_Lease] = LimiterStore(self.max_entries, clock=time.time, name="waf_prefilter")
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._leases)
+
+    def admit(self, key: Tuple[str, str], buckets: Tuple[int, ...], now_ts: float) -> Optional[Tuple[bool, Optional[int]]]:
+        """Return (allowed, retry_after) decided locally, or None when the DB must be asked."""
+        with self._lock:
+            lease = self._leases.get(key, now=now_ts)
+            if lease is None:
+                return None
+            if lease.locked_until > now_ts:
+                return False, int(max(1, lease.locked_until - now_ts))
+            if lease.tokens <= 0 or lease.buckets != buckets:
+                return None
+            lease.tokens -= 1
+            lease.pending += 1
+            return True, None
+
+    def take_pending(self, key: Tuple[str, str], buckets: Tuple[int, ...], now_ts: Optional[float] = None) -> Tuple[int, ...]:
+        """
+        Increments for the next DB statement: 1 per window plus the locally
+        admitted hits still in the same bucket. Outstanding tokens are revoked
+        until record() grants new ones.
+        """
+        with self._lock:
+            lease = self._leases.get(key, now=now_ts)
+            if lease is None:
+                return tuple(1 for _ in buckets)
+            pending = lease.pending
+            same = lease.buckets if len(lease.buckets) == len(buckets) else ()
+            lease.tokens = 0
+            lease.pending = 0
+        return tuple(1 + pending if same and same[i] == b else 1 for i, b in enumerate(buckets))
+
+    def record(
+        self,
+        key: Tuple[str, str],
+        buckets: Tuple[int, ...],
+        limits: Sequence[int],
+        hits: Sequence[Optional[int]],
+        now_ts: float,
+        locked_until: Optional[float] = None,
+        valid_until: Optional[float] = None,
+    ) -> None:
+        """
+        Store the DB answer: cache a lockout until locked_until, or grant tokens
+        from the remaining headroom, kept until valid_until (the last window
+        bucket rollover) at most.
+        """
+        lease = _Lease(buckets=buckets)
+        if locked_until is not None and locked_until > now_ts:
+            lease.locked_until = locked_until
+        elif self.share > 0 and limits and all(h is not None for h in hits):
+            headroom = min(limit - int(h) for limit, h in zip(limits, hits))
+            lease.tokens = max(0, math.floor(self.share * headroom))
+        if not lease.tokens and not lease.locked_until:
+            with self._lock:
+                self._leases.pop(key, None)
+            return
+        until = lease.locked_until or valid_until
+        ttl_s = max(0.0, until - now_ts) if until else None
+        with self._lock:
+            self._leases.set(key, lease, ttl_s=ttl_s, now=now_ts)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._leases.clear()
+
+
+__all__ = [
+    "PREFILTER_MAX_ENTRIES_DEFAULT",
+    "TokenBucketPrefilter",
+    "build_rate_check_sql",
+    "rate_check_params",
+]
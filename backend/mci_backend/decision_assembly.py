@@ -5,6 +5,7 @@ Phase 9 — Step 8: Decision State Assembly Pipeline (deterministic, bounded, fa
 
 Responsibilities:
 - Run Steps 1–5 and 7 in canonical order.
+- Scan the message once for the union of all engine markers and share the hits.
 - Enforce cross-field invariants without changing engine semantics.
 - Return a final immutable DecisionState or raise a bounded validation error.
 
@@ -16,11 +17,12 @@ Forbidden:
 
 from dataclasses import dataclass
 
-from .decision_irreversibility import apply_irreversibility
-from .decision_outcomes import apply_outcome_classes
-from .decision_proximity import apply_proximity
-from .decision_responsibility import apply_responsibility_scope
-from .decision_risk import apply_risk_classification
+from .decision_irreversibility import IRREVERSIBILITY_MARKERS, apply_irreversibility
+from .decision_outcomes import OUTCOME_MARKERS, apply_outcome_classes
+from .decision_proximity import PROXIMITY_MARKERS, apply_proximity
+from .decision_responsibility import RESPONSIBILITY_MARKERS, apply_responsibility_scope
+from .decision_risk import RISK_MARKERS, apply_risk_classification
+from .decision_text_features import MarkerVocabulary, extract_text_features
 from .decision_unknowns import consolidate_unknowns
 from .decision_state import (
     ConfidenceLevel,
@@ -37,6 +39,10 @@ from .decision_state import (
     PHASE_9_SCHEMA_VERSION,
 )
 
+DECISION_VOCABULARY = MarkerVocabulary(
+    PROXIMITY_MARKERS + RISK_MARKERS + IRREVERSIBILITY_MARKERS + RESPONSIBILITY_MARKERS + OUTCOME_MARKERS
+)
+
 
 @dataclass(frozen=True)
 class AssemblyValidationError(ValueError):
@@ -127,11 +133,12 @@ def assemble_decision_state(
         ),
     )
 
-    state = apply_proximity(baseline, message, intent_framing)
-    state = apply_risk_classification(state, message, intent_framing)
-    state = apply_irreversibility(state, message, intent_framing)
-    state = apply_responsibility_scope(state, message, intent_framing)
-    state = apply_outcome_classes(state, message, intent_framing)
+    features = extract_text_features(message, intent_framing, DECISION_VOCABULARY)
+    state = apply_proximity(baseline, message, intent_framing, features)
+    state = apply_risk_classification(state, message, intent_framing, features)
+    state = apply_irreversibility(state, message, intent_framing, features)
+    state = apply_responsibility_scope(state, message, intent_framing, features)
+    state = apply_outcome_classes(state, message, intent_framing, features)
     state = consolidate_unknowns(state)
 
     return _validate_cross_fields(state)
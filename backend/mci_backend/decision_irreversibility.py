@@ -15,7 +15,7 @@ Forbidden:
 """
 
 from dataclasses import replace
-from typing import Iterable, Tuple
+from typing import Tuple
 
 from .decision_state import (
     ConsequenceHorizon,
@@ -23,98 +23,110 @@ from .decision_state import (
     ReversibilityClass,
     UnknownSource,
 )
+from .decision_text_features import DecisionTextFeatures, MarkerVocabulary, extract_text_features
+
+_IRREVERSIBLE_MARKERS = (
+    "cannot undo",
+    "irreversible",
+    "permanent",
+    "one-way",
+    "destructive",
+    "non-recoverable",
+    "delete permanently",
+)
 
+_COSTLY_MARKERS = (
+    "requires approval",
+    "contract",
+    "legal",
+    "surgery",
+    "compliance",
+    "license",
+    "migration",
+    "downtime",
+)
 
-def _lower(text: str | None) -> str:
-    return (text or "").lower()
+_EASY_MARKERS = (
+    "draft",
+    "temporary",
+    "test",
+    "trial",
+    "prototype",
+    "undo",
+    "rollback",
+    "revert",
+)
 
+_LONG_HORIZON_MARKERS = (
+    "years",
+    "decades",
+    "lifetime",
+    "forever",
+    "permanent",
+    "long term",
+    "long-term",
+    "irreversible",
+)
 
-def _contains_any(text: str, markers: Iterable[str]) -> bool:
-    return any(marker in text for marker in markers)
+_MEDIUM_HORIZON_MARKERS = (
+    "months",
+    "quarter",
+    "this year",
+    "over time",
+    "medium term",
+    "medium-term",
+)
 
+_SHORT_HORIZON_MARKERS = (
+    "today",
+    "now",
+    "tonight",
+    "this week",
+    "immediately",
+    "soon",
+    "short term",
+    "short-term",
+)
+
+IRREVERSIBILITY_MARKERS = (
+    _IRREVERSIBLE_MARKERS
+    + _COSTLY_MARKERS
+    + _EASY_MARKERS
+    + _LONG_HORIZON_MARKERS
+    + _MEDIUM_HORIZON_MARKERS
+    + _SHORT_HORIZON_MARKERS
+)
+
+_VOCABULARY = MarkerVocabulary(IRREVERSIBILITY_MARKERS)
 
-def classify_reversibility(message: str) -> Tuple[ReversibilityClass, bool]:
-    text = _lower(message)
 
-    irreversible_markers = [
-        "cannot undo",
-        "irreversible",
-        "permanent",
-        "one-way",
-        "destructive",
-        "non-recoverable",
-        "delete permanently",
-    ]
-    if _contains_any(text, irreversible_markers):
+def classify_reversibility(message: str, features: DecisionTextFeatures | None = None) -> Tuple[ReversibilityClass, bool]:
+    if features is None:
+        features = extract_text_features(message, None, _VOCABULARY)
+
+    if features.in_text(_IRREVERSIBLE_MARKERS):
         return ReversibilityClass.IRREVERSIBLE, False
 
-    costly_markers = [
-        "requires approval",
-        "contract",
-        "legal",
-        "surgery",
-        "compliance",
-        "license",
-        "migration",
-        "downtime",
-    ]
-    if _contains_any(text, costly_markers):
+    if features.in_text(_COSTLY_MARKERS):
         return ReversibilityClass.COSTLY_REVERSIBLE, False
 
-    easy_markers = [
-        "draft",
-        "temporary",
-        "test",
-        "trial",
-        "prototype",
-        "undo",
-        "rollback",
-        "revert",
-    ]
-    if _contains_any(text, easy_markers):
+    if features.in_text(_EASY_MARKERS):
         return ReversibilityClass.EASILY_REVERSIBLE, True
 
     return ReversibilityClass.UNKNOWN, True
 
 
-def classify_horizon(message: str) -> Tuple[ConsequenceHorizon, bool]:
-    text = _lower(message)
-
-    long_markers = [
-        "years",
-        "decades",
-        "lifetime",
-        "forever",
-        "permanent",
-        "long term",
-        "long-term",
-        "irreversible",
-    ]
-    if _contains_any(text, long_markers):
+def classify_horizon(message: str, features: DecisionTextFeatures | None = None) -> Tuple[ConsequenceHorizon, bool]:
+    if features is None:
+        features = extract_text_features(message, None, _VOCABULARY)
+
+    if features.in_text(_LONG_HORIZON_MARKERS):
         return ConsequenceHorizon.LONG_HORIZON, False
 
-    medium_markers = [
-        "months",
-        "quarter",
-        "this year",
-        "over time",
-        "medium term",
-        "medium-term",
-    ]
-    if _contains_any(text, medium_markers):
+    if features.in_text(_MEDIUM_HORIZON_MARKERS):
         return ConsequenceHorizon.MEDIUM_HORIZON, False
 
-    short_markers = [
-        "today",
-        "now",
-        "tonight",
-        "this week",
-        "immediately",
-        "soon",
-        "short term",
-        "short-term",
-    ]
-    if _contains_any(text, short_markers):
+    if features.in_text(_SHORT_HORIZON_MARKERS):
         return ConsequenceHorizon.SHORT_HORIZON, True
 
     return ConsequenceHorizon.UNKNOWN, True
@@ -151,13 +163,16 @@ def apply_irreversibility(
     decision_state: DecisionState,
     message: str,
     intent_framing: str | None = None,
+    features: DecisionTextFeatures | None = None,
 ) -> DecisionState:
     """
     Populate reversibility_class and consequence_horizon deterministically.
     Uses only current message and optional Phase 4 framing.
     """
-    reversibility, rev_uncertain = classify_reversibility(message)
-    horizon, horizon_uncertain = classify_horizon(message)
+    if features is None:
+        features = extract_text_features(message, None, _VOCABULARY)
+    reversibility, rev_uncertain = classify_reversibility(message, features)
+    horizon, horizon_uncertain = classify_horizon(message, features)
 
     unknowns = list(decision_state.explicit_unknown_zone)
     if rev_uncertain:
@@ -14,7 +14,7 @@ Forbidden:
 """
 
 from dataclasses import replace
-from typing import Iterable, List, Set, Tuple
+from typing import Set, Tuple
 
 from .decision_state import (
     ConsequenceHorizon,
@@ -25,53 +25,47 @@ from .decision_state import (
     UnknownSource,
     ResponsibilityScope,
 )
-
-
-def _lower(text: str | None) -> str:
-    return (text or "").lower()
-
-
-def _contains_any(text: str, markers: Iterable[str]) -> bool:
-    return any(marker in text for marker in markers)
-
-
-def _text_markers() -> dict[OutcomeClass, dict[str, List[str]]]:
-    return {
-        OutcomeClass.FINANCIAL_OUTCOME: {
-            "markers": ["payment", "wire", "bank", "invoice", "price", "budget", "cost", "buy", "sell"],
-        },
-        OutcomeClass.LEGAL_REGULATORY_OUTCOME: {
-            "markers": ["illegal", "lawsuit", "regulation", "compliance", "violate", "breach", "contract", "policy"],
-        },
-        OutcomeClass.MEDICAL_BIOLOGICAL_OUTCOME: {
-            "markers": ["surgery", "prescription", "dose", "diagnosis", "clinical", "health", "treatment"],
-        },
-        OutcomeClass.PHYSICAL_SAFETY_OUTCOME: {
-            "markers": ["weapon", "attack", "hazard", "injury", "crash", "dangerous", "safety"],
-        },
-        OutcomeClass.PSYCHOLOGICAL_EMOTIONAL_OUTCOME: {
-            "markers": ["stress", "anxiety", "depressed", "panic", "trauma", "self-harm", "bullying"],
-        },
-        OutcomeClass.ETHICAL_MORAL_OUTCOME: {
-            "markers": ["ethical", "moral", "plagiarize", "cheat", "fraud", "bribe", "integrity"],
-        },
-        OutcomeClass.REPUTATIONAL_SOCIAL_OUTCOME: {
-            "markers": ["publicly", "publish", "broadcast", "reputation", "defamation", "slander", "libel", "backlash"],
-        },
-        OutcomeClass.OPERATIONAL_SYSTEM_OUTCOME: {
-            "markers": ["outage", "downtime", "deployment", "rollback", "system failure", "maintenance"],
-        },
-        OutcomeClass.IRREVERSIBLE_PERSONAL_HARM_OUTCOME: {
-            "markers": ["irreversible", "permanent damage", "cannot undo", "lifelong"],
-        },
-    }
-
-
-def _classify_from_text(message: str, framing: str) -> Set[OutcomeClass]:
+from .decision_text_features import DecisionTextFeatures, MarkerVocabulary, extract_text_features
+
+_OUTCOME_MARKERS: dict[OutcomeClass, dict[str, Tuple[str, ...]]] = {
+    OutcomeClass.FINANCIAL_OUTCOME: {
+        "markers": ("payment", "wire", "bank", "invoice", "price", "budget", "cost", "buy", "sell"),
+    },
+    OutcomeClass.LEGAL_REGULATORY_OUTCOME: {
+        "markers": ("illegal", "lawsuit", "regulation", "compliance", "violate", "breach", "contract", "policy"),
+    },
+    OutcomeClass.MEDICAL_BIOLOGICAL_OUTCOME: {
+        "markers": ("surgery", "prescription", "dose", "diagnosis", "clinical", "health", "treatment"),
+    },
+    OutcomeClass.PHYSICAL_SAFETY_OUTCOME: {
+        "markers": ("weapon", "attack", "hazard", "injury", "crash", "dangerous", "safety"),
+    },
+    OutcomeClass.PSYCHOLOGICAL_EMOTIONAL_OUTCOME: {
+        "markers": ("stress", "anxiety", "depressed", "panic", "trauma", "self-harm", "bullying"),
+    },
+    OutcomeClass.ETHICAL_MORAL_OUTCOME: {
+        "markers": ("ethical", "moral", "plagiarize", "cheat", "fraud", "bribe", "integrity"),
+    },
+    OutcomeClass.REPUTATIONAL_SOCIAL_OUTCOME: {
+        "markers": ("publicly", "publish", "broadcast", "reputation", "defamation", "slander", "libel", "backlash"),
+    },
+    OutcomeClass.OPERATIONAL_SYSTEM_OUTCOME: {
+        "markers": ("outage", "downtime", "deployment", "rollback", "system failure", "maintenance"),
+    },
+    OutcomeClass.IRREVERSIBLE_PERSONAL_HARM_OUTCOME: {
+        "markers": ("irreversible", "permanent damage", "cannot undo", "lifelong"),
+    },
+}
+
+OUTCOME_MARKERS = tuple(marker for data in _OUTCOME_MARKERS.values() for marker in data["markers"])
+
+_VOCABULARY = MarkerVocabulary(OUTCOME_MARKERS)
+
+
+def _classify_from_text(features: DecisionTextFeatures) -> Set[OutcomeClass]:
     outcomes: Set[OutcomeClass] = set()
-    markers = _text_markers()
-    for outcome, data in markers.items():
-        if _contains_any(message, data["markers"]) or _contains_any(framing, data["markers"]):
+    for outcome, data in _OUTCOME_MARKERS.items():
+        if features.in_either(data["markers"]):
             outcomes.add(outcome)
     return outcomes
 
@@ -138,6 +132,7 @@ def apply_outcome_classes(
     decision_state: DecisionState,
     message: str,
     intent_framing: str | None = None,
+    features: DecisionTextFeatures | None = None,
 ) -> DecisionState:
     """
     Populate outcome_classes deterministically.
@@ -145,12 +140,13 @@ def apply_outcome_classes(
     Inputs:
     - message: current user message only.
     - intent_framing: optional Phase 4 framing.
+    - features: optional shared scan from assembly; computed locally when absent.
     """
-    text = _lower(message)
-    framing = _lower(intent_framing)
+    if features is None:
+        features = extract_text_features(message, intent_framing, _VOCABULARY)
 
     outcomes: Set[OutcomeClass] = set()
-    outcomes.update(_classify_from_text(text, framing))
+    outcomes.update(_classify_from_text(features))
     outcomes.update(_classify_from_state(decision_state))
 
     outcomes_tuple, unknowns_tuple = _enforce_invariants(outcomes, decision_state.explicit_unknown_zone)
@@ -14,13 +14,14 @@ Forbidden:
 """
 
 from dataclasses import replace
-from typing import Iterable, Tuple
+from typing import Tuple
 
 from .decision_state import (
     DecisionState,
     ProximityState,
     UnknownSource,
 )
+from .decision_text_features import DecisionTextFeatures, MarkerVocabulary, extract_text_features
 
 PROXIMITY_ORDER = [
     ProximityState.VERY_LOW,
@@ -31,82 +32,87 @@ PROXIMITY_ORDER = [
 ]
 
 
-def _lower(s: str | None) -> str:
-    return (s or "").lower()
+_IMMINENT_MARKERS = (
+    "about to",
+    "ready to",
+    "before i do",
+    "before we do",
+    "going to",
+    "on my way",
+    "right now",
+    "doing this now",
+    "today",
+    "tonight",
+    "this minute",
+    "immediately",
+)
 
+_HIGH_MARKERS = (
+    "will do",
+    "plan to",
+    "planning to",
+    "intend to",
+    "going ahead",
+    "scheduled",
+    "set to",
+    "decided to",
+)
 
-def _contains_any(text: str, markers: Iterable[str]) -> bool:
-    return any(marker in text for marker in markers)
+_MEDIUM_MARKERS = (
+    "between",
+    "should i pick",
+    "choose between",
+    "which option",
+    "confirm",
+    "is this okay",
+    "is this ok",
+    "before choosing",
+)
+
+_LOW_MARKERS = (
+    "thinking about",
+    "considering",
+    "might",
+    "maybe do",
+    "could",
+    "potentially",
+)
 
+PROXIMITY_MARKERS = _IMMINENT_MARKERS + _HIGH_MARKERS + _MEDIUM_MARKERS + _LOW_MARKERS
 
-def classify_proximity(message: str, intent_framing: str | None = None) -> Tuple[ProximityState, bool]:
+_VOCABULARY = MarkerVocabulary(PROXIMITY_MARKERS)
+
+
+def classify_proximity(
+    message: str,
+    intent_framing: str | None = None,
+    features: DecisionTextFeatures | None = None,
+) -> Tuple[ProximityState, bool]:
     """
     Deterministic rule-based classification of proximity.
 
     Inputs:
     - message: current user message only.
     - intent_framing: optional Phase 4 Step 0 framing (bounded).
+    - features: optional shared scan from assembly; computed locally when absent.
     """
-    text = _lower(message)
-    framing = _lower(intent_framing)
+    if features is None:
+        features = extract_text_features(message, intent_framing, _VOCABULARY)
 
     # Strongest signals: imminent execution framing and immediate temporal markers.
-    imminent_markers = [
-        "about to",
-        "ready to",
-        "before i do",
-        "before we do",
-        "going to",
-        "on my way",
-        "right now",
-        "doing this now",
-        "today",
-        "tonight",
-        "this minute",
-        "immediately",
-    ]
-    if _contains_any(text, imminent_markers) or _contains_any(framing, imminent_markers):
+    if features.in_either(_IMMINENT_MARKERS):
         return ProximityState.IMMINENT, False
 
     # High: clear commitment / execution language without immediate timing.
-    high_markers = [
-        "will do",
-        "plan to",
-        "planning to",
-        "intend to",
-        "going ahead",
-        "scheduled",
-        "set to",
-        "decided to",
-    ]
-    if _contains_any(text, high_markers) or _contains_any(framing, high_markers):
+    if features.in_either(_HIGH_MARKERS):
         return ProximityState.HIGH, False
 
     # Medium: narrowing options, validation-seeking prior to action.
-    medium_markers = [
-        "between",
-        "should i pick",
-        "choose between",
-        "which option",
-        "confirm",
-        "is this okay",
-        "is this ok",
-        "before choosing",
-        "before choosing",
-    ]
-    if _contains_any(text, medium_markers) or _contains_any(framing, medium_markers):
+    if features.in_either(_MEDIUM_MARKERS):
         return ProximityState.MEDIUM, False
 
     # Low: early-stage, exploratory references to action.
-    low_markers = [
-        "thinking about",
-        "considering",
-        "might",
-        "maybe do",
-        "could",
-        "potentially",
-    ]
-    if _contains_any(text, low_markers) or _contains_any(framing, low_markers):
+    if features.in_either(_LOW_MARKERS):
         return ProximityState.LOW, True
 
     # Default: insufficient signals → very low with uncertainty.
@@ -147,9 +153,10 @@ def apply_proximity(
     decision_state: DecisionState,
     message: str,
     intent_framing: str | None = None,
+    features: DecisionTextFeatures | None = None,
 ) -> DecisionState:
     """Populate proximity_state and proximity_uncertainty on a DecisionState (immutable replace)."""
-    new_state, uncertainty = classify_proximity(message, intent_framing)
+    new_state, uncertainty = classify_proximity(message, intent_framing, features)
     updated_unknowns = _enforce_invariants(
         prior_state=decision_state.proximity_state,
         new_state=new_state,
@@ -14,7 +14,7 @@ Forbidden:
 """
 
 from dataclasses import replace
-from typing import Iterable, Tuple
+from typing import Tuple
 
 from .decision_state import (
     DecisionState,
@@ -22,83 +22,87 @@ from .decision_state import (
     UnknownSource,
     ConsequenceHorizon,
 )
+from .decision_text_features import DecisionTextFeatures, MarkerVocabulary, extract_text_features
+
+_SYSTEMIC_MARKERS = (
+    "publicly",
+    "publish",
+    "broadcast",
+    "release",
+    "release publicly",
+    "policy",
+    "users",
+    "customers",
+    "vulnerability",
+    "exploit",
+    "mass",
+    "system-wide",
+    "company-wide",
+)
 
+_THIRD_PARTY_MARKERS = (
+    "client",
+    "customer",
+    "employee",
+    "employer",
+    "manager",
+    "contractor",
+    "for them",
+    "for her",
+    "for him",
+    "allow",
+    "approve",
+    "deny",
+    "permission",
+    "they depend on me",
+)
 
-def _lower(text: str | None) -> str:
-    return (text or "").lower()
+_SHARED_MARKERS = (
+    "family",
+    "parents",
+    "child",
+    "friend",
+    "partner",
+    "team",
+    "group",
+    "we",
+    "us",
+    "together",
+    "shared",
+    "our",
+)
 
+_SELF_MARKERS = (
+    "i will",
+    "i'm going to",
+    "for myself",
+    "my decision",
+    "personal",
+)
 
-def _contains_any(text: str, markers: Iterable[str]) -> bool:
-    return any(marker in text for marker in markers)
+RESPONSIBILITY_MARKERS = _SYSTEMIC_MARKERS + _THIRD_PARTY_MARKERS + _SHARED_MARKERS + _SELF_MARKERS
 
+_VOCABULARY = MarkerVocabulary(RESPONSIBILITY_MARKERS)
 
-def classify_responsibility_scope(message: str, intent_framing: str | None = None) -> Tuple[ResponsibilityScope, bool]:
-    text = _lower(message)
-    framing = _lower(intent_framing)
 
-    systemic_markers = [
-        "publicly",
-        "publish",
-        "broadcast",
-        "release",
-        "release publicly",
-        "policy",
-        "users",
-        "customers",
-        "vulnerability",
-        "exploit",
-        "mass",
-        "system-wide",
-        "company-wide",
-    ]
-    if _contains_any(text, systemic_markers) or _contains_any(framing, systemic_markers):
+def classify_responsibility_scope(
+    message: str,
+    intent_framing: str | None = None,
+    features: DecisionTextFeatures | None = None,
+) -> Tuple[ResponsibilityScope, bool]:
+    if features is None:
+        features = extract_text_features(message, intent_framing, _VOCABULARY)
+
+    if features.in_either(_SYSTEMIC_MARKERS):
         return ResponsibilityScope.SYSTEMIC_PUBLIC, False
 
-    third_party_markers = [
-        "client",
-        "customer",
-        "employee",
-        "employer",
-        "manager",
-        "contractor",
-        "for them",
-        "for her",
-        "for him",
-        "for them",
-        "allow",
-        "approve",
-        "deny",
-        "permission",
-        "they depend on me",
-    ]
-    if _contains_any(text, third_party_markers) or _contains_any(framing, third_party_markers):
+    if features.in_either(_THIRD_PARTY_MARKERS):
         return ResponsibilityScope.THIRD_PARTY, False
 
-    shared_markers = [
-        "family",
-        "parents",
-        "child",
-        "friend",
-        "partner",
-        "team",
-        "group",
-        "we",
-        "us",
-        "together",
-        "shared",
-        "our",
-    ]
-    if _contains_any(text, shared_markers) or _contains_any(framing, shared_markers):
+    if features.in_either(_SHARED_MARKERS):
         return ResponsibilityScope.SHARED, False
 
-    self_markers = [
-        "i will",
-        "i'm going to",
-        "for myself",
-        "my decision",
-        "personal",
-    ]
-    if _contains_any(text, self_markers) or _contains_any(framing, self_markers):
+    if features.in_either(_SELF_MARKERS):
         return ResponsibilityScope.SELF_ONLY, True
 
     return ResponsibilityScope.UNKNOWN, True
@@ -132,9 +136,10 @@ def apply_responsibility_scope(
     decision_state: DecisionState,
     message: str,
     intent_framing: str | None = None,
+    features: DecisionTextFeatures | None = None,
 ) -> DecisionState:
     """Populate responsibility_scope deterministically; leaves other fields unchanged."""
-    scope, uncertain = classify_responsibility_scope(message, intent_framing)
+    scope, uncertain = classify_responsibility_scope(message, intent_framing, features)
 
     unknowns = list(decision_state.explicit_unknown_zone)
     if uncertain and UnknownSource.RESPONSIBILITY_SCOPE not in unknowns:
@@ -15,7 +15,7 @@ Forbidden:
 """
 
 from dataclasses import replace
-from typing import Iterable, List, Tuple
+from typing import List, Tuple
 
 from .decision_state import (
     ConfidenceLevel,
@@ -25,69 +25,65 @@ from .decision_state import (
     UnknownSource,
     ProximityState,
 )
+from .decision_text_features import DecisionTextFeatures, MarkerVocabulary, extract_text_features
+
+_DOMAIN_MARKERS: dict[RiskDomain, dict[str, Tuple[str, ...]]] = {
+    RiskDomain.FINANCIAL: {
+        "high": ("payment", "wire", "transfer", "bank", "invoice", "price", "budget"),
+        "medium": ("cost", "spend", "buy", "sell", "refund"),
+    },
+    RiskDomain.LEGAL_REGULATORY: {
+        "high": ("illegal", "lawsuit", "regulation", "compliance", "violate", "breach"),
+        "medium": ("contract", "terms", "policy", "license"),
+    },
+    RiskDomain.MEDICAL_BIOLOGICAL: {
+        "high": ("surgery", "prescription", "dose", "diagnosis", "clinical", "biological"),
+        "medium": ("health", "symptom", "treatment", "therapy"),
+    },
+    RiskDomain.PHYSICAL_SAFETY: {
+        "high": ("weapon", "attack", "crash", "hazard", "injury", "kill"),
+        "medium": ("dangerous", "safety", "accident", "exposure"),
+    },
+    RiskDomain.PSYCHOLOGICAL_EMOTIONAL: {
+        "high": ("self-harm", "suicide", "panic", "trauma"),
+        "medium": ("stress", "anxiety", "depressed", "bullying"),
+    },
+    RiskDomain.ETHICAL_MORAL: {
+        "high": ("plagiarize", "cheat", "fraud", "bribe"),
+        "medium": ("fair", "ethical", "moral", "integrity"),
+    },
+    RiskDomain.REPUTATIONAL_SOCIAL: {
+        "high": ("defamation", "slander", "libel", "cancel"),
+        "medium": ("public image", "reputation", "social backlash"),
+    },
+    RiskDomain.OPERATIONAL_SYSTEMIC: {
+        "high": ("outage", "downtime", "system failure"),
+        "medium": ("deployment", "rollback", "maintenance"),
+    },
+    RiskDomain.IRREVERSIBLE_PERSONAL_HARM: {
+        "high": ("irreversible", "permanent damage"),
+        "medium": ("lifelong", "cannot undo"),
+    },
+    RiskDomain.LEGAL_ADJACENT_GRAY_ZONE: {
+        "high": ("loophole", "gray area", "grey area"),
+        "medium": ("borderline", "edge case"),
+    },
+}
+
+RISK_MARKERS = tuple(
+    marker for levels in _DOMAIN_MARKERS.values() for level in ("high", "medium") for marker in levels[level]
+)
+
+_VOCABULARY = MarkerVocabulary(RISK_MARKERS)
 
 
-def _lower(text: str | None) -> str:
-    return (text or "").lower()
-
-
-def _contains_any(text: str, markers: Iterable[str]) -> bool:
-    return any(marker in text for marker in markers)
-
-
-def _domain_markers() -> dict[RiskDomain, dict[str, List[str]]]:
-    return {
-        RiskDomain.FINANCIAL: {
-            "high": ["payment", "wire", "transfer", "bank", "invoice", "price", "budget"],
-            "medium": ["cost", "spend", "buy", "sell", "refund"],
-        },
-        RiskDomain.LEGAL_REGULATORY: {
-            "high": ["illegal", "lawsuit", "regulation", "compliance", "violate", "breach"],
-            "medium": ["contract", "terms", "policy", "license"],
-        },
-        RiskDomain.MEDICAL_BIOLOGICAL: {
-            "high": ["surgery", "prescription", "dose", "diagnosis", "clinical", "biological"],
-            "medium": ["health", "symptom", "treatment", "therapy"],
-        },
-        RiskDomain.PHYSICAL_SAFETY: {
-            "high": ["weapon", "attack", "crash", "hazard", "injury", "kill"],
-            "medium": ["dangerous", "safety", "accident", "exposure"],
-        },
-        RiskDomain.PSYCHOLOGICAL_EMOTIONAL: {
-            "high": ["self-harm", "suicide", "panic", "trauma"],
-            "medium": ["stress", "anxiety", "depressed", "bullying"],
-        },
-        RiskDomain.ETHICAL_MORAL: {
-            "high": ["plagiarize", "cheat", "fraud", "bribe"],
-            "medium": ["fair", "ethical", "moral", "integrity"],
-        },
-        RiskDomain.REPUTATIONAL_SOCIAL: {
-            "high": ["defamation", "slander", "libel", "cancel"],
-            "medium": ["public image", "reputation", "social backlash"],
-        },
-        RiskDomain.OPERATIONAL_SYSTEMIC: {
-            "high": ["outage", "downtime", "system failure"],
-            "medium": ["deployment", "rollback", "maintenance"],
-        },
-        RiskDomain.IRREVERSIBLE_PERSONAL_HARM: {
-            "high": ["irreversible", "permanent damage"],
-            "medium": ["lifelong", "cannot undo"],
-        },
-        RiskDomain.LEGAL_ADJACENT_GRAY_ZONE: {
-            "high": ["loophole", "gray area", "grey area"],
-            "medium": ["borderline", "edge case"],
-        },
-    }
-
-
-def _classify_domains(text: str, framing: str) -> List[RiskAssessment]:
+def _classify_domains(features: DecisionTextFeatures) -> List[RiskAssessment]:
     assessments: List[RiskAssessment] = []
-    markers = _domain_markers()
-    for domain, levels in markers.items():
+    for domain, levels in _DOMAIN_MARKERS.items():
         confidence: ConfidenceLevel | None = None
-        if _contains_any(text, levels["high"]) or _contains_any(framing, levels["high"]):
+        if features.in_either(levels["high"]):
             confidence = ConfidenceLevel.HIGH
-        elif _contains_any(text, levels["medium"]) or _contains_any(framing, levels["medium"]):
+        elif features.in_either(levels["medium"]):
             confidence = ConfidenceLevel.MEDIUM
         if confidence:
             assessments.append(RiskAssessment(domain=domain, confidence=confidence))
@@ -145,6 +141,7 @@ def apply_risk_classification(
     decision_state: DecisionState,
     message: str,
     intent_framing: str | None = None,
+    features: DecisionTextFeatures | None = None,
 ) -> DecisionState:
     """
     Populate risk_domains with deterministic, bounded classifications.
@@ -152,12 +149,13 @@ def apply_risk_classification(
     Inputs:
     - message: current user message only.
     - intent_framing: optional Phase 4 framing.
+    - features: optional shared scan from assembly; computed locally when absent.
     """
-    text = _lower(message)
-    framing = _lower(intent_framing)
+    if features is None:
+        features = extract_text_features(message, intent_framing, _VOCABULARY)
 
     unknowns: List[UnknownSource] = list(decision_state.explicit_unknown_zone)
-    assessments = _classify_domains(text, framing)
+    assessments = _classify_domains(features)
 
     assessments, unknowns = _ensure_presence(assessments, unknowns)
     assessments_tuple, unknowns_tuple = _enforce_invariants(
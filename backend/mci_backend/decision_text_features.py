@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+"""
+Phase 9 — Shared Text-Feature Extraction for the decision engines (deterministic, bounded).
+
+Responsibilities:
+- Lowercase the message and optional Phase 4 framing once per assembly.
+- Resolve the union of all engine markers against the text in one scan and
+  hand each engine the precomputed hit sets.
+- Preserve the engines' substring semantics exactly: a marker hits wherever
+  `marker in text` holds, not only on word boundaries.
+
+Forbidden:
+- No classification; engines alone decide what a hit means.
+- No models, heuristics, probabilities, or history.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import FrozenSet, Iterable, List, Tuple
+
+# Texts shorter than this are scanned marker-by-marker directly; building the
+# token index costs more than it saves on short chat messages.
+TOKEN_INDEX_MIN_CHARS = 512
+
+_TOKEN_RE = re.compile(r"[a-z']+")
+
+
+def _lower(text: str | None) -> str:
+    return (text or "").lower()
+
+
+class MarkerVocabulary:
+    """
+    Deduplicated marker set compiled for repeated scans.
+
+    Long texts are reduced to their unique letter runs first. A marker made of a
+    single run can only occur inside one such run, so it is tested against the
+    joined unique runs; a compound marker ("cannot undo", "self-harm") is only
+    searched in the full text when every one of its runs is present.
+    """
+
+    def __init__(self, markers: Iterable[str]) -> None:
+        ordered: List[str] = []
+        seen = set()
+        for marker in markers:
+            if not marker or marker != marker.lower():
+                raise ValueError("markers must be non-empty lowercase strings.")
+            if marker not in seen:
+                seen.add(marker)
+                ordered.append(marker)
+        self._markers: Tuple[str, ...] = tuple(ordered)
+        self._simple: Tuple[str, ...] = tuple(m for m in ordered if _TOKEN_RE.fullmatch(m))
+        self._compound: Tuple[Tuple[str, Tuple[str, ...]], ...] = tuple(
+            (m, tuple(_TOKEN_RE.findall(m))) for m in ordered if not _TOKEN_RE.fullmatch(m)
+        )
+
+    @property
+    def markers(self) -> Tuple[str, ...]:
+        return self._markers
+
+    def __len__(self) -> int:
+        return len(self._markers)
+
+    def scan(self, text: str) -> FrozenSet[str]:
+        """Return the markers occurring in already-lowercased text."""
+        if not text:
+            return frozenset()
+        if len(text) < TOKEN_INDEX_MIN_CHARS:
+            return frozenset(m for m in self._markers if m in text)
+
+        runs = "\x00".join(set(_TOKEN_RE.findall(text)))
+        hits = [m for m in self._simple if m in runs]
+        for marker, pieces in self._compound:
+            for piece in pieces:
+                if piece not in runs:
+                    break
+            else:
+                if marker in text:
+                    hits.append(marker)
+        return frozenset(hits)
+
+
+@dataclass(frozen=True)
+class DecisionTextFeatures:
+    """Markers present in the lowercased message and framing."""
+
+    text_hits: FrozenSet[str]
+    framing_hits: FrozenSet[str]
+
+    def in_text(self, markers: Iterable[str]) -> bool:
+        return not self.text_hits.isdisjoint(markers)
+
+    def in_framing(self, markers: Iterable[str]) -> bool:
+        return not self.framing_hits.isdisjoint(markers)
+
+    def in_either(self, markers: Iterable[str]) -> bool:
+        return self.in_text(markers) or self.in_framing(markers)
+
+
+def extract_text_features(
+    message: str | None,
+    intent_framing: str | None,
+    vocabulary: MarkerVocabulary,
+) -> DecisionTextFeatures:
+    """Lowercase once and scan message and framing against the vocabulary."""
+    return DecisionTextFeatures(
+        text_hits=vocabulary.scan(_lower(message)),
+        framing_hits=vocabulary.scan(_lower(intent_framing)),
+    )
+
+
+__all__ = [
+    "TOKEN_INDEX_MIN_CHARS",
+    "MarkerVocabulary",
+    "DecisionTextFeatures",
+    "extract_text_features",
+]
@@ -2,16 +2,30 @@
 
 from __future__ import annotations
 
+import hashlib
+import threading
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional
+from typing import AsyncIterator, Optional, Tuple, Union
 
 from backend.app.llm_client import LLMClient
+from backend.app.observability.metrics import counter
+from backend.mci_backend.control_plan import SCHEMA_VERSION as CONTROL_PLAN_SCHEMA_VERSION
+from backend.mci_backend.control_plan import ControlPlan
 from backend.mci_backend.decision_assembly import assemble_decision_state
+from backend.mci_backend.decision_state import PHASE_9_SCHEMA_VERSION, DecisionState
 from backend.mci_backend.model_contract import ModelFailure, ModelFailureType, ModelInvocationResult
-from backend.mci_backend.model_invocation_pipeline import invoke_model_for_output_plan
+from backend.mci_backend.model_invocation_pipeline import (
+    ModelStreamEvent,
+    invoke_model_for_output_plan,
+    invoke_model_for_output_plan_async,
+    stream_model_for_output_plan_async,
+)
 from backend.mci_backend.orchestration_assembly import assemble_control_plan
 from backend.mci_backend.expression_assembly import assemble_output_plan
+from backend.mci_backend.output_plan import SCHEMA_VERSION as OUTPUT_PLAN_SCHEMA_VERSION
+from backend.mci_backend.output_plan import OutputPlan
 
 
 class GovernedOrchestratorError(Exception):
@@ -22,6 +36,96 @@ _TRACE_NAMESPACE = uuid.UUID("5b9fb9d8-4c5e-4568-8e5d-b1c0f6a99e7e")
 _DECISION_NAMESPACE = uuid.UUID("b8e5b0b5-0c2b-4e91-9e2e-4f9c123b9f66")
 
 
+PLAN_CACHE_MAX_ENTRIES = 2048
+# Bump PLAN_CACHE_REVISION when assembler logic changes without a schema bump.
+PLAN_CACHE_REVISION = 1
+PLAN_CACHE_SCHEMA = (
+    f"{PHASE_9_SCHEMA_VERSION}|{CONTROL_PLAN_SCHEMA_VERSION}|{OUTPUT_PLAN_SCHEMA_VERSION}|{PLAN_CACHE_REVISION}"
+)
+
+PlanTriple = Tuple[DecisionState, ControlPlan, OutputPlan]
+
+
+@dataclass(frozen=True)
+class PlanCacheStats:
+    """Plan cache counters (structure only, no text or keys)."""
+    entries: int
+    hits: int
+    misses: int
+    evictions: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class PlanCache:
+    """
+    Bounded, thread-safe LRU of Phase 9-11 plan triples.
+
+    Keys are sha256(schema versions + user_text), so a schema bump invalidates
+    every entry. Values are frozen dataclasses and are shared as-is.
+    """
+
+    def __init__(self, max_entries: int = PLAN_CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._entries: "OrderedDict[str, PlanTriple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def key(user_text: str) -> str:
+        return hashlib.sha256(f"{PLAN_CACHE_SCHEMA}\x00{user_text}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[PlanTriple]:
+        with self._lock:
+            plans = self._entries.get(key)
+            if plans is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return plans
+
+    def put(self, key: str, plans: PlanTriple) -> None:
+        with self._lock:
+            self._entries[key] = plans
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> PlanCacheStats:
+        with self._lock:
+            return PlanCacheStats(
+                entries=len(self._entries),
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+            )
+
+
+_plan_cache = PlanCache()
+
+
+def get_plan_cache() -> PlanCache:
+    return _plan_cache
+
+
+def _emit_plan_cache(result: str) -> None:
+    try:
+        counter("governed_plan_cache", 1, labels={"result": result})
+    except Exception:
+        return
+
+
 def _failure_result(request_id: str, failure_type: ModelFailureType, reason_code: str, message: str) -> ModelInvocationResult:
     return ModelInvocationResult(
         request_id=request_id,
@@ -45,21 +149,29 @@ def _deterministic_decision_id(user_text: str) -> str:
     return str(uuid.uuid5(_DECISION_NAMESPACE, user_text.strip()))
 
 
-def render_governed_response(user_text: str, *, llm_client: Optional[LLMClient] = None) -> ModelInvocationResult:
+def _assemble_plans(user_text: str) -> Union[ModelInvocationResult, PlanTriple]:
     """
-    Canonical orchestrator entrypoint (Phase 12 Step 7).
-
-    Pipeline:
-    - Assemble DecisionState (Phase 9)
-    - Assemble ControlPlan (Phase 10)
-    - Assemble OutputPlan (Phase 11)
-    - Invoke Phase 12 model pipeline (prompt → runtime → verify → fallback)
+    Phases 9-11: (DecisionState, ControlPlan, OutputPlan), or a fail-closed result.
 
-    Returns ModelInvocationResult with governed text/JSON or fail-closed failure.
+    The assemblers are pure functions of the text, so successful triples are
+    memoized in the plan cache.
     """
     if not isinstance(user_text, str) or not user_text.strip():
         raise GovernedOrchestratorError("user_text must be non-empty")
 
+    key = PlanCache.key(user_text)
+    cached = _plan_cache.get(key)
+    if cached is not None:
+        _emit_plan_cache("hit")
+        return cached
+    _emit_plan_cache("miss")
+    plans = _assemble_plans_uncached(user_text)
+    if not isinstance(plans, ModelInvocationResult):
+        _plan_cache.put(key, plans)
+    return plans
+
+
+def _assemble_plans_uncached(user_text: str) -> Union[ModelInvocationResult, PlanTriple]:
     trace_id = _deterministic_trace_id(user_text)
     decision_id = _deterministic_decision_id(user_text)
 
@@ -78,6 +190,26 @@ def render_governed_response(user_text: str, *, llm_client: Optional[LLMClient]
     except Exception as exc:  # noqa: BLE001
         return _failure_result(trace_id, ModelFailureType.CONTRACT_VIOLATION, "OUTPUT_PLAN_ASSEMBLY_FAILED", str(exc))
 
+    return decision_state, control_plan, output_plan
+
+
+def render_governed_response(user_text: str, *, llm_client: Optional[LLMClient] = None) -> ModelInvocationResult:
+    """
+    Canonical orchestrator entrypoint (Phase 12 Step 7).
+
+    Pipeline:
+    - Assemble DecisionState (Phase 9)
+    - Assemble ControlPlan (Phase 10)
+    - Assemble OutputPlan (Phase 11)
+    - Invoke Phase 12 model pipeline (prompt → runtime → verify → fallback)
+
+    Returns ModelInvocationResult with governed text/JSON or fail-closed failure.
+    """
+    plans = _assemble_plans(user_text)
+    if isinstance(plans, ModelInvocationResult):
+        return plans
+    decision_state, control_plan, output_plan = plans
+
     # Phase 12 pipeline (includes verification + fallback)
     return invoke_model_for_output_plan(
         user_text=user_text,
@@ -88,4 +220,69 @@ def render_governed_response(user_text: str, *, llm_client: Optional[LLMClient]
     )
 
 
-__all__ = ["render_governed_response", "GovernedOrchestratorError"]
+async def render_governed_response_async(
+    user_text: str,
+    *,
+    llm_client: Optional[LLMClient] = None,
+) -> ModelInvocationResult:
+    """
+    Async render_governed_response for the event loop (no executor thread).
+
+    Plan assembly is CPU-only and runs inline; the model call awaits the shared
+    httpx.AsyncClient, so a timeout cancels the upstream request and frees its
+    connection. Results are identical to render_governed_response.
+    """
+    plans = _assemble_plans(user_text)
+    if isinstance(plans, ModelInvocationResult):
+        return plans
+    decision_state, control_plan, output_plan = plans
+
+    return await invoke_model_for_output_plan_async(
+        user_text=user_text,
+        decision_state=decision_state,
+        control_plan=control_plan,
+        output_plan=output_plan,
+        llm_client=llm_client,
+    )
+
+
+async def stream_governed_response_async(
+    user_text: str,
+    *,
+    llm_client: Optional[LLMClient] = None,
+) -> AsyncIterator[ModelStreamEvent]:
+    """
+    Streaming render_governed_response: ModelStreamEvent deltas/resets, then the
+    final result. Concatenated deltas (after the last reset) always equal the
+    final output_text when the result is a streamed answer; otherwise the
+    result alone is authoritative.
+    """
+    plans = _assemble_plans(user_text)
+    if isinstance(plans, ModelInvocationResult):
+        yield ModelStreamEvent("result", result=plans)
+        return
+    decision_state, control_plan, output_plan = plans
+
+    stream = stream_model_for_output_plan_async(
+        user_text=user_text,
+        decision_state=decision_state,
+        control_plan=control_plan,
+        output_plan=output_plan,
+        llm_client=llm_client,
+    )
+    try:
+        async for event in stream:
+            yield event
+    finally:
+        await stream.aclose()
+
+
+__all__ = [
+    "PlanCache",
+    "PlanCacheStats",
+    "get_plan_cache",
+    "render_governed_response",
+    "render_governed_response_async",
+    "stream_governed_response_async",
+    "GovernedOrchestratorError",
+]
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional, Tuple
 
 from backend.app.llm_client import LLMClient
 from backend.mci_backend.control_plan import ControlPlan
@@ -16,10 +17,28 @@ from backend.mci_backend.model_contract import (
     build_request_id,
 )
 from backend.mci_backend.model_prompt_builder import ModelPromptBuilderError, build_model_invocation_request
-from backend.mci_backend.model_runtime import invoke_model
-from backend.mci_backend.model_output_verify import verify_and_sanitize_model_output
+from backend.mci_backend.model_runtime import invoke_model, invoke_model_async, stream_model_async
+from backend.mci_backend.model_output_verify import (
+    _UNKNOWN_DISCLOSURE_TOKENS,
+    StreamingOutputVerifier,
+    verify_and_sanitize_model_output,
+)
 from backend.mci_backend.fallback_rendering import FallbackRenderingError, render_fallback_content
-from backend.mci_backend.output_plan import OutputAction, OutputPlan, validate_output_plan
+from backend.mci_backend.output_plan import OutputAction, OutputPlan, UnknownDisclosureMode, validate_output_plan
+
+
+@dataclass(frozen=True)
+class ModelStreamEvent:
+    """One streamed pipeline event.
+
+    kind is "delta" (text to append), "reset" (discard all deltas so far; the
+    candidate was replaced) or "result" (final governed ModelInvocationResult,
+    always last and authoritative).
+    """
+
+    kind: str
+    text: Optional[str] = None
+    result: Optional[ModelInvocationResult] = None
 
 
 def _failure_result(
@@ -42,32 +61,182 @@ def _failure_result(
     )
 
 
-def invoke_model_for_output_plan(
-    *,
+def _streams_incrementally(output_plan: OutputPlan) -> bool:
+    """Whether text for this plan can be released before the stream ends.
+
+    CLOSE (no "?" anywhere) is only decided on the whole text and
+    ASK_ONE_QUESTION is JSON-only, so both are released once verified.
+    """
+    return output_plan.action in {OutputAction.ANSWER, OutputAction.REFUSE}
+
+
+_DISCLOSURE_CARRY = max(len(token) for token in _UNKNOWN_DISCLOSURE_TOKENS) - 1
+
+
+def _build_request(
     user_text: str,
-    decision_state: DecisionState,
-    control_plan: ControlPlan,
     output_plan: OutputPlan,
-    llm_client: Optional[LLMClient] = None,
-) -> ModelInvocationResult:
-    """Canonical pipeline: validate plan → build request → invoke model → validate candidate."""
+) -> Tuple[Optional[ModelInvocationRequest], Optional[ModelInvocationResult]]:
+    """Steps 1-2: validate OutputPlan and build the request, or return a fail-closed result."""
     # 1) Validate OutputPlan (fail-closed)
     try:
         validate_output_plan(output_plan)
     except Exception as exc:  # noqa: BLE001
         rid = getattr(output_plan, "id", "invalid-output-plan")
-        return _failure_result(rid, ModelFailureType.CONTRACT_VIOLATION, "OUTPUT_PLAN_INVALID", str(exc))
+        return None, _failure_result(rid, ModelFailureType.CONTRACT_VIOLATION, "OUTPUT_PLAN_INVALID", str(exc))
 
     # 2) Build request (Step 2)
     try:
-        request = build_model_invocation_request(user_text, output_plan)
+        return build_model_invocation_request(user_text, output_plan), None
     except ModelPromptBuilderError as exc:
         rid = getattr(output_plan, "id", "invalid-output-plan")
-        return _failure_result(rid, ModelFailureType.CONTRACT_VIOLATION, "REQUEST_BUILD_FAILED", str(exc))
+        return None, _failure_result(rid, ModelFailureType.CONTRACT_VIOLATION, "REQUEST_BUILD_FAILED", str(exc))
+
+
+def invoke_model_for_output_plan(
+    *,
+    user_text: str,
+    decision_state: DecisionState,
+    control_plan: ControlPlan,
+    output_plan: OutputPlan,
+    llm_client: Optional[LLMClient] = None,
+) -> ModelInvocationResult:
+    """Canonical pipeline: validate plan → build request → invoke model → validate candidate."""
+    request, failure = _build_request(user_text, output_plan)
+    if failure is not None:
+        return failure
 
     # 3) Invoke model (Step 1)
     result = invoke_model(request, llm_client=llm_client)
 
+    return _verify_or_fallback(
+        result=result,
+        request=request,
+        user_text=user_text,
+        decision_state=decision_state,
+        control_plan=control_plan,
+        output_plan=output_plan,
+    )
+
+
+async def invoke_model_for_output_plan_async(
+    *,
+    user_text: str,
+    decision_state: DecisionState,
+    control_plan: ControlPlan,
+    output_plan: OutputPlan,
+    llm_client: Optional[LLMClient] = None,
+) -> ModelInvocationResult:
+    """Async canonical pipeline; only the model call (step 3) awaits, the rest is shared."""
+    request, failure = _build_request(user_text, output_plan)
+    if failure is not None:
+        return failure
+
+    # 3) Invoke model (Step 1)
+    result = await invoke_model_async(request, llm_client=llm_client)
+
+    return _verify_or_fallback(
+        result=result,
+        request=request,
+        user_text=user_text,
+        decision_state=decision_state,
+        control_plan=control_plan,
+        output_plan=output_plan,
+    )
+
+
+async def stream_model_for_output_plan_async(
+    *,
+    user_text: str,
+    decision_state: DecisionState,
+    control_plan: ControlPlan,
+    output_plan: OutputPlan,
+    llm_client: Optional[LLMClient] = None,
+) -> AsyncIterator[ModelStreamEvent]:
+    """
+    Streaming canonical pipeline. Deltas pass a sliding-window forbidden-phrase
+    check as they arrive; the joined text then goes through the same
+    verify → fallback steps as invoke_model_for_output_plan. If the final text
+    is not what was streamed (violation, fallback, JSON unwrap), a reset is
+    emitted before the result. Nothing is released for a plan whose checks are
+    still undecided: CLOSE and ASK_ONE_QUESTION are held to the end, and an
+    ANSWER that must disclose unknowns is held until a disclosure token has
+    been released.
+    """
+    request, failure = _build_request(user_text, output_plan)
+    if failure is not None:
+        yield ModelStreamEvent("result", result=failure)
+        return
+
+    # 3) Invoke model (Step 1), streaming
+    incremental = _streams_incrementally(output_plan)
+    awaiting_disclosure = (
+        output_plan.action == OutputAction.ANSWER
+        and output_plan.unknown_disclosure != UnknownDisclosureMode.NONE
+    )
+    verifier = StreamingOutputVerifier()
+    held: list[str] = []
+    carry = ""
+    streamed = False
+    result: Optional[ModelInvocationResult] = None
+    stream = stream_model_async(request, llm_client=llm_client)
+    try:
+        async for item in stream:
+            if isinstance(item, ModelInvocationResult):
+                result = item
+                break
+            delta = verifier.feed(item)
+            if verifier.violation is not None:
+                # Stop the upstream call; verification below rejects the candidate
+                result = ModelInvocationResult(
+                    request_id=build_request_id(request),
+                    ok=True,
+                    output_text=verifier.text,
+                    output_json=None,
+                    failure=None,
+                )
+                break
+            if not delta:
+                continue
+            held.append(delta)
+            if awaiting_disclosure:
+                window = carry + delta
+                awaiting_disclosure = all(token not in window.lower() for token in _UNKNOWN_DISCLOSURE_TOKENS)
+                carry = window[-_DISCLOSURE_CARRY:]
+            if incremental and not awaiting_disclosure:
+                streamed = True
+                yield ModelStreamEvent("delta", text="".join(held))
+                held.clear()
+    finally:
+        await stream.aclose()
+
+    final = _verify_or_fallback(
+        result=result,
+        request=request,
+        user_text=user_text,
+        decision_state=decision_state,
+        control_plan=control_plan,
+        output_plan=output_plan,
+    )
+    tail = verifier.finish()
+    if final.ok and final.output_json is None and final.output_text == verifier.text:
+        pending = "".join(held) + tail
+        if pending:
+            yield ModelStreamEvent("delta", text=pending)
+    elif streamed:
+        yield ModelStreamEvent("reset")
+    yield ModelStreamEvent("result", result=final)
+
+
+def _verify_or_fallback(
+    *,
+    result: ModelInvocationResult,
+    request: ModelInvocationRequest,
+    user_text: str,
+    decision_state: DecisionState,
+    control_plan: ControlPlan,
+    output_plan: OutputPlan,
+) -> ModelInvocationResult:
     # 4/5) Verify & sanitize candidate output against OutputPlan (fail-closed)
     verified = verify_and_sanitize_model_output(
         model_result=result,
@@ -146,4 +315,9 @@ def invoke_model_for_output_plan(
     )
 
 
-__all__ = ["invoke_model_for_output_plan"]
+__all__ = [
+    "ModelStreamEvent",
+    "invoke_model_for_output_plan",
+    "invoke_model_for_output_plan_async",
+    "stream_model_for_output_plan_async",
+]
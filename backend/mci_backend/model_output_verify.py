@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 from backend.mci_backend.control_plan import ControlPlan
 from backend.mci_backend.decision_state import DecisionState
@@ -63,6 +63,7 @@ _FORBIDDEN_PHRASES = [
 
 _ADVICE_PHRASES = ["you should", "you must", "you need to"]
 _MULTI_QUESTION_HINTS = ["and also", "also", "plus", "another question", "as well"]
+_UNKNOWN_DISCLOSURE_TOKENS = ["unknown", "uncertain", "not sure", "unclear", "cannot confirm"]
 
 
 def _failure(request_id: str, failure_type: ModelFailureType, reason_code: str, message: str) -> ModelInvocationResult:
@@ -97,6 +98,80 @@ def _check_forbidden_phrases(text: str, request_id: str) -> Optional[ModelInvoca
     return None
 
 
+class StreamingOutputVerifier:
+    """
+    Sliding-window forbidden-phrase check for streamed model text.
+
+    Chunks are sanitized like _sanitize_text (zero-width removed, CR/CRLF -> LF,
+    stripped) and only the window that can contain a new match is scanned, so
+    the cost per chunk is O(len(chunk) + longest phrase). The last
+    (longest phrase - 1) characters are held back: released text can never
+    become part of a later match. Once `violation` is set nothing more is
+    released; the joined text is still subject to full verification.
+    """
+
+    def __init__(self, phrases: Optional[Iterable[str]] = None) -> None:
+        self._phrases = tuple(p.lower() for p in (_FORBIDDEN_PHRASES if phrases is None else phrases) if p)
+        self._holdback = max((len(p) for p in self._phrases), default=1) - 1
+        self._text = ""
+        self._released = 0
+        self._pending_cr = False
+        self.violation: Optional[str] = None
+
+    def feed(self, chunk: str) -> str:
+        """Add a chunk; return the newly releasable text ('' once a violation is seen)."""
+        if self.violation is not None:
+            return ""
+        chunk = _ZERO_WIDTH.sub("", chunk or "")
+        if self._pending_cr:
+            chunk = "\r" + chunk
+            self._pending_cr = False
+        if chunk.endswith("\r"):
+            # Could be the first half of a CRLF split across chunks
+            chunk = chunk[:-1]
+            self._pending_cr = True
+        chunk = chunk.replace("\r\n", "\n").replace("\r", "\n")
+        if not self._text:
+            chunk = chunk.lstrip()
+        window_start = max(0, len(self._text) - self._holdback)
+        self._text += chunk
+        window = self._text[window_start:].lower()
+        for phrase in self._phrases:
+            if phrase in window:
+                self.violation = phrase
+                return ""
+        return self._release(len(self._text) - self._holdback)
+
+    def finish(self) -> str:
+        """End of stream: return the held-back tail ('' if a violation was seen)."""
+        if self._pending_cr:
+            self._pending_cr = False
+            if self._text:
+                self._text += "\n"
+        if self.violation is not None:
+            return ""
+        return self._release(len(self._text))
+
+    @property
+    def text(self) -> str:
+        """Sanitized text seen so far (what _sanitize_text would produce at the end)."""
+        return self._text.strip()
+
+    @property
+    def released_text(self) -> str:
+        return self._text[: self._released]
+
+    def _release(self, limit: int) -> str:
+        # Trailing whitespace is held until more text follows so released text
+        # is always a prefix of the final stripped text.
+        end = min(limit, len(self._text.rstrip()))
+        if end <= self._released:
+            return ""
+        delta = self._text[self._released:end]
+        self._released = end
+        return delta
+
+
 def _verify_action_alignment(action: OutputAction, payload: Dict[str, Any], request_id: str) -> Tuple[Any, Optional[ModelInvocationResult]]:
     try:
         if action == OutputAction.ANSWER:
@@ -138,7 +213,7 @@ def _verify_answer(
         return failure
     if plan.unknown_disclosure != UnknownDisclosureMode.NONE:
         lowered = answer.answer_text.lower()
-        if all(token not in lowered for token in ["unknown", "uncertain", "not sure", "unclear", "cannot confirm"]):
+        if all(token not in lowered for token in _UNKNOWN_DISCLOSURE_TOKENS):
             return _failure(
                 request_id,
                 ModelFailureType.CONTRACT_VIOLATION,
@@ -227,7 +302,7 @@ def verify_and_sanitize_model_output(
                 # Check unknown disclosure for ANSWER
                 if output_plan.action == OutputAction.ANSWER and output_plan.unknown_disclosure != UnknownDisclosureMode.NONE:
                     lowered = sanitized.lower()
-                    if all(token not in lowered for token in ["unknown", "uncertain", "not sure", "unclear", "cannot confirm"]):
+                    if all(token not in lowered for token in _UNKNOWN_DISCLOSURE_TOKENS):
                         return _failure(
                             request_id,
                             ModelFailureType.CONTRACT_VIOLATION,
@@ -318,6 +393,7 @@ def verify_and_sanitize_model_output(
 
 
 __all__ = [
+    "StreamingOutputVerifier",
     "ModelOutputVerifyError",
     "ModelOutputRejected",
     "ModelOutputSchemaError",
@@ -8,9 +8,9 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict, Union
 
-from backend.app.enforcement import EnforcementError, ViolationClass
+from backend.app.enforcement import EnforcementError, ViolationClass, validate_expression_output
 from backend.app.llm_client import LLMClient
 from backend.app.schemas import CognitiveStyle, ExpressionPlan, IntermediateAnswer, UserMessage
 
@@ -93,21 +93,26 @@ def _failure_result(
     )
 
 
+def _expression_inputs(request: ModelInvocationRequest) -> Dict[str, Any]:
+    return {
+        "user_message": UserMessage(id=request.trace_id, text=request.user_text, timestamp=0),
+        "style": _default_style(),
+        "plan": _default_expression_plan(request.required_elements),
+        "intermediate": _default_intermediate(request.required_elements),
+    }
+
+
 def _call_expression_model(client: LLMClient, request: ModelInvocationRequest) -> str:
-    user_message = UserMessage(id=request.trace_id, text=request.user_text, timestamp=0)
-    style = _default_style()
-    plan = _default_expression_plan(request.required_elements)
-    intermediate = _default_intermediate(request.required_elements)
-    rendered = client.call_expression_model(
-        user_message=user_message,
-        style=style,
-        plan=plan,
-        intermediate=intermediate,
-    )
+    rendered = client.call_expression_model(**_expression_inputs(request))
     return rendered.text
 
 
-def invoke_model(request: ModelInvocationRequest, llm_client: LLMClient | None = None) -> ModelInvocationResult:
+async def _call_expression_model_async(client: LLMClient, request: ModelInvocationRequest) -> str:
+    rendered = await client.call_expression_model_async(**_expression_inputs(request))
+    return rendered.text
+
+
+def _invalid_request_result(request: ModelInvocationRequest) -> ModelInvocationResult | None:
     try:
         validate_model_request(request)
     except ModelContractError as exc:
@@ -117,51 +122,54 @@ def invoke_model(request: ModelInvocationRequest, llm_client: LLMClient | None =
             reason_code="INVALID_REQUEST",
             message=str(exc),
         )
+    return None
 
-    client = llm_client or LLMClient()
 
-    try:
-        raw_output = _call_expression_model(client, request)
-        if request.output_format == ModelOutputFormat.JSON:
-            try:
-                parsed: Dict[str, Any] = json.loads(raw_output)
-            except json.JSONDecodeError:
-                return _failure_result(
-                    request,
-                    ModelFailureType.NON_JSON,
-                    reason_code="NON_JSON_RESPONSE",
-                    message="Model output was not valid JSON",
-                )
-            if not isinstance(parsed, dict):
-                return _failure_result(
-                    request,
-                    ModelFailureType.SCHEMA_MISMATCH,
-                    reason_code="NON_OBJECT_JSON",
-                    message="Model JSON output must be an object",
-                )
-            return ModelInvocationResult(
-                request_id=build_request_id(request),
-                ok=True,
-                output_text=None,
-                output_json=parsed,
-                failure=None,
+def _result_from_output(request: ModelInvocationRequest, raw_output: Any) -> ModelInvocationResult:
+    if request.output_format == ModelOutputFormat.JSON:
+        try:
+            parsed: Dict[str, Any] = json.loads(raw_output)
+        except json.JSONDecodeError:
+            return _failure_result(
+                request,
+                ModelFailureType.NON_JSON,
+                reason_code="NON_JSON_RESPONSE",
+                message="Model output was not valid JSON",
             )
-        # TEXT path
-        if not isinstance(raw_output, str) or not raw_output.strip():
+        if not isinstance(parsed, dict):
             return _failure_result(
                 request,
                 ModelFailureType.SCHEMA_MISMATCH,
-                reason_code="EMPTY_TEXT",
-                message="Model text output missing",
+                reason_code="NON_OBJECT_JSON",
+                message="Model JSON output must be an object",
             )
         return ModelInvocationResult(
             request_id=build_request_id(request),
             ok=True,
-            output_text=raw_output,
-            output_json=None,
+            output_text=None,
+            output_json=parsed,
             failure=None,
         )
-    except EnforcementError as exc:
+    # TEXT path
+    if not isinstance(raw_output, str) or not raw_output.strip():
+        return _failure_result(
+            request,
+            ModelFailureType.SCHEMA_MISMATCH,
+            reason_code="EMPTY_TEXT",
+            message="Model text output missing",
+        )
+    return ModelInvocationResult(
+        request_id=build_request_id(request),
+        ok=True,
+        output_text=raw_output,
+        output_json=None,
+        failure=None,
+    )
+
+
+def _result_from_exception(request: ModelInvocationRequest, exc: Exception) -> ModelInvocationResult:
+    """Map an invocation exception to a fail-closed result (call from an except block)."""
+    if isinstance(exc, EnforcementError):
         failure_type = _map_violation_to_failure_type(exc.failure.violation_class, exc.failure.reason)
         return _failure_result(
             request,
@@ -169,31 +177,103 @@ def invoke_model(request: ModelInvocationRequest, llm_client: LLMClient | None =
             reason_code=exc.failure.violation_class.value,
             message=exc.failure.reason,
         )
-    except ModelContractError as exc:
+    if isinstance(exc, ModelContractError):
         return _failure_result(
             request,
             ModelFailureType.CONTRACT_VIOLATION,
             reason_code="CONTRACT_ERROR",
             message=str(exc),
         )
+    # Log full traceback for debugging provider errors
+    logger.exception(
+        "PROVIDER_ERROR",
+        extra={
+            "model": "expression_model",
+            "request_id": build_request_id(request),
+            "route": "/api/chat",
+        }
+    )
+    return _failure_result(
+        request,
+        ModelFailureType.PROVIDER_ERROR,
+        reason_code="UNEXPECTED_ERROR",
+        message=str(exc),
+    )
+
+
+def invoke_model(request: ModelInvocationRequest, llm_client: LLMClient | None = None) -> ModelInvocationResult:
+    invalid = _invalid_request_result(request)
+    if invalid is not None:
+        return invalid
+
+    client = llm_client or LLMClient()
+
+    try:
+        raw_output = _call_expression_model(client, request)
+        return _result_from_output(request, raw_output)
     except Exception as exc:  # noqa: BLE001
-        # Log full traceback for debugging provider errors
-        logger.exception(
-            "PROVIDER_ERROR",
-            extra={
-                "model": "expression_model",
-                "request_id": build_request_id(request),
-                "route": "/api/chat",
-            }
-        )
-        return _failure_result(
-            request,
-            ModelFailureType.PROVIDER_ERROR,
-            reason_code="UNEXPECTED_ERROR",
-            message=str(exc),
-        )
+        return _result_from_exception(request, exc)
+
+
+async def invoke_model_async(request: ModelInvocationRequest, llm_client: LLMClient | None = None) -> ModelInvocationResult:
+    """
+    Async invoke_model: awaits the shared httpx.AsyncClient instead of blocking a
+    thread. Cancellation (e.g. enforce_timeout) propagates and aborts the upstream
+    request; results and failure mapping are identical to invoke_model.
+    """
+    invalid = _invalid_request_result(request)
+    if invalid is not None:
+        return invalid
+
+    client = llm_client or LLMClient()
+
+    try:
+        raw_output = await _call_expression_model_async(client, request)
+        return _result_from_output(request, raw_output)
+    except Exception as exc:  # noqa: BLE001
+        return _result_from_exception(request, exc)
+
+
+async def stream_model_async(
+    request: ModelInvocationRequest,
+    llm_client: LLMClient | None = None,
+) -> AsyncIterator[Union[str, ModelInvocationResult]]:
+    """
+    Streaming invoke_model: yields raw text deltas, then exactly one
+    ModelInvocationResult built from the joined text with the same validation
+    and failure mapping as invoke_model. JSON requests are not streamed (the
+    result is the only item). Closing the generator early aborts the upstream
+    request.
+    """
+    invalid = _invalid_request_result(request)
+    if invalid is not None:
+        yield invalid
+        return
+
+    client = llm_client or LLMClient()
+
+    if request.output_format == ModelOutputFormat.JSON:
+        yield await invoke_model_async(request, llm_client=client)
+        return
+
+    inputs = _expression_inputs(request)
+    parts: list[str] = []
+    deltas = client.stream_expression_model(**inputs)
+    try:
+        async for delta in deltas:
+            parts.append(delta)
+            yield delta
+        rendered = validate_expression_output("".join(parts), intermediate=inputs["intermediate"])
+        result = _result_from_output(request, rendered.text)
+    except Exception as exc:  # noqa: BLE001
+        result = _result_from_exception(request, exc)
+    finally:
+        await deltas.aclose()
+    yield result
 
 
 __all__ = [
     "invoke_model",
+    "invoke_model_async",
+    "stream_model_async",
 ]
@@ -1,9 +1,29 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 # Ensure backend package is importable for tests
 BACKEND_ROOT = Path(__file__).resolve().parents[1]
 REPO_ROOT = BACKEND_ROOT.parent
 for path in (BACKEND_ROOT, REPO_ROOT):
     if str(path) not in sys.path:
         sys.path.insert(0, str(path))
+
+
+_PLAN_CACHE_MODULES = ("backend.mci_backend.governed_response_runtime", "mci_backend.governed_response_runtime")
+
+
+def _clear_plan_caches() -> None:
+    for name in _PLAN_CACHE_MODULES:
+        module = sys.modules.get(name)
+        if module is not None and hasattr(module, "get_plan_cache"):
+            module.get_plan_cache().clear()
+
+
+@pytest.fixture(autouse=True)
+def _isolate_plan_cache():
+    # Tests substitute the Phase 9-11 assemblers; never let their plans leak across tests
+    _clear_plan_caches()
+    yield
+    _clear_plan_caches()
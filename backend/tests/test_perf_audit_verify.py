@@ -0,0 +1,135 @@
+"""
+Checkpointed audit chain verification tests.
+
+- verify_chain records periodic checkpoints plus the tip and, on later calls,
+  verifies only events appended after the last checkpoint
+- Rewriting a checkpointed event invalidates the tip anchor (full re-verify);
+  full=True always re-verifies from index 0
+- verify_range anchors on the stored signature before `start`
+- verify_parallel by segment reports the same first bad index as a
+  sequential pass
+- recompute_signatures reuses valid stored events instead of copying them
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+from backend.app.governance import audit
+from backend.app.governance.audit import (
+    AuditCheckpoint,
+    AuditDecision,
+    AuditLog,
+    AuditOperationType,
+    AuditReasonCode,
+    record_audit_event,
+)
+
+
+def _log(count, checkpoint_interval=8):
+    log = AuditLog(checkpoint_interval=checkpoint_interval)
+    for i in range(count):
+        record_audit_event(
+            "tenant-a", AuditOperationType.GOVERNANCE_OP, AuditDecision.ALLOW,
+            AuditReasonCode.INVALID_REQUEST, {"step": i}, now_ms=i * 1000, log=log,
+        )
+    return log
+
+
+def _tamper(log, index):
+    log._events[index] = replace(log._events[index], struct_meta={"tampered": True})
+
+
+def _count_verified(monkeypatch):
+    calls = []
+    original = audit._event_is_valid
+
+    def counting(event, expected_prev_sig):
+        calls.append(event)
+        return original(event, expected_prev_sig)
+
+    monkeypatch.setattr(audit, "_event_is_valid", counting)
+    return calls
+
+
+def test_incremental_verify_checks_only_new_events(monkeypatch):
+    log = _log(20)
+    assert log.verify_chain() == (True, None)
+    assert [cp.index for cp in log.checkpoints()] == [7, 15, 19]
+    assert log.checkpoints()[-1] == AuditCheckpoint(19, log.get_last_signature())
+
+    calls = _count_verified(monkeypatch)
+    for i in range(5):
+        record_audit_event(
+            "tenant-a", AuditOperationType.GOVERNANCE_OP, AuditDecision.ALLOW,
+            AuditReasonCode.INVALID_REQUEST, {"more": i}, now_ms=0, log=log,
+        )
+    assert log.verify_chain() == (True, None)
+    assert len(calls) == 5
+    assert [cp.index for cp in log.checkpoints()] == [7, 15, 23, 24]
+
+    calls.clear()
+    assert log.verify_chain(full=True) == (True, None)
+    assert len(calls) == 25
+
+
+def test_tampering_detected_after_checkpoint_and_with_full():
+    log = _log(20)
+    log.verify_chain()
+    # Prefix before the tip is trusted in incremental mode; full re-verifies it
+    _tamper(log, 3)
+    assert log.verify_chain() == (True, None)
+    assert log.verify_chain(full=True) == (False, 3)
+    assert [cp.index for cp in log.checkpoints()] == [2]
+
+    log = _log(20)
+    log.verify_chain()
+    # Rewriting the tip event breaks the anchor and forces a full pass
+    log._events[19] = replace(log._events[19], signature="0" * 64)
+    assert log.verify_chain() == (False, 19)
+
+    log = _log(20)
+    log.verify_chain()
+    log.append(replace(log._events[5], prev_sig=log.get_last_signature()))
+    assert log.verify_chain() == (False, 20)
+
+
+def test_verify_range_anchors_on_stored_signature():
+    log = _log(30)
+    _tamper(log, 12)
+    assert log.verify_range(0, 12) == (True, None)
+    assert log.verify_range(13) == (True, None)
+    assert log.verify_range(10, 20) == (False, 12)
+    assert log.verify_range(25, 100) == (True, None)
+    assert log.verify_range(40) == (True, None)
+
+
+def test_parallel_matches_sequential():
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        log = _log(50)
+        assert log.verify_parallel(segments=4, executor=executor) == (True, None)
+        assert log.checkpoints()[-1].index == 49
+
+        for bad in (0, 12, 13, 37, 49):
+            log = _log(50)
+            _tamper(log, bad)
+            _tamper(log, 49)
+            expected = log.verify_chain(full=True)
+            assert expected == (False, bad)
+            assert log.verify_parallel(segments=4, executor=executor) == expected
+            assert log.verify_parallel(start=bad + 1, end=49, segments=3, executor=executor) == (True, None)
+
+    log = _log(40)
+    _tamper(log, 31)
+    assert log.verify_parallel(segments=2) == (False, 31)
+
+
+def test_recompute_signatures_reuses_valid_events():
+    log = _log(10)
+    _tamper(log, 6)
+    recomputed = log.recompute_signatures()
+    assert all(recomputed[i] is log._events[i] for i in range(6))
+    assert all(recomputed[i] is not log._events[i] for i in range(6, 10))
+    fixed = AuditLog()
+    for event in recomputed:
+        fixed.append(event)
+    assert fixed.verify_chain() == (True, None)
@@ -0,0 +1,198 @@
+"""
+Shared canonical JSON encoder tests.
+
+- Golden signatures, recorded before signing moved to the shared encoder,
+  are unchanged for every migrated module, with orjson and without it
+- Encoder output equals json.dumps(sort_keys=True, separators=(",", ":"))
+  on edge cases (floats, non-ASCII, control chars, big ints, non-str keys),
+  whichever backend is active
+- Enums and dataclasses encode like their value / asdict() form
+- Unsupported types and circular references fail like the json module
+"""
+
+import dataclasses
+import enum
+import json
+
+import pytest
+
+from backend.app.perf import canonical
+from backend.app.perf.canonical import canonical_dumps, canonical_dumps_bytes, canonical_sha256
+from backend.app.deepthink.schema import PatchOp
+from backend.app.deepthink.telemetry import compute_decision_signature
+from backend.app.governance import audit, export, regions, retention
+from backend.app.governance.audit import AuditLog
+from backend.app.governance.change_control import ChangeRequest, ChangeType, apply_change_control
+from backend.app.governance.policy_engine import OperationType, PolicyRequest, decide_policy
+from backend.app.governance.rbac import AdminOperation, Role, authorize_admin_action
+from backend.app.governance.tenant import FeatureFlag, PlanTier, TenantConfig, resolve_tenant_caps
+from backend.app.integration import governance_wiring, memory_wiring
+from backend.app.memory import read as memory_read, safety_filter
+from backend.app.memory.schema import MemoryCategory, MemoryFact, MemoryValueType, Provenance, ProvenanceType
+from backend.app.memory.telemetry import compute_memory_signature
+from backend.app.research import cache, injection_defense
+from backend.app.research.telemetry import compute_research_signature
+from backend.app.retrieval.adapter import compute_source_id
+from backend.app.retrieval.types import SourceSnippet, ToolKind
+
+BACKENDS = ["orjson", "json"]
+
+# Recorded with the per-module json.dumps encoders before the migration
+GOLDEN = {
+    "audit": ("2d246818024600db8ed626059897fcf12d1b99753bce3217998fdd67279fea8b", "1244e7c42265b620a601f937305f8a9f"),
+    "cache_key": "3163e3d17cbcd6863f4ab4baacd1100714358f4b6502b6a1b29c26afa15d6781",
+    "cache_source": "d25165d80a4d",
+    "change_control": "de61a37de18966687a9e0d2b5194765042f8800789ba90a62fd7abad4d0ec082",
+    "deepthink": "e7feaac2edbc03cf96a2a10dbdbace3c36dc8067daa8070b676cd9c1d5bcf523",
+    "export": "4829d86e47f85c50c37ea87a18fb82cbafca2b26f4167ef1a7cb9b0c0cc1bea0",
+    "export_bundle": "c3df6f78e09430f76f6315cc82a6c011a75e38c8b6308d660824795090426ca7",
+    "governance_wiring": "7938d8fd030e83afae6fcb9c6ae17ea0d9b0aeefae7c949f1e2981e98f0b10c1",
+    "injection": "2a2c0b1f0fa47ca1",
+    "memory_read": "693324d889971547",
+    "memory_safety": "d4c4a46899d1ef78a5b5f98c33d2fc46d61ba8bcf97b87f924580c4fad2a768c",
+    "memory_telemetry": "e7adf2b980e84f9ea22c8e800cd7538b6a7124119da89699c9ace6591df45822",
+    "memory_wiring": "b94dbfd456ca137a",
+    "policy": "2c3622c974e953b1d45b78d913f893090792ee51931d1808f02bd690adf8a4ef",
+    "rbac": "b65596e631795c89f650511df6a6f59f23bf2120dc5396b06546d8aa1b622b91",
+    "regions": "9c22c38f5927e4794d8a3303d9b188d82ebf0581fc2d02e654be354f0effb2d1",
+    "research_telemetry": "7ee9ad8c0cdb3524a6de1143c5c01886548672051bc5ecdbb887c621f6874b46",
+    "retention": "4ac3dcc262d6d32de14b248ddbfc24bdead68fc7b9099ce7b805f9e3bffcfa36",
+    "retrieval": "7ff4ab682e8bd580dec8c1672b71296850953afb5718a7503e61319a160dc0db",
+}
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    previous = canonical.canonical_backend()
+    canonical.set_canonical_backend(request.param)
+    yield request.param
+    canonical.set_canonical_backend(previous)
+
+
+def _signatures():
+    tenant = TenantConfig(
+        tenant_id="tenant-golden",
+        plan=PlanTier.ENTERPRISE,
+        regions=["us-east", "eu-west"],
+        enabled_features={FeatureFlag.EXPORT_ENABLED},
+    )
+    core = audit.create_event_core_pack(
+        "20.3.0", 120_000, "a" * 64, audit.AuditOperationType.TOOL_CALL, audit.AuditDecision.DENY,
+        audit.AuditReasonCode.TOOL_NOT_ALLOWED, {"dropped_keys_count": 2, "nested": {"z": [1, {"b": None, "a": True}]}}, "b" * 64,
+    )
+    fact = MemoryFact(
+        fact_id="fact-1", category=MemoryCategory.USER_GOALS, key="goal", value_type=MemoryValueType.NUM,
+        value_str=None, value_num=3.5, value_bool=None, value_list_str=None, confidence=0.75,
+        provenance=Provenance(source_type=ProvenanceType.USER_EXPLICIT, source_id="src-1", collected_at_ms=10, citation_ids=["c1"]),
+        created_at_ms=20, expires_at_ms=None, tags=["t1"],
+    )
+    match = safety_filter.ForbiddenMatch(
+        reason=list(safety_filter.ForbiddenReason)[0], matched_rule_id="rule_1", field="key", match_count=2, evidence_len=7,
+    )
+    return {
+        "audit": audit.compute_signature_and_id(core),
+        "export": export.compute_export_signature({"export_version": "20.5.0", "metrics": {"b": 1, "a": [2, 1]}, "é": "ü"}),
+        "export_bundle": export.build_export_bundle(
+            tenant, audit_events=[{"event_id": "e1", "operation": "TOOL_CALL", "decision": "ALLOW"}],
+            policy_decisions=[{"signature": "c" * 64}], memory_telemetry_events=[{"operation": "write", "success": True}],
+            now_ms=7_200_000,
+        ).signature,
+        "retention": retention.compute_plan_signature({"targets": [{"kind": "MEMORY", "count": 3}], "cutoff_ms": 86_400_000}),
+        "regions": regions.resolve_region_caps(resolve_tenant_caps(tenant), "EU").signature,
+        "rbac": authorize_admin_action(tenant, Role.ADMIN, AdminOperation.REQUEST_EXPORT, {"rows": 10}, 1_000).signature,
+        "change_control": apply_change_control(
+            tenant, ChangeRequest("tenant-golden", Role.OWNER, ChangeType.POLICY_PACK, "1.0.0", "1.1.0", "d" * 64, None, 5_000), AuditLog(),
+        ).signature,
+        "policy": decide_policy(PolicyRequest(tenant_config=tenant, operation=OperationType.TOOL_CALL, now_ms=1_000)).decision_signature,
+        "governance_wiring": governance_wiring.sha256_hash(governance_wiring.canonical_json({"op": "TOOL_CALL", "n": 1.5, "caps": {"tools": ["WEB"], "max": 3}})),
+        "memory_wiring": memory_wiring._compute_structure_signature({"op": "READ", "bundle": {"facts_count": 1, "ratio": 0.5}}),
+        "memory_telemetry": compute_memory_signature({"counts": {"facts": 3}, "ratio": 0.25, "labels": ["TTL_1D"], "memory_signature": "x"}),
+        "memory_read": memory_read._compute_tie_break_hash(fact),
+        "memory_safety": safety_filter._compute_signature([match]),
+        "research_telemetry": compute_research_signature({"domains": ["example.com"], "grade_histogram": {"A": 2}, "ratio": 0.5}),
+        "injection": injection_defense.compute_structure_signature(["FLAG_A"], 1, 10, 100, 90, 2),
+        "cache_source": cache.compute_canonical_source_id("web", "https://example.com/a", "example.com", 5, 2, (3, 4), ("k1", "k2")),
+        "cache_key": cache.make_cache_key("Python GIL", "web", "prod", {"max_results": 5}, {"fresh": True}, 3_600_000)[0],
+        "retrieval": compute_source_id(
+            list(ToolKind)[0], "https://example.com/a", "example.com", "Title é",
+            [SourceSnippet(text="snippet one"), SourceSnippet(text="two")], {"lang": "en", "rank": 1},
+        ),
+        "deepthink": compute_decision_signature(
+            stable_inputs={"budget_units_remaining": 95, "breaker_tripped": False, "abuse_blocked": False},
+            pass_plan=["REFINE", "COUNTERARG"],
+            deltas=[PatchOp(op="set", path="decision.answer", value="an answer")],
+            meta={"validator_failures": 0, "stop_reason": "SUCCESS_COMPLETED"},
+        ),
+    }
+
+
+def test_existing_signatures_unchanged(backend):
+    assert _signatures() == GOLDEN
+
+
+class _Color(enum.Enum):
+    RED = "red"
+    SIZE = 3
+
+
+class _Mode(str, enum.Enum):
+    FAST = "fast"
+
+
+class _Level(enum.IntEnum):
+    HIGH = 2
+
+
+@dataclasses.dataclass
+class _Inner:
+    zeta: int
+    alpha: _Color
+
+
+@dataclasses.dataclass(frozen=True)
+class _Outer:
+    name: str
+    inner: _Inner
+    items: tuple
+    ratio: float
+
+
+EDGE_CASES = [
+    {"b": 1, "a": [1, 2, {"d": None, "c": True}], "e": {}},
+    {"\u00e9": "\u00fc", "k": "\u2028 emoji \U0001f600"},
+    "\x7f\x00\n\t\"\\/ ",
+    [1e16, 1e-5, 0.1, -0.0, 1.0, 5e-324, float("nan"), float("inf")],
+    {"big": 2 ** 70, "neg": -(2 ** 63), "edge": 2 ** 63 - 1},
+    {1: "int key"},
+    (1, (2, 3), []),
+    {"mode": _Mode.FAST, "level": _Level.HIGH},
+    {"z": {"y": {"x": [[[{"w": "deep"}]]]}}},
+    "a" * 5000,
+]
+
+
+@pytest.mark.parametrize("case", EDGE_CASES)
+def test_encoder_matches_json_module(backend, case):
+    expected = json.dumps(case, sort_keys=True, separators=(",", ":"))
+    assert canonical_dumps(case) == expected
+    assert canonical_dumps_bytes(case) == expected.encode("ascii")
+
+
+def test_enum_and_dataclass_fast_path(backend):
+    outer = _Outer(name="n", inner=_Inner(zeta=1, alpha=_Color.SIZE), items=(_Color.RED, 2), ratio=0.5)
+    as_dict = dataclasses.asdict(outer)
+    as_dict["inner"]["alpha"] = 3
+    as_dict["items"] = ["red", 2]
+    assert canonical_dumps(outer) == json.dumps(as_dict, sort_keys=True, separators=(",", ":"))
+    assert canonical_dumps({"color": _Color.RED, "inner": _Inner(0, _Color.RED)}) == '{"color":"red","inner":{"alpha":"red","zeta":0}}'
+
+
+def test_failures_match_json_module(backend):
+    with pytest.raises(TypeError):
+        canonical_dumps({"x": object()})
+    with pytest.raises(TypeError):
+        canonical_sha256({"a": 1, 2: "mixed key types"})
+    circular = []
+    circular.append(circular)
+    with pytest.raises(ValueError):
+        canonical_dumps(circular)
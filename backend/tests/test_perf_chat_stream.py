@@ -0,0 +1,352 @@
+"""
+Streaming /api/chat tests.
+
+- StreamingOutputVerifier (sliding window) agrees with the full-text
+  forbidden-phrase check for random chunkings, and released text is always a
+  prefix of the final sanitized text
+- OpenAIProvider.stream_completion reuses pooled connections
+- stream_governed_response_async: deltas join to the governed result, and a
+  mid-stream violation resets and falls back exactly like the non-stream path
+- text is held while a plan's checks are undecided (unknown disclosure)
+- run_step5_stream: safety envelope, timeout and success paths, forced safety
+  block before the stream opens, retry only while nothing was released
+"""
+
+import asyncio
+import dataclasses
+import json
+import random
+
+from backend.app.chat_contract import ChatAction, FailureType
+from backend.app.llm_client import LLMClient
+from backend.app.perf import aclose_shared_async_httpx_client
+from backend.app.providers.base import LLMRequest
+from backend.app.providers.openai_provider import OpenAIProvider
+from backend.app.reliability.engine import Step5Context, run_step5_stream
+from backend.app.schemas import RenderedMessage
+from backend.mci_backend.governed_response_runtime import (
+    _assemble_plans,
+    render_governed_response_async,
+    stream_governed_response_async,
+)
+from backend.mci_backend.model_invocation_pipeline import stream_model_for_output_plan_async
+from backend.mci_backend.model_output_verify import (
+    _FORBIDDEN_PHRASES,
+    StreamingOutputVerifier,
+    _check_forbidden_phrases,
+    _sanitize_text,
+)
+from backend.mci_backend.output_plan import UnknownDisclosureMode
+
+USER_TEXT = "Explain how TCP congestion control works"
+ANSWER = (
+    "Congestion control adapts the send window to feedback from the network. "
+    "Loss or delay shrinks the window, acknowledgements grow it again.\r\n"
+    "Some details are uncertain for your setup."
+)
+
+WORDS = ["window", "loss", "ack", "i", "remember", "system", "prompt", "override", "the", "rate", "​", "\r\n", "\r"]
+
+
+def _random_chunks(rng: random.Random, text: str) -> list:
+    chunks, pos = [], 0
+    while pos < len(text):
+        step = rng.randint(1, 12)
+        chunks.append(text[pos:pos + step])
+        pos += step
+    return chunks
+
+
+def _random_text(rng: random.Random) -> str:
+    parts = []
+    for _ in range(rng.randint(1, 40)):
+        parts.append(rng.choice(WORDS) if rng.random() < 0.9 else rng.choice(_FORBIDDEN_PHRASES).upper())
+        parts.append(rng.choice([" ", " ", "  ", "\n", ""]))
+    return rng.choice(["", "  ", "\n"]) + "".join(parts)
+
+
+def test_sliding_window_matches_full_text_check():
+    rng = random.Random(1010)
+    for _ in range(2000):
+        text = _random_text(rng)
+        verifier = StreamingOutputVerifier()
+        released = ""
+        for chunk in _random_chunks(rng, text):
+            released += verifier.feed(chunk)
+        released += verifier.finish()
+        expected_violation = _check_forbidden_phrases(_sanitize_text(text), "rid") is not None
+        assert (verifier.violation is not None) == expected_violation, repr(text)
+        assert _sanitize_text(text).startswith(released)
+        assert _check_forbidden_phrases(released, "rid") is None
+        if not expected_violation:
+            assert released == _sanitize_text(text) == verifier.text
+
+
+class FakeSSEServer:
+    """Chat-completions server answering stream=true requests with SSE deltas."""
+
+    def __init__(self, deltas, delay_s=0.0):
+        self.deltas = deltas
+        self.delay_s = delay_s
+        self.connections = 0
+        self.requests = []
+        self._server = None
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return f"http://127.0.0.1:{self._server.sockets[0].getsockname()[1]}"
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.decode("latin-1").split("\r\n"):
+                    if line.lower().startswith("content-length:"):
+                        length = int(line.split(":", 1)[1])
+                self.requests.append(json.loads(await reader.readexactly(length)))
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nTransfer-Encoding: chunked\r\n\r\n")
+                for delta in self.deltas + [None]:
+                    if delta is None:
+                        line = "data: [DONE]\n\n"
+                    else:
+                        line = "data: " + json.dumps({"choices": [{"delta": {"content": delta}}]}) + "\n\n"
+                    data = line.encode()
+                    writer.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                    await writer.drain()
+                    if self.delay_s:
+                        await asyncio.sleep(self.delay_s)
+                writer.write(b"0\r\n\r\n")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return
+        finally:
+            writer.close()
+
+
+def test_provider_stream_reuses_pooled_connection():
+    async def scenario():
+        server = FakeSSEServer(["Hel", "lo", " there"])
+        base = await server.start()
+        provider = OpenAIProvider(api_key="test", base_url=f"{base}/chat/completions")
+        request = LLMRequest(messages=[{"role": "user", "content": "hi"}], model="m", temperature=None, stream=True)
+        try:
+            first = [d async for d in provider.stream_completion(request)]
+            second = [d async for d in provider.stream_completion(request)]
+        finally:
+            await aclose_shared_async_httpx_client()
+            await server.stop()
+        return first, second, server
+
+    first, second, server = asyncio.run(scenario())
+    assert first == second == ["Hel", "lo", " there"]
+    assert server.connections == 1
+    assert server.requests[0]["stream"] is True
+    assert "temperature" not in server.requests[0]
+
+
+class ChunkedClient(LLMClient):
+    def __init__(self, chunks):
+        super().__init__(api_base="http://127.0.0.1:9", api_key="test")
+        self.chunks = chunks
+        self.closed_early = False
+
+    async def call_expression_model_async(self, *args, **kwargs):
+        return RenderedMessage(text="".join(self.chunks).strip())
+
+    async def stream_expression_model(self, *args, **kwargs):
+        try:
+            for chunk in self.chunks:
+                await asyncio.sleep(0)
+                yield chunk
+        except GeneratorExit:
+            self.closed_early = True
+            raise
+
+
+async def _collect(client):
+    events = [e async for e in stream_governed_response_async(USER_TEXT, llm_client=client)]
+    return events, await render_governed_response_async(USER_TEXT, llm_client=client)
+
+
+def _replay(events) -> str:
+    text = ""
+    for event in events:
+        if event.kind == "reset":
+            text = ""
+        elif event.kind == "delta":
+            text += event.text
+    return text
+
+
+def test_governed_stream_matches_non_stream_result():
+    client = ChunkedClient(_random_chunks(random.Random(3), ANSWER))
+    events, expected = asyncio.run(_collect(client))
+    assert events[-1].kind == "result"
+    assert events[-1].result == expected
+    assert expected.ok and expected.output_text == _sanitize_text(ANSWER)
+    assert [e.kind for e in events[:-1]] == ["delta"] * (len(events) - 1)
+    assert _replay(events) == expected.output_text
+
+
+def test_governed_stream_violation_resets_to_fallback():
+    text = ANSWER + " As you said earlier, " + "the window grows. " * 20
+    client = ChunkedClient(_random_chunks(random.Random(5), text))
+    events, expected = asyncio.run(_collect(client))
+    kinds = [e.kind for e in events]
+    assert "reset" in kinds
+    assert events[-1].result == expected
+    assert "as you said earlier" not in _replay(events).lower()
+    assert client.closed_early
+
+
+def _stream_with_disclosure(client, mode):
+    decision_state, control_plan, output_plan = _assemble_plans(USER_TEXT)
+
+    async def scenario():
+        stream = stream_model_for_output_plan_async(
+            user_text=USER_TEXT,
+            decision_state=decision_state,
+            control_plan=control_plan,
+            output_plan=dataclasses.replace(output_plan, unknown_disclosure=mode),
+            llm_client=client,
+        )
+        return [e async for e in stream]
+
+    return asyncio.run(scenario())
+
+
+def test_unknown_disclosure_answer_is_held_until_disclosed():
+    client = ChunkedClient(_random_chunks(random.Random(6), ANSWER))
+    events = _stream_with_disclosure(client, UnknownDisclosureMode.EXPLICIT)
+    assert events[-1].result.ok
+    assert "uncertain" in events[0].text
+    assert _replay(events) == events[-1].result.output_text == _sanitize_text(ANSWER)
+
+
+def test_no_disclosure_required_streams_from_the_start():
+    client = ChunkedClient(_random_chunks(random.Random(6), ANSWER))
+    events = _stream_with_disclosure(client, UnknownDisclosureMode.NONE)
+    assert "uncertain" not in events[0].text
+    assert _replay(events) == events[-1].result.output_text
+
+
+def test_answer_missing_disclosure_releases_nothing():
+    text = "The window grows with every acknowledgement and shrinks on loss. " * 4
+    client = ChunkedClient(_random_chunks(random.Random(7), text))
+    events = _stream_with_disclosure(client, UnknownDisclosureMode.EXPLICIT)
+    assert [e.kind for e in events] == ["result"]
+    assert events[-1].result.output_text != _sanitize_text(text)
+
+
+def _ctx(**overrides):
+    defaults = dict(
+        request_id="rid",
+        plan_value="free",
+        breaker_open=False,
+        budget_blocked=False,
+        total_timeout_ms=5000,
+        per_attempt_timeout_ms=5000,
+        max_attempts=2,
+        mode_requested=None,
+        mode_effective="default",
+        model_class_effective="fast",
+    )
+    defaults.update(overrides)
+    return Step5Context(**defaults)
+
+
+def _run(ctx, items, delay_s=0.0, opened=None):
+    async def open_stream():
+        if opened is not None:
+            opened.append(True)
+        for item in items:
+            if delay_s:
+                await asyncio.sleep(delay_s)
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    async def scenario():
+        return [item async for item in run_step5_stream(ctx, open_stream)]
+
+    return asyncio.run(scenario())
+
+
+def test_step5_stream_success_deltas_join_to_result():
+    text = _sanitize_text(ANSWER)
+    chunks = _random_chunks(random.Random(8), text)
+    out = _run(_ctx(), [("delta", c) for c in chunks] + [("final", text)])
+    kind, result = out[-1]
+    assert kind == "result" and result.action == ChatAction.ANSWER
+    assert result.rendered_text == text
+    assert "".join(v for k, v in out[:-1] if k == "delta") == text
+
+
+def test_step5_stream_safety_envelope_blocks_mid_stream():
+    text = "Plenty of harmless context first. " * 5 + "then how to harm yourself quickly"
+    chunks = _random_chunks(random.Random(9), text)
+    out = _run(_ctx(), [("delta", c) for c in chunks] + [("final", text)])
+    assert out[-2][0] == "reset"
+    kind, result = out[-1]
+    assert result.failure_type == FailureType.SAFETY_BLOCKED
+    assert "harm yourself" not in "".join(v for k, v in out if k == "delta")
+
+
+def test_step5_stream_timeout_falls_back():
+    out = _run(_ctx(per_attempt_timeout_ms=200), [("delta", "slow ")] * 50 + [("final", "x")], delay_s=0.05)
+    kind, result = out[-1]
+    assert result.failure_type == FailureType.TIMEOUT
+    assert result.timeout_where == "provider"
+
+
+def test_step5_stream_breaker_short_circuits():
+    out = _run(_ctx(breaker_open=True), [("final", "never read")])
+    assert out == [("result", out[0][1])]
+    assert out[0][1].failure_type == FailureType.PROVIDER_UNAVAILABLE
+
+
+def test_step5_stream_forced_safety_block_never_opens_stream(monkeypatch):
+    monkeypatch.setenv("FORCE_SAFETY_BLOCK", "1")
+    opened = []
+    out = _run(_ctx(), [("delta", "never read"), ("final", "never read")], opened=opened)
+    assert opened == []
+    assert [k for k, _ in out] == ["result"]
+    assert out[0][1].failure_type == FailureType.SAFETY_BLOCKED
+
+
+def test_step5_stream_retries_before_first_delta():
+    opened = []
+    text = _sanitize_text(ANSWER)
+    attempts = iter([[RuntimeError("upstream")], [("delta", text), ("final", text)]])
+
+    async def open_stream():
+        opened.append(True)
+        for item in next(attempts):
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    async def scenario():
+        return [item async for item in run_step5_stream(_ctx(), open_stream)]
+
+    out = asyncio.run(scenario())
+    kind, result = out[-1]
+    assert len(opened) == 2
+    assert result.action == ChatAction.ANSWER and result.attempts == 2
+    assert "reset" not in [k for k, _ in out]
+
+
+def test_step5_stream_no_retry_after_delta():
+    opened = []
+    text = "Plenty of harmless context first. " * 5
+    out = _run(_ctx(), [("delta", text), RuntimeError("upstream")], opened=opened)
+    assert len(opened) == 1
+    assert [k for k, _ in out][-2:] == ["reset", "result"]
+    assert out[-1][1].failure_type == FailureType.PROVIDER_BAD_RESPONSE
+    assert out[-1][1].attempts == 1
@@ -0,0 +1,326 @@
+"""
+Pooled Postgres access layer tests.
+
+Uses in-memory fake connections so no database is required:
+- Reuse across checkouts (connections opened << checkouts)
+- max_size bound + wait timeout
+- Health check on idle connections, broken connections discarded
+- Commit/rollback semantics of connection()
+- Async pool parity
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from backend.app.db.pool import AsyncConnectionPool, ConnectionPool, PoolClosedError, PoolTimeoutError
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        if self.conn.fail_queries:
+            raise RuntimeError("server closed the connection")
+        self.conn.executed.append(sql)
+
+    def fetchone(self):
+        return (1,)
+
+
+class FakeConn:
+    def __init__(self):
+        self.closed = False
+        self.broken = False
+        self.fail_queries = False
+        self.executed = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+
+class FakeAsyncCursor(FakeCursor):
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, sql, params=None):
+        FakeCursor.execute(self, sql, params)
+
+    async def fetchone(self):
+        return (1,)
+
+
+class FakeAsyncConn(FakeConn):
+    def cursor(self):
+        return FakeAsyncCursor(self)
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+    async def close(self):
+        self.closed = True
+
+
+def make_pool(**kwargs):
+    created = []
+
+    def connect():
+        conn = FakeConn()
+        created.append(conn)
+        return conn
+
+    kwargs.setdefault("health_check_idle_s", 60.0)
+    pool = ConnectionPool("fake://", connect_fn=connect, **kwargs)
+    return pool, created
+
+
+def test_connections_are_reused_across_checkouts():
+    pool, created = make_pool(max_size=4)
+    for _ in range(50):
+        with pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1;")
+    stats = pool.stats()
+    assert len(created) == 1
+    assert stats.connections_opened == 1
+    assert stats.checkouts == 50
+    assert pool.idle_count == 1
+
+
+def test_connection_commits_on_success_and_rolls_back_on_error():
+    pool, created = make_pool()
+    with pool.connection():
+        pass
+    with pytest.raises(ValueError):
+        with pool.connection():
+            raise ValueError("boom")
+    conn = created[0]
+    assert conn.commits == 1
+    assert conn.rollbacks == 1
+    assert pool.idle_count == 1
+
+
+def test_max_size_bounds_open_connections_and_times_out():
+    pool, created = make_pool(max_size=2, wait_timeout_s=0.05)
+    a = pool.getconn()
+    b = pool.getconn()
+    with pytest.raises(PoolTimeoutError):
+        pool.getconn()
+    assert len(created) == 2
+    assert pool.stats().wait_timeouts == 1
+    pool.putconn(a)
+    pool.putconn(b)
+
+
+def test_waiter_is_woken_when_connection_returned():
+    pool, created = make_pool(max_size=1, wait_timeout_s=2.0)
+    held = pool.getconn()
+
+    def release_later():
+        time.sleep(0.05)
+        pool.putconn(held)
+
+    t = threading.Thread(target=release_later)
+    t.start()
+    conn = pool.getconn()
+    t.join()
+    assert conn is held
+    stats = pool.stats()
+    assert stats.waits == 1
+    assert stats.wait_ms_max > 0
+    pool.putconn(conn)
+
+
+def test_idle_connection_health_checked_and_replaced_when_dead():
+    pool, created = make_pool(health_check_idle_s=0.0)
+    with pool.connection():
+        pass
+    created[0].fail_queries = True
+    with pool.connection() as conn:
+        assert conn is not created[0]
+    stats = pool.stats()
+    assert stats.health_check_failures == 1
+    assert created[0].closed
+    assert len(created) == 2
+
+
+def test_broken_connection_is_discarded_on_return():
+    pool, created = make_pool()
+    conn = pool.getconn()
+    conn.broken = True
+    pool.putconn(conn)
+    assert pool.idle_count == 0
+    assert pool.size == 0
+
+
+def test_concurrent_threads_never_exceed_max_size():
+    pool, created = make_pool(max_size=3, wait_timeout_s=5.0)
+    in_use = []
+    peak = [0]
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(20):
+            with pool.connection():
+                with lock:
+                    in_use.append(1)
+                    peak[0] = max(peak[0], len(in_use))
+                time.sleep(0.001)
+                with lock:
+                    in_use.pop()
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert peak[0] <= 3
+    assert len(created) <= 3
+    assert pool.stats().checkouts == 160
+
+
+def test_closed_pool_rejects_checkouts():
+    pool, created = make_pool()
+    with pool.connection():
+        pass
+    pool.close()
+    assert created[0].closed
+    with pytest.raises(PoolClosedError):
+        pool.getconn()
+
+
+def test_async_pool_reuses_and_bounds_connections():
+    created = []
+
+    async def connect():
+        conn = FakeAsyncConn()
+        created.append(conn)
+        return conn
+
+    async def scenario():
+        pool = AsyncConnectionPool("fake://", max_size=2, wait_timeout_s=2.0, connect_fn=connect)
+
+        async def use():
+            async with pool.connection() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute("SELECT 1;")
+                await asyncio.sleep(0.001)
+
+        await asyncio.gather(*(use() for _ in range(20)))
+        stats = pool.stats()
+        await pool.close()
+        return stats
+
+    stats = asyncio.run(scenario())
+    assert len(created) <= 2
+    assert stats.checkouts == 20
+    assert all(conn.closed for conn in created)
+
+
+def _async_pool_with_tracking(**kwargs):
+    created = []
+
+    async def connect():
+        conn = FakeAsyncConn()
+        created.append(conn)
+        return conn
+
+    return AsyncConnectionPool("fake://", connect_fn=connect, **kwargs), created
+
+
+def test_warm_opens_min_size_connections():
+    pool, created = make_pool(min_size=2, max_size=4)
+    pool.warm()
+    assert len(created) == 2 and pool.idle_count == 2
+    pool.warm()
+    assert len(created) == 2
+
+    apool, acreated = _async_pool_with_tracking(min_size=2, max_size=4)
+    asyncio.run(apool.warm())
+    assert len(acreated) == 2 and apool.idle_count == 2
+
+
+def test_async_pool_closes_connections_orphaned_by_previous_loop():
+    pool, created = _async_pool_with_tracking()
+
+    async def use():
+        async with pool.connection():
+            pass
+
+    asyncio.run(use())
+    assert pool.idle_count == 1 and not created[0].closed
+    asyncio.run(use())
+    assert created[0].closed
+    assert len(created) == 2
+    assert pool.size == 1
+    assert pool.stats().connections_closed == 1
+
+
+def test_async_pool_close_nowait_closes_idle_connections():
+    pool, created = _async_pool_with_tracking()
+
+    async def use():
+        async with pool.connection():
+            pass
+
+    asyncio.run(use())
+    pool.close_nowait()
+    assert pool.closed
+    assert created[0].closed
+    assert pool.idle_count == 0
+
+
+def test_close_db_pools_closes_async_pool():
+    from backend.app.db import database
+
+    pool, created = _async_pool_with_tracking()
+
+    async def use():
+        async with pool.connection():
+            pass
+
+    asyncio.run(use())
+    previous = database._async_pool
+    database._async_pool = pool
+    try:
+        database.close_db_pools()
+    finally:
+        database._async_pool = previous
+    assert pool.closed
+    assert created[0].closed
+
+
+def test_db_helpers_fail_closed_without_database_url(monkeypatch):
+    from backend.app.db import database
+    from backend.app.plans import quota
+
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    with pytest.raises(RuntimeError):
+        database.acquire_db_connection()
+    assert quota.get_or_create_quota("anon", "x") is None
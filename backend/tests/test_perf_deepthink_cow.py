@@ -0,0 +1,79 @@
+"""
+Copy-on-write decision state tests.
+
+- apply_delta copies only the root and the patched parent dicts; untouched
+  branches are shared, the input state is never mutated
+- Writes through a non-object value fail closed with PatchError
+- run_engine over 5 passes on a large state shares the baseline's untouched
+  branches and produces the same signature as re-encoding every delta
+"""
+
+import pytest
+
+from backend.app.deepthink.engine import EngineContext, EngineInput, PassRunResult, run_engine
+from backend.app.deepthink.patch import PatchError, apply_delta
+from backend.app.deepthink.router import Plan
+from backend.app.deepthink.schema import PatchOp
+from backend.app.deepthink.telemetry import compute_decision_signature
+
+
+def _large_state():
+    return {
+        "decision": {"action": "ANSWER", "answer": "a", "evidence": [{"id": i} for i in range(500)]},
+        "context": {"turns": [{"idx": i, "tokens": list(range(20))} for i in range(500)]},
+    }
+
+
+def test_apply_delta_path_copies_only_patched_branches():
+    state = _large_state()
+    new = apply_delta(
+        state,
+        [PatchOp(op="set", path="decision.answer", value="b"), PatchOp(op="set", path="decision.action", value="REFUSE")],
+    )
+    assert state["decision"]["answer"] == "a" and state["decision"]["action"] == "ANSWER"
+    assert new["decision"] == {**state["decision"], "answer": "b", "action": "REFUSE"}
+    assert new is not state and new["decision"] is not state["decision"]
+    assert new["context"] is state["context"]
+    assert new["decision"]["evidence"] is state["decision"]["evidence"]
+
+    created = apply_delta({}, [PatchOp(op="set", path="decision.action", value="ANSWER")])
+    assert created == {"decision": {"action": "ANSWER"}}
+
+
+def test_patch_through_non_object_fails_closed():
+    with pytest.raises(PatchError):
+        apply_delta({"decision": "ANSWER"}, [PatchOp(op="set", path="decision.action", value="REFUSE")])
+
+
+def test_engine_shares_baseline_and_keeps_signature():
+    passes = ["REFINE", "STRESS_TEST", "COUNTERARG", "ALTERNATIVES", "REGRET"]
+    deltas = [
+        [PatchOp(op="set", path="decision.answer", value=f"answer {i}")] for i in range(4)
+    ] + [[PatchOp(op="set", path="decision.alternatives", value=["x", "yy"])]]
+
+    def runner(pass_type, state, context):
+        return PassRunResult(pass_type=pass_type, delta=deltas[passes.index(pass_type)], cost_units=1, duration_ms=1)
+
+    initial = _large_state()
+    plan = Plan(
+        effective_pass_count=5,
+        pass_plan=passes,
+        per_pass_budget=[10] * 5,
+        per_pass_timeout_ms=[1000] * 5,
+        stop_reason=None,
+    )
+    context = EngineContext(request_signature="sig", now_ms=lambda: 0, budget_units_remaining=100)
+    output = run_engine(EngineInput(request_signature="sig", initial_state=initial, plan=plan, context=context, pass_runner=runner))
+
+    assert output.meta.stop_reason == "SUCCESS_COMPLETED"
+    assert output.final_state["decision"]["answer"] == "answer 3"
+    assert output.final_state["decision"]["alternatives"] == ["x", "yy"]
+    assert initial["decision"]["answer"] == "a"
+    assert output.final_state["context"] is initial["context"]
+    expected = compute_decision_signature(
+        stable_inputs={"budget_units_remaining": 95, "breaker_tripped": False, "abuse_blocked": False},
+        pass_plan=passes,
+        deltas=[op for delta in deltas for op in delta],
+        meta={"validator_failures": 0, "stop_reason": "SUCCESS_COMPLETED"},
+    )
+    assert output.meta.decision_signature == expected
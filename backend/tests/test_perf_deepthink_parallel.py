@@ -0,0 +1,134 @@
+"""
+Parallel deepthink pass execution tests.
+
+- Built-in passes on varied states: parallel mode returns the same final
+  state, stop reason and decision signature as serial mode
+- A pass whose declared reads were changed by an earlier pass of its wave is
+  re-run on the current state; unchanged reads reuse the speculative result
+- Slow independent passes overlap: wall time approaches the slowest pass
+- Undeclared pass types and max_parallel=1 never touch the pool
+"""
+
+import threading
+import time
+
+from backend.app.deepthink.engine import EngineContext, EngineInput, PassRunResult, run_engine
+from backend.app.deepthink.passes import (
+    run_alternatives_pass,
+    run_counterargument_pass,
+    run_regret_pass,
+    run_stress_test_pass,
+)
+from backend.app.deepthink.router import Plan
+from backend.app.deepthink.scheduler import PassScheduler
+from backend.app.deepthink.schema import PatchOp
+
+PLAN_5 = ["COUNTERARG", "STRESS_TEST", "ALTERNATIVES", "REGRET", "COUNTERARG"]
+BUILTIN = {
+    "COUNTERARG": run_counterargument_pass,
+    "STRESS_TEST": run_stress_test_pass,
+    "ALTERNATIVES": run_alternatives_pass,
+    "REGRET": run_regret_pass,
+}
+
+
+def _plan(passes):
+    return Plan(
+        effective_pass_count=len(passes),
+        pass_plan=list(passes),
+        per_pass_budget=[100] * len(passes),
+        per_pass_timeout_ms=[10_000] * len(passes),
+        stop_reason=None,
+    )
+
+
+def _run(state, runner, passes=PLAN_5, max_parallel=1):
+    context = EngineContext(request_signature="req", now_ms=lambda: 0, budget_units_remaining=10_000)
+    return run_engine(
+        EngineInput(
+            request_signature="req",
+            initial_state=state,
+            plan=_plan(passes),
+            context=context,
+            pass_runner=runner,
+            max_parallel=max_parallel,
+        )
+    )
+
+
+def _builtin_runner(pass_type, state, context):
+    return BUILTIN[pass_type](pass_type, state, context)
+
+
+def test_builtin_passes_match_serial_output():
+    states = [
+        {"decision": {"action": "ANSWER", "answer": "Use a cache.", "rationale": "Fast."}},
+        {"decision": {"action": "ANSWER", "answer": "", "rationale": ""}},
+        {"request_text": "my python script crashes", "decision": {"action": "ANSWER", "answer": "Maybe it depends."}},
+        {"decision": {"action": "REFUSE", "answer": "", "rationale": "Unsafe request."}},
+        {"decision": {"action": "FALLBACK"}},
+    ]
+    for state in states:
+        serial = _run(state, _builtin_runner)
+        parallel = _run(state, _builtin_runner, max_parallel=4)
+        assert parallel.final_state == serial.final_state
+        assert parallel.meta.stop_reason == serial.meta.stop_reason
+        assert parallel.meta.decision_signature == serial.meta.decision_signature
+        assert parallel.meta.telemetry_event == serial.meta.telemetry_event
+
+
+def test_invalidated_speculation_is_rerun():
+    calls = []
+    lock = threading.Lock()
+
+    def runner(pass_type, state, context):
+        answer = state["decision"].get("answer", "")
+        with lock:
+            calls.append((pass_type, answer))
+        if pass_type == "COUNTERARG":
+            delta = [PatchOp(op="set", path="decision.answer", value="changed")]
+        else:
+            delta = [PatchOp(op="set", path="decision.rationale", value=f"saw {answer}")]
+        return PassRunResult(pass_type=pass_type, delta=delta, cost_units=1, duration_ms=1)
+
+    state = {"decision": {"action": "ANSWER", "answer": "orig"}}
+    passes = ["COUNTERARG", "STRESS_TEST", "REGRET"]
+    serial = _run(state, runner, passes)
+    calls.clear()
+    parallel = _run(state, runner, passes, max_parallel=3)
+    assert parallel.final_state == serial.final_state
+    assert parallel.final_state["decision"]["rationale"] == "saw changed"
+    assert ("STRESS_TEST", "changed") in calls and ("REGRET", "changed") in calls
+
+    scheduler = PassScheduler(["STRESS_TEST", "REGRET"], runner, context=None, max_parallel=2)
+    scheduler.run(0, state)
+    # decision.alternatives is not a declared read: the speculative result stands
+    scheduler.run(1, {"decision": {"action": "ANSWER", "answer": "orig", "alternatives": ["x"]}})
+    assert (scheduler.speculative_hits, scheduler.speculative_misses) == (1, 0)
+
+
+def test_slow_independent_passes_overlap():
+    def runner(pass_type, state, context):
+        time.sleep(0.1)
+        return PassRunResult(pass_type=pass_type, delta=[], cost_units=1, duration_ms=100)
+
+    state = {"decision": {"action": "ANSWER", "answer": "a"}}
+    passes = ["COUNTERARG", "STRESS_TEST", "ALTERNATIVES", "REGRET"]
+    start = time.perf_counter()
+    parallel = _run(state, runner, passes, max_parallel=4)
+    elapsed = time.perf_counter() - start
+    assert parallel.meta.stop_reason == "SUCCESS_COMPLETED"
+    assert elapsed < 0.3
+
+
+def test_serial_mode_and_undeclared_passes_stay_on_caller_thread():
+    threads = set()
+
+    def runner(pass_type, state, context):
+        threads.add(threading.current_thread().name)
+        return PassRunResult(pass_type=pass_type, delta=[], cost_units=1, duration_ms=1)
+
+    state = {"decision": {"action": "ANSWER"}}
+    _run(state, runner, ["COUNTERARG", "STRESS_TEST", "REGRET"], max_parallel=1)
+    _run(state, runner, ["REFINE", "CUSTOM"], max_parallel=4)
+    assert threads == {threading.current_thread().name}
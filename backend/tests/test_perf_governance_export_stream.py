@@ -0,0 +1,124 @@
+"""
+Streaming NDJSON governance export tests.
+
+- Sources are pulled lazily: the first chunk is produced before the audit
+  source is exhausted, and chunks stay near EXPORT_CHUNK_BYTES
+- Every record is sanitized (no sentinel leakage, audit allowlist applied)
+  and there is no MAX_AUDIT_EVENTS truncation
+- The trailer signature covers the running hash of all lines; any edited
+  line fails verify_export_stream; gzip output decompresses to the same bytes
+- Refused exports have no chunks and map to 403 over HTTP; allowed exports
+  are served chunked as application/x-ndjson
+"""
+
+import gzip
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.app.governance.audit import AuditDecision, AuditLog, AuditOperationType, AuditReasonCode, record_audit_event
+from backend.app.governance.export import (
+    EXPORT_CHUNK_BYTES,
+    MAX_AUDIT_EVENTS,
+    ExportReasonCode,
+    audit_log_pages,
+    build_export_stream,
+    iter_pages,
+    verify_export_stream,
+)
+from backend.app.governance.tenant import FeatureFlag, PlanTier, TenantConfig
+from backend.app.routers.governance_export import ndjson_export_response
+
+SENTINEL = "SENSITIVE_USER_TEXT_123"
+
+
+def _tenant(export=True):
+    features = {FeatureFlag.EXPORT_ENABLED} if export else set()
+    return TenantConfig(tenant_id="tenant-1", plan=PlanTier.ENTERPRISE, regions=["us-east"], enabled_features=features)
+
+
+def _audit_source(count, pulled):
+    for i in range(count):
+        pulled.append(i)
+        yield {"event_id": f"{i:064x}", "operation": "TOOL_CALL", "decision": "ALLOW", "reason": "OK", "user_text": SENTINEL}
+
+
+def test_stream_is_lazy_sanitized_and_untruncated():
+    pulled = []
+    count = 5000
+    stream = build_export_stream(
+        _tenant(),
+        audit_events=_audit_source(count, pulled),
+        policy_decisions=[{"signature": "a" * 64}, {"signature": "not-a-hash"}],
+        memory_telemetry_events=[{"operation": "write", "success": True, "prompt": SENTINEL}],
+        now_ms=3_600_000,
+    )
+    assert stream.ok and stream.reason_code == ExportReasonCode.OK
+    first = next(stream.chunks)
+    assert len(pulled) < count
+    chunks = [first] + list(stream.chunks)
+    assert all(len(chunk) < 2 * EXPORT_CHUNK_BYTES for chunk in chunks)
+
+    data = b"".join(chunks)
+    assert SENTINEL.encode() not in data
+    records = [json.loads(line) for line in data.splitlines()]
+    assert records[0]["type"] == "header" and records[-1]["type"] == "trailer"
+    audit_records = [r["record"] for r in records if r["type"] == "audit_event"]
+    assert len(audit_records) == count > MAX_AUDIT_EVENTS
+    assert set(audit_records[0]) == {"event_id", "operation", "decision", "reason"}
+    trailer = records[-1]
+    assert trailer["counts"] == {"audit_events": count, "decision_signatures": 1, "memory_telemetry": 1, "research_telemetry": 0}
+    assert trailer["metrics"]["memory_write_counts"] == {"attempted": 1, "accepted": 1, "rejected": 0}
+    assert verify_export_stream(data.splitlines())
+
+
+def test_signature_detects_edits_and_gzip_round_trips():
+    log = AuditLog()
+    for i in range(300):
+        record_audit_event(
+            "tenant-1", AuditOperationType.EXPORT_REQUEST, AuditDecision.ALLOW,
+            AuditReasonCode.INVALID_REQUEST, {"step": i}, now_ms=i, log=log,
+        )
+    plain = b"".join(build_export_stream(_tenant(), audit_events=audit_log_pages(log, page_size=64), now_ms=0).chunks)
+    packed = b"".join(build_export_stream(_tenant(), audit_events=audit_log_pages(log, page_size=7), now_ms=0, gzip=True).chunks)
+    assert gzip.decompress(packed) == plain
+    lines = plain.splitlines()
+    assert sum(b'"audit_event"' in line for line in lines) == 300
+    assert verify_export_stream(lines)
+
+    edited = list(lines)
+    edited[5] = edited[5].replace(b"EXPORT_REQUEST", b"TOOL_CALL")
+    assert not verify_export_stream(edited)
+    assert not verify_export_stream(lines[:-2] + lines[-1:])
+
+
+def test_iter_pages_follows_cursor():
+    calls = []
+
+    def fetch_page(cursor, limit):
+        calls.append((cursor, limit))
+        start = cursor or 0
+        return [{"i": i} for i in range(start, min(start + limit, 10))], (start + limit if start + limit < 10 else None)
+
+    assert [r["i"] for r in iter_pages(fetch_page, page_size=4)] == list(range(10))
+    assert calls == [(None, 4), (4, 4), (8, 4)]
+
+
+def test_http_response_is_chunked_ndjson():
+    app = FastAPI()
+
+    @app.get("/export")
+    def export(enabled: bool = True):
+        return ndjson_export_response(build_export_stream(_tenant(enabled), audit_events=_audit_source(50, []), gzip=True))
+
+    client = TestClient(app)
+    response = client.get("/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["content-encoding"] == "gzip"
+    assert verify_export_stream(response.content.splitlines())
+
+    refused = build_export_stream(_tenant(export=False))
+    assert not refused.ok and refused.chunks is None and refused.reason_code == ExportReasonCode.EXPORT_DISABLED
+    assert client.get("/export", params={"enabled": False}).status_code == 403
@@ -0,0 +1,114 @@
+"""
+Bounded limiter store tests.
+
+- TTL: expired keys are never returned and are swept by slot, re-set keys
+  move to their new slot
+- Hard ceiling: LRU eviction at max_keys with eviction counters
+- WAF memory fallback and quota buckets stay bounded under many distinct
+  subjects and drop state once windows/cooldowns/refill have passed, with
+  unchanged limiting decisions
+- Soak (reduced; scripts/bench_limiter_store.py runs millions): traced memory
+  and time-wheel size stay flat after the store is full
+"""
+
+import tracemalloc
+
+from backend.app.perf.limiter_store import LimiterStore
+from backend.app.security import quotas
+from backend.app.waf import guard
+from backend.app.waf.guard import LimitWindow, RateKey
+
+T0 = 1_000.0
+
+
+def test_ttl_expiry_and_slot_sweep():
+    store = LimiterStore(100)
+    store.set("a", 1, ttl_s=5, now=T0)
+    store.set("b", 2, ttl_s=50, now=T0)
+    store.set("c", 3, now=T0)
+    assert store.get("a", now=T0 + 4.9) == 1
+    # Expired before its slot is swept: still never returned.
+    assert store.get("a", now=T0 + 5.0) is None
+    store.set("b", 2, ttl_s=100, now=T0 + 10)
+    assert store.prune(now=T0 + 70) == 0
+    assert store.get("b", now=T0 + 70) == 2
+    assert store.prune(now=T0 + 200) == 1
+    assert len(store) == 1 and store.get("c", now=T0 + 10_000) == 3
+    stats = store.stats()
+    assert (stats.inserts, stats.expired, stats.evicted) == (3, 2, 0)
+
+
+def test_lru_ceiling_evicts_least_recently_used():
+    store = LimiterStore(3)
+    for key in "abc":
+        store.set(key, key, now=T0)
+    store.get("a", now=T0)
+    store.set("d", "d", now=T0)
+    assert "b" not in store and "a" in store
+    for i in range(100):
+        store.set(i, i, ttl_s=10, now=T0)
+    stats = store.stats()
+    assert stats.size == 3 and stats.evicted == 101
+    assert sum(len(keys) for keys in store._slots.values()) <= 3
+
+
+def test_waf_memory_state_is_bounded_and_self_pruning(monkeypatch):
+    monkeypatch.setattr(guard, "_mem_windows", LimiterStore(500, name="waf_windows"))
+    monkeypatch.setattr(guard, "_mem_locks", LimiterStore(500, name="waf_locks"))
+    windows = (LimitWindow(2, 10), LimitWindow(60, 60))
+    for i in range(20_000):
+        guard._rate_check_with(None, RateKey(scope="anon", value=f"s{i}"), windows, T0)
+    assert len(guard._mem_windows) == 500
+    assert guard._mem_windows.stats().evicted == 2 * 20_000 - 500
+
+    key = RateKey(scope="anon", value="hot")
+    results = [guard._rate_check_with(None, key, windows, T0)[0] for _ in range(3)]
+    assert results == [True, True, False]
+    assert guard._rate_check_with(None, key, windows, T0 + 29)[0] is False
+    assert guard._rate_check_with(None, key, windows, T0 + 31)[0] is True
+
+    guard._mem_windows.prune(now=T0 + 120)
+    assert len(guard._mem_windows) == 0
+    guard._mem_locks.prune(now=T0 + 31 + guard.WAF_LOCKOUT_COOLDOWN_SECONDS + 60)
+    assert len(guard._mem_locks) == 0
+
+
+def test_quota_buckets_bounded_and_idle_buckets_dropped(monkeypatch):
+    monkeypatch.setattr(quotas, "_buckets", LimiterStore(200, name="quota_buckets"))
+    monkeypatch.delenv("QUOTA_FORCE_BLOCK", raising=False)
+
+    def ctx(actor, now):
+        return quotas.QuotaContext(plan="free", actor_key=actor, ip_hash="", est_input_tokens=1, est_output_cap=None, now_monotonic=now)
+
+    for i in range(5_000):
+        assert quotas.quota_precheck(ctx(f"a{i}", T0)).allowed
+    assert len(quotas._buckets) == 200
+
+    decisions = [quotas.quota_precheck(ctx("hot", T0)).reason_code for _ in range(21)]
+    assert decisions[:20] == ["OK"] * 20 and decisions[20] == "RATE_LIMIT"
+    assert quotas.quota_precheck(ctx("hot", T0 + 3.1)).allowed
+    quotas._buckets.prune(now=T0 + 3.1 + quotas._BUCKET_IDLE_TTL_S + 1)
+    assert len(quotas._buckets) == 0
+
+
+def test_soak_memory_and_wheel_flat_after_fill():
+    store = LimiterStore(5_000, name="soak")
+
+    def drive(start, count):
+        for i in range(start, start + count):
+            now = T0 + i / 1000.0
+            store.set(("anon", f"subject-{i}", 60), 1, ttl_s=60, now=now)
+            store.get(("anon", f"subject-{i // 2}", 60), now=now)
+
+    drive(0, 10_000)
+    tracemalloc.start()
+    try:
+        drive(10_000, 20_000)
+        baseline, _ = tracemalloc.get_traced_memory()
+        drive(30_000, 40_000)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(store) == 5_000
+    assert after - baseline < 256 * 1024
+    assert len(store._slot_heap) <= 62
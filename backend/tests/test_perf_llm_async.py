@@ -0,0 +1,170 @@
+"""
+Native async LLM path tests.
+
+Runs a local fake chat-completions server (asyncio.start_server) so no provider
+is required:
+- Concurrent invoke_model_async calls share one pooled AsyncClient; in-flight
+  upstream requests are bounded by outbound_http_max_connections
+- No worker threads are spawned for the model call
+- Cancelling the awaiting task (timeout) closes the upstream connection
+- Sync and async paths return identical results
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+from backend.app.llm_client import LLMClient
+from backend.app.perf import aclose_shared_async_httpx_client
+from backend.mci_backend.model_contract import ModelInvocationClass, ModelInvocationRequest, ModelOutputFormat
+from backend.mci_backend.model_runtime import invoke_model, invoke_model_async
+
+REPLY_TEXT = "Here is a bounded reply about the one point."
+
+
+class FakeChatServer:
+    """Minimal HTTP/1.1 keep-alive server answering chat completions after a delay."""
+
+    def __init__(self, delay_s: float):
+        self.delay_s = delay_s
+        self.in_flight = 0
+        self.peak = 0
+        self.completed = 0
+        self.disconnects = 0
+        self._server = None
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.decode("latin-1").split("\r\n"):
+                    if line.lower().startswith("content-length:"):
+                        length = int(line.split(":", 1)[1])
+                await reader.readexactly(length)
+
+                self.in_flight += 1
+                self.peak = max(self.peak, self.in_flight)
+                try:
+                    # Wait out the delay while watching for the client hanging up
+                    try:
+                        early = await asyncio.wait_for(reader.read(1), timeout=self.delay_s)
+                    except asyncio.TimeoutError:
+                        early = None
+                    if early == b"":
+                        self.disconnects += 1
+                        return
+                finally:
+                    self.in_flight -= 1
+
+                body = json.dumps({"choices": [{"message": {"content": REPLY_TEXT}}]}).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+                self.completed += 1
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return
+        finally:
+            writer.close()
+
+
+def _request(idx: int = 0) -> ModelInvocationRequest:
+    return ModelInvocationRequest(
+        trace_id=f"t{idx}",
+        decision_state_id="d1",
+        control_plan_id="c1",
+        output_plan_id="o1",
+        invocation_class=ModelInvocationClass.EXPRESSION_CANDIDATE,
+        output_format=ModelOutputFormat.TEXT,
+        user_text="hello",
+        required_elements=("one",),
+        forbidden_requirements=(),
+        max_output_tokens=64,
+    )
+
+
+def _limit_connections(monkeypatch, limit: int) -> None:
+    monkeypatch.setattr("backend.app.perf.http_client.outbound_http_max_connections", lambda: limit)
+
+
+def test_concurrent_calls_bounded_by_pool_without_threads(monkeypatch):
+    _limit_connections(monkeypatch, 8)
+
+    async def scenario():
+        server = FakeChatServer(delay_s=0.2)
+        client = LLMClient(api_base=await server.start(), api_key="test")
+        threads_before = threading.active_count()
+        start = time.perf_counter()
+        try:
+            results = await asyncio.gather(*(invoke_model_async(_request(i), llm_client=client) for i in range(40)))
+        finally:
+            await aclose_shared_async_httpx_client()
+            await server.stop()
+        return results, time.perf_counter() - start, threads_before, threading.active_count(), server
+
+    results, elapsed, threads_before, threads_after, server = asyncio.run(scenario())
+    assert all(r.ok and r.output_text == REPLY_TEXT for r in results)
+    assert server.completed == 40
+    # Pool saturated but never exceeded: 40 requests / 8 sockets = 5 waves of 0.2s
+    assert server.peak == 8
+    assert 0.9 <= elapsed < 2.5
+    assert threads_after <= threads_before
+
+
+def test_timeout_cancels_upstream_request(monkeypatch):
+    _limit_connections(monkeypatch, 4)
+
+    async def scenario():
+        server = FakeChatServer(delay_s=2.0)
+        client = LLMClient(api_base=await server.start(), api_key="test")
+        try:
+            try:
+                await asyncio.wait_for(invoke_model_async(_request(), llm_client=client), timeout=0.2)
+            except asyncio.TimeoutError:
+                timed_out = True
+            else:
+                timed_out = False
+            for _ in range(50):
+                if server.disconnects:
+                    break
+                await asyncio.sleep(0.02)
+        finally:
+            await aclose_shared_async_httpx_client()
+            await server.stop()
+        return timed_out, server
+
+    timed_out, server = asyncio.run(scenario())
+    assert timed_out
+    assert server.disconnects == 1
+    assert server.completed == 0
+    assert server.in_flight == 0
+
+
+def test_sync_and_async_results_identical():
+    async def scenario():
+        server = FakeChatServer(delay_s=0.0)
+        client = LLMClient(api_base=await server.start(), api_key="test")
+        try:
+            async_result = await invoke_model_async(_request(), llm_client=client)
+            sync_result = await asyncio.to_thread(invoke_model, _request(), llm_client=client)
+        finally:
+            await aclose_shared_async_httpx_client()
+            await server.stop()
+        return sync_result, async_result
+
+    sync_result, async_result = asyncio.run(scenario())
+    assert async_result == sync_result
+    assert async_result.ok and async_result.output_text == REPLY_TEXT
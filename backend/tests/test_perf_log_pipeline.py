@@ -0,0 +1,207 @@
+"""
+Async log pipeline tests.
+
+- Records are written by the listener thread, in order, with the original
+  handler's formatter; stop drains the queue and restores the handler
+- A full queue drops (never blocks) and counts drops per level and in the
+  log_records_dropped metric
+- Lazy payloads are built once, only for records a handler takes (not for
+  disabled levels or sampled-out events); lazy extras are built on the
+  listener thread and only if the formatter reads them
+- Per-event sampling: stable per request key, hooks, WARNING+ always kept;
+  structured_log events sample by their event/type
+"""
+
+import logging
+import threading
+
+import pytest
+
+from backend.app.observability import log_pipeline, metrics
+from backend.app.observability import logging as obs_logging
+from backend.app.observability.log_pipeline import (
+    bind_log_sample_key,
+    install_log_pipeline,
+    lazy,
+    log_pipeline_stats,
+    parse_sample_rates,
+    reset_log_sample_key,
+    set_log_sampling,
+    stop_log_pipeline,
+)
+
+
+class Collecting(logging.Handler):
+    def __init__(self, gate=None):
+        super().__init__()
+        self.lines = []
+        self.threads = set()
+        self.gate = gate
+        self.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+
+    def emit(self, record):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.threads.add(threading.get_ident())
+        self.lines.append(self.format(record))
+
+
+@pytest.fixture
+def test_logger(request):
+    logger = logging.getLogger(f"test.log_pipeline.{request.node.name}")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    yield logger
+    stop_log_pipeline(logger)
+    logger.handlers.clear()
+    log_pipeline._sampler.clear()
+
+
+def test_listener_writes_in_order_and_stop_drains(test_logger):
+    target = Collecting()
+    test_logger.addHandler(target)
+    handler = install_log_pipeline(queue_size=1000, sample_rates={}, logger=test_logger)
+    assert handler in test_logger.handlers and target not in test_logger.handlers
+    assert install_log_pipeline(queue_size=1000, sample_rates={}, logger=test_logger) is handler
+
+    for i in range(200):
+        test_logger.info("line %d", i)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        test_logger.exception("failed")
+    stop_log_pipeline(test_logger)
+
+    assert target in test_logger.handlers and handler not in test_logger.handlers
+    assert target.lines[:200] == [f"INFO line {i}" for i in range(200)]
+    assert target.lines[200].startswith("ERROR failed\nTraceback") and "ValueError: boom" in target.lines[200]
+    assert threading.get_ident() not in target.threads
+    assert not log_pipeline_stats(test_logger)["running"]
+
+
+def test_full_queue_drops_and_counts(test_logger):
+    gate = threading.Event()
+    target = Collecting(gate)
+    test_logger.addHandler(target)
+    install_log_pipeline(queue_size=5, sample_rates={}, logger=test_logger)
+    before = metrics.get_registry().snapshot().counters.get(("log_records_dropped", (("level", "INFO"),)), 0)
+
+    test_logger.info("first")  # picked up by the listener, which blocks on the gate
+    for _ in range(200):
+        if log_pipeline_stats(test_logger)["queued"] == 0:
+            break
+        threading.Event().wait(0.01)
+    for i in range(20):
+        test_logger.info("burst %d", i)
+    test_logger.warning("late")
+
+    stats = log_pipeline_stats(test_logger)
+    assert stats["queued"] == 5 and stats["dropped"] == {"INFO": 15, "WARNING": 1}
+    after = metrics.get_registry().snapshot().counters[("log_records_dropped", (("level", "INFO"),))]
+    assert after - before == 15
+
+    gate.set()
+    stop_log_pipeline(test_logger)
+    assert target.lines == ["INFO first"] + [f"INFO burst {i}" for i in range(5)]
+
+
+def test_lazy_payloads_built_only_when_emitted(test_logger):
+    target = Collecting()
+    target.setFormatter(logging.Formatter("%(message)s %(payload)s"))
+    test_logger.addHandler(target)
+    install_log_pipeline(queue_size=100, sample_rates={}, logger=test_logger)
+    calls = []
+
+    def build(tag):
+        calls.append(tag)
+        return {"tag": tag}
+
+    test_logger.debug("disabled", extra={"payload": lazy(build, "debug")})
+    set_log_sampling("sampled out", 0.0)
+    test_logger.info("sampled out", extra={"payload": lazy(build, "dropped")})
+    test_logger.info("kept", extra={"payload": lazy(build, "kept")})
+    test_logger.info("args %s", lazy(build, "arg"), extra={"payload": lazy(lambda: 1 / 0)})
+    stop_log_pipeline(test_logger)
+
+    assert sorted(calls) == ["arg", "kept"]
+    assert target.lines == ["kept {'tag': 'kept'}", "args {'tag': 'arg'} <unavailable: ZeroDivisionError>"]
+
+
+def test_lazy_extras_unread_by_formatter_are_never_built(test_logger):
+    target = Collecting()  # "%(levelname)s %(message)s", like the root formatter
+    test_logger.addHandler(target)
+    install_log_pipeline(queue_size=100, sample_rates={}, logger=test_logger)
+    built = []
+
+    test_logger.info("payload", extra={"payload": lazy(lambda: built.append(threading.get_ident()))})
+    stop_log_pipeline(test_logger)
+
+    assert target.lines == ["INFO payload"]
+    assert built == []
+
+
+def test_lazy_extras_read_by_formatter_build_on_listener(test_logger):
+    target = Collecting()
+    target.setFormatter(logging.Formatter("%(message)s %(payload)s"))
+    test_logger.addHandler(target)
+    install_log_pipeline(queue_size=100, sample_rates={}, logger=test_logger)
+    built = []
+
+    def build():
+        built.append(threading.get_ident())
+        return "p"
+
+    test_logger.info("payload", extra={"payload": lazy(build)})
+    stop_log_pipeline(test_logger)
+
+    assert target.lines == ["payload p"]
+    assert len(built) == 1 and built[0] != threading.get_ident()
+
+
+def test_sampling_stable_per_request_and_hooks(test_logger):
+    target = Collecting()
+    test_logger.addHandler(target)
+    install_log_pipeline(queue_size=10000, sample_rates={"chatty": 0.25}, logger=test_logger)
+    set_log_sampling("hooked %d", lambda record: record.args[0] % 2 == 0)
+
+    for rid in range(400):
+        token = bind_log_sample_key(f"req-{rid}")
+        try:
+            for _ in range(3):
+                test_logger.info("chatty")
+            test_logger.warning("chatty")
+        finally:
+            reset_log_sample_key(token)
+    for i in range(6):
+        test_logger.info("hooked %d", i)
+    stop_log_pipeline(test_logger)
+
+    chatty = [line for line in target.lines if line == "INFO chatty"]
+    kept_requests = len(chatty) // 3
+    assert len(chatty) % 3 == 0 and 60 <= kept_requests <= 140
+    assert target.lines.count("WARNING chatty") == 400
+    assert [line for line in target.lines if "hooked" in line] == ["INFO hooked 0", "INFO hooked 2", "INFO hooked 4"]
+    assert parse_sample_rates("[LLM#1] Reasoning input=0.1, api_chat=2,bad,=0.5,x=y") == {
+        "[LLM#1] Reasoning input": 0.1,
+        "api_chat": 1.0,
+    }
+
+
+def test_structured_log_is_lazy_and_sampled_by_event(monkeypatch, test_logger):
+    target = Collecting()
+    target.setFormatter(logging.Formatter("%(message)s"))
+    test_logger.addHandler(target)
+    monkeypatch.setattr(obs_logging, "logger", test_logger)
+    dumped = []
+    dumps = log_pipeline._dumps
+    monkeypatch.setattr(log_pipeline, "_dumps", lambda obj: dumped.append(obj) or dumps(obj))
+    install_log_pipeline(queue_size=100, sample_rates={"metric_rollup": 0.0}, logger=test_logger)
+
+    obs_logging.structured_log({"type": "api_chat", "status_code": 200, "body": "secret"})
+    obs_logging.structured_log({"type": "metric_rollup", "name": "chat_requests"})
+    test_logger.setLevel(logging.WARNING)
+    obs_logging.structured_log({"type": "api_chat", "status_code": 500})
+    stop_log_pipeline(test_logger)
+
+    assert target.lines == ['{"type":"api_chat","status_code":200}']
+    assert dumped == [{"type": "api_chat", "status_code": 200}]
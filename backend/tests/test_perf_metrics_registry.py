@@ -0,0 +1,147 @@
+"""
+In-process metrics registry tests.
+
+- Samples from many threads merge on scrape; shards of finished threads are
+  folded in and keep their totals
+- Prometheus text: cumulative fixed buckets, sum/count, escaped labels
+- Label sets beyond the per-metric cap land in {overflow="true"}; a name
+  keeps its first metric type
+- No log line per sample: rollups emit one line per metric with deltas
+- /metrics serves the registry only when METRICS_ENABLED=1
+"""
+
+import threading
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.app.observability import metrics
+from backend.app.observability.metrics import MetricsRegistry
+from backend.app.routers import metrics as metrics_router
+
+
+def test_thread_shards_merge_and_survive_thread_exit():
+    registry = MetricsRegistry(rollup_interval_s=0)
+    barrier = threading.Barrier(8)
+
+    def work(idx):
+        barrier.wait()
+        for i in range(1000):
+            registry.inc("requests", 1, {"route": "chat"})
+            registry.observe("latency_ms", (i % 10) * 10.0, {"route": "chat"})
+        registry.set("last_worker", idx)
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for _ in range(2):  # second scrape reads the folded totals
+        snap = registry.snapshot()
+        key = ("requests", (("route", "chat"),))
+        assert snap.counters[key] == 8000
+        bounds, counts, total = snap.histograms[("latency_ms", (("route", "chat"),))]
+        assert sum(counts) == 8000 and total == 8 * 100 * sum(range(0, 100, 10))
+        assert snap.gauges[("last_worker", ())] in range(8)
+    assert registry._shards == []
+
+
+def test_prometheus_text_format():
+    registry = MetricsRegistry(rollup_interval_s=0)
+    registry.set_buckets("db_wait_ms", [1, 10, 100])
+    for value in (0.5, 1, 5, 50, 500):
+        registry.observe("db_wait_ms", value, {"pool": "main"})
+    registry.inc("waf_rejections", 2, {"error_code": 'bad"code\n'})
+    registry.set("provider_circuit_open", 1, {"circuit": "openai:gpt"})
+
+    text = registry.render_prometheus()
+    assert text.endswith("\n")
+    lines = text.splitlines()
+    assert "# TYPE db_wait_ms histogram" in lines
+    assert [line for line in lines if line.startswith("db_wait_ms")] == [
+        'db_wait_ms_bucket{pool="main",le="1"} 2',
+        'db_wait_ms_bucket{pool="main",le="10"} 3',
+        'db_wait_ms_bucket{pool="main",le="100"} 4',
+        'db_wait_ms_bucket{pool="main",le="+Inf"} 5',
+        'db_wait_ms_sum{pool="main"} 556.5',
+        'db_wait_ms_count{pool="main"} 5',
+    ]
+    assert 'waf_rejections{error_code="bad\\"code\\n"} 2' in lines
+    assert 'provider_circuit_open{circuit="openai:gpt"} 1' in lines
+
+
+def test_circuit_gauge_resets_when_open_window_lapses(monkeypatch):
+    from backend.app.providers import circuit
+
+    gauges = []
+    clock = [1_700_000_000.0]
+    monkeypatch.setattr(circuit, "_FAILURES", {})
+    monkeypatch.setattr(circuit, "_OPEN_UNTIL", {})
+    monkeypatch.setattr(circuit, "_now", lambda: clock[0])
+    monkeypatch.setattr(circuit, "gauge", lambda name, value, labels=None: gauges.append((name, value)))
+
+    circuit.record_failure("openai:gpt", window_seconds=60, failure_threshold=1, open_seconds=30)
+    assert circuit.is_open("openai:gpt", open_seconds=30)[0]
+    clock[0] += 31
+    assert circuit.is_open("openai:gpt", open_seconds=30) == (False, None)
+    assert circuit.is_open("openai:gpt", open_seconds=30) == (False, None)
+    assert gauges == [("provider_circuit_open", 1), ("provider_circuit_open", 0)]
+
+
+def test_label_cardinality_cap_and_type_conflicts():
+    registry = MetricsRegistry(max_series_per_metric=3, rollup_interval_s=0)
+    for i in range(10):
+        registry.inc("by_subject", 1, {"subject": f"s{i}"})
+    registry.observe("by_subject", 5.0)
+    registry.inc("by_subject", 1, {"subject": "s0"})
+
+    counters = registry.snapshot().counters
+    assert counters[("by_subject", (("subject", "s0"),))] == 2
+    assert counters[("by_subject", metrics.OVERFLOW_LABELS)] == 7
+    assert len(counters) == 4
+    assert registry.overflowed == 7
+    assert "metrics_series_overflow 7" in registry.render_prometheus()
+    assert not registry.snapshot().histograms
+
+
+def test_rollups_replace_per_sample_logs(monkeypatch):
+    logged = []
+    monkeypatch.setattr(metrics, "structured_log", logged.append)
+    now = [0.0]
+    registry = MetricsRegistry(rollup_interval_s=60, clock=lambda: now[0])
+
+    for i in range(500):
+        registry.observe("chat_latency_ms", float(i), {"plan": "free"})
+        registry.inc("chat_requests", 1, {"status": "200"})
+    assert logged == []
+
+    now[0] = 61.0
+    registry.inc("chat_requests", 1, {"status": "200"})
+    by_name = {event["name"]: event for event in logged}
+    assert set(by_name) == {"chat_latency_ms", "chat_requests"}
+    assert by_name["chat_requests"]["series"] == [{"labels": {"status": "200"}, "value": 501}]
+    latency = by_name["chat_latency_ms"]["series"][0]
+    assert (latency["count"], latency["p50_le"], latency["p99_le"]) == (500, 250, 500)
+
+    logged.clear()
+    registry.inc("chat_requests", 3, {"status": "200"})
+    assert registry.flush_rollup() == 1
+    assert logged[0]["series"] == [{"labels": {"status": "200"}, "value": 3}]
+
+
+def test_metrics_endpoint_gated_by_setting(monkeypatch):
+    app = FastAPI()
+    app.include_router(metrics_router.router)
+    client = TestClient(app)
+    metrics.counter("endpoint_probe", 1, {"route": "/metrics"})
+
+    monkeypatch.setattr(metrics_router, "get_settings", lambda: SimpleNamespace(metrics_enabled=0))
+    assert client.get("/metrics").status_code == 404
+
+    monkeypatch.setattr(metrics_router, "get_settings", lambda: SimpleNamespace(metrics_enabled=1))
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'endpoint_probe{route="/metrics"}' in response.text
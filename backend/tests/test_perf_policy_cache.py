@@ -0,0 +1,137 @@
+"""
+Policy decision cache tests.
+
+- Cached decisions match uncached ones (signature and limits) across plans,
+  operations, hints and requested params; callers get independent copies
+- Keys are exact: inputs the normalizers treat differently (enum vs string
+  tools, tuple vs list regions) never share an entry
+- An accepted change control drops the tenant's cached decisions; a denied
+  one does not
+- Inside policy_request_scope one request resolves tenant caps once
+- Inputs without an exact key are decided uncached
+"""
+
+import pytest
+
+from backend.app.governance import policy_engine
+from backend.app.governance.audit import AuditLog
+from backend.app.governance.change_control import ChangeRequest, ChangeType, apply_change_control
+from backend.app.governance.policy_cache import configure_policy_cache, get_policy_cache, policy_request_scope
+from backend.app.governance.policy_engine import OperationType, PolicyRequest, decide_policy
+from backend.app.governance.rbac import Role
+from backend.app.governance.tenant import FeatureFlag, PlanTier, TenantConfig, ToolKind
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    configure_policy_cache()
+    yield
+    configure_policy_cache()
+
+
+def _tenant(plan=PlanTier.PRO, tenant_id="tenant-a"):
+    return TenantConfig(
+        tenant_id=tenant_id,
+        plan=plan,
+        regions=["us-east", "eu-west"],
+        enabled_features={FeatureFlag.RESEARCH_ENABLED, FeatureFlag.MEMORY_ENABLED, FeatureFlag.DEEPTHINK_ENABLED},
+    )
+
+
+def _uncached(req):
+    return policy_engine._decide_policy(req, None)
+
+
+def test_cached_decisions_match_uncached():
+    requests = []
+    for plan in PlanTier:
+        for op in OperationType:
+            requests.append(PolicyRequest(tenant_config=_tenant(plan), operation=op))
+            requests.append(PolicyRequest(
+                tenant_config=_tenant(plan), operation=op,
+                request_hints={"requested_research": True, "requested_tools": ["WEB"]},
+                requested={"max_tool_calls": 2, "max_facts": 1, "logging_verbosity": "MINIMAL", "region": "us-east"},
+            ))
+    requests.append(PolicyRequest(tenant_config={"tenant_id": "t", "plan": "MAX", "enabled_features": ["MEMORY_ENABLED"]}, operation=OperationType.MEMORY_READ))
+    requests.append(PolicyRequest(tenant_config={"tenant_id": "t", "prompt": "x"}, operation=OperationType.LOGGING))
+    requests.append(PolicyRequest(tenant_config=None, operation=OperationType.LOGGING))
+
+    for _ in range(2):
+        for req in requests:
+            assert decide_policy(req).as_dict() == _uncached(req).as_dict()
+    cache = get_policy_cache()
+    assert cache.hits == len(requests) and len(cache) == len(requests)
+
+    first = decide_policy(requests[1])
+    first.limits.clamp_notes.append("MUTATED")
+    first.limits.allowed_tools.clear()
+    assert decide_policy(requests[1]).as_dict() == _uncached(requests[1]).as_dict()
+
+
+def test_keys_distinguish_types_the_normalizers_treat_differently():
+    tenant = _tenant(PlanTier.ENTERPRISE)
+    as_str = PolicyRequest(tenant_config=tenant, operation=OperationType.TOOL_CALL, request_hints={"requested_tools": ["WEB"]})
+    as_enum = PolicyRequest(tenant_config=tenant, operation=OperationType.TOOL_CALL, request_hints={"requested_tools": [ToolKind.WEB]})
+    listed = {"tenant_id": "t", "plan": "PRO", "regions": ["us-east"], "enabled_features": ["RESEARCH_ENABLED"]}
+    tupled = dict(listed, regions=("us-east",))
+    by_list = PolicyRequest(tenant_config=listed, operation=OperationType.TOOL_CALL, requested={"region": "us-east"})
+    by_tuple = PolicyRequest(tenant_config=tupled, operation=OperationType.TOOL_CALL, requested={"region": "us-east"})
+
+    for req in (as_str, as_enum, by_list, by_tuple, as_str, by_tuple):
+        assert decide_policy(req).as_dict() == _uncached(req).as_dict()
+    assert decide_policy(by_list).allowed and not decide_policy(by_tuple).allowed
+    assert len(get_policy_cache()) == 4
+
+
+def test_accepted_change_control_invalidates_tenant():
+    tenant, other = _tenant(tenant_id="tenant-a"), _tenant(tenant_id="tenant-b")
+    for cfg in (tenant, other):
+        for op in (OperationType.TOOL_CALL, OperationType.MEMORY_READ):
+            decide_policy(PolicyRequest(tenant_config=cfg, operation=op))
+    cache = get_policy_cache()
+    assert len(cache) == 4
+
+    denied = apply_change_control(tenant, ChangeRequest("tenant-a", Role.OWNER, ChangeType.POLICY_PACK, "1.1.0", "1.0.0", now_ms=1), AuditLog())
+    assert not denied.allow and len(cache) == 4
+
+    accepted = apply_change_control(tenant, ChangeRequest("tenant-a", Role.OWNER, ChangeType.POLICY_PACK, "1.0.0", "1.1.0", now_ms=1), AuditLog())
+    assert accepted.allow and len(cache) == 2
+    decide_policy(PolicyRequest(tenant_config=other, operation=OperationType.TOOL_CALL))
+    assert cache.hits == 1
+
+
+def test_request_scope_resolves_caps_once(monkeypatch):
+    calls = []
+    resolve = policy_engine.resolve_tenant_caps
+
+    def counting(cfg, hints=None):
+        calls.append(cfg.tenant_id)
+        return resolve(cfg, hints)
+
+    monkeypatch.setattr(policy_engine, "resolve_tenant_caps", counting)
+    tenant = _tenant(PlanTier.MAX)
+    ops = [
+        (OperationType.TOOL_CALL, {"tool_kind": "WEB"}),
+        (OperationType.MEMORY_READ, {"max_facts": 4}),
+        (OperationType.MEMORY_WRITE_PHASE17, None),
+        (OperationType.LOGGING, {"logging_verbosity": "MINIMAL"}),
+    ]
+    with policy_request_scope():
+        with policy_request_scope():
+            decisions = [decide_policy(PolicyRequest(tenant_config=tenant, operation=op, requested=req)) for op, req in ops]
+    assert calls == ["tenant-a"]
+    assert all(d.allowed for d in decisions)
+
+    configure_policy_cache()
+    decide_policy(PolicyRequest(tenant_config=tenant, operation=OperationType.LOGGING))
+    decide_policy(PolicyRequest(tenant_config=tenant, operation=OperationType.MEMORY_READ))
+    assert len(calls) == 3
+
+
+def test_unfreezable_inputs_are_decided_uncached():
+    class Opaque:
+        pass
+
+    req = PolicyRequest(tenant_config=_tenant(), operation=OperationType.TOOL_CALL, request_hints={"requested_tools": ["WEB"], "extra": Opaque()})
+    assert decide_policy(req).as_dict() == _uncached(req).as_dict()
+    assert len(get_policy_cache()) == 0
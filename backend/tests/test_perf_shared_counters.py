@@ -0,0 +1,267 @@
+"""
+Shared quota/cost counter backend tests.
+
+- In-process backend: counters keep their first TTL, multi-key token takes
+  are all-or-nothing with the right retry-after
+- Shared memory: several worker processes on one mmap'd table never lose an
+  increment and never hand out more tokens than the bucket holds, including
+  through quota_precheck and CostPolicy's global daily budget
+- Redis backend plumbing (pipelined script calls, MGET, key prefix) against a
+  stand-in client that applies the scripts' semantics
+- Batching: increments reach the inner backend in few flushes with exact
+  totals, token leases across workers never exceed capacity, and an
+  unreachable inner backend degrades to local state
+"""
+
+import multiprocessing
+
+import pytest
+
+from backend.app.cost.storage import DailyCounter, RollingWindowCounter
+from backend.app.perf import shared_counters
+from backend.app.perf.shared_counters import (
+    BatchingCounterBackend,
+    InProcessCounterBackend,
+    RedisCounterBackend,
+    SharedMemoryCounterBackend,
+)
+from backend.app.security import quotas
+
+T0 = 1_700_000_000.0
+WORKERS = 4
+
+
+class Clock:
+    def __init__(self, now=T0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def shm_path(tmp_path):
+    return str(tmp_path / "limiter.shm")
+
+
+@pytest.fixture
+def installed_backend():
+    yield shared_counters.set_counter_backend
+    shared_counters.set_counter_backend(None)
+
+
+def test_in_process_counters_and_all_or_nothing_buckets():
+    clock = Clock()
+    backend = InProcessCounterBackend(clock=clock)
+    assert backend.incr("c", 5, ttl_s=10) == 5
+    clock.now += 6
+    assert backend.incr("c", 1, ttl_s=10) == 6
+    clock.now += 5
+    assert backend.get("c") == 0
+
+    assert backend.take_tokens(["a"], 2, 1.0, ttl_s=60) == (1, 0.0)
+    assert backend.take_tokens(["a"], 2, 1.0, ttl_s=60) == (1, 0.0)
+    # "a" is empty, so "b" must not be charged either.
+    granted, retry = backend.take_tokens(["b", "a"], 2, 1.0, ttl_s=60)
+    assert granted == 0 and retry == pytest.approx(1.0)
+    assert backend.take_tokens(["b"], 2, 1.0, ttl_s=60, want=5) == (2, 0.0)
+
+
+def _shm_worker(path, rounds, results):
+    backend = SharedMemoryCounterBackend(path, slots=1024)
+    granted = 0
+    for _ in range(rounds):
+        backend.incr("hits", 1, ttl_s=600)
+        granted += backend.take_tokens(["actor", "actor|ip"], 40, 0.0, ttl_s=600)[0]
+    shared_counters.set_counter_backend(backend)
+    allowed = 0
+    for _ in range(rounds):
+        ctx = quotas.QuotaContext(
+            plan="free", actor_key="quota-actor", ip_hash="ip", est_input_tokens=1, est_output_cap=None, now_monotonic=0.0
+        )
+        allowed += quotas.quota_precheck(ctx).allowed
+    results.put((granted, allowed))
+    backend.close()
+
+
+def test_shared_memory_is_exact_across_processes(shm_path, monkeypatch):
+    monkeypatch.delenv("QUOTA_FORCE_BLOCK", raising=False)
+    ctx = multiprocessing.get_context("fork")
+    results = ctx.Queue()
+    procs = [ctx.Process(target=_shm_worker, args=(shm_path, 250, results)) for _ in range(WORKERS)]
+    for proc in procs:
+        proc.start()
+    outcomes = [results.get(timeout=60) for _ in procs]
+    for proc in procs:
+        proc.join(timeout=60)
+        assert proc.exitcode == 0
+
+    backend = SharedMemoryCounterBackend(shm_path, slots=1024)
+    try:
+        assert backend.get("hits") == WORKERS * 250
+        assert sum(granted for granted, _ in outcomes) == 40
+        # rpm=20 for the free plan, across all workers rather than per worker.
+        assert sum(allowed for _, allowed in outcomes) == quotas._PLAN_LIMITS["free"]["rpm"]
+    finally:
+        backend.close()
+
+
+def test_shared_memory_expiry_and_stripe_eviction(shm_path):
+    clock = Clock()
+    backend = SharedMemoryCounterBackend(shm_path, slots=64, clock=clock)
+    try:
+        backend.incr("short", 3, ttl_s=5)
+        assert backend.get("short") == 3
+        clock.now += 10
+        assert backend.get("short") == 0
+        assert backend.incr("short", 1, ttl_s=5) == 1
+        for i in range(200):
+            backend.incr(f"k{i}", 1, ttl_s=100 + i)
+        # One stripe of 64 slots: the keys expiring last survive, the rest were evicted.
+        assert backend.get("k199") == 1 and backend.get("k0") == 0 and backend.get("short") == 0
+        with pytest.raises(ValueError):
+            SharedMemoryCounterBackend(shm_path, slots=128)
+    finally:
+        backend.close()
+
+
+def test_cost_budgets_use_shared_backend(shm_path, installed_backend):
+    from backend.app.cost.policy import CostPolicy
+
+    first = SharedMemoryCounterBackend(shm_path, slots=1024)
+    second = SharedMemoryCounterBackend(shm_path, slots=1024)
+    try:
+        installed_backend(first)
+        worker_a = CostPolicy()
+        installed_backend(second)
+        worker_b = CostPolicy()
+        worker_a.global_daily.add("global", 300, now=T0)
+        worker_b.global_daily.add("global", 200, now=T0)
+        assert worker_a.global_daily.total("global", now=T0) == 500
+        assert worker_a.global_daily.total("global", now=T0 + 86400) == 0
+
+        window_a = RollingWindowCounter(3600, first, namespace="ip")
+        window_b = RollingWindowCounter(3600, second, namespace="ip")
+        window_a.add("ip-1", 10, now=T0)
+        window_b.add("ip-1", 5, now=T0 + 1800)
+        assert window_a.total("ip-1", now=T0 + 1800) == 15
+        assert window_b.total("ip-1", now=T0 + 3600 + 300 + 1) == 5
+    finally:
+        first.close()
+        second.close()
+
+
+class StandInScript:
+    """Mimics redis-py Script: runs a Python equivalent of the Lua source."""
+
+    def __init__(self, server, source):
+        self.server = server
+        self.source = source
+
+    def __call__(self, keys, args, client=None):
+        if self.source == shared_counters._INCR_LUA:
+            result = self.server.incr(keys[0], int(args[0]), int(args[1]))
+        else:
+            result = self.server.take(keys, *args)
+        if client is not None and client is not self.server:
+            client.results.append(result)
+            return client
+        return result
+
+
+class StandInPipeline:
+    def __init__(self):
+        self.results = []
+
+    def execute(self):
+        return self.results
+
+
+class StandInRedis:
+    def __init__(self):
+        self.data = {}
+        self.ttl = {}
+        self.buckets = InProcessCounterBackend()
+        self.round_trips = 0
+
+    def register_script(self, source):
+        return StandInScript(self, source)
+
+    def pipeline(self, transaction=True):
+        self.round_trips += 1
+        return StandInPipeline()
+
+    def mget(self, keys):
+        self.round_trips += 1
+        return [None if self.data.get(key) is None else str(self.data[key]) for key in keys]
+
+    def incr(self, key, amount, ttl_s):
+        self.data[key] = self.data.get(key, 0) + amount
+        self.ttl.setdefault(key, ttl_s)
+        return self.data[key]
+
+    def take(self, keys, capacity, rate, want, need, now, ttl_ms):
+        self.round_trips += 1
+        granted, retry = self.buckets.take_tokens(
+            keys, capacity, rate, ttl_s=ttl_ms / 1000, want=want, need=need, now=float(now)
+        )
+        return [granted, str(retry)]
+
+    def close(self):
+        return None
+
+
+def test_redis_backend_pipelines_and_prefixes_keys():
+    server = StandInRedis()
+    backend = RedisCounterBackend(server)
+    assert backend.incr_many({"a": (2, 10.5), "b": (3, 60)}) == {"a": 2, "b": 3}
+    assert server.round_trips == 1
+    assert server.ttl == {"limiter:a": 11, "limiter:b": 60}
+    assert backend.get_many(["a", "missing"]) == {"a": 2, "missing": 0}
+    assert backend.take_tokens(["x"], 2, 1.0, ttl_s=60, now=T0) == (1, 0.0)
+    backend.take_tokens(["x"], 2, 1.0, ttl_s=60, now=T0)
+    granted, retry = backend.take_tokens(["x"], 2, 1.0, ttl_s=60, now=T0)
+    assert granted == 0 and retry == pytest.approx(1.0)
+
+
+def test_batching_flushes_in_few_round_trips_with_exact_totals():
+    clock = Clock(0.0)
+    server = StandInRedis()
+    worker_a = BatchingCounterBackend(RedisCounterBackend(server), flush_interval_s=0.25, max_pending=50, clock=clock)
+    worker_b = BatchingCounterBackend(RedisCounterBackend(server), flush_interval_s=0.25, max_pending=50, clock=clock)
+    for i in range(200):
+        worker_a.incr("tokens", 10, ttl_s=60)
+        worker_b.incr("tokens", 5, ttl_s=60)
+    assert server.round_trips <= 8
+    # Each worker always sees its own increments, others' within one interval.
+    assert worker_a.get("tokens") >= 200 * 10
+    worker_a.flush()
+    worker_b.flush()
+    clock.now += 0.3
+    assert worker_a.get("tokens") == worker_b.get("tokens") == 200 * 15 == server.data["limiter:tokens"]
+
+
+def test_batching_token_leases_never_exceed_capacity():
+    inner = InProcessCounterBackend(clock=lambda: T0)
+    workers = [BatchingCounterBackend(inner, token_lease=4) for _ in range(3)]
+    granted = 0
+    for i in range(90):
+        granted += workers[i % 3].take_tokens(["actor"], 20, 0.0, ttl_s=60)[0]
+    assert granted == 20
+
+
+def test_batching_degrades_to_local_state_when_inner_fails():
+    class Down(InProcessCounterBackend):
+        def incr_many(self, items):
+            raise ConnectionError("down")
+
+        get_many = take_tokens = incr_many
+
+    clock = Clock(0.0)
+    backend = BatchingCounterBackend(Down(), flush_interval_s=0.0, clock=clock)
+    assert backend.incr("tokens", 7, ttl_s=60) == 7
+    assert backend.incr("tokens", 3, ttl_s=60) == 10
+    assert backend.get("tokens") == 10
+    assert DailyCounter(backend).total("x") == 0
+    allowed = [backend.take_tokens(["actor"], 2, 0.0, ttl_s=60)[0] for _ in range(3)]
+    assert allowed == [1, 1, 0]
@@ -0,0 +1,129 @@
+"""
+Striped-lock concurrency tests.
+
+Hammers shared limiter state from many threads with a tiny GIL switch
+interval so interleavings are frequent:
+- StripedLocks maps keys to stable stripes; hold_many orders stripes so
+  opposite-order callers cannot deadlock
+- No lost updates in RollingWindowCounter, DailyCounter, quota in-flight
+  counts, provider circuit failures and CircuitBreaker failures
+- Quota token buckets never hand out more tokens than the limit
+"""
+
+import sys
+import threading
+
+import pytest
+
+from backend.app.cost.breaker import CircuitBreaker
+from backend.app.cost.storage import DailyCounter, RollingWindowCounter
+from backend.app.perf.limiter_store import LimiterStore
+from backend.app.perf.striped import StripedLocks
+from backend.app.providers import circuit
+from backend.app.security import quotas
+
+THREADS = 8
+T0 = 1_700_000_000.0
+
+
+@pytest.fixture(autouse=True)
+def frequent_switches():
+    previous = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        yield
+    finally:
+        sys.setswitchinterval(previous)
+
+
+def _run_threads(fn, threads=THREADS):
+    barrier = threading.Barrier(threads)
+    errors = []
+
+    def runner(idx):
+        try:
+            barrier.wait()
+            fn(idx)
+        except Exception as exc:  # noqa: BLE001
+            errors.append(exc)
+
+    workers = [threading.Thread(target=runner, args=(i,)) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=60)
+    assert not any(worker.is_alive() for worker in workers), "deadlock"
+    assert not errors, errors
+
+
+def test_stripes_are_stable_and_hold_many_does_not_deadlock():
+    locks = StripedLocks(stripes=48)
+    assert len(locks) == 64
+    assert locks.index("actor-1") == StripedLocks(stripes=64).index("actor-1")
+    keys = [f"k{i}" for i in range(8)]
+    counter = {"n": 0}
+
+    def work(idx):
+        order = keys if idx % 2 else list(reversed(keys))
+        for _ in range(300):
+            with locks.hold_many(order):
+                with locks.hold(order[0]):
+                    counter["n"] += 1
+
+    _run_threads(work)
+    assert counter["n"] == THREADS * 300
+
+
+def test_cost_counters_lose_no_updates():
+    rolling = RollingWindowCounter(60)
+    daily = DailyCounter()
+
+    def work(idx):
+        for i in range(2_000):
+            rolling.add("ip-1", 1, now=T0 + (i % 3))
+            daily.add("user-1", 2, now=T0)
+
+    _run_threads(work)
+    assert rolling.total("ip-1", now=T0 + 3) == THREADS * 2_000
+    assert daily.total("user-1", now=T0) == THREADS * 2_000 * 2
+
+
+def test_quota_in_flight_and_buckets_are_exact(monkeypatch):
+    monkeypatch.setattr(quotas, "_buckets", LimiterStore(1_000))
+    monkeypatch.setattr(quotas, "_in_flight", LimiterStore(1_000))
+    monkeypatch.delenv("QUOTA_FORCE_BLOCK", raising=False)
+
+    _run_threads(lambda idx: [quotas.quota_begin("actor") for _ in range(500)])
+    assert quotas._in_flight.get("actor")["count"] == THREADS * 500
+    _run_threads(lambda idx: [quotas.quota_end("actor") for _ in range(500)])
+    assert "actor" not in quotas._in_flight
+
+    allowed = []
+
+    def spend(idx):
+        for _ in range(50):
+            ctx = quotas.QuotaContext(
+                plan="free", actor_key="spender", ip_hash="ip", est_input_tokens=1, est_output_cap=None, now_monotonic=T0
+            )
+            if quotas.quota_precheck(ctx).allowed:
+                allowed.append(idx)
+
+    _run_threads(spend)
+    assert len(allowed) == quotas._PLAN_LIMITS["free"]["rpm"]
+
+
+def test_circuits_count_every_failure(monkeypatch):
+    monkeypatch.setattr(circuit, "_FAILURES", {})
+    monkeypatch.setattr(circuit, "_OPEN_UNTIL", {})
+    breaker = CircuitBreaker()
+
+    def work(idx):
+        for _ in range(400):
+            circuit.record_failure("provider:model", window_seconds=3600, failure_threshold=10**9, open_seconds=30)
+            breaker.on_failure("provider:model", now=T0)
+
+    _run_threads(work)
+    assert len(circuit._FAILURES["provider:model"]) == THREADS * 400
+    assert sum(breaker._states["provider:model"].failures.values()) == THREADS * 400
+    circuit.record_success("provider:model")
+    assert circuit.is_open("provider:model", open_seconds=30) == (False, None)
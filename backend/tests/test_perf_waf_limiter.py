@@ -0,0 +1,166 @@
+"""
+Async WAF limiter tests.
+
+Uses fake async connections so no database is required:
+- One statement (one round trip) per DB rate check, covering lockout and both
+  windows, with every placeholder bound
+- Disabled windows are left out of the statement
+- Prefilter admits from DB-granted tokens, folds those hits into the next
+  increment, expires on bucket rollover and caches lockouts
+- DB errors fall back to the in-memory limiter, keeping prefilter hits
+"""
+
+import asyncio
+import re
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+import pytest
+
+from backend.app.perf.limiter_store import LimiterStore
+from backend.app.waf import guard
+from backend.app.waf.guard import LimitWindow, RateKey
+from backend.app.waf.limiter import TokenBucketPrefilter, build_rate_check_sql, rate_check_params
+
+WINDOWS = (LimitWindow(5, 10), LimitWindow(60, 60))
+NOW = 1_700_000_005.0
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, sql, params=None):
+        if self.conn.fail:
+            raise RuntimeError("server closed the connection")
+        self.conn.executed.append((sql, params))
+
+    async def fetchone(self):
+        return self.conn.rows.pop(0)
+
+
+class FakeConn:
+    def __init__(self, rows=(), fail=False):
+        self.rows = list(rows)
+        self.fail = fail
+        self.executed = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+
+@pytest.fixture()
+def fake_db(monkeypatch):
+    def install(conn, share=0.5):
+        @asynccontextmanager
+        async def connection():
+            yield conn
+
+        monkeypatch.setattr(guard, "async_db_connection", connection)
+        monkeypatch.setattr(guard, "_prefilter", TokenBucketPrefilter(share))
+        monkeypatch.setattr(guard, "_mem_windows", LimiterStore(1000))
+        monkeypatch.setattr(guard, "_mem_locks", LimiterStore(1000))
+        return conn
+
+    return install
+
+
+def _ts(value: float) -> datetime:
+    return datetime.fromtimestamp(value, tz=timezone.utc)
+
+
+def _check(key, now_ts=NOW, windows=WINDOWS):
+    return asyncio.run(guard._rate_check_async(key, windows, now_ts))
+
+
+def test_statement_binds_every_placeholder():
+    for count in range(3):
+        sql = build_rate_check_sql(count)
+        windows = [(5, 10), (60, 60)][:count]
+        params = rate_check_params("ip", "h", NOW, windows, [1] * count, (30, 120), 600)
+        assert set(re.findall(r"%\((\w+)\)s", sql)) == set(params)
+        assert sql.count("INSERT INTO rate_limits") == count + 1
+    assert params["start0"] == _ts(NOW - 5) and params["start1"] == _ts(NOW - 25)
+    with pytest.raises(ValueError):
+        build_rate_check_sql(-1)
+
+
+def test_one_round_trip_per_check_and_disabled_windows_skipped(fake_db):
+    conn = fake_db(FakeConn(rows=[(None, None, None, 1, 1), (None, None, None, 2)]), share=0)
+    key = RateKey(scope="user", value="u1")
+    assert _check(key) == (True, None, False)
+    assert len(conn.executed) == 1
+    sql, params = conn.executed[0]
+    assert sql == build_rate_check_sql(2)
+    assert (params["scope"], params["subject"], params["inc0"], params["inc1"]) == ("user", "u1", 1, 1)
+
+    assert _check(key, windows=(LimitWindow(0, 10), LimitWindow(60, 60))) == (True, None, False)
+    sql, params = conn.executed[1]
+    assert sql == build_rate_check_sql(1)
+    assert params["limit0"] == 60 and "limit1" not in params
+
+
+def test_strike_and_lockout_map_to_retry_after(fake_db):
+    conn = fake_db(
+        FakeConn(rows=[(None, 1, _ts(NOW + 30), 6, None), (_ts(NOW + 20), None, None, None, None)]), share=0
+    )
+    assert _check(RateKey(scope="user", value="a")) == (False, 30, False)
+    assert _check(RateKey(scope="user", value="b")) == (False, 20, False)
+    assert len(conn.executed) == 2
+
+
+def test_prefilter_tokens_fold_into_next_increment(fake_db):
+    conn = fake_db(FakeConn(rows=[(None, None, None, 1, 1), (None, None, None, 4, 4)]), share=0.5)
+    key = RateKey(scope="user", value="u2")
+    assert _check(key) == (True, None, False)
+    # headroom min(5 - 1, 60 - 1) = 4 -> two local tokens
+    assert _check(key, NOW + 1) == (True, None, False)
+    assert _check(key, NOW + 2) == (True, None, False)
+    assert len(conn.executed) == 1
+    assert _check(key, NOW + 3) == (True, None, False)
+    _, params = conn.executed[1]
+    assert (params["inc0"], params["inc1"]) == (3, 3)
+
+
+def test_prefilter_expires_on_bucket_rollover_and_caches_lockout():
+    prefilter = TokenBucketPrefilter(0.5)
+    key = ("user", "u3")
+    prefilter.record(key, (10, 60), [5, 60], [1, 1], NOW)
+    assert prefilter.admit(key, (10, 60), NOW) == (True, None)
+    assert prefilter.admit(key, (20, 60), NOW) is None
+    assert prefilter.take_pending(key, (20, 60)) == (1, 2)
+
+    prefilter.record(key, (20, 60), [5, 60], [6, None], NOW, locked_until=NOW + 30)
+    assert prefilter.admit(key, (20, 60), NOW + 10) == (False, 20)
+    assert prefilter.admit(key, (30, 60), NOW + 31) is None
+
+    prefilter.record(key, (30, 60), [5, 60], [5, 9], NOW + 31)
+    assert len(prefilter) == 0
+
+
+def test_db_error_falls_back_to_memory(fake_db):
+    fake_db(FakeConn(fail=True), share=0.5)
+    key = RateKey(scope="user", value="u4")
+    results = [_check(key, NOW) for _ in range(6)]
+    assert [allowed for allowed, _, _ in results] == [True] * 5 + [False]
+    assert all(used_memory for _, _, used_memory in results)
+
+
+def test_db_error_keeps_prefilter_hits_in_memory_fallback(fake_db):
+    conn = fake_db(FakeConn(rows=[(None, None, None, 1, 1)]), share=0.5)
+    key = RateKey(scope="user", value="u5")
+    assert _check(key) == (True, None, False)
+    # two hits admitted locally, never written to the DB
+    assert _check(key, NOW + 1) == (True, None, False)
+    assert _check(key, NOW + 2) == (True, None, False)
+    conn.fail = True
+    # this hit plus the two pending ones land in the memory window: 3 of 5
+    assert _check(key, NOW + 3) == (True, None, True)
+    assert guard._mem_windows.get(("user", key.hashed().value, 10, int(NOW) - int(NOW) % 10), 0, now=NOW + 3) == 3
+    assert [_check(key, NOW + 4)[0] for _ in range(3)] == [True, True, False]
@@ -0,0 +1,87 @@
+"""
+Phase 12 Step 7: Governed Plan Cache Tests
+
+- Cached (DecisionState, ControlPlan, OutputPlan) triples equal fresh assembly
+- Bounded LRU eviction and hit/miss accounting
+- Key includes schema versions; the cache is cleared between tests
+- Concurrent lookups are safe
+"""
+
+import threading
+
+from backend.mci_backend import governed_response_runtime as grr
+from backend.mci_backend.governed_response_runtime import PLAN_CACHE_SCHEMA, PlanCache, get_plan_cache
+
+TEXTS = [
+    "hello",
+    "Explain how TCP congestion control works",
+    "Should I delete the production database to save costs?",
+    "I want to quit my job tomorrow and move abroad",
+    "What is a binary search tree?",
+]
+
+
+def test_cached_plans_equal_fresh_assembly():
+    cache = get_plan_cache()
+    cache.clear()
+    for text in TEXTS:
+        first = grr._assemble_plans(text)
+        second = grr._assemble_plans(text)
+        assert second is first
+        assert first == grr._assemble_plans_uncached(text)
+
+
+def test_lru_eviction_and_stats():
+    cache = PlanCache(max_entries=2)
+    plans = {text: grr._assemble_plans_uncached(text) for text in TEXTS[:3]}
+    keys = {text: PlanCache.key(text) for text in plans}
+    cache.put(keys[TEXTS[0]], plans[TEXTS[0]])
+    cache.put(keys[TEXTS[1]], plans[TEXTS[1]])
+    assert cache.get(keys[TEXTS[0]]) is plans[TEXTS[0]]
+    cache.put(keys[TEXTS[2]], plans[TEXTS[2]])
+    # TEXTS[1] was least recently used
+    assert cache.get(keys[TEXTS[1]]) is None
+    assert cache.get(keys[TEXTS[0]]) is plans[TEXTS[0]]
+    stats = cache.stats()
+    assert (stats.entries, stats.hits, stats.misses, stats.evictions) == (2, 2, 1, 1)
+    assert abs(stats.hit_rate - 2 / 3) < 1e-9
+
+
+def test_key_depends_on_text_and_schema(monkeypatch):
+    assert PlanCache.key("hello") == PlanCache.key("hello")
+    assert PlanCache.key("hello") != PlanCache.key("hello ")
+    before = PlanCache.key("hello")
+    monkeypatch.setattr(grr, "PLAN_CACHE_SCHEMA", PLAN_CACHE_SCHEMA + "-next")
+    assert PlanCache.key("hello") != before
+
+
+def test_cache_starts_empty_for_each_test():
+    # conftest clears the process-wide cache around every test
+    assert get_plan_cache().stats().entries == 0
+    grr._assemble_plans("hello")
+    assert get_plan_cache().stats().entries == 1
+
+
+def test_concurrent_lookups_share_one_entry_per_text():
+    cache = get_plan_cache()
+    cache.clear()
+    results = {text: [] for text in TEXTS}
+    errors = []
+
+    def worker():
+        try:
+            for _ in range(20):
+                for text in TEXTS:
+                    results[text].append(grr._assemble_plans(text))
+        except Exception as exc:  # noqa: BLE001
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+    assert cache.stats().entries == len(TEXTS)
+    for text, seen in results.items():
+        assert all(plans == seen[0] for plans in seen)
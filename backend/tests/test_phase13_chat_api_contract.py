@@ -28,11 +28,18 @@ def _stub_result(text: str = "hello") -> mc.ModelInvocationResult:
     )
 
 
+def _async_stub(result: mc.ModelInvocationResult):
+    async def _render(*args, **kwargs):
+        return result
+
+    return _render
+
+
 def test_request_rejects_extra_fields(monkeypatch):
     monkeypatch.setattr("app.main.assemble_decision_state", lambda *args, **kwargs: None)
     monkeypatch.setattr("app.main.assemble_control_plan", lambda *args, **kwargs: None)
     monkeypatch.setattr("app.main.assemble_output_plan", lambda *args, **kwargs: _stub_output_plan())
-    monkeypatch.setattr("app.main.render_governed_response", lambda *args, **kwargs: _stub_result())
+    monkeypatch.setattr("app.main.render_governed_response_async", _async_stub(_stub_result()))
 
     payload = {"user_text": "hi", "extra": "nope"}
     res = client.post("/api/chat", json=payload)
@@ -73,7 +80,7 @@ def test_valid_request_returns_bounded_response(monkeypatch):
     monkeypatch.setattr("app.main.assemble_decision_state", lambda *args, **kwargs: None)
     monkeypatch.setattr("app.main.assemble_control_plan", lambda *args, **kwargs: None)
     monkeypatch.setattr("app.main.assemble_output_plan", lambda *args, **kwargs: _stub_output_plan("ANSWER"))
-    monkeypatch.setattr("app.main.render_governed_response", lambda *args, **kwargs: _stub_result("rendered"))
+    monkeypatch.setattr("app.main.render_governed_response_async", _async_stub(_stub_result("rendered")))
 
     res = client.post("/api/chat", json={"user_text": "hello"})
     assert res.status_code == 200
@@ -90,10 +97,10 @@ def test_pipeline_error_sanitized(monkeypatch):
     monkeypatch.setattr("app.main.assemble_control_plan", lambda *args, **kwargs: None)
     monkeypatch.setattr("app.main.assemble_output_plan", lambda *args, **kwargs: _stub_output_plan("ANSWER"))
 
-    def _raise(*args, **kwargs):
+    async def _raise(*args, **kwargs):
         raise RuntimeError("boom")
 
-    monkeypatch.setattr("app.main.render_governed_response", _raise)
+    monkeypatch.setattr("app.main.render_governed_response_async", _raise)
 
     res = client.post("/api/chat", json={"user_text": "hello"})
     assert res.status_code == 500
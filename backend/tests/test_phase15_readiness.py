@@ -39,7 +39,10 @@ def test_ready_prod_missing_env_fails(client: TestClient, monkeypatch: pytest.Mo
 def test_chat_internal_errors_are_sanitized(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
     # Force orchestrator call to raise to verify sanitized response
     with monkeypatch.context() as m:
-        m.setattr("backend.app.main.render_governed_response", lambda *_args, **_kwargs: (_ for _ in ()).throw(Exception("boom")))  # type: ignore
+        async def _boom(*_args, **_kwargs):
+            raise Exception("boom")
+
+        m.setattr("backend.app.main.render_governed_response_async", _boom)
         payload = {"user_text": "hi"}
         resp = client.post(
             "/api/chat",
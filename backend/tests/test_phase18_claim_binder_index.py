@@ -0,0 +1,140 @@
+"""
+Phase 18 Step 4: Inverted-Index Claim Binding Tests
+
+Differential tests proving bind_claims_to_sources (inverted index, lazy
+CitationRefs) yields exactly the bindings of the per-claim full scan.
+"""
+
+import random
+from dataclasses import dataclass
+from typing import Optional
+
+from backend.app.research.citations import GRADE_TO_SCORE, make_citation_ref
+from backend.app.research.claim_binder import (
+    MAX_CITATIONS_PER_CLAIM,
+    bind_claims_and_citations,
+    bind_claims_to_sources,
+    compute_overlap_score,
+    compute_tie_break_hash,
+    extract_claims,
+    tokenize_text,
+)
+from backend.app.retrieval.types import SourceBundle, SourceSnippet, ToolKind
+
+
+def reference_bind(claims, sources):
+    bindings = {}
+    for claim in claims:
+        claim_tokens = tokenize_text(claim.text)
+        candidates = []
+        for source in sources:
+            if hasattr(source, "source"):
+                bundle, credibility = source.source, getattr(source, "credibility", None)
+            else:
+                bundle, credibility = source, None
+            credibility_score = 0
+            if credibility:
+                credibility_score = getattr(credibility, "score", 0)
+                if credibility_score is None:
+                    credibility_score = GRADE_TO_SCORE.get(getattr(credibility, "grade", "UNKNOWN"), 0)
+            published_date = None
+            if bundle.metadata:
+                for date_field in ["published_at", "date", "updated_at"]:
+                    if date_field in bundle.metadata:
+                        published_date = bundle.metadata[date_field]
+                        break
+            for idx, snippet in enumerate(bundle.snippets):
+                overlap = compute_overlap_score(claim_tokens, tokenize_text(snippet.text))
+                if overlap >= 2 or any(t in bundle.domain.lower() for t in claim_tokens):
+                    ref = make_citation_ref(
+                        bundle.source_id, bundle.url, bundle.domain, bundle.title, idx,
+                        len(snippet.text), published_date, credibility,
+                    )
+                    candidates.append((
+                        credibility_score, overlap, 1 if published_date else 0, bundle.domain, bundle.url,
+                        idx, compute_tie_break_hash(claim.claim_id, bundle.source_id, idx), ref,
+                    ))
+        candidates.sort(key=lambda x: (-x[0], -x[1], -x[2], x[3], x[4], x[5], x[6]))
+        seen, selected = set(), []
+        for candidate in candidates:
+            ref = candidate[7]
+            if (ref.source_id, ref.snippet_index) not in seen:
+                selected.append(ref)
+                seen.add((ref.source_id, ref.snippet_index))
+            if len(selected) >= MAX_CITATIONS_PER_CLAIM:
+                break
+        bindings[claim.claim_id] = selected
+    return bindings
+
+
+@dataclass
+class _Report:
+    score: Optional[int]
+    grade: str
+
+
+@dataclass
+class _Graded:
+    source: SourceBundle
+    credibility: _Report
+
+
+WORDS = [
+    "climate", "policy", "energy", "solar", "wind", "carbon", "tax", "report", "growth",
+    "market", "python", "release", "version", "error", "nasa", "europa", "science", "data",
+]
+DOMAINS = ["nasa.gov", "europa.eu", "example.com", "science.org", "data.io", "blog.net"]
+
+
+def _sentence(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n))
+
+
+def random_sources(rng: random.Random, n_sources: int, n_snippets: int) -> list:
+    sources = []
+    for i in range(n_sources):
+        metadata = rng.choice([{}, {"published_at": "2025-01-01"}, {"date": "2024-06-01"}])
+        bundle = SourceBundle(
+            source_id=f"src_{rng.randrange(max(1, n_sources - 1)):03d}",
+            tool=ToolKind.WEB,
+            url=f"https://{rng.choice(DOMAINS)}/{rng.randrange(5)}",
+            domain=rng.choice(DOMAINS),
+            title=rng.choice([None, "Title"]),
+            retrieved_at="2026-01-29T00:00:00Z",
+            snippets=[SourceSnippet(text=_sentence(rng, rng.randint(0, 20))) for _ in range(rng.randint(0, n_snippets))],
+            metadata=metadata,
+        )
+        roll = rng.random()
+        if roll < 0.3:
+            sources.append(_Graded(bundle, _Report(rng.choice([None, 40, 90]), rng.choice(["A", "C", "X"]))))
+        else:
+            sources.append(bundle)
+    return sources
+
+
+def test_index_binding_matches_full_scan_fuzz():
+    rng = random.Random(1804)
+    for _ in range(200):
+        answer = ". ".join(_sentence(rng, rng.randint(2, 9)) for _ in range(rng.randint(1, 14))) + "."
+        claims = extract_claims(answer)
+        sources = random_sources(rng, rng.randint(0, 8), 6)
+        assert bind_claims_to_sources(claims, sources) == reference_bind(claims, sources)
+
+
+def test_domain_match_binds_snippets_without_overlap():
+    claims = extract_claims("The nasa mission launched in 2024.")
+    source = SourceBundle(
+        source_id="s1", tool=ToolKind.WEB, url="https://nasa.gov/x", domain="nasa.gov", title=None,
+        retrieved_at="2026-01-29T00:00:00Z", snippets=[SourceSnippet(text="unrelated words only")], metadata={},
+    )
+    bindings = bind_claims_to_sources(claims, [source])
+    assert bindings == reference_bind(claims, [source])
+    assert [ref.snippet_index for ref in bindings[claims[0].claim_id]] == [0]
+
+
+def test_end_to_end_output_unchanged():
+    rng = random.Random(5)
+    sources = random_sources(rng, 10, 20)
+    answer = ". ".join(_sentence(rng, 7) for _ in range(50)) + "."
+    output = bind_claims_and_citations(answer, sources)
+    assert output.bindings == reference_bind(output.claims, sources)
@@ -0,0 +1,178 @@
+"""
+Phase 18 Step 6: Research Cache LRU/TTL/Size Tests
+
+- Without reads between puts, eviction is exactly the old FIFO order
+- get refreshes recency (LRU), TTL expires by time bucket
+- Byte budgets bound SourceBundle payloads; oversized values are never shared
+- Shared backend lets a second cache reuse results; backend errors read as misses
+"""
+
+import random
+
+from backend.app.research.cache import (
+    InMemoryCacheBackend,
+    RedisCacheBackend,
+    ResearchCache,
+    decode_cache_value,
+    encode_cache_value,
+    estimate_value_bytes,
+)
+from backend.app.retrieval.types import ToolKind
+from backend.tests.test_phase18_cache_dedup import make_test_bundle
+
+
+def fifo_reference(max_entries: int, ops):
+    order = []
+    values = {}
+    for key, value in ops:
+        if key in values:
+            order.remove(key)
+        elif len(values) >= max_entries:
+            values.pop(order.pop(0))
+        order.append(key)
+        values[key] = value
+    return values
+
+
+def test_put_only_eviction_matches_fifo_reference():
+    rng = random.Random(618)
+    for _ in range(50):
+        max_entries = rng.randint(1, 8)
+        ops = [(f"key{rng.randrange(15)}", rng.random()) for _ in range(rng.randint(0, 60))]
+        cache = ResearchCache(max_entries=max_entries)
+        for key, value in ops:
+            cache.put(key, value, created_bucket=0)
+        expected = fifo_reference(max_entries, ops)
+        assert cache.size() == len(expected)
+        for key in (f"key{i}" for i in range(15)):
+            assert cache.get(key) == expected.get(key)
+
+
+def test_get_refreshes_recency():
+    cache = ResearchCache(max_entries=3)
+    for key in ("key1", "key2", "key3"):
+        cache.put(key, key.upper(), created_bucket=0)
+    assert cache.get("key1") == "KEY1"
+    cache.put("key4", "KEY4", created_bucket=0)
+    assert cache.get("key2") is None
+    assert cache.get("key1") == "KEY1"
+    stats = cache.stats()
+    assert stats.evictions == 1
+    assert stats.hits == 2 and stats.misses == 1
+
+
+def test_ttl_by_time_bucket():
+    cache = ResearchCache(max_entries=10, ttl_buckets=2)
+    cache.put("key", "value", created_bucket=100)
+    assert cache.get("key", current_bucket=101) == "value"
+    assert cache.get("key") == "value"
+    assert cache.get("key", current_bucket=102) is None
+    assert cache.size() == 0
+    assert cache.stats().expirations == 1
+
+
+def test_byte_budget_evicts_and_rejects_oversized():
+    bundles = [
+        [make_test_bundle(f"src{i}", f"https://example.com/{i}", "example.com", "Title", ["x" * 400] * 3)]
+        for i in range(6)
+    ]
+    one = estimate_value_bytes(bundles[0])
+    cache = ResearchCache(max_entries=100, max_bytes=one * 3)
+    for i, value in enumerate(bundles):
+        cache.put(f"key{i}", value, created_bucket=0)
+        assert cache.bytes_used() <= one * 3
+    assert cache.size() == 3
+    assert [cache.get(f"key{i}") is not None for i in range(6)] == [False, False, False, True, True, True]
+
+    big = [make_test_bundle("big", "https://example.com/big", "example.com", "Big", ["y" * 500] * 5)] * 4
+    cache.put("key3", big, created_bucket=0)
+    assert cache.get("key3") is None
+    assert cache.stats().rejected == 1
+    assert cache.bytes_used() == one * 2
+
+
+def test_shared_backend_serves_other_worker():
+    backend = InMemoryCacheBackend()
+    worker_a = ResearchCache(max_entries=4, backend=backend)
+    worker_b = ResearchCache(max_entries=4, backend=backend)
+    bundles = [
+        make_test_bundle("src1", "https://example.com/a", "example.com", "A", ["alpha", "beta"], metadata={"rank": 1}),
+        make_test_bundle("src2", "https://docs.example.com/b", "docs.example.com", None, [], tool=ToolKind.DOCS),
+    ]
+    worker_a.put("shared", bundles, created_bucket=7)
+    assert worker_b.get("shared") == bundles
+    assert worker_b.stats().backend_hits == 1
+    assert worker_b.size() == 1
+    assert worker_b.get("shared", current_bucket=7) == bundles
+
+
+def test_oversized_value_is_not_shared():
+    backend = InMemoryCacheBackend()
+    small = [make_test_bundle("src", "https://example.com/s", "example.com", "S", ["x" * 100])]
+    big = [make_test_bundle("big", "https://example.com/big", "example.com", "Big", ["y" * 500] * 5)] * 4
+    worker_a = ResearchCache(max_entries=4, max_bytes=estimate_value_bytes(small) * 2, backend=backend)
+    worker_b = ResearchCache(max_entries=4, backend=backend)
+    worker_a.put("k", small, created_bucket=0)
+    worker_a.put("k", big, created_bucket=0)
+    assert worker_a.stats().rejected == 1
+    assert backend.get("k") is None
+    assert worker_b.get("k") is None
+
+
+class _BrokenBackend:
+    def get(self, key):
+        raise ConnectionError("down")
+
+    def put(self, key, value, created_bucket):
+        raise ConnectionError("down")
+
+    def delete(self, key):
+        raise ConnectionError("down")
+
+    def clear(self):
+        raise ConnectionError("down")
+
+
+def test_backend_errors_fail_closed():
+    cache = ResearchCache(max_entries=2, backend=_BrokenBackend())
+    cache.put("key", "value", created_bucket=0)
+    assert cache.get("key") == "value"
+    assert cache.get("other") is None
+    assert cache.stats().backend_errors == 2
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.data = {}
+        self.expiry = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value.encode("utf-8")
+        self.expiry[key] = ex
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def scan_iter(self, match=None):
+        prefix = match.rstrip("*")
+        return [key for key in list(self.data) if key.startswith(prefix)]
+
+
+def test_redis_backend_round_trip():
+    client = _FakeRedis()
+    backend = RedisCacheBackend(client, namespace="rc", ttl_seconds=900)
+    bundles = [make_test_bundle("src1", "https://example.com/a", "example.com", "A", ["alpha"])]
+    backend.put("k1", bundles, created_bucket=3)
+    assert client.expiry["rc:k1"] == 900
+    assert backend.get("k1") == (bundles, 3)
+    assert backend.get("missing") is None
+    backend.clear()
+    assert client.data == {}
+
+
+def test_encode_decode_plain_values():
+    for value in ["text", 3, [1, 2], {"a": [True, None]}, []]:
+        assert decode_cache_value(encode_cache_value(value)) == value
@@ -0,0 +1,139 @@
+"""
+Phase 18 Step 1: Concurrent Retrieval Fan-out Tests
+
+Fake slow tools prove that:
+- concurrent fan-out (thread pool and async) matches serial output exactly
+- wall-clock is ~max(tool latency) instead of the sum
+- per-tool and total deadlines drop stragglers; async stragglers are cancelled
+"""
+
+import asyncio
+import time
+
+import backend.app.retrieval.adapter as adapter_module
+from backend.app.retrieval.adapter import RetrievalRequest, retrieve, retrieve_async
+from backend.app.retrieval.types import EnvMode, PolicyCaps, RequestFlags, ToolKind
+
+
+def make_request(tools, max_results=10, per_tool_timeout_ms=5000, total_timeout_ms=15000):
+    return RetrievalRequest(
+        query="fan out query",
+        policy_caps=PolicyCaps(
+            max_results=max_results,
+            per_tool_timeout_ms=per_tool_timeout_ms,
+            total_timeout_ms=total_timeout_ms,
+        ),
+        allowed_tools=tools,
+        env_mode=EnvMode.DEV,
+        request_flags=RequestFlags(),
+    )
+
+
+def raw_results(tool, count=4):
+    host = "web.example.com" if tool == ToolKind.WEB else "docs.example.com"
+    return [
+        {"url": f"https://{host}/{i}", "title": f"{tool.value} {i}", "snippets": [f"snippet {i}"]}
+        for i in range(count)
+    ]
+
+
+def make_slow_tool(delays):
+    def slow_tool(tool, query, caps):
+        time.sleep(delays[tool])
+        return raw_results(tool)
+    return slow_tool
+
+
+def ids(sources):
+    return [(s.tool.value, s.url, s.source_id) for s in sources]
+
+
+def test_fanout_matches_serial_and_is_faster(monkeypatch):
+    monkeypatch.setattr(adapter_module, "run_tool_stub", make_slow_tool({ToolKind.WEB: 0.3, ToolKind.DOCS: 0.3}))
+    req = make_request([ToolKind.WEB, ToolKind.DOCS])
+
+    start = time.perf_counter()
+    serial = retrieve(req)
+    serial_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    concurrent = retrieve(req, concurrent=True)
+    concurrent_s = time.perf_counter() - start
+
+    assert ids(concurrent) == ids(serial)
+    assert len(serial) == 8
+    assert serial_s >= 0.6
+    assert concurrent_s < 0.5
+
+
+def test_merge_order_ignores_completion_order(monkeypatch):
+    # WEB finishes last but is first in allowed_tools, so truncation keeps WEB results
+    monkeypatch.setattr(adapter_module, "run_tool_stub", make_slow_tool({ToolKind.WEB: 0.2, ToolKind.DOCS: 0.0}))
+    req = make_request([ToolKind.WEB, ToolKind.DOCS], max_results=5)
+    serial = retrieve(req)
+    assert ids(retrieve(req, concurrent=True)) == ids(serial)
+    assert ids(asyncio.run(retrieve_async(req))) == ids(serial)
+    assert [s.tool for s in serial].count(ToolKind.WEB) == 4
+
+
+def test_per_tool_timeout_drops_straggler(monkeypatch):
+    monkeypatch.setattr(adapter_module, "run_tool_stub", make_slow_tool({ToolKind.WEB: 1.0, ToolKind.DOCS: 0.0}))
+    req = make_request([ToolKind.WEB, ToolKind.DOCS], per_tool_timeout_ms=200)
+    start = time.perf_counter()
+    result = retrieve(req, concurrent=True)
+    elapsed = time.perf_counter() - start
+    assert {s.tool for s in result} == {ToolKind.DOCS}
+    assert elapsed < 0.8
+
+
+def test_total_timeout_bounds_async_fanout(monkeypatch):
+    monkeypatch.setattr(adapter_module, "run_tool_stub", make_slow_tool({ToolKind.WEB: 0.0, ToolKind.DOCS: 1.0}))
+    req = make_request([ToolKind.WEB, ToolKind.DOCS], total_timeout_ms=200)
+    start = time.perf_counter()
+    result = asyncio.run(retrieve_async(req))
+    assert time.perf_counter() - start < 0.8
+    assert {s.tool for s in result} == {ToolKind.WEB}
+
+
+def test_caller_deadline_tightens_fanout(monkeypatch):
+    monkeypatch.setattr(adapter_module, "run_tool_stub", make_slow_tool({ToolKind.WEB: 0.0, ToolKind.DOCS: 1.0}))
+    req = make_request([ToolKind.WEB, ToolKind.DOCS])
+    start = time.perf_counter()
+    result = retrieve(req, concurrent=True, deadline_ms=200)
+    assert time.perf_counter() - start < 0.8
+    assert {s.tool for s in result} == {ToolKind.WEB}
+    assert {s.tool for s in asyncio.run(retrieve_async(req, deadline_ms=200))} == {ToolKind.WEB}
+
+
+def test_async_tool_runner_is_cancelled_at_deadline(monkeypatch):
+    cancelled = []
+
+    async def async_tool(tool, query, caps):
+        try:
+            await asyncio.sleep(5 if tool == ToolKind.DOCS else 0.05)
+        except asyncio.CancelledError:
+            cancelled.append(tool)
+            raise
+        return raw_results(tool)
+
+    monkeypatch.setattr(adapter_module, "run_tool_stub", async_tool)
+    req = make_request([ToolKind.WEB, ToolKind.DOCS], per_tool_timeout_ms=300)
+    start = time.perf_counter()
+    result = asyncio.run(retrieve_async(req))
+    assert time.perf_counter() - start < 1.0
+    assert {s.tool for s in result} == {ToolKind.WEB}
+    assert cancelled == [ToolKind.DOCS]
+
+
+def test_failing_tool_is_skipped_in_all_modes(monkeypatch):
+    def flaky_tool(tool, query, caps):
+        if tool == ToolKind.WEB:
+            raise RuntimeError("connector down")
+        return raw_results(tool)
+
+    monkeypatch.setattr(adapter_module, "run_tool_stub", flaky_tool)
+    req = make_request([ToolKind.WEB, ToolKind.DOCS])
+    serial = retrieve(req)
+    assert [s.tool for s in serial] == [ToolKind.DOCS] * 4
+    assert ids(retrieve(req, concurrent=True)) == ids(serial)
+    assert ids(asyncio.run(retrieve_async(req))) == ids(serial)
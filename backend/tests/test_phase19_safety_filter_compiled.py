@@ -0,0 +1,184 @@
+"""
+Phase 19 Step 6: Compiled Single-Pass Safety Filter Tests
+
+Differential tests proving the compiled matcher used by scan_fact_forbidden
+produces exactly the matches (order, counts, evidence_len) and signatures of
+the reference per-group regex scanner.
+"""
+
+import random
+import re
+from dataclasses import asdict
+
+from backend.app.memory.safety_filter import (
+    ACADEMIC_EXCEPTIONS,
+    AFFILIATION_VERBS,
+    MAX_MATCHES_RETURNED,
+    PATTERN_GROUPS,
+    REASON_PRIORITY,
+    _compute_signature,
+    _normalize_list_item,
+    _PhraseMatcher,
+    _scan_field,
+    _scan_text_for_patterns,
+    _tokenize,
+    scan_fact_forbidden,
+    scan_facts_forbidden,
+)
+from backend.app.memory.schema import MemoryCategory, MemoryFact, MemoryValueType
+
+
+def _phrases(patterns):
+    words = []
+    for pattern in patterns:
+        body = pattern[2:-2]
+        if body.startswith("(?:"):
+            body = body[3:-1]
+        words.extend(body.split("|"))
+    return words
+
+
+VOCAB = (
+    _phrases([p for patterns, _ in PATTERN_GROUPS for p, _ in patterns])
+    + _phrases(ACADEMIC_EXCEPTIONS)
+    + _phrases(AFFILIATION_VERBS)
+    + ["hello", "project", "deadline", "union", "labor", "sexual", "wing", "blood", "i", "am", "bpx", "votes"]
+)
+SEPARATORS = [" ", " ", " ", "  ", "\n", "\t", "-", ", ", ".", "​", "_", ""]
+ODDITIES = ["ı", "ſ", "İ", "K", "é", "VOTE", "Cancer", "SEX LIFE"]
+
+
+def random_text(rng: random.Random) -> str:
+    parts = []
+    for _ in range(rng.randint(0, 14)):
+        roll = rng.random()
+        if roll < 0.8:
+            word = rng.choice(VOCAB)
+            if rng.random() < 0.15:
+                word = word.upper()
+        else:
+            word = rng.choice(ODDITIES)
+        if rng.random() < 0.05 and len(word) > 2:
+            pos = rng.randrange(1, len(word))
+            word = word[:pos] + rng.choice(["ı", "ſ"]) + word[pos + 1:]
+        parts.append(word)
+        parts.append(rng.choice(SEPARATORS))
+    return "".join(parts)
+
+
+def reference_scan_field(text: str, field_name: str):
+    matches = []
+    for patterns, reason in PATTERN_GROUPS:
+        matches.extend(_scan_text_for_patterns(text, field_name, patterns, reason))
+    return matches
+
+
+def reference_scan_fact(fact: MemoryFact):
+    matches = []
+    if fact.key:
+        matches.extend(reference_scan_field(fact.key, "key"))
+    if fact.value_str:
+        matches.extend(reference_scan_field(fact.value_str, "value_str"))
+    for item in fact.value_list_str or []:
+        normalized_item = _normalize_list_item(item)
+        if normalized_item:
+            matches.extend(reference_scan_field(normalized_item, "value_str_list"))
+    for tag in fact.tags or []:
+        if tag:
+            matches.extend(reference_scan_field(tag, "tags"))
+    if len(matches) > MAX_MATCHES_RETURNED:
+        matches.sort(key=lambda m: REASON_PRIORITY[m.reason])
+        matches = matches[:MAX_MATCHES_RETURNED]
+    return matches
+
+
+def make_fact(rng: random.Random, idx: int) -> MemoryFact:
+    return MemoryFact(
+        fact_id=f"fact_{idx:04d}",
+        category=MemoryCategory.PROJECT_CONTEXT,
+        key="note",
+        value_type=MemoryValueType.STR,
+        value_str=random_text(rng),
+        value_num=None,
+        value_bool=None,
+        value_list_str=None,
+        confidence=0.8,
+        provenance=None,
+        created_at_ms=1000000,
+        expires_at_ms=None,
+        tags=[random_text(rng)[:40] for _ in range(rng.randint(0, 2))],
+    )
+
+
+def test_compiled_field_scan_matches_reference_fuzz():
+    rng = random.Random(1906)
+    for _ in range(3000):
+        text = random_text(rng)
+        expected = [asdict(m) for m in reference_scan_field(text, "value_str")]
+        actual = [asdict(m) for m in _scan_field(text, "value_str")]
+        assert actual == expected, repr(text)
+
+
+def test_overlapping_rules_counted_independently():
+    text = "sexual orientation and labor union member, blood pressure bp"
+    expected = [asdict(m) for m in reference_scan_field(text, "value_str")]
+    actual = [asdict(m) for m in _scan_field(text, "value_str")]
+    assert actual == expected
+    rule_ids = [m["matched_rule_id"] for m in actual]
+    assert "SEX_LIFE_SEXUAL_01" in rule_ids
+    assert "SENSITIVE_ORIENTATION_01" in rule_ids
+    assert "UNION_LABOR_01" in rule_ids and "UNION_MEMBER_01" in rule_ids
+    bp = [m for m in actual if m["matched_rule_id"] == "HEALTH_BP_01"][0]
+    assert bp["match_count"] == 2
+
+
+def test_ignorecase_special_letters_match_like_regex():
+    for text in ["ſex life", "relıgion", "dıabetes", "K"]:
+        expected = [asdict(m) for m in reference_scan_field(text, "key")]
+        assert [asdict(m) for m in _scan_field(text, "key")] == expected
+
+
+def test_academic_exception_and_affiliation_override():
+    assert _scan_field("political science syllabus covers election history", "value_str") == []
+    overridden = _scan_field("in political science i vote in every election", "value_str")
+    assert [m.matched_rule_id for m in overridden] == ["POLITICS_VOTE_01", "POLITICS_ELECTION_01"]
+
+
+def test_scan_fact_results_and_signatures_unchanged():
+    rng = random.Random(77)
+    facts = [make_fact(rng, i) for i in range(300)]
+    for fact in facts:
+        expected = reference_scan_fact(fact)
+        result = scan_fact_forbidden(fact)
+        assert [asdict(m) for m in result.matches] == [asdict(m) for m in expected]
+        assert result.signature == _compute_signature(expected)
+    batch = scan_facts_forbidden(facts)
+    expected_batch = [m for fact in facts for m in reference_scan_fact(fact)]
+    expected_batch.sort(key=lambda m: REASON_PRIORITY[m.reason])
+    expected_batch = expected_batch[:MAX_MATCHES_RETURNED]
+    assert batch.forbidden
+    assert batch.signature == _compute_signature(expected_batch)
+    assert batch.top_reason == expected_batch[0].reason
+
+
+def test_non_literal_and_invalid_patterns_fall_back_to_regex():
+    matcher = _PhraseMatcher([r"\bvot(?:e|ing)\b", r"\bcancer\b", r"(unclosed"])
+    normalized = "voting and cancer and vote"
+    counts = matcher.count(normalized, _tokenize(normalized))
+    assert counts[0] == len(re.findall(r"\bvot(?:e|ing)\b", normalized))
+    assert counts[1] == 1
+    assert counts[2] == -1
+
+
+def test_regex_error_never_grants_academic_exemption(monkeypatch):
+    import backend.app.memory.safety_filter as safety_filter
+
+    broken = _PhraseMatcher([r"(unclosed"])
+    text = "syllabus covers election history"
+    assert broken.any(text, _tokenize(text))
+    assert not broken.any(text, _tokenize(text), error_matches=False)
+
+    expected = [asdict(m) for m in reference_scan_field(text, "value_str")]
+    assert expected
+    monkeypatch.setattr(safety_filter, "_ACADEMIC_MATCHER", broken)
+    assert [asdict(m) for m in _scan_field(text, "value_str")] == expected
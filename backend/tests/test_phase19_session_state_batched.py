@@ -0,0 +1,274 @@
+"""
+Phase 19: Batched Session State Tests
+
+Runs the real redis-py client against a minimal in-process RESP server so no
+Redis is required:
+- ConversationService.handle_message issues one MGET and one MULTI/EXEC
+- Repository and legacy load_*/save_* helpers share keys and version stamps
+- Decode cache is reused only while version stamp and payloads are unchanged,
+  and hands out copies
+- Save refreshes TTLs on every key, including the version stamp
+"""
+
+import socket
+import socketserver
+import threading
+
+import redis
+
+from backend.app.memory import legacy
+from backend.app.memory.session_state import SessionState, SessionStateRepository, session_keys
+from backend.app.schemas import (
+    CognitiveStyle,
+    Hypothesis,
+    HypothesisDelta,
+    IntermediateAnswer,
+    ReasoningOutput,
+    ReasoningTrace,
+    RenderedMessage,
+    SessionSummary,
+)
+from backend.app.service import ConversationService
+
+TTL = 600
+
+
+class MiniRedis:
+    """Threaded RESP2 server with GET/SET/MGET/DEL/INCRBY/EXPIRE and MULTI/EXEC."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttl = {}
+        self.commands = []
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                server._serve(self.request)
+
+        self._server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"redis://127.0.0.1:{self._server.server_address[1]}/0"
+
+    def start(self) -> "MiniRedis":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset_log(self) -> None:
+        self.commands.clear()
+
+    @staticmethod
+    def _parse(buf: bytes):
+        if not buf.startswith(b"*"):
+            return None, buf
+        end = buf.find(b"\r\n")
+        if end < 0:
+            return None, buf
+        count, pos, args = int(buf[1:end]), end + 2, []
+        for _ in range(count):
+            end = buf.find(b"\r\n", pos)
+            if end < 0:
+                return None, buf
+            size = int(buf[pos + 1:end])
+            start = end + 2
+            if len(buf) < start + size + 2:
+                return None, buf
+            args.append(buf[start:start + size])
+            pos = start + size + 2
+        return args, buf[pos:]
+
+    @staticmethod
+    def _bulk(value) -> bytes:
+        if value is None:
+            return b"$-1\r\n"
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+
+    def _run(self, name: str, args):
+        if name == "GET":
+            return self._bulk(self.data.get(args[0]))
+        if name == "MGET":
+            return b"*%d\r\n" % len(args) + b"".join(self._bulk(self.data.get(k)) for k in args)
+        if name == "SET":
+            self.data[args[0]] = args[1]
+            self.ttl[args[0]] = int(args[3]) if len(args) > 3 and args[2].upper() == b"EX" else None
+            return b"+OK\r\n"
+        if name == "DEL":
+            removed = sum(1 for k in args if self.data.pop(k, None) is not None)
+            return b":%d\r\n" % removed
+        if name in ("INCR", "INCRBY"):
+            value = int(self.data.get(args[0], b"0")) + (int(args[1]) if len(args) > 1 else 1)
+            self.data[args[0]] = str(value).encode()
+            return b":%d\r\n" % value
+        if name == "EXPIRE":
+            self.ttl[args[0]] = int(args[1])
+            return b":1\r\n"
+        if name == "PING":
+            return b"+PONG\r\n"
+        return b"+OK\r\n"  # CLIENT SETINFO, SELECT, ...
+
+    def _serve(self, sock: socket.socket) -> None:
+        buf, queued = b"", None
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                return
+            buf += chunk
+            replies = []
+            while True:
+                args, buf = self._parse(buf)
+                if args is None:
+                    break
+                name = args[0].decode().upper()
+                with self._lock:
+                    if name not in ("CLIENT", "SELECT", "PING"):
+                        self.commands.append(name)
+                    if name == "MULTI":
+                        queued = []
+                        replies.append(b"+OK\r\n")
+                    elif name == "EXEC":
+                        results = [self._run(n, a) for n, a in queued or []]
+                        replies.append(b"*%d\r\n" % len(results) + b"".join(results))
+                        queued = None
+                    elif queued is not None:
+                        queued.append((name, args[1:]))
+                        replies.append(b"+QUEUED\r\n")
+                    else:
+                        replies.append(self._run(name, args[1:]))
+            if replies:
+                sock.sendall(b"".join(replies))
+
+
+class CountingConnection(redis.Connection):
+    """Counts client round trips: one packed send per command or pipeline."""
+
+    sends = 0
+
+    def send_packed_command(self, command, check_health=True):
+        type(self).sends += 1
+        return super().send_packed_command(command, check_health)
+
+
+def _client(server: MiniRedis) -> redis.Redis:
+    return redis.Redis.from_url(server.url, decode_responses=True, connection_class=CountingConnection)
+
+
+def _style(formality: str = "neutral") -> CognitiveStyle:
+    return CognitiveStyle(abstraction_level="medium", formality=formality, preferred_analogies="mixed", overrides={"k": 1})
+
+
+class FakeLLM:
+    def call_reasoning_model(self, **kwargs):
+        return ReasoningOutput(
+            reasoning_trace=ReasoningTrace(steps=[], summary="s"),
+            updated_hypotheses=[HypothesisDelta(id="h1", claim="c", support_score_delta=0.2, justification="j")],
+            intermediate_answer=IntermediateAnswer(goals=["g"], key_points=["k"]),
+        )
+
+    def call_expression_model(self, **kwargs):
+        return RenderedMessage(text="ok")
+
+
+def test_handle_message_uses_one_mget_and_one_transaction():
+    server = MiniRedis().start()
+    try:
+        client = _client(server)
+        repo = SessionStateRepository(client, ttl_seconds=TTL)
+        service = ConversationService(llm_client=FakeLLM(), session_store=repo)
+        service.handle_message("s1", "explain classes please")
+        assert server.commands == ["MGET", "MULTI", "SET", "SET", "SET", "INCRBY", "EXPIRE", "EXEC"]
+        server.reset_log()
+        service.handle_message("s1", "and again")
+        assert server.commands[0] == "MGET" and server.commands.count("EXEC") == 1
+        state = repo.load("s1")
+        assert [h.id for h in state.hypotheses] == ["h1"]
+        assert abs(state.hypotheses[0].support_score - 0.4) < 1e-9
+        assert state.version == 2
+        assert all(server.ttl[k.encode()] == TTL for k in session_keys("s1"))
+    finally:
+        server.stop()
+
+
+def test_repository_and_legacy_helpers_share_keys(monkeypatch):
+    server = MiniRedis().start()
+    try:
+        client = _client(server)
+        monkeypatch.setattr(legacy, "get_redis", lambda: client)
+        repo = SessionStateRepository(client, ttl_seconds=TTL)
+        hypotheses = [Hypothesis(id="a", claim="x", support_score=0.5, last_updated=1)]
+        repo.save("s2", SessionState(style=_style(), hypotheses=hypotheses, summary=SessionSummary(active_goal="g")))
+        assert legacy.load_cognitive_style("s2") == _style()
+        assert legacy.load_hypotheses("s2") == hypotheses
+        assert legacy.load_session_summary("s2").active_goal == "g"
+
+        legacy.save_session_summary("s2", SessionSummary(active_goal="changed"))
+        state = repo.load("s2")
+        assert state.summary.active_goal == "changed"
+        assert state.version == 2
+
+        empty = repo.load("missing")
+        assert (empty.style, empty.hypotheses, empty.summary, empty.version) == (None, [], SessionSummary(), 0)
+    finally:
+        server.stop()
+
+
+def test_decode_cache_hits_only_on_matching_stamp_and_returns_copies():
+    server = MiniRedis().start()
+    try:
+        client = _client(server)
+        repo = SessionStateRepository(client, ttl_seconds=TTL, cache_entries=16)
+        other_process = SessionStateRepository(client, ttl_seconds=TTL)
+        hypotheses = [Hypothesis(id="a", claim="x", support_score=0.5, last_updated=1)]
+        repo.save("s3", SessionState(style=_style(), hypotheses=hypotheses))
+
+        first = repo.load("s3")
+        first.hypotheses[0].support_score = 99.0
+        first.style.overrides["k"] = 2
+        second = repo.load("s3")
+        assert second.hypotheses[0].support_score == 0.5
+        assert second.style.overrides == {"k": 1}
+        assert repo.stats().cache_hits == 2
+
+        other_process.save("s3", SessionState(style=_style("formal"), hypotheses=[]))
+        third = repo.load("s3")
+        assert third.style.formality == "formal" and third.hypotheses == []
+        assert repo.stats().cache_hits == 2
+
+        # Payload changed behind an unchanged stamp (e.g. key expiry): never served stale.
+        del server.data[session_keys("s3")[0].encode()]
+        assert repo.load("s3").style is None
+    finally:
+        server.stop()
+
+
+def test_round_trips_per_message_vs_legacy(monkeypatch):
+    server = MiniRedis().start()
+    try:
+        client = _client(server)
+        monkeypatch.setattr(legacy, "get_redis", lambda: client)
+        client.ping()
+        CountingConnection.sends = 0
+        legacy.load_cognitive_style("s4")
+        legacy.load_hypotheses("s4")
+        legacy.load_session_summary("s4")
+        legacy.save_hypotheses("s4", [])
+        legacy.save_cognitive_style("s4", _style())
+        legacy.save_session_summary("s4", SessionSummary())
+        legacy_round_trips = CountingConnection.sends
+
+        CountingConnection.sends = 0
+        repo = SessionStateRepository(client, ttl_seconds=TTL)
+        state = repo.load("s4")
+        repo.save("s4", state)
+        assert legacy_round_trips == 6
+        assert CountingConnection.sends == 2
+    finally:
+        server.stop()
@@ -0,0 +1,156 @@
+"""
+Phase 19 Step 4: Incremental Materialized View Tests
+
+Property tests proving MemoryEventLogStore.recompute() (incremental view)
+is identical to full log replay (recompute_current_view) for randomized
+event sequences, now_ms values and caps, including dict ordering.
+"""
+
+import random
+
+from backend.app.memory.schema import (
+    MemoryCategory,
+    MemoryFact,
+    MemoryValueType,
+    Provenance,
+    ProvenanceType,
+)
+from backend.app.memory.store import (
+    CurrentView,
+    MaterializedView,
+    MemoryEventLogStore,
+    MemoryStore,
+    StoreCaps,
+    create_fact_added_event,
+    create_fact_expired_event,
+    create_fact_revoked_event,
+    recompute_current_view,
+)
+
+SCOPE = "scope_prop"
+CATEGORIES = list(MemoryCategory)
+PROVENANCE_TYPES = list(ProvenanceType)
+
+
+def make_fact(rng: random.Random, fact_id: str) -> MemoryFact:
+    collected = rng.choice([1000000, 1000500, 1001000, 1002000])
+    return MemoryFact(
+        fact_id=fact_id,
+        category=rng.choice(CATEGORIES),
+        key="k" * rng.randint(1, 6),
+        value_type=MemoryValueType.STR,
+        value_str="value",
+        value_num=None,
+        value_bool=None,
+        value_list_str=None,
+        confidence=rng.choice([0.3, 0.5, 0.5, 0.8, 0.9]),
+        provenance=Provenance(
+            source_type=rng.choice(PROVENANCE_TYPES),
+            source_id="src_001",
+            collected_at_ms=collected,
+            citation_ids=[],
+        ),
+        created_at_ms=collected,
+        expires_at_ms=None,
+        tags=[],
+    )
+
+
+def random_events(rng: random.Random, n_events: int, n_ids: int) -> list:
+    events = []
+    for i in range(n_events):
+        fact_id = f"fact_{rng.randrange(n_ids):03d}"
+        created = 1000000 + i
+        roll = rng.random()
+        if roll < 0.65:
+            expires = rng.choice([1500000, 2000000, 3000000, 5000000])
+            events.append(create_fact_added_event(SCOPE, make_fact(rng, fact_id), created, expires))
+        elif roll < 0.8:
+            events.append(create_fact_expired_event(SCOPE, fact_id, created, created))
+        else:
+            events.append(create_fact_revoked_event(SCOPE, fact_id, created, "USER_REQUEST", created))
+    return events
+
+
+def fingerprint(view: CurrentView) -> str:
+    """Order-sensitive representation (dict iteration order included)."""
+    return repr(
+        (
+            list(view.active_facts.items()),
+            view.dropped_due_to_caps,
+            view.total_active,
+            list(view.per_category_active.items()),
+            view.store_version,
+            view.error_code,
+        )
+    )
+
+
+def test_incremental_view_matches_replay_randomized():
+    rng = random.Random(1919)
+    caps_choices = [StoreCaps(), StoreCaps(5, 3), StoreCaps(3, 5), StoreCaps(1, 1), StoreCaps(0, 5)]
+    for trial in range(60):
+        events = random_events(rng, rng.randint(0, 150), rng.randint(1, 40))
+        store = MemoryEventLogStore()
+        for idx, event in enumerate(events):
+            store.append_event(SCOPE, event)
+            # Check at a few intermediate prefixes as well as the final log
+            if idx % 17 == 0 or idx == len(events) - 1:
+                now_ms = rng.choice([0, 1600000, 2500000, 4000000, 6000000])
+                caps = rng.choice(caps_choices)
+                expected = recompute_current_view(events[: idx + 1], now_ms, caps)
+                actual = store.recompute(SCOPE, now_ms, caps)
+                assert fingerprint(actual) == fingerprint(expected), f"trial {trial} idx {idx}"
+                assert fingerprint(store.replay(SCOPE, now_ms, caps)) == fingerprint(expected)
+
+
+def test_revoke_then_readd_keeps_original_position():
+    rng = random.Random(7)
+    fact_a = make_fact(rng, "fact_a")
+    fact_b = make_fact(rng, "fact_b")
+    events = [
+        create_fact_added_event(SCOPE, fact_a, 1000000, 5000000),
+        create_fact_added_event(SCOPE, fact_b, 1000001, 5000000),
+        create_fact_revoked_event(SCOPE, "fact_a", 1000002, "USER_REQUEST", 1000002),
+        create_fact_added_event(SCOPE, fact_a, 1000003, 5000000),
+    ]
+    store = MemoryEventLogStore()
+    store.append_events(SCOPE, events)
+    view = store.recompute(SCOPE, 2000000, StoreCaps())
+    assert list(view.active_facts.keys()) == ["fact_a", "fact_b"]
+    assert fingerprint(view) == fingerprint(recompute_current_view(events, 2000000, StoreCaps()))
+
+
+def test_returned_view_is_not_shared_with_memo():
+    store = MemoryEventLogStore()
+    rng = random.Random(3)
+    store.append_event(SCOPE, create_fact_added_event(SCOPE, make_fact(rng, "fact_x"), 1000000, 5000000))
+    first = store.recompute(SCOPE, 2000000, StoreCaps())
+    first.active_facts.clear()
+    first.dropped_due_to_caps.append("tampered")
+    second = store.recompute(SCOPE, 2000000, StoreCaps())
+    assert list(second.active_facts.keys()) == ["fact_x"]
+    assert second.dropped_due_to_caps == []
+
+
+def test_expired_event_removes_fact_from_index():
+    view = MaterializedView()
+    rng = random.Random(5)
+    view.apply(create_fact_added_event(SCOPE, make_fact(rng, "fact_1"), 1000000, 5000000))
+    assert view.live_count() == 1
+    view.apply(create_fact_expired_event(SCOPE, "fact_1", 1000001, 1000001))
+    assert view.live_count() == 0
+    # Expired-by-event facts stay expired even if re-added (replay semantics)
+    view.apply(create_fact_added_event(SCOPE, make_fact(rng, "fact_1"), 1000002, 5000000))
+    assert view.view(2000000, StoreCaps()).total_active == 0
+
+
+def test_memory_store_reads_use_incremental_view():
+    rng = random.Random(11)
+    store = MemoryStore(scope_id=SCOPE)
+    facts = [make_fact(rng, f"fact_{i:03d}") for i in range(40)]
+    store.write_facts_with_expiry(facts, 5000000)
+    event_store = store.get_event_store()
+    expected = event_store.replay(SCOPE, 2000000, StoreCaps())
+    assert [f.fact_id for f in store.get_current_facts(2000000)] == list(expected.active_facts.keys())
+    assert store.count(2000000) == expected.total_active
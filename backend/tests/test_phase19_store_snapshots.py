@@ -0,0 +1,109 @@
+"""
+Phase 19 Step 4: Snapshot + Compaction Tests
+
+- Replay from (snapshot + tail) is identical to full-log replay
+- Snapshot signatures are deterministic and chained
+- Compaction truncates superseded events so long-lived scopes stay under the cap
+"""
+
+import random
+from dataclasses import replace
+
+from backend.app.memory.store import (
+    MAX_EVENTS_PER_SCOPE,
+    SNAPSHOT_GENESIS_SIGNATURE,
+    MemoryEventLogStore,
+    StoreCaps,
+    build_snapshot,
+    create_fact_added_event,
+    create_fact_revoked_event,
+    recompute_current_view,
+    verify_snapshot,
+)
+from backend.tests.test_phase19_store_incremental_view import (
+    SCOPE,
+    fingerprint,
+    make_fact,
+    random_events,
+)
+
+
+def test_replay_from_snapshot_matches_full_replay():
+    rng = random.Random(2024)
+    caps_choices = [StoreCaps(), StoreCaps(5, 3), StoreCaps(2, 2)]
+    for trial in range(40):
+        events = random_events(rng, rng.randint(1, 200), rng.randint(1, 30))
+        store = MemoryEventLogStore(snapshot_interval=rng.randint(1, 40))
+        store.append_events(SCOPE, events)
+        for now_ms in (0, 1600000, 2500000, 6000000):
+            caps = rng.choice(caps_choices)
+            expected = recompute_current_view(events, now_ms, caps)
+            assert fingerprint(store.replay(SCOPE, now_ms, caps)) == fingerprint(expected), f"trial {trial}"
+            assert fingerprint(store.recompute(SCOPE, now_ms, caps)) == fingerprint(expected), f"trial {trial}"
+
+
+def test_compaction_truncates_tail_and_counts_all_events():
+    rng = random.Random(1)
+    events = random_events(rng, 50, 10)
+    store = MemoryEventLogStore(snapshot_interval=0)
+    store.append_events(SCOPE, events)
+    assert len(store.read_events(SCOPE)) == 50
+    snapshot = store.compact(SCOPE)
+    assert snapshot is not None
+    assert snapshot.last_event_id == events[-1].event_id
+    assert snapshot.event_count == 50
+    assert store.read_events(SCOPE) == []
+    assert store.event_count(SCOPE) == 50
+    assert store.retained_count(SCOPE) == snapshot.record_count()
+    # Compacting an empty tail keeps the same snapshot
+    assert store.compact(SCOPE) is snapshot
+
+
+def test_snapshot_signature_deterministic_and_chained():
+    rng = random.Random(9)
+    events = random_events(rng, 80, 15)
+    first = build_snapshot(SCOPE, events[:40])
+    second = build_snapshot(SCOPE, events[40:], first)
+    assert first.prev_signature == SNAPSHOT_GENESIS_SIGNATURE
+    assert second.prev_signature == first.signature
+    assert verify_snapshot(first, SNAPSHOT_GENESIS_SIGNATURE)
+    assert verify_snapshot(second, first.signature)
+    assert not verify_snapshot(second, SNAPSHOT_GENESIS_SIGNATURE)
+
+    again = build_snapshot(SCOPE, events[40:], build_snapshot(SCOPE, events[:40]))
+    assert again.signature == second.signature
+
+
+def test_tampered_snapshot_fails_verification():
+    rng = random.Random(4)
+    snapshot = build_snapshot(SCOPE, random_events(rng, 30, 8))
+    assert verify_snapshot(snapshot)
+    assert not verify_snapshot(replace(snapshot, last_event_id="forged"))
+    assert not verify_snapshot(replace(snapshot, revoked_ids=snapshot.revoked_ids + ("fact_999",)))
+    assert not verify_snapshot(replace(snapshot, facts=snapshot.facts[1:]))
+
+
+def test_long_lived_scope_exceeds_cap_when_events_are_superseded():
+    rng = random.Random(12)
+    facts = [make_fact(rng, f"fact_{i:02d}") for i in range(20)]
+    store = MemoryEventLogStore(snapshot_interval=500)
+    appended = 0
+    for i in range(MAX_EVENTS_PER_SCOPE + 2000):
+        fact = facts[i % len(facts)]
+        if i % 2:
+            event = create_fact_revoked_event(SCOPE, fact.fact_id, 1000000 + i, "USER_REQUEST", 1000000 + i)
+        else:
+            event = create_fact_added_event(SCOPE, fact, 1000000 + i, 5000000)
+        appended += int(store.append_event(SCOPE, event))
+    assert appended == MAX_EVENTS_PER_SCOPE + 2000
+    assert store.retained_count(SCOPE) < 600
+    assert store.event_count(SCOPE) == appended
+
+
+def test_snapshot_contains_no_raw_values():
+    rng = random.Random(21)
+    fact = make_fact(rng, "fact_raw")
+    fact = replace(fact, value_str="SENSITIVE_RAW_VALUE")
+    snapshot = build_snapshot(SCOPE, [create_fact_added_event(SCOPE, fact, 1000000, 5000000)])
+    assert "SENSITIVE_RAW_VALUE" not in snapshot.signature
+    assert "SENSITIVE_RAW_VALUE" not in snapshot.last_event_id
@@ -0,0 +1,123 @@
+"""
+Phase 9: Shared Decision Text-Feature Tests
+
+- MarkerVocabulary.scan returns exactly the markers for which `marker in text`
+  holds, on both the direct and the token-indexed (long text) paths
+- Engines fed the shared assembly scan classify exactly as when they scan alone
+- assemble_decision_state output is unchanged from the per-engine substring
+  loops (golden digest over a seeded corpus recorded before the refactor)
+"""
+
+import hashlib
+import json
+import random
+
+import pytest
+
+from backend.mci_backend.decision_assembly import DECISION_VOCABULARY, assemble_decision_state
+from backend.mci_backend.decision_irreversibility import classify_horizon, classify_reversibility
+from backend.mci_backend.decision_proximity import classify_proximity
+from backend.mci_backend.decision_responsibility import classify_responsibility_scope
+from backend.mci_backend.decision_text_features import (
+    TOKEN_INDEX_MIN_CHARS,
+    MarkerVocabulary,
+    extract_text_features,
+)
+
+VOCAB = sorted(DECISION_VOCABULARY.markers)
+FILLER = ["the", "a", "plan", "hello", "thing", "must", "bus", "Payment", "TODAY", "Release", "weekly", "nowhere", "ourselves"]
+SEPARATORS = [" ", " ", "", "-", "\n", ", "]
+ODDITIES = ["İ", "ſelf-harm", "naïve", "CANNOT  UNDO", "self—harm", "I'M GOING TO", "o'clock"]
+
+# sha256 over fingerprints of the seeded corpus below, computed with the
+# original per-engine `_lower` + `_contains_any` implementation.
+GOLDEN_DIGEST = "4af99785b93fddde4d3704d80521915ea3b1c518c0f595065ba700cca7ab5274"
+
+
+def random_text(rng: random.Random) -> str:
+    parts = []
+    for _ in range(rng.randint(0, 12)):
+        word = rng.choice(VOCAB) if rng.random() < 0.35 else rng.choice(FILLER)
+        if rng.random() < 0.1:
+            word = word.upper()
+        parts.append(word)
+        parts.append(rng.choice(SEPARATORS))
+    return "".join(parts)
+
+
+def long_text(rng: random.Random) -> str:
+    text = " ".join(random_text(rng) for _ in range(rng.randint(10, 60)))
+    if rng.random() < 0.5:
+        text += rng.choice(ODDITIES)
+    return text
+
+
+def fingerprint(state):
+    return (
+        state.proximity_state.value,
+        state.proximity_uncertainty,
+        sorted((ra.domain.value, ra.confidence.value) for ra in state.risk_domains),
+        state.reversibility_class.value,
+        state.consequence_horizon.value,
+        state.responsibility_scope.value,
+        sorted(oc.value for oc in state.outcome_classes),
+        [u.value for u in state.explicit_unknown_zone],
+    )
+
+
+def test_scan_matches_substring_semantics():
+    rng = random.Random(1209)
+    for _ in range(600):
+        text = (long_text(rng) if rng.random() < 0.5 else random_text(rng)).lower()
+        expected = {m for m in VOCAB if m in text}
+        assert DECISION_VOCABULARY.scan(text) == expected, repr(text)
+    assert any(len(long_text(rng)) >= TOKEN_INDEX_MIN_CHARS for _ in range(5))
+
+
+def test_compound_markers_and_embedded_substrings_on_long_text():
+    padding = "lorem ipsum " * (TOKEN_INDEX_MIN_CHARS // 12 + 1)
+    text = padding + "mustard self-harm cannot  undo i'm going to the trustees"
+    hits = DECISION_VOCABULARY.scan(text)
+    # Substring semantics: "us" inside "mustard", "must" is not a marker.
+    assert "us" in hits
+    assert "self-harm" in hits
+    assert "cannot undo" not in hits
+    assert "i'm going to" in hits and "going to" in hits
+    assert hits == {m for m in VOCAB if m in text}
+
+
+def test_vocabulary_dedupes_and_rejects_bad_markers():
+    vocabulary = MarkerVocabulary(["now", "today", "now"])
+    assert vocabulary.markers == ("now", "today")
+    with pytest.raises(ValueError):
+        MarkerVocabulary(["Today"])
+    with pytest.raises(ValueError):
+        MarkerVocabulary([""])
+
+
+def test_shared_features_match_engine_local_scans():
+    rng = random.Random(77)
+    for _ in range(500):
+        message = long_text(rng) if rng.random() < 0.3 else random_text(rng)
+        framing = random_text(rng) if rng.random() < 0.4 else None
+        features = extract_text_features(message, framing, DECISION_VOCABULARY)
+        assert classify_proximity(message, framing, features) == classify_proximity(message, framing)
+        assert classify_reversibility(message, features) == classify_reversibility(message)
+        assert classify_horizon(message, features) == classify_horizon(message)
+        assert classify_responsibility_scope(message, framing, features) == classify_responsibility_scope(
+            message, framing
+        )
+
+
+def test_assembly_output_unchanged_golden():
+    rng = random.Random(912)
+    digest = hashlib.sha256()
+    for _ in range(3000):
+        message = random_text(rng)
+        framing = random_text(rng) if rng.random() < 0.3 else None
+        try:
+            fp = fingerprint(assemble_decision_state("d", "t", message, framing))
+        except Exception as exc:  # noqa: BLE001
+            fp = type(exc).__name__
+        digest.update(json.dumps(fp).encode())
+    assert digest.hexdigest() == GOLDEN_DIGEST
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""
+Audit chain verification: full walk vs checkpointed vs segment-parallel.
+
+Builds a signed chain of --events audit events, then times:
+  full         verify_chain(full=True), every event from index 0
+  incremental  verify_chain() after appending --append events to a log whose
+               last checkpoint is the previous tip
+  parallel     verify_parallel() over the whole chain with --segments worker
+               processes, each anchored on the stored prev_sig boundary
+  recompute    recompute_signatures() (stored events reused, not copied)
+Then tampers one event in the middle and checks that full and parallel
+report the same first bad index.
+
+Usage:
+    python scripts/bench_audit_verify.py --events 1000000 --segments 8
+    python scripts/bench_audit_verify.py --events 100000 --append 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from backend.app.governance.audit import (  # noqa: E402
+    AUDIT_MODEL_VERSION,
+    AuditDecision,
+    AuditEvent,
+    AuditLog,
+    AuditOperationType,
+    AuditReasonCode,
+    compute_signature_and_id,
+    compute_tenant_ref,
+    create_event_core_pack,
+)
+
+
+def _append(log: AuditLog, count: int) -> None:
+    tenant_ref = compute_tenant_ref("bench-tenant")
+    prev_sig = log.get_last_signature()
+    for i in range(count):
+        struct_meta = {"dropped_keys_count": 0, "redacted_values_count": 0, "had_forbidden_keys": False, "step": i % 97}
+        core_pack = create_event_core_pack(
+            AUDIT_MODEL_VERSION, (i // 60) * 60_000, tenant_ref, AuditOperationType.GOVERNANCE_OP,
+            AuditDecision.ALLOW, AuditReasonCode.INVALID_REQUEST, struct_meta, prev_sig,
+        )
+        signature, event_id = compute_signature_and_id(core_pack)
+        log.append(AuditEvent(
+            event_id=event_id, event_version=AUDIT_MODEL_VERSION, ts_bucket_ms=core_pack["ts_bucket_ms"],
+            tenant_ref=tenant_ref, operation=AuditOperationType.GOVERNANCE_OP, decision=AuditDecision.ALLOW,
+            reason=AuditReasonCode.INVALID_REQUEST, struct_meta=struct_meta, prev_sig=prev_sig, signature=signature,
+        ))
+        prev_sig = signature
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=1_000_000)
+    parser.add_argument("--append", type=int, default=1000, help="events appended before the incremental check")
+    parser.add_argument("--segments", type=int, default=os.cpu_count() or 4)
+    args = parser.parse_args()
+
+    log = AuditLog()
+    _, build_ms = _timed(lambda: _append(log, args.events))
+    print(f"built {args.events} events in {build_ms / 1000:.1f} s")
+
+    full, full_ms = _timed(lambda: log.verify_chain(full=True))
+    print(f"full         {full_ms:10.1f} ms  {full}")
+    _append(log, args.append)
+    incremental, inc_ms = _timed(log.verify_chain)
+    print(f"incremental  {inc_ms:10.1f} ms  {incremental}  ({args.append} new events, {len(log.checkpoints())} checkpoints)")
+    parallel, par_ms = _timed(lambda: log.verify_parallel(segments=args.segments))
+    print(f"parallel     {par_ms:10.1f} ms  {parallel}  ({args.segments} segments)")
+    recomputed, rec_ms = _timed(log.recompute_signatures)
+    reused = sum(a is b for a, b in zip(recomputed, log._events))
+    print(f"recompute    {rec_ms:10.1f} ms  reused {reused} of {len(recomputed)}")
+
+    bad = len(log._events) // 2
+    log._events[bad] = replace(log._events[bad], struct_meta={"tampered": True})
+    tampered_full = log.verify_chain(full=True)
+    tampered_parallel = log.verify_parallel(segments=args.segments)
+    print(f"tampered at {bad}: full={tampered_full} parallel={tampered_parallel}")
+
+    ok = full == incremental == parallel == (True, None) and tampered_full == tampered_parallel == (False, bad)
+    print(f"full/incremental x{full_ms / max(inc_ms, 1e-9):.0f}  full/parallel x{full_ms / max(par_ms, 1e-9):.1f}  "
+          f"{'results agree' if ok else 'RESULTS DIFFER'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""
+Canonical JSON + SHA-256 signing: legacy per-module encoders vs the shared
+encoder (backend/app/perf/canonical.py), json and orjson backends.
+
+"legacy" is what audit/export/retention did before: a recursively sorted
+copy, json.dumps(sort_keys=True), str.encode, sha256. Payloads: an audit
+core pack, a deepthink decision signature pack (5 passes) and a
+200-event export bundle. Digests must be identical for every mode.
+
+Usage:
+    python scripts/bench_canonical_json.py --runs 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from backend.app.perf import canonical  # noqa: E402
+
+
+def _sort_dict_recursively(obj):
+    if isinstance(obj, dict):
+        return {key: _sort_dict_recursively(value) for key, value in sorted(obj.items())}
+    if isinstance(obj, list):
+        return [_sort_dict_recursively(item) for item in obj]
+    return obj
+
+
+def _legacy_sha256(obj) -> str:
+    encoded = json.dumps(_sort_dict_recursively(obj), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _payloads() -> dict:
+    audit_pack = {
+        "event_version": "20.3.0",
+        "ts_bucket_ms": 1_700_000_000_000,
+        "tenant_ref": "a" * 64,
+        "operation": "TOOL_CALL",
+        "decision": "ALLOW",
+        "reason": "TOOL_NOT_ALLOWED",
+        "struct_meta": {"dropped_keys_count": 0, "redacted_values_count": 1, "had_forbidden_keys": False, "tool": "WEB"},
+        "prev_sig": "b" * 64,
+    }
+    deepthink_pack = {
+        "stable_inputs": {"budget_units_remaining": 95, "breaker_tripped": False, "abuse_blocked": False},
+        "pass_plan": ["REFINE", "STRESS_TEST", "COUNTERARG", "ALTERNATIVES", "REGRET"],
+        "deltas_structure": [{"op": "set", "path": f"decision.field_{i}", "value_type": "str", "value_len": 40} for i in range(10)],
+        "validator_failures": 0,
+        "stop_reason": "SUCCESS_COMPLETED",
+    }
+    export_bundle = {
+        "export_version": "20.5.0",
+        "tenant_hash": "c" * 64,
+        "audit_events": [
+            {"event_id": f"{i:032x}", "operation": "TOOL_CALL", "decision": "ALLOW", "reason": "OK", "signature": "d" * 64}
+            for i in range(200)
+        ],
+        "metrics": {"memory_write_counts": {"attempted": 10, "accepted": 9, "rejected": 1}, "grade_histogram": {"A": 3, "B": 1}},
+    }
+    return {"audit core pack": audit_pack, "deepthink signature": deepthink_pack, "export bundle (200)": export_bundle}
+
+
+def _time(fn, obj, runs: int) -> float:
+    start = time.perf_counter()
+    for _ in range(runs):
+        fn(obj)
+    return (time.perf_counter() - start) * 1e6 / runs
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=20000)
+    args = parser.parse_args()
+
+    backends = ["json"] + (["orjson"] if canonical.orjson is not None else [])
+    ok = True
+    previous = canonical.canonical_backend()
+    try:
+        for name, obj in _payloads().items():
+            runs = max(1, args.runs // (50 if "export" in name else 1))
+            expected = _legacy_sha256(obj)
+            timings = {"legacy": _time(_legacy_sha256, obj, runs)}
+            for backend in backends:
+                canonical.set_canonical_backend(backend)
+                ok = ok and canonical.canonical_sha256(obj) == expected
+                timings[backend] = _time(canonical.canonical_sha256, obj, runs)
+            cells = "  ".join(f"{mode} {us:8.2f} us" for mode, us in timings.items())
+            print(f"{name:<22} {cells}  best x{timings['legacy'] / min(timings.values()):.1f}")
+    finally:
+        canonical.set_canonical_backend(previous)
+    if canonical.orjson is None:
+        print("orjson not installed: json backend only")
+    print("digests identical" if ok else "DIGESTS DIFFER")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
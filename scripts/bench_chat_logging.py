@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+"""
+/api/chat logging benchmark: logging off vs synchronous vs queued handlers.
+
+Drives --requests sequential POST /api/chat through the full app (WAF, plan
+guard, governed runtime, LLMClient) with the provider answered in-process by
+an httpx.MockTransport, so the request path is CPU + logging only (~20 INFO
+records per request). The console handler from LOGGING_CONFIG writes to a
+temporary file, either directly ("file") or with --sink-delay-us of blocking
+per flush ("slow", a pipe to a busy log collector). Modes:
+
+- off:   logging.disable(CRITICAL)
+- sync:  LOG_QUEUE_SIZE=0 behaviour, the handler writes on the request path
+- async: install_log_pipeline(), the listener thread writes; drain time at
+         stop and dropped records are reported separately
+
+Usage:
+    python scripts/bench_chat_logging.py --requests 500
+    python scripts/bench_chat_logging.py --requests 2000 --queue-size 256 --sink-delay-us 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-bench")
+os.environ.setdefault("LLM_API_BASE", "http://llm.bench/v1")
+# One client hammers the app: lift the WAF windows and token budgets
+for _name in ("WAF_IP_BURST_LIMIT", "WAF_IP_SUSTAIN_LIMIT", "WAF_SUBJECT_BURST_LIMIT", "WAF_SUBJECT_SUSTAIN_LIMIT",
+              "COST_GLOBAL_DAILY_TOKENS", "COST_ACTOR_DAILY_TOKENS", "COST_IP_WINDOW_TOKENS"):
+    os.environ.setdefault(_name, "100000000")
+
+import httpx  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+import backend.app.llm_client as llm_client  # noqa: E402
+import backend.app.main as main  # noqa: E402
+from backend.app.observability.log_pipeline import install_log_pipeline, log_pipeline_stats, stop_log_pipeline  # noqa: E402
+
+ANSWER = (
+    "Congestion control adapts the send window to feedback from the network. "
+    "Loss or delay shrinks the window, acknowledgements grow it again. "
+    "Some details are uncertain for your setup."
+)
+
+
+class SlowSink:
+    """File stream whose flush blocks for delay_s (releases the GIL like a full pipe)."""
+
+    def __init__(self, stream, delay_s: float) -> None:
+        self.stream = stream
+        self.delay_s = delay_s
+
+    def write(self, text: str) -> int:
+        return self.stream.write(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+        if self.delay_s:
+            time.sleep(self.delay_s)
+
+
+def _provider(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"choices": [{"message": {"role": "assistant", "content": ANSWER}}]})
+
+
+def _run(client: TestClient, requests: int) -> tuple[float, int]:
+    ok = 0
+    start = time.perf_counter()
+    for i in range(requests):
+        resp = client.post("/api/chat", json={"user_text": f"Explain how TCP congestion control works ({i})"})
+        ok += resp.status_code == 200
+    return time.perf_counter() - start, ok
+
+
+def _set_sink(stream) -> None:
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, logging.StreamHandler):
+            handler.setStream(stream)
+
+
+def main_() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--queue-size", type=int, default=10000)
+    parser.add_argument("--sink-delay-us", type=int, default=200)
+    args = parser.parse_args()
+
+    mock = httpx.AsyncClient(transport=httpx.MockTransport(_provider))
+    llm_client.get_shared_async_httpx_client = lambda: mock
+
+    out = tempfile.NamedTemporaryFile("w", suffix=".log", delete=False)
+    stop_log_pipeline()
+    _set_sink(out)
+    failed = 0
+    with TestClient(main.app) as client:
+        stop_log_pipeline()
+        _run(client, min(50, args.requests))  # warm-up: plan caches, pools
+
+        logging.disable(logging.CRITICAL)
+        off, ok = _run(client, args.requests)
+        logging.disable(logging.NOTSET)
+        failed += args.requests - ok
+        print(f"{'off':<12} {off * 1e3 / args.requests:8.3f} ms/request")
+
+        for sink, delay_us in (("file", 0), ("slow", args.sink_delay_us)):
+            _set_sink(SlowSink(out, delay_us / 1e6))
+            elapsed, ok = _run(client, args.requests)
+            failed += args.requests - ok
+            print(f"{sink + ' sync':<12} {elapsed * 1e3 / args.requests:8.3f} ms/request  "
+                  f"logging +{(elapsed - off) * 1e6 / args.requests:6.0f} us/request")
+
+            install_log_pipeline(queue_size=args.queue_size)
+            elapsed, ok = _run(client, args.requests)
+            failed += args.requests - ok
+            dropped = sum(log_pipeline_stats()["dropped"].values())
+            drain_start = time.perf_counter()
+            stop_log_pipeline()
+            drain_ms = (time.perf_counter() - drain_start) * 1000
+            print(f"{sink + ' async':<12} {elapsed * 1e3 / args.requests:8.3f} ms/request  "
+                  f"logging +{(elapsed - off) * 1e6 / args.requests:6.0f} us/request  "
+                  f"drain {drain_ms:.1f} ms  dropped {dropped}")
+
+    out.close()
+    os.unlink(out.name)
+    print(f"requests failed {failed}")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main_())
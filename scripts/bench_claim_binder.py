@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+"""
+Benchmark: claim-to-source binding, per-claim full scan vs inverted index.
+
+The reference re-tokenizes every snippet and builds a CitationRef for every
+candidate, per claim; bind_claims_to_sources tokenizes each snippet once,
+scores only indexed candidates and builds CitationRefs for the selected
+citations only. Both must produce identical bindings.
+
+Usage:
+    python scripts/bench_claim_binder.py --claims 50 --sources 10 --snippets 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from backend.app.research.citations import make_citation_ref  # noqa: E402
+from backend.app.research.claim_binder import (  # noqa: E402
+    MAX_CITATIONS_PER_CLAIM,
+    Claim,
+    bind_claims_to_sources,
+    compute_claim_id,
+    compute_overlap_score,
+    compute_tie_break_hash,
+    tokenize_text,
+)
+from backend.app.retrieval.types import SourceBundle, SourceSnippet, ToolKind  # noqa: E402
+
+WORDS = (
+    "climate policy energy solar wind carbon emissions market growth report agency "
+    "budget federal research funding nuclear battery storage grid transmission demand "
+    "price inflation rates central bank housing supply chain semiconductor export"
+).split()
+DOMAINS = ["energy.gov", "europa.eu", "reuters.com", "nature.com", "imf.org", "example.org"]
+
+
+def build_inputs(n_claims: int, n_sources: int, n_snippets: int, seed: int = 18):
+    rng = random.Random(seed)
+    claims = []
+    for _ in range(n_claims):
+        text = " ".join(rng.choice(WORDS) for _ in range(10))
+        claims.append(Claim(claim_id=compute_claim_id(text), text=text, kind="FACT", required=True, confidence="MED"))
+    sources = []
+    for i in range(n_sources):
+        sources.append(SourceBundle(
+            source_id=f"src_{i:03d}",
+            tool=ToolKind.WEB,
+            url=f"https://{DOMAINS[i % len(DOMAINS)]}/article/{i}",
+            domain=DOMAINS[i % len(DOMAINS)],
+            title=f"Source {i}",
+            retrieved_at="2026-01-29T00:00:00Z",
+            snippets=[SourceSnippet(text=" ".join(rng.choice(WORDS) for _ in range(40))) for _ in range(n_snippets)],
+            metadata={"published_at": "2025-06-01"} if i % 2 else {},
+        ))
+    return claims, sources
+
+
+def reference_bind(claims, sources):
+    bindings = {}
+    for claim in claims:
+        claim_tokens = tokenize_text(claim.text)
+        candidates = []
+        for bundle in sources:
+            published_date = bundle.metadata.get("published_at") if bundle.metadata else None
+            for idx, snippet in enumerate(bundle.snippets):
+                overlap = compute_overlap_score(claim_tokens, tokenize_text(snippet.text))
+                if overlap >= 2 or any(t in bundle.domain.lower() for t in claim_tokens):
+                    ref = make_citation_ref(
+                        bundle.source_id, bundle.url, bundle.domain, bundle.title, idx,
+                        len(snippet.text), published_date, None,
+                    )
+                    candidates.append((
+                        0, overlap, 1 if published_date else 0, bundle.domain, bundle.url, idx,
+                        compute_tie_break_hash(claim.claim_id, bundle.source_id, idx), ref,
+                    ))
+        candidates.sort(key=lambda x: (-x[0], -x[1], -x[2], x[3], x[4], x[5], x[6]))
+        seen, selected = set(), []
+        for candidate in candidates:
+            ref = candidate[7]
+            if (ref.source_id, ref.snippet_index) not in seen:
+                selected.append(ref)
+                seen.add((ref.source_id, ref.snippet_index))
+            if len(selected) >= MAX_CITATIONS_PER_CLAIM:
+                break
+        bindings[claim.claim_id] = selected
+    return bindings
+
+
+def _timed(fn, rounds: int):
+    result = None
+    start = time.perf_counter()
+    for _ in range(rounds):
+        result = fn()
+    return (time.perf_counter() - start) * 1000.0 / rounds, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--claims", type=int, default=50)
+    parser.add_argument("--sources", type=int, default=10)
+    parser.add_argument("--snippets", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    claims, sources = build_inputs(args.claims, args.sources, args.snippets)
+    ref_ms, expected = _timed(lambda: reference_bind(claims, sources), args.rounds)
+    new_ms, actual = _timed(lambda: bind_claims_to_sources(claims, sources), args.rounds)
+    print(f"claims={args.claims} sources={args.sources} snippets/source={args.snippets}")
+    print(f"full scan       {ref_ms:9.2f} ms")
+    print(f"inverted index  {new_ms:9.2f} ms  speedup x{ref_ms / max(new_ms, 1e-9):.1f}")
+    print(f"bindings identical: {actual == expected}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
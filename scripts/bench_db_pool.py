@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+"""
+Benchmark: per-call psycopg.connect vs pooled connections on the /api/chat DB path.
+
+Simulates one chat request as the DB touches it performs (session upsert,
+WAF lockout + two window increments for IP and subject, quota ensure/fetch,
+invocation log insert) and reports connections opened per request and
+p50/p99 latency for both modes.
+
+Usage (requires a local Postgres with backend/app/db/migrations applied):
+    DATABASE_URL=postgresql://localhost/cognitive python scripts/bench_db_pool.py --requests 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+import psycopg  # noqa: E402
+
+from backend.app.db.pool import ConnectionPool  # noqa: E402
+
+# touches per simulated request: session, waf ip, waf subject, quota, invocation log
+TOUCHES_PER_REQUEST = 5
+
+
+def _touch(conn) -> None:
+    with conn.cursor() as cur:
+        cur.execute("SELECT 1;")
+        cur.fetchone()
+    conn.commit()
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[idx]
+
+
+def run_direct(url: str, requests: int) -> tuple[list[float], int]:
+    opened = 0
+    latencies: list[float] = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        for _ in range(TOUCHES_PER_REQUEST):
+            with psycopg.connect(url, connect_timeout=3) as conn:
+                opened += 1
+                _touch(conn)
+        latencies.append((time.perf_counter() - start) * 1000.0)
+    return latencies, opened
+
+
+def run_pooled(url: str, requests: int, max_size: int) -> tuple[list[float], int]:
+    pool = ConnectionPool(url, min_size=1, max_size=max_size)
+    pool.warm()
+    latencies: list[float] = []
+    try:
+        for _ in range(requests):
+            start = time.perf_counter()
+            for _ in range(TOUCHES_PER_REQUEST):
+                with pool.connection() as conn:
+                    _touch(conn)
+            latencies.append((time.perf_counter() - start) * 1000.0)
+        return latencies, pool.stats().connections_opened
+    finally:
+        pool.close()
+
+
+def _report(label: str, latencies: list[float], opened: int, requests: int) -> None:
+    print(
+        f"{label:<8} conns/request={opened / requests:6.3f} "
+        f"p50={statistics.median(latencies):8.2f}ms p99={_percentile(latencies, 99):8.2f}ms"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--pool-size", type=int, default=4)
+    args = parser.parse_args()
+
+    url = os.environ.get("DATABASE_URL")
+    if not url:
+        print("ERROR: DATABASE_URL is required", file=sys.stderr)
+        return 1
+
+    direct, direct_opened = run_direct(url, args.requests)
+    pooled, pooled_opened = run_pooled(url, args.requests, args.pool_size)
+    _report("direct", direct, direct_opened, args.requests)
+    _report("pooled", pooled, pooled_opened, args.requests)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
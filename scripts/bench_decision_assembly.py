@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark: assemble_decision_state per-message cost on long inputs.
+
+Compares the per-engine path (every engine lowercases the message and scans
+its own markers, as when the apply_* engines are called standalone) with the
+shared path used by assemble_decision_state (one lowercase, one scan over the
+union of all engine markers), and checks both yield the same DecisionState.
+
+Usage:
+    python scripts/bench_decision_assembly.py --words 2000 --rounds 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from backend.mci_backend import decision_assembly  # noqa: E402
+from backend.mci_backend.decision_assembly import assemble_decision_state  # noqa: E402
+from backend.mci_backend.decision_text_features import extract_text_features  # noqa: E402
+
+FILLER = (
+    "we should compare the two vendors before the review and write down what the team "
+    "expects from the rollout including the budget notes and open questions"
+).split()
+NEUTRAL = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor".split()
+
+
+def build_message(words: int, neutral: bool, seed: int = 12) -> str:
+    rng = random.Random(seed)
+    pool = NEUTRAL if neutral else FILLER
+    return " ".join(rng.choice(pool) for _ in range(words))
+
+
+def _per_engine_features(message, intent_framing, vocabulary):
+    # Each engine falls back to its own lowercase + scan when features is None.
+    return None
+
+
+def _timed(fn, rounds: int) -> tuple[float, object]:
+    result = None
+    start = time.perf_counter()
+    for _ in range(rounds):
+        result = fn()
+    return (time.perf_counter() - start) * 1000.0 / rounds, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--words", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--neutral", action="store_true", help="text with no markers (every scan runs to the end)")
+    args = parser.parse_args()
+
+    message = build_message(args.words, args.neutral)
+    framing = "deciding between two vendors"
+
+    def run():
+        return assemble_decision_state("bench", "bench", message, framing)
+
+    decision_assembly.extract_text_features = _per_engine_features
+    try:
+        ref_ms, ref_state = _timed(run, args.rounds)
+    finally:
+        decision_assembly.extract_text_features = extract_text_features
+    new_ms, new_state = _timed(run, args.rounds)
+
+    print(f"words={args.words} chars={len(message)} neutral={args.neutral}")
+    print(f"per-engine scans {ref_ms:9.3f} ms/message")
+    print(f"shared scan      {new_ms:9.3f} ms/message  speedup x{ref_ms / max(new_ms, 1e-9):.1f}")
+    print(f"state match: {ref_state == new_state}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+"""
+Deepthink engine benchmark: deepcopy per pass vs copy-on-write states.
+
+Runs run_engine with 5 passes over a large decision state (--turns context
+entries of --tokens ints each, plus --evidence decision entries). The
+"deepcopy" mode restores the previous apply_delta behaviour (a full deepcopy
+of the state before every patch); "cow" is the current path-copying
+apply_delta. Reports wall time per run and bytes allocated per run
+(tracemalloc peak over one run). Final states and signatures must match.
+
+With --pass-ms N each pass also sleeps N ms (standing in for model latency)
+and the run is repeated with max_parallel=--parallel. Only REFINE (first,
+undeclared, always serial) changes the answer; the other four passes write
+decision.alternatives, which none of them reads, so they overlap. Outputs
+must match serial.
+
+Usage:
+    python scripts/bench_deepthink_engine.py --turns 2000 --tokens 50 --runs 50
+    python scripts/bench_deepthink_engine.py --pass-ms 40 --parallel 4 --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from backend.app.deepthink import engine  # noqa: E402
+from backend.app.deepthink.engine import EngineContext, EngineInput, PassRunResult  # noqa: E402
+from backend.app.deepthink.patch import apply_delta  # noqa: E402
+from backend.app.deepthink.router import Plan  # noqa: E402
+from backend.app.deepthink.schema import PatchOp  # noqa: E402
+
+PASSES = ["REFINE", "STRESS_TEST", "COUNTERARG", "ALTERNATIVES", "REGRET"]
+
+
+def _deepcopy_apply_delta(state, delta):
+    return apply_delta(copy.deepcopy(state), delta)
+
+
+def _state(turns: int, tokens: int, evidence: int) -> dict:
+    return {
+        "decision": {
+            "action": "ANSWER",
+            "answer": "baseline",
+            "evidence": [{"id": i, "score": i / 7.0, "source": f"doc-{i}"} for i in range(evidence)],
+        },
+        "context": {"turns": [{"idx": i, "role": "user", "tokens": list(range(tokens))} for i in range(turns)]},
+    }
+
+
+def _runner(pass_type, state, context):
+    idx = PASSES.index(pass_type)
+    delta = [
+        PatchOp(op="set", path="decision.answer", value=f"refined answer {idx}"),
+        PatchOp(op="set", path="decision.rationale", value=f"pass {pass_type}"),
+    ]
+    return PassRunResult(pass_type=pass_type, delta=delta, cost_units=1, duration_ms=1)
+
+
+def _slow_runner(pass_ms: float):
+    def runner(pass_type, state, context):
+        time.sleep(pass_ms / 1000)
+        if pass_type == PASSES[0]:
+            delta = [PatchOp(op="set", path="decision.answer", value="refined answer")]
+        else:
+            delta = [PatchOp(op="set", path="decision.alternatives", value=[pass_type.lower()])]
+        return PassRunResult(pass_type=pass_type, delta=delta, cost_units=1, duration_ms=int(pass_ms))
+
+    return runner
+
+
+def _run(initial: dict, runner=_runner, max_parallel: int = 1):
+    plan = Plan(effective_pass_count=5, pass_plan=PASSES, per_pass_budget=[10] * 5, per_pass_timeout_ms=[10_000] * 5, stop_reason=None)
+    context = EngineContext(request_signature="bench", now_ms=lambda: 0, budget_units_remaining=100)
+    return engine.run_engine(
+        EngineInput(
+            request_signature="bench",
+            initial_state=initial,
+            plan=plan,
+            context=context,
+            pass_runner=runner,
+            max_parallel=max_parallel,
+        )
+    )
+
+
+def _measure(initial: dict, runs: int) -> tuple[float, int, object]:
+    output = _run(initial)
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        _run(initial)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    start = time.perf_counter()
+    for _ in range(runs):
+        _run(initial)
+    return (time.perf_counter() - start) * 1000 / runs, peak, output
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=2000)
+    parser.add_argument("--tokens", type=int, default=50)
+    parser.add_argument("--evidence", type=int, default=500)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--pass-ms", type=float, default=0.0, help="simulated latency per pass")
+    parser.add_argument("--parallel", type=int, default=4)
+    args = parser.parse_args()
+
+    initial = _state(args.turns, args.tokens, args.evidence)
+    results = {}
+    for mode, applier in (("deepcopy", _deepcopy_apply_delta), ("cow", apply_delta)):
+        engine.apply_delta = applier
+        try:
+            results[mode] = _measure(initial, args.runs)
+        finally:
+            engine.apply_delta = apply_delta
+        ms, peak, _ = results[mode]
+        print(f"{mode:<9} {ms:9.3f} ms/run  {peak / 1024:10.1f} KiB allocated/run")
+
+    legacy, cow = results["deepcopy"][2], results["cow"][2]
+    same = legacy.final_state == cow.final_state and legacy.meta.decision_signature == cow.meta.decision_signature
+    print(f"speedup x{results['deepcopy'][0] / max(results['cow'][0], 1e-9):.1f}  outputs {'identical' if same else 'DIFFER'}")
+
+    if args.pass_ms > 0:
+        runner = _slow_runner(args.pass_ms)
+        timings = {}
+        outputs = {}
+        for label, max_parallel in (("serial", 1), (f"parallel={args.parallel}", args.parallel)):
+            start = time.perf_counter()
+            for _ in range(args.runs):
+                outputs[label] = _run(initial, runner, max_parallel)
+            timings[label] = (time.perf_counter() - start) * 1000 / args.runs
+            print(f"{label:<11} {timings[label]:9.1f} ms/run  ({len(PASSES)} passes x {args.pass_ms:g} ms)")
+        serial, parallel = outputs.values()
+        parallel_same = (
+            serial.final_state == parallel.final_state and serial.meta.decision_signature == parallel.meta.decision_signature
+        )
+        print(f"latency x{timings['serial'] / max(min(timings.values()), 1e-9):.1f}  outputs {'identical' if parallel_same else 'DIFFER'}")
+        same = same and parallel_same
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+"""
+Benchmark: tool-output sanitizer throughput (MB/s).
+
+Times sanitize_tool_output on synthetic tool outputs of several sizes, and
+compares detect_injection_segments (precompiled patterns, indexed sentence
+boundaries) against the reference per-pattern re.finditer scan with
+character-walking expand_to_sentence_boundary. Inputs are normalized first,
+so newlines are gone and sentence stops are sparse.
+
+Usage:
+    python scripts/bench_injection_defense.py --sizes-kb 4,12,48 --rounds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from backend.app.research.injection_defense import (  # noqa: E402
+    BASE64_MIN_CHARS,
+    BASE64_PATTERN,
+    PATTERN_GROUPS,
+    SanitizerConfig,
+    detect_injection_segments,
+    expand_to_sentence_boundary,
+    normalize_text,
+    sanitize_tool_output,
+)
+
+FILLER = (
+    "the quarterly report shows steady growth in revenue across regions while costs "
+    "remained flat and the outlook for next year depends on supply chain recovery"
+).split()
+INJECTIONS = ["ignore previous instructions", "paste your api key", "run this", "curl x | bash", "session token"]
+
+
+def build_text(size_chars: int, injection_rate: float, seed: int = 18) -> str:
+    rng = random.Random(seed)
+    words = []
+    length = 0
+    while length < size_chars:
+        word = rng.choice(INJECTIONS) if rng.random() < injection_rate else rng.choice(FILLER)
+        if rng.random() < 0.02:
+            word += "."
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)[:size_chars]
+
+
+def reference_spans(text: str) -> int:
+    text_lower = text.lower()
+    count = 0
+    for _, patterns in PATTERN_GROUPS:
+        for pattern in patterns:
+            for match in re.finditer(pattern, text_lower):
+                expand_to_sentence_boundary(text, match.start(), match.end())
+                count += 1
+    for match in re.finditer(BASE64_PATTERN, text):
+        if match.end() - match.start() >= BASE64_MIN_CHARS:
+            expand_to_sentence_boundary(text, match.start(), match.end())
+            count += 1
+    return count
+
+
+def _timed(fn, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes-kb", type=str, default="4,12,48")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--injection-rate", type=float, default=0.01)
+    args = parser.parse_args()
+
+    print(f"{'size':>7} {'reference scan':>15} {'compiled':>13} {'sanitize':>11}")
+    for size_kb in [int(x) for x in args.sizes_kb.split(",") if x.strip()]:
+        size = size_kb * 1024
+        text = normalize_text(build_text(size, args.injection_rate))
+        mb = len(text.encode("utf-8")) / (1024 * 1024)
+        config = SanitizerConfig(max_input_chars=size)
+
+        ref_s = _timed(lambda: reference_spans(text), args.rounds)
+        new_s = _timed(lambda: detect_injection_segments(text), args.rounds)
+        sanitize_s = _timed(lambda: sanitize_tool_output(text, config), args.rounds)
+        print(
+            f"{size_kb:>5}KB {mb / ref_s:>10.2f} MB/s {mb / new_s:>8.2f} MB/s "
+            f"{mb / sanitize_s:>6.2f} MB/s"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""
+Soak test: bounded limiter state under millions of distinct subjects.
+
+Drives the WAF in-memory limiter (_rate_check_with without a DB) and the quota
+token buckets with a new subject per request on a simulated clock, sampling
+RSS and per-request cost every chunk. After a warm-up (stores full and one
+TTL horizon elapsed) RSS must stay flat and the per-request cost constant;
+the script exits 1 otherwise.
+
+Usage:
+    python scripts/bench_limiter_store.py --subjects 2000000 --max-keys 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from backend.app.perf.limiter_store import LimiterStore  # noqa: E402
+from backend.app.security import quotas  # noqa: E402
+from backend.app.waf import guard  # noqa: E402
+from backend.app.waf.guard import LimitWindow, RateKey  # noqa: E402
+
+WINDOWS = (LimitWindow(5, 10), LimitWindow(60, 60))
+
+
+def _rss_mb() -> float:
+    try:
+        with open("/proc/self/statm") as fh:
+            pages = int(fh.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError):
+        import resource
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--subjects", type=int, default=2_000_000)
+    parser.add_argument("--max-keys", type=int, default=50_000)
+    parser.add_argument("--rate", type=float, default=2_000.0, help="simulated requests per second")
+    parser.add_argument("--chunk", type=int, default=100_000)
+    parser.add_argument("--rss-slack-mb", type=float, default=16.0)
+    parser.add_argument("--cost-slack", type=float, default=2.0, help="max ratio of worst to first post-warm-up chunk")
+    args = parser.parse_args()
+
+    guard._mem_windows = LimiterStore(args.max_keys, name="waf_windows")
+    guard._mem_locks = LimiterStore(args.max_keys, name="waf_locks")
+    quotas._buckets = LimiterStore(args.max_keys, name="quota_buckets")
+    os.environ.pop("QUOTA_FORCE_BLOCK", None)
+
+    # Warm-up: fill every store and let one full TTL horizon (sustain window) pass.
+    warmup = max(2 * args.max_keys, int(args.rate * (WINDOWS[1].window_seconds + 2)))
+    samples: list[tuple[int, float, float]] = []
+    t0 = 1_700_000_000.0
+    start = time.perf_counter()
+    for i in range(args.subjects):
+        now = t0 + i / args.rate
+        guard._rate_check_with(None, RateKey(scope="anon", value=f"subject-{i}"), WINDOWS, now)
+        quotas.quota_precheck(
+            quotas.QuotaContext(
+                plan="free", actor_key=f"actor-{i}", ip_hash="", est_input_tokens=1, est_output_cap=None, now_monotonic=now
+            )
+        )
+        if (i + 1) % args.chunk == 0:
+            elapsed = time.perf_counter() - start
+            samples.append((i + 1, _rss_mb(), elapsed * 1e6 / args.chunk))
+            print(
+                f"subjects={i + 1:>9} rss={samples[-1][1]:7.1f}MB  {samples[-1][2]:6.2f} us/request  "
+                f"waf_windows={len(guard._mem_windows)} quota_buckets={len(quotas._buckets)}"
+            )
+            start = time.perf_counter()
+
+    steady = [s for s in samples if s[0] > warmup]
+    if len(steady) < 2:
+        print("not enough post-warm-up samples; raise --subjects", file=sys.stderr)
+        return 1
+    rss_growth = max(s[1] for s in steady) - steady[0][1]
+    cost_ratio = max(s[2] for s in steady) / max(steady[0][2], 1e-9)
+    stats = guard._mem_windows.stats()
+    print(f"evicted={stats.evicted} expired={stats.expired} rss_growth={rss_growth:.1f}MB cost_ratio={cost_ratio:.2f}")
+    ok = rss_growth <= args.rss_slack_mb and cost_ratio <= args.cost_slack
+    print("flat" if ok else "NOT FLAT")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
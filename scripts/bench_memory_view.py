@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+"""
+Benchmark: memory view reads via full log replay vs incremental materialized view,
+and replay time vs log length with and without snapshots.
+
+Builds a scope with N events (adds, expiries, revocations) and times
+MemoryEventLogStore.replay() against MemoryEventLogStore.recompute() at
+distinct now_ms values (so the per-view memo does not hide the cost).
+With --lengths, times recompute_current_view over the full log vs from
+the latest snapshot (compaction every --snapshot-interval events).
+
+Usage:
+    python scripts/bench_memory_view.py --events 10000 --reads 50
+    python scripts/bench_memory_view.py --lengths 1000,2500,5000,10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from backend.app.memory.schema import (  # noqa: E402
+    MemoryCategory,
+    MemoryFact,
+    MemoryValueType,
+    Provenance,
+    ProvenanceType,
+)
+from backend.app.memory.store import (  # noqa: E402
+    MemoryEventLogStore,
+    StoreCaps,
+    create_fact_added_event,
+    create_fact_expired_event,
+    create_fact_revoked_event,
+    recompute_current_view,
+)
+
+SCOPE = "bench_scope"
+
+
+def _fact(rng: random.Random, fact_id: str) -> MemoryFact:
+    return MemoryFact(
+        fact_id=fact_id,
+        category=rng.choice(list(MemoryCategory)),
+        key=f"key_{rng.randrange(50)}",
+        value_type=MemoryValueType.STR,
+        value_str="value",
+        value_num=None,
+        value_bool=None,
+        value_list_str=None,
+        confidence=rng.random(),
+        provenance=Provenance(
+            source_type=rng.choice(list(ProvenanceType)),
+            source_id="bench",
+            collected_at_ms=1000000 + rng.randrange(100000),
+            citation_ids=[],
+        ),
+        created_at_ms=1000000,
+        expires_at_ms=None,
+        tags=[],
+    )
+
+
+def build_events(n_events: int, seed: int = 19, n_ids: int = 0) -> list:
+    rng = random.Random(seed)
+    n_ids = n_ids or max(1, n_events // 3)
+    events = []
+    for i in range(n_events):
+        fact_id = f"fact_{rng.randrange(n_ids):06d}"
+        roll = rng.random()
+        if roll < 0.8:
+            event = create_fact_added_event(SCOPE, _fact(rng, fact_id), 1000000 + i, 1000000 + rng.randrange(10_000_000))
+        elif roll < 0.9:
+            event = create_fact_expired_event(SCOPE, fact_id, 1000000 + i, 1000000 + i)
+        else:
+            event = create_fact_revoked_event(SCOPE, fact_id, 1000000 + i, "USER_REQUEST", 1000000 + i)
+        events.append(event)
+    return events
+
+
+def build_store(n_events: int, seed: int = 19, snapshot_interval: int = 0, n_ids: int = 0) -> MemoryEventLogStore:
+    store = MemoryEventLogStore(snapshot_interval=snapshot_interval)
+    store.append_events(SCOPE, build_events(n_events, seed, n_ids))
+    return store
+
+
+def _time_reads(fn, reads: int) -> float:
+    start = time.perf_counter()
+    for i in range(reads):
+        fn(SCOPE, 2000000 + i, StoreCaps())
+    return (time.perf_counter() - start) * 1000.0 / reads
+
+
+def bench_lengths(lengths: list[int], reads: int, snapshot_interval: int, n_ids: int) -> None:
+    print(f"{'events':>8} {'full replay':>14} {'from snapshot':>14} {'tail':>6}")
+    for n_events in lengths:
+        events = build_events(n_events, n_ids=n_ids)
+        store = build_store(n_events, snapshot_interval=snapshot_interval, n_ids=n_ids)
+        snapshot = store.get_snapshot(SCOPE)
+        tail = store.read_events(SCOPE)
+
+        start = time.perf_counter()
+        for i in range(reads):
+            recompute_current_view(events, 2000000 + i, StoreCaps())
+        full_ms = (time.perf_counter() - start) * 1000.0 / reads
+
+        start = time.perf_counter()
+        for i in range(reads):
+            recompute_current_view(tail, 2000000 + i, StoreCaps(), snapshot)
+        snap_ms = (time.perf_counter() - start) * 1000.0 / reads
+        print(f"{n_events:>8} {full_ms:>11.3f} ms {snap_ms:>11.3f} ms {len(tail):>6}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=10000)
+    parser.add_argument("--reads", type=int, default=50)
+    parser.add_argument("--lengths", type=str, default="")
+    parser.add_argument("--snapshot-interval", type=int, default=1000)
+    parser.add_argument("--fact-ids", type=int, default=200, help="distinct fact ids for --lengths (long-lived churn)")
+    args = parser.parse_args()
+
+    if args.lengths:
+        lengths = [int(x) for x in args.lengths.split(",") if x.strip()]
+        bench_lengths(lengths, args.reads, args.snapshot_interval, args.fact_ids)
+        return 0
+
+    build_start = time.perf_counter()
+    store = build_store(args.events)
+    build_ms = (time.perf_counter() - build_start) * 1000.0
+
+    replay_ms = _time_reads(store.replay, args.reads)
+    incremental_ms = _time_reads(store.recompute, args.reads)
+    print(f"events={args.events} build={build_ms:.1f}ms")
+    print(f"replay      {replay_ms:8.3f} ms/read")
+    print(f"incremental {incremental_ms:8.3f} ms/read  speedup x{replay_ms / max(incremental_ms, 1e-9):.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
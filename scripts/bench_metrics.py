@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""
+Metrics benchmark: one JSON log line per sample vs the in-process registry.
+
+"log" replays the previous counter/histogram path (build the payload,
+safe_redact, json.dumps, logger.info through a StreamHandler into
+/dev/null). "registry" is the current histogram()/counter() path: a
+sharded in-memory update, no I/O. Each thread records --samples latency
+observations plus one counter increment per sample, over --labels distinct
+plan labels. Also reports a scrape (render_prometheus) of the result.
+
+Usage:
+    python scripts/bench_metrics.py --samples 200000 --threads 1
+    python scripts/bench_metrics.py --samples 50000 --threads 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from backend.app.observability import metrics  # noqa: E402
+from backend.app.observability.logging import safe_redact  # noqa: E402
+
+_log = logging.getLogger("bench.metrics")
+
+
+def _legacy_emit(metric_type: str, name: str, value: float, labels: dict) -> None:
+    payload = {"type": "metric", "metric_type": metric_type, "name": name, "value": value, "labels": labels or {}}
+    _log.info(json.dumps(safe_redact(payload), separators=(",", ":")))
+
+
+def _legacy_worker(samples: int, labels: list) -> None:
+    for i in range(samples):
+        label = labels[i % len(labels)]
+        _legacy_emit("histogram", "chat_latency_ms", float(i % 3000), label)
+        _legacy_emit("counter", "chat_requests", 1, label)
+
+
+def _registry_worker(samples: int, labels: list) -> None:
+    for i in range(samples):
+        label = labels[i % len(labels)]
+        metrics.histogram("chat_latency_ms", float(i % 3000), label)
+        metrics.counter("chat_requests", 1, label)
+
+
+def _run(worker, threads: int, samples: int, labels: list) -> float:
+    pool = [threading.Thread(target=worker, args=(samples, labels)) for _ in range(threads)]
+    start = time.perf_counter()
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=200_000, help="samples per thread")
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument("--labels", type=int, default=4)
+    args = parser.parse_args()
+
+    devnull = open(os.devnull, "w")
+    handler = logging.StreamHandler(devnull)
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s"))
+    _log.addHandler(handler)
+    _log.setLevel(logging.INFO)
+    _log.propagate = False
+
+    labels = [{"plan": f"plan{i}", "status": "2xx"} for i in range(args.labels)]
+    total = args.samples * args.threads * 2
+    results = {
+        "log": _run(_legacy_worker, args.threads, args.samples, labels),
+        "registry": _run(_registry_worker, args.threads, args.samples, labels),
+    }
+    for mode, elapsed in results.items():
+        print(f"{mode:<9} {elapsed * 1e9 / total:9.0f} ns/sample  {elapsed:7.3f} s total")
+
+    start = time.perf_counter()
+    text = metrics.render_prometheus()
+    scrape_ms = (time.perf_counter() - start) * 1000
+    counted = metrics.get_registry().snapshot().counters
+    recorded = sum(v for (name, _), v in counted.items() if name == "chat_requests")
+    print(f"scrape    {scrape_ms:9.3f} ms  ({len(text.splitlines())} lines)")
+    print(f"speedup x{results['log'] / max(results['registry'], 1e-9):.1f}  counted {recorded}/{total // 2}")
+    devnull.close()
+    return 0 if recorded == total // 2 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
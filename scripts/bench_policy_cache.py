@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+"""
+Policy decision benchmark: uncached decide_policy vs the decision cache.
+
+Simulates --turns chat turns spread over --tenants tenants. Each turn makes
+the governed-op decisions of one request (--tool-calls tool calls, a memory
+read, two memory writes and a telemetry emit). Modes:
+
+- uncached: every decision normalizes, validates, resolves caps and signs
+- scoped:   empty decision cache, each turn in policy_request_scope (caps
+            resolved once per turn)
+- cached:   warm process-wide decision cache
+
+Decisions must be identical in every mode.
+
+Usage:
+    python scripts/bench_policy_cache.py --turns 2000 --tenants 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from backend.app.governance import policy_engine  # noqa: E402
+from backend.app.governance.policy_cache import configure_policy_cache, policy_request_scope  # noqa: E402
+from backend.app.governance.policy_engine import OperationType, PolicyRequest, decide_policy  # noqa: E402
+from backend.app.governance.tenant import FeatureFlag, PlanTier, TenantConfig  # noqa: E402
+
+PLANS = list(PlanTier)
+
+
+def _tenant(idx: int) -> TenantConfig:
+    return TenantConfig(
+        tenant_id=f"tenant-{idx}",
+        plan=PLANS[idx % len(PLANS)],
+        regions=["us-east", "eu-west"],
+        enabled_features={FeatureFlag.RESEARCH_ENABLED, FeatureFlag.MEMORY_ENABLED, FeatureFlag.DEEPTHINK_ENABLED},
+    )
+
+
+def _turn(tenant: TenantConfig, tool_calls: int) -> list:
+    hints = {"requested_research": True, "requested_tools": ["WEB"]}
+    requests = [
+        PolicyRequest(tenant_config=tenant, operation=OperationType.TOOL_CALL, request_hints=hints, requested={"tool_kind": "WEB", "max_tool_calls": 4})
+        for _ in range(tool_calls)
+    ]
+    requests.append(PolicyRequest(tenant_config=tenant, operation=OperationType.MEMORY_READ, request_hints=hints, requested={"max_facts": 8}))
+    requests.append(PolicyRequest(tenant_config=tenant, operation=OperationType.MEMORY_WRITE_PHASE17, request_hints=hints))
+    requests.append(PolicyRequest(tenant_config=tenant, operation=OperationType.MEMORY_WRITE_PHASE18, request_hints=hints))
+    requests.append(PolicyRequest(tenant_config=tenant, operation=OperationType.LOGGING, request_hints=hints, requested={"logging_verbosity": "MINIMAL"}))
+    return requests
+
+
+def _run(turns: list, decide, scoped: bool) -> tuple[float, list]:
+    signatures = []
+    start = time.perf_counter()
+    for requests in turns:
+        if scoped:
+            with policy_request_scope():
+                signatures.extend(decide(req).decision_signature for req in requests)
+        else:
+            signatures.extend(decide(req).decision_signature for req in requests)
+    return time.perf_counter() - start, signatures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=2000)
+    parser.add_argument("--tenants", type=int, default=50)
+    parser.add_argument("--tool-calls", type=int, default=4)
+    args = parser.parse_args()
+
+    tenants = [_tenant(i) for i in range(args.tenants)]
+    turns = [_turn(tenants[i % len(tenants)], args.tool_calls) for i in range(args.turns)]
+    decisions = sum(len(t) for t in turns)
+
+    results = {}
+    results["uncached"] = _run(turns, lambda req: policy_engine._decide_policy(req, None), scoped=False)
+    configure_policy_cache()
+    results["scoped"] = _run(turns, decide_policy, scoped=True)
+    results["cached"] = _run(turns, decide_policy, scoped=False)
+    configure_policy_cache()
+
+    for mode, (elapsed, _) in results.items():
+        print(f"{mode:<9} {elapsed * 1e6 / decisions:8.2f} us/decision  {elapsed * 1e3 / args.turns:7.3f} ms/turn")
+    same = len({tuple(sigs) for _, sigs in results.values()}) == 1
+    uncached = results["uncached"][0]
+    print(f"speedup scoped x{uncached / results['scoped'][0]:.1f}  cached x{uncached / results['cached'][0]:.1f}  "
+          f"decisions {'identical' if same else 'DIFFER'}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
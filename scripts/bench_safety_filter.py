@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark: memory safety filter over large fact batches.
+
+Compares the reference per-group regex scan (re.findall per pattern per
+group, text re-normalized per group) with the compiled single-pass matcher
+used by scan_facts_forbidden, and checks both yield the same signature.
+
+Usage:
+    python scripts/bench_safety_filter.py --facts 2000 --rounds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from backend.app.memory.safety_filter import (  # noqa: E402
+    MAX_MATCHES_RETURNED,
+    PATTERN_GROUPS,
+    REASON_PRIORITY,
+    _compute_signature,
+    _scan_text_for_patterns,
+    scan_facts_forbidden,
+)
+from backend.app.memory.schema import MemoryCategory, MemoryFact, MemoryValueType  # noqa: E402
+
+FILLER = (
+    "the project deadline moved to next sprint and the team prefers async reviews "
+    "with short standups keep the api stable and document the migration plan"
+).split()
+SENSITIVE = ["doctor", "election", "church", "trade union", "caste", "blood pressure"]
+
+
+def _text(rng: random.Random, words: int, sensitive_rate: float) -> str:
+    out = []
+    for _ in range(words):
+        out.append(rng.choice(SENSITIVE) if rng.random() < sensitive_rate else rng.choice(FILLER))
+    return " ".join(out)
+
+
+def build_facts(n: int, sensitive_rate: float, seed: int = 6) -> list[MemoryFact]:
+    rng = random.Random(seed)
+    return [
+        MemoryFact(
+            fact_id=f"fact_{i:06d}",
+            category=MemoryCategory.PROJECT_CONTEXT,
+            key=f"note_{i % 17}",
+            value_type=MemoryValueType.STR,
+            value_str=_text(rng, 60, sensitive_rate),
+            value_num=None,
+            value_bool=None,
+            value_list_str=None,
+            confidence=0.8,
+            provenance=None,
+            created_at_ms=1000000,
+            expires_at_ms=None,
+            tags=[_text(rng, 3, sensitive_rate), _text(rng, 3, sensitive_rate)],
+        )
+        for i in range(n)
+    ]
+
+
+def reference_signature(facts: list[MemoryFact]) -> str:
+    matches = []
+    for fact in facts:
+        for field, text in [("key", fact.key), ("value_str", fact.value_str)] + [("tags", t) for t in fact.tags]:
+            if not text:
+                continue
+            for patterns, reason in PATTERN_GROUPS:
+                matches.extend(_scan_text_for_patterns(text, field, patterns, reason))
+    matches.sort(key=lambda m: REASON_PRIORITY[m.reason])
+    return _compute_signature(matches[:MAX_MATCHES_RETURNED])
+
+
+def _timed(fn, rounds: int) -> tuple[float, object]:
+    result = None
+    start = time.perf_counter()
+    for _ in range(rounds):
+        result = fn()
+    return (time.perf_counter() - start) * 1000.0 / rounds, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--facts", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--sensitive-rate", type=float, default=0.0, help="0 = clean batch (full scan, no early exit)")
+    args = parser.parse_args()
+
+    facts = build_facts(args.facts, args.sensitive_rate)
+    ref_ms, ref_sig = _timed(lambda: reference_signature(facts), args.rounds)
+    new_ms, result = _timed(lambda: scan_facts_forbidden(facts), args.rounds)
+    print(f"facts={args.facts} sensitive_rate={args.sensitive_rate}")
+    print(f"per-group regex  {ref_ms:9.2f} ms/batch")
+    print(f"compiled         {new_ms:9.2f} ms/batch  speedup x{ref_ms / max(new_ms, 1e-9):.1f}")
+    print(f"signature match: {ref_sig == result.signature}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,209 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark: Redis round trips and latency per message for session state.
+
+Compares the legacy per-key helpers (three GETs, three SETs) with
+SessionStateRepository (one MGET, one MULTI/EXEC), with and without the
+per-process decode cache. Without --redis-url a local RESP stand-in is
+started. Round trips are counted on the client (one packed send per command
+or pipeline) and --rtt-ms adds that much delay to each to model network
+latency.
+
+Usage:
+    python scripts/bench_session_state.py --messages 500 --rtt-ms 0.5
+    python scripts/bench_session_state.py --redis-url redis://localhost:6379/15
+"""
+
+from __future__ import annotations
+
+import argparse
+import socketserver
+import sys
+import threading
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+import redis  # noqa: E402
+
+from backend.app.memory import legacy  # noqa: E402
+from backend.app.memory.session_state import SessionState, SessionStateRepository  # noqa: E402
+from backend.app.schemas import CognitiveStyle, Hypothesis, SessionSummary  # noqa: E402
+
+
+class RespStandIn:
+    """Minimal threaded RESP2 server (GET/SET/MGET/DEL/INCRBY/EXPIRE, MULTI/EXEC)."""
+
+    def __init__(self):
+        self.data = {}
+        stand_in = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                stand_in._serve(self.request)
+
+        self._server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        self.url = f"redis://127.0.0.1:{self._server.server_address[1]}/0"
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    @staticmethod
+    def _parse(buf: bytes):
+        end = buf.find(b"\r\n")
+        if not buf.startswith(b"*") or end < 0:
+            return None, buf
+        count, pos, args = int(buf[1:end]), end + 2, []
+        for _ in range(count):
+            end = buf.find(b"\r\n", pos)
+            if end < 0:
+                return None, buf
+            start = end + 2
+            size = int(buf[pos + 1:end])
+            if len(buf) < start + size + 2:
+                return None, buf
+            args.append(buf[start:start + size])
+            pos = start + size + 2
+        return args, buf[pos:]
+
+    @staticmethod
+    def _bulk(value) -> bytes:
+        return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+
+    def _run(self, name: str, args) -> bytes:
+        if name == "GET":
+            return self._bulk(self.data.get(args[0]))
+        if name == "MGET":
+            return b"*%d\r\n" % len(args) + b"".join(self._bulk(self.data.get(k)) for k in args)
+        if name == "SET":
+            self.data[args[0]] = args[1]
+            return b"+OK\r\n"
+        if name == "DEL":
+            return b":%d\r\n" % sum(1 for k in args if self.data.pop(k, None) is not None)
+        if name in ("INCR", "INCRBY"):
+            value = int(self.data.get(args[0], b"0")) + (int(args[1]) if len(args) > 1 else 1)
+            self.data[args[0]] = str(value).encode()
+            return b":%d\r\n" % value
+        if name == "EXPIRE":
+            return b":1\r\n"
+        return b"+OK\r\n"
+
+    def _serve(self, sock) -> None:
+        buf, queued = b"", None
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                return
+            buf += chunk
+            replies = []
+            while True:
+                args, buf = self._parse(buf)
+                if args is None:
+                    break
+                name = args[0].decode().upper()
+                if name == "MULTI":
+                    queued = []
+                    replies.append(b"+OK\r\n")
+                elif name == "EXEC":
+                    results = [self._run(n, a) for n, a in queued or []]
+                    replies.append(b"*%d\r\n" % len(results) + b"".join(results))
+                    queued = None
+                elif queued is not None:
+                    queued.append((name, args[1:]))
+                    replies.append(b"+QUEUED\r\n")
+                else:
+                    replies.append(self._run(name, args[1:]))
+            if replies:
+                sock.sendall(b"".join(replies))
+
+
+class RoundTripConnection(redis.Connection):
+    """Counts packed sends (one per command or pipeline) and adds a fixed RTT to each."""
+
+    sends = 0
+    rtt_s = 0.0
+
+    def send_packed_command(self, command, check_health=True):
+        type(self).sends += 1
+        if self.rtt_s:
+            time.sleep(self.rtt_s)
+        return super().send_packed_command(command, check_health)
+
+
+def _hypotheses(n: int) -> list[Hypothesis]:
+    return [
+        Hypothesis(id=f"h{i}", claim=f"the user prefers option {i} for this project", support_score=0.3, last_updated=1)
+        for i in range(n)
+    ]
+
+
+STYLE = CognitiveStyle(abstraction_level="medium", formality="neutral", preferred_analogies="mixed")
+
+
+def legacy_message(session_id: str) -> None:
+    stored = legacy.load_cognitive_style(session_id)
+    hypotheses = legacy.load_hypotheses(session_id)
+    summary = legacy.load_session_summary(session_id)
+    legacy.save_hypotheses(session_id, hypotheses)
+    legacy.save_cognitive_style(session_id, stored or STYLE)
+    legacy.save_session_summary(session_id, summary)
+
+
+def repository_message(repo: SessionStateRepository, session_id: str) -> None:
+    state = repo.load(session_id)
+    repo.save(session_id, SessionState(style=state.style or STYLE, hypotheses=state.hypotheses, summary=state.summary))
+
+
+def _timed(fn, rounds: int) -> tuple[float, object]:
+    result = None
+    start = time.perf_counter()
+    for _ in range(rounds):
+        result = fn()
+    return (time.perf_counter() - start) * 1000.0 / rounds, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--hypotheses", type=int, default=20)
+    parser.add_argument("--rtt-ms", type=float, default=0.5, help="added delay per round trip")
+    parser.add_argument("--redis-url", default=None, help="use a real Redis instead of the stand-in")
+    args = parser.parse_args()
+
+    stand_in = None if args.redis_url else RespStandIn()
+    RoundTripConnection.rtt_s = args.rtt_ms / 1000.0
+    client = redis.Redis.from_url(
+        args.redis_url or stand_in.url, decode_responses=True, connection_class=RoundTripConnection
+    )
+    legacy.get_redis = lambda: client
+    seed = SessionState(style=STYLE, hypotheses=_hypotheses(args.hypotheses), summary=SessionSummary(active_goal="g"))
+
+    variants = [
+        ("legacy per-key", lambda sid: legacy_message(sid)),
+        ("mget + multi/exec", lambda sid, r=SessionStateRepository(client, cache_entries=0): repository_message(r, sid)),
+        ("  + decode cache", lambda sid, r=SessionStateRepository(client, cache_entries=64): repository_message(r, sid)),
+    ]
+    print(f"messages={args.messages} hypotheses={args.hypotheses} backend={args.redis_url or 'stand-in'}")
+    baseline_ms = None
+    try:
+        for idx, (label, fn) in enumerate(variants):
+            session_id = f"bench:{idx}"
+            SessionStateRepository(client, cache_entries=0).save(session_id, seed)
+            RoundTripConnection.sends = 0
+            ms, _ = _timed(lambda: fn(session_id), args.messages)
+            baseline_ms = baseline_ms or ms
+            trips = RoundTripConnection.sends / args.messages
+            print(f"{label:<20} {ms:8.3f} ms/msg  {trips:4.1f} round trips/msg  speedup x{baseline_ms / max(ms, 1e-9):.1f}")
+    finally:
+        if stand_in:
+            stand_in.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+"""
+Cross-worker limits: per-process vs shared quota and cost counters.
+
+Starts --workers processes that each send --requests quota prechecks for one
+actor (free plan, rpm=20, no refill within the run) and add tokens to the
+global daily cost budget. With the in-process backend every worker admits its
+own rpm, so the cluster admits workers x rpm; with a shared backend the total
+admitted must equal rpm and the budget total must be exact. Also prints
+per-request cost for each backend.
+
+Redis is included when --redis-url is given (batched, see
+backend/app/perf/shared_counters.py).
+
+Usage:
+    python scripts/bench_shared_counters.py --workers 4 --requests 2000
+    python scripts/bench_shared_counters.py --redis-url redis://localhost:6379/15
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from backend.app.cost.storage import DailyCounter  # noqa: E402
+from backend.app.perf import shared_counters  # noqa: E402
+from backend.app.security import quotas  # noqa: E402
+
+
+def _build(kind: str, shm_path: str, redis_url: str):
+    if kind == "memory":
+        return shared_counters.InProcessCounterBackend()
+    if kind == "shm":
+        return shared_counters.SharedMemoryCounterBackend(shm_path)
+    import redis
+
+    client = redis.Redis.from_url(redis_url, decode_responses=True)
+    return shared_counters.BatchingCounterBackend(shared_counters.RedisCounterBackend(client))
+
+
+def _worker(kind: str, shm_path: str, redis_url: str, run_id: str, requests: int, results) -> None:
+    backend = _build(kind, shm_path, redis_url)
+    shared_counters.set_counter_backend(backend)
+    budget = DailyCounter(shared_counters.shared_counter_backend(), namespace=f"bench:{run_id}")
+    allowed = 0
+    start = time.perf_counter()
+    for _ in range(requests):
+        ctx = quotas.QuotaContext(
+            plan="free", actor_key=f"bench-{run_id}", ip_hash="ip", est_input_tokens=1, est_output_cap=None, now_monotonic=0.0
+        )
+        allowed += quotas.quota_precheck(ctx).allowed
+        budget.add("global", 10)
+    elapsed = time.perf_counter() - start
+    backend.flush()
+    results.put((allowed, budget.total("global"), elapsed * 1e6 / requests))
+    backend.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=2000, help="prechecks per worker")
+    parser.add_argument("--redis-url", default="")
+    args = parser.parse_args()
+
+    os.environ.pop("QUOTA_FORCE_BLOCK", None)
+    rpm = quotas._PLAN_LIMITS["free"]["rpm"]
+    kinds = ["memory", "shm"] + (["redis"] if args.redis_url else [])
+    ctx = multiprocessing.get_context("fork")
+    ok = True
+    with tempfile.TemporaryDirectory() as tmp:
+        for kind in kinds:
+            run_id = uuid.uuid4().hex[:8]
+            results = ctx.Queue()
+            procs = [
+                ctx.Process(target=_worker, args=(kind, os.path.join(tmp, "limiter.shm"), args.redis_url, run_id, args.requests, results))
+                for _ in range(args.workers)
+            ]
+            for proc in procs:
+                proc.start()
+            outcomes = [results.get(timeout=300) for _ in procs]
+            for proc in procs:
+                proc.join()
+            admitted = sum(o[0] for o in outcomes)
+            budget_seen = max(o[1] for o in outcomes)
+            if kind != "memory":
+                backend = _build(kind, os.path.join(tmp, "limiter.shm"), args.redis_url)
+                budget_seen = DailyCounter(backend, namespace=f"bench:{run_id}").total("global")
+                backend.close()
+            us = sum(o[2] for o in outcomes) / len(outcomes)
+            expected_budget = args.workers * args.requests * 10
+            print(
+                f"{kind:<7} admitted={admitted:<5} (limit {rpm}, x{admitted / rpm:.1f})  "
+                f"budget={budget_seen} of {expected_budget}  {us:7.2f} us/request"
+            )
+            if kind != "memory":
+                ok = ok and admitted == rpm and budget_seen == expected_budget
+    print("shared limits hold" if ok else "SHARED LIMITS EXCEEDED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""
+Contention benchmark: one global lock vs StripedLocks for per-actor updates.
+
+Each thread updates counters for its own set of actors. The critical section
+is a dict read-modify-write plus --hold-us of GIL-releasing work (standing in
+for the I/O or C calls a real update path makes while holding state). With a
+global lock, throughput stays flat as threads are added; with striped locks,
+threads on different actors proceed in parallel. With --hold-us 0 the section
+is pure Python and the GIL caps both modes.
+
+Usage:
+    python scripts/bench_striped_locks.py --threads 1,2,4,8 --ops 2000 --hold-us 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from backend.app.perf.striped import StripedLocks  # noqa: E402
+
+
+class GlobalLock:
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+
+    def hold(self, key):
+        return self._lock
+
+
+def run(locks, threads: int, ops: int, hold_s: float) -> tuple[float, int]:
+    counts: dict[str, int] = {}
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(idx: int) -> None:
+        actors = [f"actor-{idx}-{j}" for j in range(16)]
+        barrier.wait()
+        for i in range(ops):
+            key = actors[i % len(actors)]
+            with locks.hold(key):
+                counts[key] = counts.get(key, 0) + 1
+                if hold_s:
+                    time.sleep(hold_s)
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - start
+    return threads * ops / elapsed, sum(counts.values())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", default="1,2,4,8")
+    parser.add_argument("--ops", type=int, default=2000, help="updates per thread")
+    parser.add_argument("--hold-us", type=float, default=50.0)
+    args = parser.parse_args()
+
+    hold_s = args.hold_us / 1e6
+    print(f"ops/thread={args.ops} hold={args.hold_us}us")
+    for threads in [int(t) for t in args.threads.split(",") if t.strip()]:
+        row = []
+        for label, locks in (("global", GlobalLock()), ("striped", StripedLocks())):
+            ops_s, total = run(locks, threads, args.ops, hold_s)
+            assert total == threads * args.ops, "lost update"
+            row.append((label, ops_s))
+        speedup = row[1][1] / max(row[0][1], 1e-9)
+        print(f"threads={threads:<3} " + "  ".join(f"{label} {ops_s:10.0f} ops/s" for label, ops_s in row) + f"  x{speedup:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+"""
+Load test: requests/sec through waf_dependency for each limiter backend.
+
+Mounts waf_dependency on a bare POST /api/chat route (identity is stubbed so
+only the WAF touches the DB) and drives it with concurrent in-process clients,
+each with its own forwarded IP and subject. Limits are raised so every request
+is allowed and the limiter runs its full path. Modes:
+- sync:      the per-statement psycopg path (_rate_check), blocking the loop
+- cte:       one statement per check on the async pool, prefilter off
+- prefilter: cte plus the token-bucket prefilter (--share)
+
+Usage (requires a local Postgres with backend/app/db/migrations applied):
+    DATABASE_URL=postgresql://localhost/cognitive python scripts/bench_waf_limiter.py --requests 2000 --clients 32
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+import httpx  # noqa: E402
+from fastapi import Depends, FastAPI, Request  # noqa: E402
+
+from backend.app.auth.identity import IdentityContext  # noqa: E402
+from backend.app.db.database import aclose_db_pools, db_connection  # noqa: E402
+from backend.app.deps.identity import identity_dependency  # noqa: E402
+from backend.app.waf import guard  # noqa: E402
+from backend.app.waf.limiter import TokenBucketPrefilter  # noqa: E402
+
+BENCH_PREFIX = "bench-waf-"
+
+
+def _identity(request: Request) -> IdentityContext:
+    subject = request.headers.get("x-bench-subject", BENCH_PREFIX + "0")
+    return IdentityContext(
+        is_authenticated=True,
+        user_id=subject,
+        anon_id=None,
+        subject_type="user",
+        subject_id=subject,
+        ip_hash="",
+        user_agent_hash="",
+    )
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/api/chat")
+    async def chat(identity: IdentityContext = Depends(guard.waf_dependency)):
+        return {"ok": True}
+
+    app.dependency_overrides[identity_dependency] = _identity
+    return app
+
+
+async def _sync_rate_check(key, windows, now_ts):
+    return guard._rate_check(key, windows, now_ts)
+
+
+def _raise_limits(limit: int) -> None:
+    for name in (
+        "WAF_IP_BURST_LIMIT",
+        "WAF_IP_SUSTAIN_LIMIT",
+        "WAF_SUBJECT_BURST_LIMIT",
+        "WAF_SUBJECT_SUSTAIN_LIMIT",
+    ):
+        setattr(guard, name, limit)
+
+
+def _cleanup(clients: int) -> None:
+    ip_hashes = [guard._hash_value(f"203.0.113.{i % 250}") for i in range(clients)]
+    with db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "DELETE FROM rate_limits WHERE subject_id LIKE %s OR subject_id = ANY(%s);",
+                (BENCH_PREFIX + "%", ip_hashes),
+            )
+
+
+async def run(app: FastAPI, requests: int, clients: int) -> tuple[float, int, int]:
+    transport = httpx.ASGITransport(app=app, client=("10.0.0.2", 40000))
+    per_client = max(1, requests // clients)
+    statuses: dict[int, int] = {}
+
+    async def client_loop(idx: int) -> None:
+        headers = {
+            "content-type": "application/json",
+            "x-forwarded-for": f"203.0.113.{idx % 250}",
+            "x-bench-subject": f"{BENCH_PREFIX}{idx}",
+        }
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for _ in range(per_client):
+                resp = await client.post("/api/chat", json={"user_text": "hi"}, headers=headers)
+                statuses[resp.status_code] = statuses.get(resp.status_code, 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client_loop(i) for i in range(clients)))
+    elapsed = time.perf_counter() - start
+    return (per_client * clients) / elapsed, statuses.get(200, 0), per_client * clients - statuses.get(200, 0)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--share", type=float, default=0.25, help="prefilter share for the prefilter mode")
+    parser.add_argument("--limit", type=int, default=1_000_000, help="per-window limit used for every window")
+    args = parser.parse_args()
+
+    if not os.environ.get("DATABASE_URL"):
+        print("ERROR: DATABASE_URL is required", file=sys.stderr)
+        return 1
+
+    _raise_limits(args.limit)
+    app = build_app()
+    rate_check_async = guard._rate_check_async
+    modes = [
+        ("sync", _sync_rate_check, 0.0),
+        ("cte", rate_check_async, 0.0),
+        ("prefilter", rate_check_async, args.share),
+    ]
+    print(f"requests={args.requests} clients={args.clients} share={args.share}")
+    baseline = None
+    for label, check, share in modes:
+        _cleanup(args.clients)
+        guard._rate_check_async = check
+        guard._prefilter = TokenBucketPrefilter(share)
+        try:
+            rps, ok, rejected = asyncio.run(run(app, args.requests, args.clients))
+        finally:
+            guard._rate_check_async = rate_check_async
+            asyncio.run(aclose_db_pools())
+        baseline = baseline or rps
+        print(f"{label:<10} {rps:9.1f} req/s  ok={ok} rejected={rejected}  speedup x{rps / max(baseline, 1e-9):.1f}")
+    _cleanup(args.clients)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())